@@ -0,0 +1,157 @@
+"""
+Streaming tar archives of record files.
+
+`stream_records_tar` turns an iterable of records, e.g. the generator
+returned by `Sensor.filter_records`, into the bytes of a tar archive with
+one member per record file, named by its object key. Objects are opened
+on a thread pool a few records ahead, so request latency overlaps with
+streaming the previous files, and each body is copied through in fixed
+size chunks. Memory use therefore stays constant however large the
+archive grows.
+
+Members are written in PAX format, so long object keys are kept intact.
+Files that cannot be opened are skipped; a file that fails halfway
+aborts the stream, since the archive can no longer be completed.
+"""
+
+import tarfile
+from pathlib import Path
+from collections import deque
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, Optional, Tuple, Union
+
+from gemini.api.base import get_minio_storage_provider
+from gemini.storage.exceptions import StorageDownloadError
+
+DEFAULT_ARCHIVE_DEPTH = 8
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+
+def stream_records_tar(
+    records: Iterable[Any],
+    depth: int = DEFAULT_ARCHIVE_DEPTH,
+    bucket_name: str = "gemini",
+    chunk_size: int = ARCHIVE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Streams the files of records as a tar archive.
+
+    Examples:
+        >>> sensor = Sensor.get(sensor_name="FLIR Camera", experiment_name="Experiment A")
+        >>> records = sensor.filter_records(start_timestamp=datetime(2024, 7, 1), end_timestamp=datetime(2024, 7, 2), lightweight=True)
+        >>> with open("flir_2024-07-01.tar", "wb") as archive:
+        ...     for chunk in stream_records_tar(records):
+        ...         archive.write(chunk)
+
+    Args:
+        records (Iterable): The records, with a `record_file` attribute. Records without a file are skipped.
+        depth (int, optional): Number of objects opened ahead of the one being streamed. Defaults to 8.
+        bucket_name (str, optional): The bucket of the record files. Defaults to `gemini`.
+        chunk_size (int, optional): Bytes read from storage at a time. Defaults to 1 MiB.
+
+    Yields:
+        bytes: The archive, chunk by chunk.
+
+    Raises:
+        StorageDownloadError: If a file ends before its stored size, leaving the archive incomplete.
+    """
+    storage_provider = get_minio_storage_provider()
+    depth = max(depth, 1)
+    record_files = (record.record_file for record in records if getattr(record, "record_file", None))
+    executor = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="gemini-archive")
+    pending: Deque[Tuple[str, Future]] = deque()
+    written = 0
+
+    def open_object(object_name: str) -> Any:
+        return storage_provider.download_file_stream(object_name, bucket_name=bucket_name)
+
+    def write_member(object_name: str, future: Future) -> Iterator[bytes]:
+        try:
+            response = future.result()
+        except Exception as e:
+            print(f"Skipping {object_name} in archive: {e}")
+            return
+        try:
+            member = tarfile.TarInfo(object_name)
+            member.size = int(response.headers["Content-Length"])
+            member.mode = 0o644
+            member.mtime = _last_modified(response.headers.get("Last-Modified"))
+            yield member.tobuf(format=tarfile.PAX_FORMAT)
+            remaining = member.size
+            for chunk in response.stream(chunk_size):
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+                yield chunk
+            if remaining:
+                raise StorageDownloadError(f"{object_name} ended {remaining} bytes early, the archive is incomplete")
+            padding = -member.size % tarfile.BLOCKSIZE
+            if padding:
+                yield tarfile.NUL * padding
+        finally:
+            response.close()
+            response.release_conn()
+
+    try:
+        for object_name in record_files:
+            pending.append((object_name, executor.submit(open_object, object_name)))
+            if len(pending) > depth:
+                for chunk in write_member(*pending.popleft()):
+                    written += len(chunk)
+                    yield chunk
+        while pending:
+            for chunk in write_member(*pending.popleft()):
+                written += len(chunk)
+                yield chunk
+        # End of archive: two zero blocks, padded to a whole tar record
+        end = 2 * tarfile.BLOCKSIZE
+        end += -(written + end) % tarfile.RECORDSIZE
+        yield tarfile.NUL * end
+    finally:
+        for _, future in pending:
+            if not future.cancel():
+                future.add_done_callback(_close_response)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def write_records_tar(
+    records: Iterable[Any],
+    destination: Union[str, Path],
+    depth: int = DEFAULT_ARCHIVE_DEPTH,
+    bucket_name: str = "gemini"
+) -> Path:
+    """
+    Writes the files of records to a tar archive on disk.
+
+    Args:
+        records (Iterable): The records, with a `record_file` attribute.
+        destination (str | Path): The archive file to write.
+        depth (int, optional): Number of objects opened ahead of the one being written. Defaults to 8.
+        bucket_name (str, optional): The bucket of the record files. Defaults to `gemini`.
+
+    Returns:
+        Path: The written archive.
+    """
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with open(destination, "wb") as archive:
+        for chunk in stream_records_tar(records, depth=depth, bucket_name=bucket_name):
+            archive.write(chunk)
+    return destination
+
+
+def _last_modified(value: Optional[str]) -> int:
+    try:
+        return int(parsedate_to_datetime(value).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+
+def _close_response(future: Future) -> None:
+    # Objects opened ahead of an abandoned stream are closed once their request completes
+    try:
+        response = future.result()
+    except Exception:
+        return
+    response.close()
+    response.release_conn()
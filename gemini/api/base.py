@@ -1,28 +1,71 @@
 import os
+import threading
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import computed_field
 from pydantic import model_validator
-from typing import Any, Optional, Union, ClassVar
+from typing import Any, Iterator, Optional, Tuple, Union, ClassVar
 from uuid import UUID
 
 from gemini.storage.providers.minio_storage import MinioStorageProvider
 from gemini.storage.config.storage_config import MinioStorageConfig
+from gemini.storage.file_cache import LocalFileCache
 from gemini.manager import GEMINIManager, GEMINIComponentType
+from gemini.api.uploads import DEFAULT_UPLOAD_WORKERS
+from gemini.storage.multipart import DEFAULT_MULTIPART_CONCURRENCY
 
 from functools import cached_property
 from abc import ABC, abstractmethod
-
-manager = GEMINIManager()
-minio_storage_settings = manager.get_component_settings(GEMINIComponentType.STORAGE)
-minio_storage_config = MinioStorageConfig(
-    endpoint=f"{minio_storage_settings['GEMINI_STORAGE_HOSTNAME']}:{minio_storage_settings['GEMINI_STORAGE_PORT']}",
-    access_key=minio_storage_settings['GEMINI_STORAGE_ACCESS_KEY'],
-    secret_key=minio_storage_settings['GEMINI_STORAGE_SECRET_KEY'],
-    bucket_name=minio_storage_settings['GEMINI_STORAGE_BUCKET_NAME'],
-    secure=False
-)
-minio_storage_provider = MinioStorageProvider(minio_storage_config)
+from pathlib import Path
+
+# Created on first use so importing the API does not read settings or build a client
+_minio_storage_provider: Optional[MinioStorageProvider] = None
+_minio_storage_lock = threading.Lock()
+
+def get_minio_storage_provider() -> MinioStorageProvider:
+    """
+    Retrieves the MinIO storage provider shared by the API, creating it on first use.
+
+    Returns:
+        MinioStorageProvider: The MinIO storage provider.
+    """
+    global _minio_storage_provider
+    if _minio_storage_provider is None:
+        with _minio_storage_lock:
+            if _minio_storage_provider is None:
+                minio_storage_settings = GEMINIManager().get_component_settings(GEMINIComponentType.STORAGE)
+                minio_storage_config = MinioStorageConfig(
+                    endpoint=f"{minio_storage_settings['GEMINI_STORAGE_HOSTNAME']}:{minio_storage_settings['GEMINI_STORAGE_PORT']}",
+                    access_key=minio_storage_settings['GEMINI_STORAGE_ACCESS_KEY'],
+                    secret_key=minio_storage_settings['GEMINI_STORAGE_SECRET_KEY'],
+                    bucket_name=minio_storage_settings['GEMINI_STORAGE_BUCKET_NAME'],
+                    secure=False,
+                    # Every upload worker may send several parts of a large file at once
+                    max_connections=max(DEFAULT_UPLOAD_WORKERS * DEFAULT_MULTIPART_CONCURRENCY, 10),
+                    public_endpoint=minio_storage_settings.get('GEMINI_STORAGE_PUBLIC_ENDPOINT') or None
+                )
+                _minio_storage_provider = MinioStorageProvider(minio_storage_config)
+    return _minio_storage_provider
+
+_file_cache: Optional[LocalFileCache] = None
+
+def get_file_cache() -> LocalFileCache:
+    """
+    Retrieves the local file cache shared by the API, creating it on first use.
+
+    The cache directory and size cap are read from the `GEMINI_FILE_CACHE_DIR`
+    and `GEMINI_FILE_CACHE_SIZE` environment variables.
+
+    Returns:
+        LocalFileCache: The local file cache, reading through the MinIO storage provider.
+    """
+    global _file_cache
+    if _file_cache is None:
+        storage_provider = get_minio_storage_provider()
+        with _minio_storage_lock:
+            if _file_cache is None:
+                _file_cache = LocalFileCache(storage_provider)
+    return _file_cache
 
 class APIBase(BaseModel):
 
@@ -81,8 +124,6 @@ class FileHandlerMixin(BaseModel):
         arbitrary_types_allowed=True
     )
 
-    minio_storage_provider: ClassVar[MinioStorageProvider] = minio_storage_provider
-
     @classmethod
     @abstractmethod
     def process_record(cls, record: 'APIBase') -> 'APIBase':
@@ -93,3 +134,84 @@ class FileHandlerMixin(BaseModel):
     def create_file_uri(cls, record_file_key: str) -> str:
         pass
 
+    def get_cached_file(self, validate: bool = True) -> Optional[Path]:
+        """
+        Retrieves a local copy of the record file, downloading it into the local file cache if needed.
+
+        Examples:
+            >>> record = SensorRecord.get_by_id(UUID('...'))
+            >>> image = Image.open(record.get_cached_file())
+
+        Args:
+            validate (bool, optional): Check a cached copy against the stored file's ETag and last-modified time. Defaults to True.
+
+        Returns:
+            Optional[Path]: The path of the cached copy, or None if the record has no file or it could not be retrieved.
+        """
+        try:
+            record_file = getattr(self, "record_file", None)
+            if not record_file:
+                print("No record file available for this record.")
+                return None
+            return get_file_cache().get(record_file, bucket_name="gemini", validate=validate)
+        except Exception as e:
+            print(f"Error getting cached record file: {e}")
+            return None
+
+    def get_download_url(self) -> Optional[str]:
+        """
+        Retrieves a pre-signed URL to download the record file directly from storage.
+
+        URLs are cached in-process and reused while they are valid for at least half of their lifetime.
+
+        Examples:
+            >>> record = SensorRecord.get_by_id(UUID('...'))
+            >>> record.get_download_url()
+            'https://storage.example.org/gemini/sensor_data/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Returns:
+            Optional[str]: The URL, or None if the record has no file or an error occurred.
+        """
+        try:
+            from gemini.api.presign import get_presigned_url_cache
+            record_file = getattr(self, "record_file", None)
+            if not record_file:
+                print("No record file available for this record.")
+                return None
+            url, _ = get_presigned_url_cache().get_url(record_file, bucket_name="gemini")
+            return url
+        except Exception as e:
+            print(f"Error getting record download URL: {e}")
+            return None
+
+    @classmethod
+    def iter_files(
+        cls,
+        prefetch: int = 8,
+        as_bytes: bool = False,
+        workers: Optional[int] = None,
+        **search_parameters
+    ) -> Iterator[Tuple['APIBase', Optional[Union[Path, bytes]]]]:
+        """
+        Search for records and yield each with its file, prefetching the files of the next records in the background.
+
+        Examples:
+            >>> for record, path in SensorRecord.iter_files(sensor_name="Camera A", experiment_name="Experiment A", prefetch=16):
+            ...     image = Image.open(path)
+
+        Args:
+            prefetch (int, optional): Number of files fetched ahead of the loop. Defaults to 8.
+            as_bytes (bool, optional): Yield the file contents instead of the path of a cached copy. Defaults to False.
+            workers (int, optional): Number of fetch threads. Defaults to the prefetch depth, at most `DEFAULT_UPLOAD_WORKERS`.
+            **search_parameters: The search parameters, as for `search`.
+        Yields:
+            Tuple: Each record in search order, with its local path or contents, or None if it has no file.
+        """
+        from gemini.api.prefetch import prefetch_record_files
+        yield from prefetch_record_files(
+            cls.search(**search_parameters),
+            depth=prefetch,
+            workers=workers,
+            as_bytes=as_bytes
+        )
+
@@ -0,0 +1,296 @@
+"""
+In-process cache for the small GEMINI metadata entities.
+
+Lookups of experiments, seasons, sites, plots, sensors and datasets by ID
+or by their natural key (e.g. sensor name and experiment name) are served
+from a TTL and LRU bounded cache shared by the process. Entries are
+invalidated by the `update`, `set_info`, `delete` and association methods
+of the cached classes, and expire after the TTL so that writes made by
+other processes are picked up.
+
+The cache is configured with `configure_entity_cache` or the environment
+variables `GEMINI_ENTITY_CACHE` ("0" or "false" turns it off),
+`GEMINI_ENTITY_CACHE_TTL` (seconds) and `GEMINI_ENTITY_CACHE_SIZE`.
+"""
+
+import os
+import time
+import inspect
+import threading
+from functools import wraps
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+class EntityCache:
+    """
+    Thread-safe TTL and LRU cache of API entities keyed by ID and natural key.
+
+    Features:
+    - Entries stored once per ID, natural keys map to the ID
+    - Least recently used entries evicted above the maximum size
+    - Entries expire after the TTL
+    - Copies handed out, so callers cannot modify cached entities
+    - Hit, miss, eviction and expiration counters
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): The maximum number of cached entities. Defaults to 1024.
+            ttl (float): Seconds an entity stays cached. Defaults to 60.
+            enabled (bool): Whether lookups use the cache. Defaults to True.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any, Set[Hashable]]]" = OrderedDict()
+        self._keys: Dict[Hashable, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def get_by_id(self, entity_class: type, id: Any) -> Optional[Any]:
+        """
+        Retrieves a cached entity by its ID.
+
+        Args:
+            entity_class (type): The API class of the entity.
+            id (UUID | int | str): The ID of the entity.
+
+        Returns:
+            The entity, or None if it is not cached.
+        """
+        if not self.enabled or id is None:
+            return None
+        return self._get((entity_class.__name__, str(id)))
+
+    def get_by_key(self, entity_class: type, **natural_key: Any) -> Optional[Any]:
+        """
+        Retrieves a cached entity by its natural key.
+
+        Examples:
+            >>> entity_cache.get_by_key(Sensor, sensor_name="Temperature Sensor", experiment_name="Experiment 1")
+            Sensor(sensor_name=Temperature Sensor, id=UUID('...'))
+
+        Args:
+            entity_class (type): The API class of the entity.
+            **natural_key: The lookup parameters.
+
+        Returns:
+            The entity, or None if it is not cached.
+        """
+        if not self.enabled:
+            return None
+        entry_key = self._keys.get(_natural_key(entity_class, natural_key))
+        if entry_key is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return self._get(entry_key)
+
+    def put(self, entity_class: type, entity: Any, **natural_key: Any) -> None:
+        """
+        Caches an entity under its ID and, if given, a natural key.
+
+        Args:
+            entity_class (type): The API class of the entity.
+            entity: The entity to cache. A copy is stored.
+            **natural_key: The lookup parameters the entity was found with.
+        """
+        if not self.enabled or entity is None or getattr(entity, "id", None) is None:
+            return
+        entry_key = (entity_class.__name__, str(entity.id))
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            _, _, aliases = self._entries.pop(entry_key, (None, None, set()))
+            if natural_key:
+                alias = _natural_key(entity_class, natural_key)
+                aliases.add(alias)
+                self._keys[alias] = entry_key
+            self._entries[entry_key] = (expires_at, entity.model_copy(deep=True), aliases)
+            while len(self._entries) > self.max_size:
+                _, (_, _, evicted_aliases) = self._entries.popitem(last=False)
+                self._drop_aliases(evicted_aliases)
+                self.evictions += 1
+
+    def invalidate(self, entity_class: type, id: Any) -> None:
+        """
+        Removes an entity and its natural keys from the cache.
+
+        Args:
+            entity_class (type): The API class of the entity.
+            id (UUID | int | str): The ID of the entity.
+        """
+        with self._lock:
+            entry = self._entries.pop((entity_class.__name__, str(id)), None)
+            if entry is not None:
+                self._drop_aliases(entry[2])
+
+    def invalidate_keys(self) -> None:
+        """
+        Removes every natural key from the cache, keeping the entries reachable by ID.
+
+        Natural keys can be scoped by associations (e.g. a sensor looked up by
+        experiment name), so association changes drop all of them.
+        """
+        with self._lock:
+            self._keys.clear()
+            for _, _, aliases in self._entries.values():
+                aliases.clear()
+
+    def clear(self) -> None:
+        """
+        Removes every entity from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+
+    def reset_stats(self) -> None:
+        """
+        Resets the hit, miss, eviction and expiration counters.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Retrieves the cache counters.
+
+        Returns:
+            dict: The hits, misses, hit ratio, evictions, expirations and current size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl
+        }
+
+    def _get(self, entry_key: Tuple[str, str]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, entity, aliases = entry
+            if expires_at <= time.monotonic():
+                del self._entries[entry_key]
+                self._drop_aliases(aliases)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+        return entity.model_copy(deep=True)
+
+    def _drop_aliases(self, aliases: Set[Hashable]) -> None:
+        for alias in aliases:
+            self._keys.pop(alias, None)
+
+
+def _natural_key(entity_class: type, natural_key: Dict[str, Any]) -> Hashable:
+    return (entity_class.__name__,) + tuple(sorted((name, str(value)) for name, value in natural_key.items()))
+
+
+def _env_enabled() -> bool:
+    return os.getenv("GEMINI_ENTITY_CACHE", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+entity_cache = EntityCache(
+    max_size=int(os.getenv("GEMINI_ENTITY_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("GEMINI_ENTITY_CACHE_TTL", "60")),
+    enabled=_env_enabled()
+)
+
+
+def configure_entity_cache(
+    enabled: Optional[bool] = None,
+    ttl: Optional[float] = None,
+    max_size: Optional[int] = None
+) -> EntityCache:
+    """
+    Changes the settings of the shared entity cache. Cached entities are dropped.
+
+    Examples:
+        >>> configure_entity_cache(enabled=False)
+        >>> configure_entity_cache(enabled=True, ttl=300)
+
+    Args:
+        enabled (bool, optional): Whether lookups use the cache.
+        ttl (float, optional): Seconds an entity stays cached.
+        max_size (int, optional): The maximum number of cached entities.
+
+    Returns:
+        EntityCache: The shared entity cache.
+    """
+    if enabled is not None:
+        entity_cache.enabled = enabled
+    if ttl is not None:
+        entity_cache.ttl = ttl
+    if max_size is not None:
+        entity_cache.max_size = max_size
+    entity_cache.clear()
+    return entity_cache
+
+
+def invalidates_cached_entity(method: Callable) -> Callable:
+    """
+    Decorates an instance method that modifies the entity or its associations.
+
+    After the method runs, the entity and all natural keys are removed from the cache.
+    """
+    def invalidate(self) -> None:
+        entity_cache.invalidate(type(self), self.id)
+        entity_cache.invalidate_keys()
+
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                invalidate(self)
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            invalidate(self)
+    return wrapper
+
+
+def clears_entity_cache(method: Callable) -> Callable:
+    """
+    Decorates an instance method that deletes an entity.
+
+    Deletes cascade to dependent entities, so the whole cache is cleared after the method runs.
+    """
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                entity_cache.clear()
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            entity_cache.clear()
+    return wrapper
@@ -0,0 +1,303 @@
+"""
+Column-wise record building for bulk inserts.
+
+`insert_records` builds and validates a Pydantic record per row and dumps
+it again before inserting, which dominates the cost of large imports. The
+functions in this module take the per-row values as columns instead
+(lists, NumPy arrays or pandas Series, or the columns of a DataFrame),
+normalise and check each column in a single pass, and build the insert
+rows directly, merging in the values shared by every row.
+
+Columns can also be generators or other iterables of unknown length.
+`iter_column_batches` reads them in fixed-size batches, so that a log of
+any length is validated, uploaded and inserted with flat memory use.
+"""
+
+import math
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Rows per batch when inserting from iterables
+STREAM_BATCH_SIZE = 10000
+
+
+def column_length(columns: Dict[str, Any]) -> int:
+    """
+    Retrieves the common length of the given columns, ignoring missing and scalar ones.
+
+    Args:
+        columns (dict): The columns by name.
+
+    Returns:
+        int: The number of rows.
+
+    Raises:
+        ValueError: If no column has values or the columns differ in length.
+    """
+    lengths = {
+        name: len(values) for name, values in columns.items()
+        if values is not None and not _is_scalar(values) and hasattr(values, "__len__")
+    }
+    if not lengths:
+        raise ValueError("At least one column of values must be provided.")
+    length = max(lengths.values())
+    mismatched = [f"{name} ({count})" for name, count in lengths.items() if count != length]
+    if mismatched:
+        raise ValueError(f"All columns must have {length} values, got: {', '.join(mismatched)}")
+    return length
+
+
+def collect_columns(columns: Dict[str, Any], frame: Any = None) -> Dict[str, Optional[list]]:
+    """
+    Converts the columns of a record insert to lists of equal length.
+
+    Columns that are None are taken from the DataFrame, if it has a column of the same name.
+
+    Args:
+        columns (dict): The columns by record field name.
+        frame (pandas.DataFrame, optional): Further columns, one row per record.
+
+    Returns:
+        dict: The columns as lists, or None for columns that were not given.
+    """
+    columns = dict(columns)
+    if frame is not None:
+        for name, values in frame_columns(frame, list(columns)).items():
+            if columns[name] is None:
+                columns[name] = values
+    length = column_length(columns)
+    return {name: to_list(values, length) for name, values in columns.items()}
+
+
+def frame_columns(frame: Any, names: Sequence[str]) -> Dict[str, Any]:
+    """
+    Retrieves the columns of a DataFrame that match record field names.
+
+    Args:
+        frame (pandas.DataFrame): The frame, one row per record.
+        names (Sequence[str]): The record field names to look for, e.g. `timestamp` or `plot_number`.
+
+    Returns:
+        dict: The matching columns, keyed by field name.
+    """
+    return {name: frame[name] for name in names if name in frame.columns}
+
+
+def to_list(values: Any, length: int) -> Optional[list]:
+    """
+    Converts a column to a list of Python values.
+
+    Scalars are repeated for every row. NumPy and pandas datetimes become `datetime` objects.
+
+    Args:
+        values: A list, NumPy array, pandas Series or scalar. None is passed through.
+        length (int): The number of rows.
+
+    Returns:
+        list: The values, or None if `values` is None.
+    """
+    if values is None:
+        return None
+    if _is_scalar(values):
+        return [values] * length
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and dtype.kind == "M":
+        if hasattr(values, "dt"):
+            values = values.dt.to_pydatetime()
+        else:
+            values = values.astype("datetime64[us]")
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def timestamp_column(values: list, name: str = "timestamps") -> List[datetime]:
+    """
+    Checks a timestamp column, parsing ISO 8601 strings.
+
+    Raises:
+        ValueError: If a value is missing or not a timestamp.
+    """
+    converted = [datetime.fromisoformat(value) if isinstance(value, str) else value for value in values]
+    _check(converted, name, lambda value: isinstance(value, datetime), "a datetime")
+    return converted
+
+
+def date_column(values: list, name: str = "collection_date") -> List[date]:
+    """
+    Checks a date column, parsing ISO 8601 strings and taking the date of timestamps.
+
+    Raises:
+        ValueError: If a value is missing or not a date.
+    """
+    converted = [
+        date.fromisoformat(value) if isinstance(value, str)
+        else value.date() if isinstance(value, datetime)
+        else value
+        for value in values
+    ]
+    _check(converted, name, lambda value: isinstance(value, date), "a date")
+    return converted
+
+
+def int_column(values: Optional[list], name: str) -> Optional[List[Optional[int]]]:
+    """
+    Checks an integer column. Missing values (None or NaN) become None.
+
+    Raises:
+        ValueError: If a value is not integral.
+    """
+    if values is None:
+        return None
+    converted = [None if _is_missing(value) else value for value in values]
+    _check(converted, name, lambda value: value is None or float(value).is_integer(), "an integer")
+    return [None if value is None else int(value) for value in converted]
+
+
+def float_column(values: Optional[list], name: str, required: bool = False) -> Optional[List[Optional[float]]]:
+    """
+    Checks a numeric column. Missing values (None or NaN) become None.
+
+    Raises:
+        ValueError: If a value is not numeric, or is missing while required.
+    """
+    if values is None:
+        return None
+    converted = [None if _is_missing(value) else value for value in values]
+    _check(
+        converted, name,
+        lambda value: (value is not None or not required) and (value is None or isinstance(value, (int, float))),
+        "a number"
+    )
+    return [None if value is None else float(value) for value in converted]
+
+
+def dict_column(values: Optional[list], name: str) -> Optional[List[Optional[dict]]]:
+    """
+    Checks a column of JSON objects. Missing values become None.
+
+    Raises:
+        ValueError: If a value is not a dictionary.
+    """
+    if values is None:
+        return None
+    _check(values, name, lambda value: value is None or isinstance(value, dict), "a dictionary")
+    return values
+
+
+def check_plot_columns(plot_numbers: Optional[list], plot_row_numbers: Optional[list], plot_column_numbers: Optional[list]) -> None:
+    """
+    Checks that each row has either all three plot coordinates or none.
+
+    Raises:
+        ValueError: If a row has only some of the plot coordinates.
+    """
+    columns = [column for column in (plot_numbers, plot_row_numbers, plot_column_numbers) if column is not None]
+    if not columns:
+        return
+    if len(columns) < 3:
+        raise ValueError("Plot number, plot row number, and plot column number are required if a plot is specified.")
+    partial = sum(
+        1 for coordinates in zip(*columns)
+        if any(value is None for value in coordinates) and any(value is not None for value in coordinates)
+    )
+    if partial:
+        raise ValueError(f"{partial} rows have only some of plot number, plot row number, and plot column number.")
+
+
+def build_rows(shared: Dict[str, Any], columns: Dict[str, Optional[list]]) -> List[Dict[str, Any]]:
+    """
+    Builds insert rows from the values shared by every row and the per-row columns.
+
+    Missing values are left out of each row, as `insert` does for records.
+
+    Examples:
+        >>> build_rows({"sensor_name": "Sensor A"}, {"timestamp": [t1, t2], "plot_number": [1, None]})
+        [{'sensor_name': 'Sensor A', 'timestamp': t1, 'plot_number': 1}, {'sensor_name': 'Sensor A', 'timestamp': t2}]
+
+    Args:
+        shared (dict): Values of every row, e.g. the sensor and dataset names.
+        columns (dict): Per-row values by field name. Columns that are None are skipped.
+
+    Returns:
+        List[dict]: One row per record.
+    """
+    shared = {name: value for name, value in shared.items() if value is not None}
+    names = [name for name, values in columns.items() if values is not None]
+    rows = []
+    for values in zip(*(columns[name] for name in names)):
+        row = shared.copy()
+        row.update((name, value) for name, value in zip(names, values) if value is not None)
+        rows.append(row)
+    return rows
+
+
+def is_streamed(*columns: Any) -> bool:
+    """
+    Checks whether any of the columns is an iterable of unknown length, e.g. a generator.
+
+    Args:
+        *columns: The columns. None and scalars are ignored.
+
+    Returns:
+        bool: True if a column has to be read in batches.
+    """
+    return any(
+        values is not None and not _is_scalar(values) and not hasattr(values, "__len__")
+        for values in columns
+    )
+
+
+def iter_column_batches(columns: Dict[str, Any], batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Reads iterable columns together in batches of rows.
+
+    Scalars and None are passed through to every batch unchanged, empty lists become None.
+
+    Examples:
+        >>> batches = iter_column_batches({"timestamps": read_log_timestamps(), "sensor_data": read_log_values(), "dataset_name": "Log"}, 2)
+        >>> next(batches)
+        {'timestamps': [t1, t2], 'sensor_data': [{...}, {...}], 'dataset_name': 'Log'}
+
+    Args:
+        columns (dict): The columns by name, lists, arrays or generators.
+        batch_size (int, optional): Rows per batch. Defaults to 10000.
+
+    Yields:
+        dict: The columns of the next batch, iterables as lists.
+
+    Raises:
+        ValueError: If the iterable columns differ in length.
+    """
+    columns = {
+        name: None if isinstance(values, (list, tuple)) and not values else values
+        for name, values in columns.items()
+    }
+    names = [name for name, values in columns.items() if values is not None and not _is_scalar(values)]
+    if not names:
+        raise ValueError("At least one column of values must be provided.")
+    rows = zip(*(columns[name] for name in names), strict=True)
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            return
+        batch = dict(columns)
+        for name, values in zip(names, zip(*chunk)):
+            batch[name] = list(values)
+        yield batch
+
+
+def _is_scalar(values: Any) -> bool:
+    return isinstance(values, (str, bytes, dict, date)) or not hasattr(values, "__iter__")
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _check(values: list, name: str, is_valid: Callable[[Any], bool], expected: str) -> None:
+    invalid = [index for index, value in enumerate(values) if not is_valid(value)]
+    if invalid:
+        raise ValueError(
+            f"{len(invalid)} values of {name} are not {expected}, "
+            f"first at row {invalid[0]}: {values[invalid[0]]!r}"
+        )
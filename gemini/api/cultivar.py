@@ -215,6 +215,33 @@ class Cultivar(APIBase):
         except Exception as e:
             print(f"Error getting cultivar by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Cultivar"]:
+        """
+        Asynchronously get a cultivar by its ID.
+
+        Examples:
+            >>> cultivar = await Cultivar.get_by_id_async(UUID(...))
+            >>> print(cultivar)
+            Cultivar(cultivar_population=Wheat, cultivar_accession=Accession123, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the cultivar.
+
+        Returns:
+            Optional["Cultivar"]: The cultivar, or None if not found.
+        """
+        try:
+            db_instance = await CultivarModel.get_async(id)
+            if not db_instance:
+                print(f"Cultivar with ID {id} does not exist.")
+                return None
+            cultivar = cls.model_validate(db_instance)
+            return cultivar
+        except Exception as e:
+            print(f"Error getting cultivar by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["Cultivar"]]:
@@ -242,6 +269,33 @@ class Cultivar(APIBase):
         except Exception as e:
             print(f"Error getting all cultivars: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Cultivar"]]:
+        """
+        Asynchronously get all cultivars.
+
+        Examples:
+            >>> cultivars = await Cultivar.get_all_async()
+            >>> for cultivar in cultivars:
+            ...     print(cultivar)
+            Cultivar(cultivar_population=Wheat, cultivar_accession=Accession123, id=UUID(...))
+            Cultivar(cultivar_population=Corn, cultivar_accession=Accession456, id=UUID(...))
+
+
+        Returns:
+            Optional[List["Cultivar"]]: A list of all cultivars, or None if an error occurred.
+        """
+        try:
+            cultivars = await CultivarModel.all_async()
+            if not cultivars or len(cultivars) == 0:
+                print("No cultivars found.")
+                return None
+            cultivars = [cls.model_validate(cultivar) for cultivar in cultivars]
+            return cultivars
+        except Exception as e:
+            print(f"Error getting all cultivars: {e}")
+            return None
         
     @classmethod
     def search(
@@ -288,6 +342,139 @@ class Cultivar(APIBase):
         except Exception as e:
             print(f"Error searching cultivars: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls, 
+        cultivar_population: str = None,
+        cultivar_accession: str = None,
+        cultivar_info: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["Cultivar"]]:
+        """
+        Asynchronously search for cultivars based on various criteria.
+
+        Examples:
+            >>> cultivars = await Cultivar.search_async(cultivar_population="Wheat")
+            >>> for cultivar in cultivars:
+            ...     print(cultivar)
+            Cultivar(cultivar_population=Wheat, cultivar_accession=Accession123, id=UUID(...))
+            Cultivar(cultivar_population=Wheat, cultivar_accession=Accession456, id=UUID(...))
+
+        Args:
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            cultivar_accession (str, optional): The accession number of the cultivar. Defaults to None.
+            cultivar_info (dict, optional): Additional information about the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+
+        Returns:
+            Optional[List["Cultivar"]]: A list of matching cultivars, or None if an error occurred.
+        """
+        try:
+            if not any([experiment_name, cultivar_population, cultivar_accession, cultivar_info]):
+                print("At least one search parameter must be provided.")
+                return None
+            cultivars = await ExperimentCultivarsViewModel.search_async(
+                experiment_name=experiment_name,
+                cultivar_population=cultivar_population,
+                cultivar_accession=cultivar_accession,
+                cultivar_info=cultivar_info,
+            )
+            if not cultivars or len(cultivars) == 0:
+                print("No cultivars found with the provided search parameters.")
+                return None
+            cultivars = [cls.model_validate(cultivar) for cultivar in cultivars]
+            return cultivars
+        except Exception as e:
+            print(f"Error searching cultivars: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        cultivar_population: str = None,
+        cultivar_accession: str = None,
+        cultivar_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Cultivar"], Optional[str]]:
+        """
+        Retrieve a page of cultivars using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> cultivars, next_cursor = Cultivar.paginate(page_limit=50)
+            >>> more_cultivars, next_cursor = Cultivar.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of cultivars in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            cultivar_accession (str, optional): The accession number of the cultivar. Defaults to None.
+            cultivar_info (dict, optional): Additional information about the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Cultivar], Optional[str]]: The cultivars in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([cultivar_population, cultivar_accession, cultivar_info, experiment_name]):
+            instances, next_cursor = ExperimentCultivarsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                cultivar_population=cultivar_population,
+                cultivar_accession=cultivar_accession,
+                cultivar_info=cultivar_info
+            )
+        else:
+            instances, next_cursor = CultivarModel.paginate(page_limit=page_limit, cursor=cursor)
+        cultivars = [cls.model_validate(instance) for instance in instances]
+        return cultivars, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        cultivar_population: str = None,
+        cultivar_accession: str = None,
+        cultivar_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Cultivar"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of cultivars using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> cultivars, next_cursor = await Cultivar.paginate_async(page_limit=50)
+            >>> more_cultivars, next_cursor = await Cultivar.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of cultivars in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            cultivar_accession (str, optional): The accession number of the cultivar. Defaults to None.
+            cultivar_info (dict, optional): Additional information about the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Cultivar], Optional[str]]: The cultivars in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([cultivar_population, cultivar_accession, cultivar_info, experiment_name]):
+            instances, next_cursor = await ExperimentCultivarsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                cultivar_population=cultivar_population,
+                cultivar_accession=cultivar_accession,
+                cultivar_info=cultivar_info
+            )
+        else:
+            instances, next_cursor = await CultivarModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        cultivars = [cls.model_validate(instance) for instance in instances]
+        return cultivars, next_cursor
+
         
     def update(
         self,
@@ -335,6 +522,53 @@ class Cultivar(APIBase):
         except Exception as e:
             print(f"Error updating cultivar: {e}")
             return None
+
+    async def update_async(
+        self,
+        cultivar_accession: str = None,
+        cultivar_population: str = None,
+        cultivar_info: dict = None,
+    ) -> Optional["Cultivar"]:
+        """
+        Asynchronously update the details of the cultivar.
+
+        Examples:
+            >>> cultivar = Cultivar.get("Wheat", "Accession123")
+            >>> updated_cultivar = await cultivar.update_async(cultivar_accession="NewAccession")
+            >>> print(updated_cultivar)
+            Cultivar(cultivar_population=Wheat, cultivar_accession=NewAccession, id=UUID(...))
+            
+
+        Args:
+            cultivar_accession (str, optional): The new accession number. Defaults to None.
+            cultivar_population (str, optional): The new population. Defaults to None.
+            cultivar_info (dict, optional): The new information. Defaults to None.
+
+        Returns:
+            Optional["Cultivar"]: The updated cultivar, or None if an error occurred.
+        """
+        try:
+            if not any([cultivar_accession, cultivar_population, cultivar_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+            
+            current_id = self.id
+            cultivar = await CultivarModel.get_async(current_id)
+            if not cultivar:
+                print(f"Cultivar with ID {current_id} does not exist.")
+                return None
+            cultivar = await CultivarModel.update_async(
+                cultivar,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population,
+                cultivar_info=cultivar_info,
+            )
+            cultivar = self.model_validate(cultivar)
+            await self.refresh_async()
+            return cultivar
+        except Exception as e:
+            print(f"Error updating cultivar: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -359,6 +593,30 @@ class Cultivar(APIBase):
             return True
         except Exception as e:
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the cultivar.
+
+        Examples:
+            >>> cultivar = Cultivar.get("Wheat", "Accession123")
+            >>> success = await cultivar.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the cultivar was deleted successfully, False otherwise.
+        """
+        try:
+            current_id = self.id
+            cultivar = await CultivarModel.get_async(current_id)
+            if not cultivar:
+                print(f"Cultivar with ID {current_id} does not exist.")
+                return False
+            await CultivarModel.delete_async(cultivar)
+            return True
+        except Exception as e:
+            return False
         
     
     def refresh(self) -> Optional["Cultivar"]:
@@ -388,6 +646,34 @@ class Cultivar(APIBase):
         except Exception as e:
             print(f"Error refreshing cultivar: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Cultivar"]:
+        """
+        Asynchronously refresh the cultivar's data from the database. It is rarely needed to be called by the user,
+        as the data is automatically refreshed when accessed.
+
+        Examples:
+            >>> cultivar = Cultivar.get("Wheat", "Accession123")
+            >>> refreshed_cultivar = await cultivar.refresh_async()
+            >>> print(refreshed_cultivar)
+            Cultivar(cultivar_population=Wheat, cultivar_accession=Accession123, id=UUID(...))
+
+        Returns:
+            Optional["Cultivar"]: The refreshed cultivar, or None if an error occurred.
+        """
+        try:
+            db_instance = await CultivarModel.get_async(self.id)
+            if not db_instance:
+                print(f"Cultivar with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing cultivar: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -183,6 +183,33 @@ class DataFormat(APIBase):
             print(f"Error getting data format by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["DataFormat"]:
+        """
+        Asynchronously get a data format by its ID.
+
+        Examples:
+            >>> data_format = await DataFormat.get_by_id_async(...)
+            >>> print(data_format)
+            DataFormat(data_format_name=JSON, data_format_mime_type=application/json, id=...)
+
+        Args:
+            id (UUID | int | str): The ID of the data format.
+
+        Returns:
+            Optional["DataFormat"]: The data format, or None if not found.
+        """
+        try:
+            db_instance = await DataFormatModel.get_async(id)
+            if not db_instance:
+                print(f"Data format with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting data format by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["DataFormat"]]:
         """
@@ -209,6 +236,32 @@ class DataFormat(APIBase):
             print(f"Error getting all data formats: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["DataFormat"]]:
+        """
+        Asynchronously get all data formats.
+
+        Examples:
+            >>> all_formats = await DataFormat.get_all_async()
+            >>> for fmt in all_formats:
+            ...     print(fmt)
+            DataFormat(data_format_name=CSV, data_format_mime_type=text/csv, id=...)
+            DataFormat(data_format_name=JSON, data_format_mime_type=application/json, id=...)
+
+        Returns:
+            Optional[List["DataFormat"]]: A list of all data formats, or None if an error occurred.
+        """
+        try:
+            instances = await DataFormatModel.all_async()
+            if not instances or len(instances) == 0:
+                print("No data formats found.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error getting all data formats: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -253,6 +306,131 @@ class DataFormat(APIBase):
             print(f"Error searching data formats: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        data_format_name: str = None,
+        data_format_mime_type: str = None,
+        data_format_info: dict = None
+    ) -> Optional[List["DataFormat"]]:
+        """
+        Asynchronously search for data formats based on various criteria.
+
+        Examples:
+            >>> formats = await DataFormat.search_async(data_format_name="CSV")
+            >>> for fmt in formats:
+            ...     print(fmt)
+            DataFormat(data_format_name=CSV, data_format_mime_type=text/csv, id=...)
+            
+
+        Args:
+            data_format_name (str, optional): The name of the data format. Defaults to None.
+            data_format_mime_type (str, optional): The MIME type of the data format. Defaults to None.
+            data_format_info (dict, optional): Additional information about the data format. Defaults to None.
+
+        Returns:
+            Optional[List["DataFormat"]]: A list of matching data formats, or None if an error occurred.
+        """
+        try:
+            if not any([data_format_name, data_format_mime_type, data_format_info]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            data_formats = await DataFormatModel.search_async(
+                data_format_name=data_format_name,
+                data_format_mime_type=data_format_mime_type,
+                data_format_info=data_format_info,
+            )
+            if not data_formats or len(data_formats) == 0:
+                print("No data formats found with the provided search parameters.")
+                return None
+            data_formats = [cls.model_validate(data_format) for data_format in data_formats]
+            return data_formats
+        except Exception as e:
+            print(f"Error searching data formats: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        data_format_name: str = None,
+        data_format_mime_type: str = None,
+        data_format_info: dict = None
+    ) -> tuple[List["DataFormat"], Optional[str]]:
+        """
+        Retrieve a page of data formats using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> data_formats, next_cursor = DataFormat.paginate(page_limit=50)
+            >>> more_data_formats, next_cursor = DataFormat.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of data formats in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            data_format_name (str, optional): The name of the data format. Defaults to None.
+            data_format_mime_type (str, optional): The MIME type of the data format. Defaults to None.
+            data_format_info (dict, optional): Additional information about the data format. Defaults to None.
+        Returns:
+            tuple[List[DataFormat], Optional[str]]: The data formats in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([data_format_name, data_format_mime_type, data_format_info]):
+            instances, next_cursor = DataFormatModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                data_format_name=data_format_name,
+                data_format_mime_type=data_format_mime_type,
+                data_format_info=data_format_info
+            )
+        else:
+            instances, next_cursor = DataFormatModel.paginate(page_limit=page_limit, cursor=cursor)
+        data_formats = [cls.model_validate(instance) for instance in instances]
+        return data_formats, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        data_format_name: str = None,
+        data_format_mime_type: str = None,
+        data_format_info: dict = None
+    ) -> tuple[List["DataFormat"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of data formats using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> data_formats, next_cursor = await DataFormat.paginate_async(page_limit=50)
+            >>> more_data_formats, next_cursor = await DataFormat.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of data formats in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            data_format_name (str, optional): The name of the data format. Defaults to None.
+            data_format_mime_type (str, optional): The MIME type of the data format. Defaults to None.
+            data_format_info (dict, optional): Additional information about the data format. Defaults to None.
+        Returns:
+            tuple[List[DataFormat], Optional[str]]: The data formats in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([data_format_name, data_format_mime_type, data_format_info]):
+            instances, next_cursor = await DataFormatModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                data_format_name=data_format_name,
+                data_format_mime_type=data_format_mime_type,
+                data_format_info=data_format_info
+            )
+        else:
+            instances, next_cursor = await DataFormatModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        data_formats = [cls.model_validate(instance) for instance in instances]
+        return data_formats, next_cursor
+
+
     def update(
         self,
         data_format_name: str = None,
@@ -305,6 +483,58 @@ class DataFormat(APIBase):
             print(f"Error updating data format: {e}")
             return None
 
+    async def update_async(
+        self,
+        data_format_name: str = None,
+        data_format_mime_type: str = None,
+        data_format_info: dict = None,
+    ) -> Optional["DataFormat"]:
+        """
+        Asynchronously update the details of the data format.
+
+        Examples:
+            >>> data_format = DataFormat.get("CSV")
+            >>> updated_format = await data_format.update_async(
+            ...     data_format_name="Updated CSV",
+            ...     data_format_mime_type="text/csv",
+            ...     data_format_info={"version": "2.0"}
+            ... )
+            >>> print(updated_format)
+            DataFormat(data_format_name=Updated CSV, data_format_mime_type=text/csv, id=...)
+
+
+        Args:
+            data_format_name (str, optional): The new name of the data format. Defaults to None.
+            data_format_mime_type (str, optional): The new MIME type. Defaults to None.
+            data_format_info (dict, optional): The new information. Defaults to None.
+
+        Returns:
+            Optional["DataFormat"]: The updated data format, or None if an error occurred.
+        """
+        try:
+            if not any([data_format_name, data_format_mime_type, data_format_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            data_format = await DataFormatModel.get_async(current_id)
+            if not data_format:
+                print(f"Data format with ID {current_id} does not exist.")
+                return None
+
+            data_format = await DataFormatModel.update_async(
+                data_format,
+                data_format_name=data_format_name,
+                data_format_mime_type=data_format_mime_type,
+                data_format_info=data_format_info,
+            )
+            instance = self.model_validate(data_format)
+            await self.refresh_async() # Refresh self with updated data
+            return instance # Return the validated instance
+        except Exception as e:
+            print(f"Error updating data format: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the data format.
@@ -330,6 +560,31 @@ class DataFormat(APIBase):
             print(f"Error deleting data format: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the data format.
+
+        Examples:
+            >>> data_format = DataFormat.get("CSV")
+            >>> success = await data_format.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the data format was deleted successfully, False otherwise.
+        """
+        try:
+            current_id = self.id
+            data_format = await DataFormatModel.get_async(current_id)
+            if not data_format:
+                print(f"Data format with ID {current_id} does not exist.")
+                return False
+            await DataFormatModel.delete_async(data_format)
+            return True
+        except Exception as e:
+            print(f"Error deleting data format: {e}")
+            return False
+
     def refresh(self) -> Optional["DataFormat"]:
         """
         Refresh the data format's data from the database. It is rarely called by the user
@@ -360,6 +615,36 @@ class DataFormat(APIBase):
             print(f"Error refreshing data format: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["DataFormat"]:
+        """
+        Asynchronously refresh the data format's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> data_format = DataFormat.get("CSV")
+            >>> refreshed_format = await data_format.refresh_async()
+            >>> print(refreshed_format)
+            DataFormat(data_format_name=CSV, data_format_mime_type=text/csv, id=...)
+
+
+        Returns:
+            Optional["DataFormat"]: The refreshed data format, or None if an error occurred.
+        """
+        try:
+            db_instance = await DataFormatModel.get_async(self.id)
+            if not db_instance:
+                print(f"Data format with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            # Update self attributes
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing data format: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the data format.
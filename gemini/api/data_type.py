@@ -167,6 +167,31 @@ class DataType(APIBase):
             print(f"Error getting data type by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["DataType"]:
+        """
+        Asynchronously retrieve a data type by its ID.
+
+        Examples:
+            >>> await DataType.get_by_id_async(...)  
+            DataType(data_type_name="Temperature", id=...)
+
+        Args:
+            id (UUID | int | str): The ID of the data type.
+        Returns:
+            Optional["DataType"]: The data type, or None if not found.
+        """
+        try:
+            db_instance = await DataTypeModel.get_async(id)
+            if not db_instance:
+                print(f"Data type with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting data type by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["DataType"]]:
         """
@@ -191,6 +216,30 @@ class DataType(APIBase):
             print(f"Error getting all data types: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["DataType"]]:
+        """
+        Asynchronously retrieve all data types.
+
+        Examples:
+            >>> await DataType.get_all_async()
+            [DataType(data_type_name="Temperature", id=...), DataType(data_type_name="Yield", id=...)]
+
+
+        Returns:
+            Optional[List["DataType"]]: A list of all data types, or None if an error occurred.
+        """
+        try:
+            instances = await DataTypeModel.all_async()
+            if not instances or len(instances) == 0:
+                print("No data types found.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error getting all data types: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -228,6 +277,118 @@ class DataType(APIBase):
             print(f"Error searching data types: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        data_type_name: str = None,
+        data_type_info: dict = None
+    ) -> Optional[List["DataType"]]:
+        """
+        Asynchronously search for data types based on various criteria.
+
+        Examples:
+            >>> await DataType.search_async(data_type_name="Temperature")
+            [DataType(data_type_name="Temperature", id=...)]
+
+        Args:
+            data_type_name (str, optional): The name of the data type. Defaults to None.
+            data_type_info (dict, optional): Additional information about the data type. Defaults to None.
+        Returns:
+            Optional[List["DataType"]]: A list of matching data types, or None if an error occurred.
+        """
+        try:
+            if not any([data_type_name, data_type_info]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            instances = await DataTypeModel.search_async(
+                data_type_name=data_type_name,
+                data_type_info=data_type_info
+            )
+            if not instances or len(instances) == 0:
+                print("No data types found with the provided search parameters.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error searching data types: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        data_type_name: str = None,
+        data_type_info: dict = None
+    ) -> tuple[List["DataType"], Optional[str]]:
+        """
+        Retrieve a page of data types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> data_types, next_cursor = DataType.paginate(page_limit=50)
+            >>> more_data_types, next_cursor = DataType.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of data types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            data_type_name (str, optional): The name of the data type. Defaults to None.
+            data_type_info (dict, optional): Additional information about the data type. Defaults to None.
+        Returns:
+            tuple[List[DataType], Optional[str]]: The data types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([data_type_name, data_type_info]):
+            instances, next_cursor = DataTypeModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                data_type_name=data_type_name,
+                data_type_info=data_type_info
+            )
+        else:
+            instances, next_cursor = DataTypeModel.paginate(page_limit=page_limit, cursor=cursor)
+        data_types = [cls.model_validate(instance) for instance in instances]
+        return data_types, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        data_type_name: str = None,
+        data_type_info: dict = None
+    ) -> tuple[List["DataType"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of data types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> data_types, next_cursor = await DataType.paginate_async(page_limit=50)
+            >>> more_data_types, next_cursor = await DataType.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of data types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            data_type_name (str, optional): The name of the data type. Defaults to None.
+            data_type_info (dict, optional): Additional information about the data type. Defaults to None.
+        Returns:
+            tuple[List[DataType], Optional[str]]: The data types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([data_type_name, data_type_info]):
+            instances, next_cursor = await DataTypeModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                data_type_name=data_type_name,
+                data_type_info=data_type_info
+            )
+        else:
+            instances, next_cursor = await DataTypeModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        data_types = [cls.model_validate(instance) for instance in instances]
+        return data_types, next_cursor
+
+
     def update(
         self,
         data_type_name: str = None,
@@ -271,6 +432,49 @@ class DataType(APIBase):
             print(f"Error updating data type: {e}")
             return None
 
+    async def update_async(
+        self,
+        data_type_name: str = None,
+        data_type_info: dict = None,
+    ) -> Optional["DataType"]:
+        """
+        Asynchronously update the details of the data type.
+
+        Examples:
+            >>> data_type = DataType.get("Temperature")
+            >>> updated_data_type = await data_type.update_async(data_type_name="New Temperature", data_type_info={"unit": "Fahrenheit"})
+            >>> print(updated_data_type)
+            DataType(data_type_name="New Temperature", id=...)
+
+        Args:
+            data_type_name (str, optional): The new name of the data type. Defaults to None.
+            data_type_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional["DataType"]: The updated data type, or None if an error occurred.
+        """
+        try:
+            if not any([data_type_name, data_type_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            data_type = await DataTypeModel.get_async(current_id)
+            if not data_type:
+                print(f"Data type with ID {current_id} does not exist.")
+                return None
+
+            data_type = await DataTypeModel.update_async(
+                data_type,
+                data_type_name=data_type_name,
+                data_type_info=data_type_info
+            )
+            instance = self.model_validate(data_type)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating data type: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the data type.
@@ -296,6 +500,31 @@ class DataType(APIBase):
             print(f"Error deleting data type: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the data type.
+
+        Examples:
+            >>> data_type = DataType.get("Temperature")
+            >>> success = await data_type.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the data type was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            data_type = await DataTypeModel.get_async(current_id)
+            if not data_type:
+                print(f"Data type with ID {current_id} does not exist.")
+                return False
+            await DataTypeModel.delete_async(data_type)
+            return True
+        except Exception as e:
+            print(f"Error deleting data type: {e}")
+            return False
+
     def refresh(self) -> Optional["DataType"]:
         """
         Refresh the data type's data from the database. It is rarely called by the user
@@ -324,6 +553,34 @@ class DataType(APIBase):
             print(f"Error refreshing data type: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["DataType"]:
+        """
+        Asynchronously refresh the data type's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> data_type = DataType.get("Temperature")
+            >>> refreshed_data_type = await data_type.refresh_async()
+            >>> print(refreshed_data_type)
+            DataType(data_type_name="Temperature", id=...)
+
+        Returns:
+            Optional["DataType"]: The refreshed data type, or None if an error occurred.
+        """
+        try:
+            db_instance = await DataTypeModel.get_async(self.id)
+            if not db_instance:
+                print(f"Data type with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing data type: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the data type.
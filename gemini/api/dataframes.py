@@ -0,0 +1,99 @@
+"""
+Column-wise pandas DataFrame export for GEMINI records.
+
+Result rows are read from the database cursor in chunks and transposed
+into one list per column, so a frame is built without creating a record
+object or dictionary per row. JSON columns such as `sensor_data` and
+`record_info` can be flattened into one column per key.
+
+pandas is imported on first use.
+"""
+
+from itertools import islice
+from typing import Any, Iterable, List, Optional, Sequence
+
+from gemini.api.rows import field_aliases
+
+# Rows transposed into columns at a time
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def json_fields(api_class: type) -> List[str]:
+    """
+    Retrieves the fields of an API class that hold JSON objects, e.g. `sensor_data` and `record_info`.
+
+    Args:
+        api_class (type): The API class, e.g. `SensorRecord`.
+
+    Returns:
+        List[str]: The names of the dictionary typed fields.
+    """
+    return [
+        name for name, field in api_class.model_fields.items()
+        if field.annotation is dict or dict in getattr(field.annotation, "__args__", ())
+    ]
+
+
+def records_to_dataframe(
+    api_class: type,
+    rows: Iterable[Any],
+    flatten: bool = False,
+    flatten_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Any:
+    """
+    Builds a DataFrame column by column from result rows.
+
+    Columns are named after the fields of the API class, e.g. `sensor_record_id` becomes `id`.
+
+    Examples:
+        >>> frame = records_to_dataframe(SensorRecord, SensorRecordsIMMVModel.stream_rows(sensor_name="Sensor A"), flatten=True)
+        >>> frame.columns[:3].tolist()
+        ['id', 'timestamp', 'collection_date']
+
+    Args:
+        api_class (type): The API class whose fields name the columns.
+        rows (Iterable): Result rows, e.g. from `stream_rows` or `filter_records`.
+        flatten (bool, optional): Expand the JSON fields of the API class into one column per key. Defaults to False.
+        flatten_columns (Sequence[str], optional): The JSON columns to expand. Defaults to all JSON fields if flatten is set.
+        chunk_size (int, optional): The number of rows transposed at a time. Defaults to 10000.
+
+    Returns:
+        pandas.DataFrame: One row per record.
+    """
+    import pandas as pd
+
+    iterator = iter(rows)
+    chunk = list(islice(iterator, chunk_size))
+    if not chunk:
+        return pd.DataFrame(columns=list(api_class.model_fields))
+
+    keys = list(chunk[0]._fields)
+    columns: List[list] = [[] for _ in keys]
+    while chunk:
+        for column, values in zip(columns, zip(*chunk)):
+            column.extend(values)
+        chunk = list(islice(iterator, chunk_size))
+
+    names = {
+        alias: field
+        for field, aliases in field_aliases(api_class).items()
+        for alias in reversed(aliases)
+    }
+    frame = pd.DataFrame({names.get(key, key): column for key, column in zip(keys, columns)})
+
+    if flatten or flatten_columns:
+        for name in flatten_columns or json_fields(api_class):
+            if name in frame.columns:
+                frame = _flatten_column(pd, frame, name)
+    return frame
+
+
+def _flatten_column(pd: Any, frame: Any, name: str) -> Any:
+    values = [value if isinstance(value, dict) else {} for value in frame[name]]
+    expanded = pd.json_normalize(values, sep=".")
+    if expanded.empty:
+        return frame.drop(columns=[name])
+    expanded.columns = [f"{name}.{key}" for key in expanded.columns]
+    expanded.index = frame.index
+    return pd.concat([frame.drop(columns=[name]), expanded], axis=1)
@@ -24,16 +24,18 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
 from gemini.api.base import APIBase
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.api.enums import GEMINIDatasetType
 from gemini.api.dataset_type import DatasetType
 from gemini.api.dataset_record import DatasetRecord
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.datasets import DatasetModel
 from gemini.db.models.dataset_types import DatasetTypeModel
 from gemini.db.models.associations import ExperimentDatasetModel
@@ -42,6 +44,8 @@ from gemini.db.models.views.experiment_views import ExperimentDatasetsViewModel
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from gemini.api.journal import IngestionJournal
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment  # Avoid circular import issues
 
 class Dataset(APIBase):
@@ -161,6 +165,9 @@ class Dataset(APIBase):
             Optional["Dataset"]: The retrieved dataset, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, dataset_name=dataset_name, experiment_name=experiment_name)
+            if cached is not None:
+                return cached
             db_instance = ExperimentDatasetsViewModel.get_by_parameters(
                 dataset_name=dataset_name,
                 experiment_name=experiment_name
@@ -169,6 +176,7 @@ class Dataset(APIBase):
                 print(f"Dataset with name {dataset_name} not found.")
                 return None
             dataset = cls.model_validate(db_instance)
+            entity_cache.put(cls, dataset, dataset_name=dataset_name, experiment_name=experiment_name)
             return dataset
         except Exception as e:
             print(f"Error getting dataset: {e}")
@@ -190,11 +198,45 @@ class Dataset(APIBase):
             Optional["Dataset"]: The retrieved dataset, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             db_instance = DatasetModel.get(id)
             if not db_instance:
                 print(f"Dataset with ID {id} does not exist.")
                 return None
             dataset = cls.model_validate(db_instance)
+            entity_cache.put(cls, dataset)
+            return dataset
+        except Exception as e:
+            print(f"Error getting dataset by ID: {e}")
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Dataset"]:
+        """
+        Asynchronously retrieve a dataset by its ID.
+
+        Examples:
+            >>> dataset = await Dataset.get_by_id_async(UUID('...'))
+            >>> print(dataset)
+            Dataset(dataset_name=my_dataset, collection_date=2023-10-01, dataset_type=Default, id=UUID('...'))
+
+        Args:
+            id (UUID | int | str): The ID of the dataset.
+        Returns:
+            Optional["Dataset"]: The retrieved dataset, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            db_instance = await DatasetModel.get_async(id)
+            if not db_instance:
+                print(f"Dataset with ID {id} does not exist.")
+                return None
+            dataset = cls.model_validate(db_instance)
+            entity_cache.put(cls, dataset)
             return dataset
         except Exception as e:
             print(f"Error getting dataset by ID: {e}")
@@ -225,6 +267,32 @@ class Dataset(APIBase):
         except Exception as e:
             print(f"Error getting all datasets: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Dataset"]]:
+        """
+        Asynchronously retrieve all datasets.
+
+        Examples:
+            >>> datasets = await Dataset.get_all_async()
+            >>> for dataset in datasets:
+            ...     print(dataset)
+            Dataset(dataset_name=my_dataset1, collection_date=2023-10-01, dataset_type=Default, id=UUID('...'))
+            Dataset(dataset_name=my_dataset2, collection_date=2023-10-02, dataset_type=Sensor, id=UUID('...'))
+
+        Returns:
+            Optional[List["Dataset"]]: A list of all datasets, or None if an error occurred.
+        """
+        try:
+            datasets = await DatasetModel.all_async()
+            if not datasets or len(datasets) == 0:
+                print("No datasets found.")
+                return None
+            datasets = [cls.model_validate(dataset) for dataset in datasets]
+            return datasets
+        except Exception as e:
+            print(f"Error getting all datasets: {e}")
+            return None
         
     @classmethod
     def search(
@@ -272,7 +340,148 @@ class Dataset(APIBase):
         except Exception as e:
             print(f"Error searching datasets: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        dataset_name: str = None,
+        dataset_info: dict = None,
+        dataset_type: GEMINIDatasetType = None,
+        collection_date: date = None,
+        experiment_name: str = None,
+    ) -> Optional[List["Dataset"]]:
+        """
+        Asynchronously search for datasets based on various criteria.
+
+        Examples:
+            >>> datasets = await Dataset.search_async(dataset_name="my_dataset")
+            >>> for dataset in datasets:
+            ...     print(dataset)
+            Dataset(dataset_name=my_dataset, collection_date=2023-10-01, dataset_type=Default, id=UUID('...'))
+
+        Args:
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_info (dict, optional): Additional information about the dataset. Defaults to None.
+            dataset_type (GEMINIDatasetType, optional): The type of the dataset. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List["Dataset"]]: A list of datasets matching the search criteria, or None if an error occurred.
+        """
+        try:
+            if not any([dataset_name, dataset_info, dataset_type, collection_date, experiment_name]):
+                print("At least one parameter must be provided.")
+                return None
+            datasets = await ExperimentDatasetsViewModel.search_async(
+                dataset_name=dataset_name,
+                dataset_info=dataset_info,
+                dataset_type=dataset_type,
+                collection_date=collection_date,
+                experiment_name=experiment_name
+            )
+            if not datasets or len(datasets) == 0:
+                print("No datasets found with the provided search parameters.")
+                return None
+            datasets = [cls.model_validate(dataset) for dataset in datasets]
+            return datasets
+        except Exception as e:
+            print(f"Error searching datasets: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        dataset_info: dict = None,
+        dataset_type: GEMINIDatasetType = None,
+        collection_date: date = None,
+        experiment_name: str = None
+    ) -> tuple[List["Dataset"], Optional[str]]:
+        """
+        Retrieve a page of datasets using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> datasets, next_cursor = Dataset.paginate(page_limit=50)
+            >>> more_datasets, next_cursor = Dataset.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of datasets in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_info (dict, optional): Additional information about the dataset. Defaults to None.
+            dataset_type (GEMINIDatasetType, optional): The type of the dataset. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Dataset], Optional[str]]: The datasets in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([dataset_name, dataset_info, dataset_type, collection_date, experiment_name]):
+            instances, next_cursor = ExperimentDatasetsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                dataset_name=dataset_name,
+                dataset_info=dataset_info,
+                dataset_type=dataset_type,
+                collection_date=collection_date,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = DatasetModel.paginate(page_limit=page_limit, cursor=cursor)
+        datasets = [cls.model_validate(instance) for instance in instances]
+        return datasets, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        dataset_info: dict = None,
+        dataset_type: GEMINIDatasetType = None,
+        collection_date: date = None,
+        experiment_name: str = None
+    ) -> tuple[List["Dataset"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of datasets using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> datasets, next_cursor = await Dataset.paginate_async(page_limit=50)
+            >>> more_datasets, next_cursor = await Dataset.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of datasets in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_info (dict, optional): Additional information about the dataset. Defaults to None.
+            dataset_type (GEMINIDatasetType, optional): The type of the dataset. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Dataset], Optional[str]]: The datasets in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([dataset_name, dataset_info, dataset_type, collection_date, experiment_name]):
+            instances, next_cursor = await ExperimentDatasetsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                dataset_name=dataset_name,
+                dataset_info=dataset_info,
+                dataset_type=dataset_type,
+                collection_date=collection_date,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await DatasetModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        datasets = [cls.model_validate(instance) for instance in instances]
+        return datasets, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         dataset_name: str = None,
@@ -319,7 +528,56 @@ class Dataset(APIBase):
         except Exception as e:
             print(f"Error updating dataset: {e}")
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        dataset_name: str = None,
+        dataset_info: dict = None,
+        dataset_type: GEMINIDatasetType = None,
+        collection_date: date = None
+    ) -> Optional["Dataset"]:
+        """
+        Asynchronously update the details of a dataset.
+
+        Examples:
+            >>> dataset = Dataset.get("my_dataset")
+            >>> updated_dataset = await dataset.update_async(dataset_name="new_dataset_name", dataset_info={"description": "Updated dataset"})
+            >>> print(updated_dataset)
+            Dataset(dataset_name=new_dataset_name, collection_date=2023-10-01, dataset_type=Default, id=UUID('...'))
+
+        Args:
+            dataset_name (str, optional): The new name of the dataset. Defaults to None.
+            dataset_info (dict, optional): The new additional information about the dataset. Defaults to None.
+            dataset_type (GEMINIDatasetType, optional): The new type of the dataset. Defaults to None.
+            collection_date (date, optional): The new collection date. Defaults to None.
+        Returns:
+            Optional["Dataset"]: The updated dataset, or None if an error occurred.
+        """
+        try:
+            if not any([dataset_name, dataset_info, dataset_type, collection_date]):
+                print("At least one parameter must be provided for update.")
+                return None
+            current_id = self.id
+            dataset = await DatasetModel.get_async(current_id)
+            if not dataset:
+                print(f"Dataset with ID {current_id} does not exist.")
+                return None
+            dataset = await DatasetModel.update_async(
+                dataset,
+                dataset_name=dataset_name,
+                dataset_info=dataset_info,
+                dataset_type_id=dataset_type.value if dataset_type else None,
+                collection_date=collection_date
+            )
+            dataset = self.model_validate(dataset)
+            await self.refresh_async()
+            return dataset
+        except Exception as e:
+            print(f"Error updating dataset: {e}")
+            return None
         
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete a dataset.
@@ -344,6 +602,32 @@ class Dataset(APIBase):
         except Exception as e:
             print(f"Error deleting dataset: {e}")
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete a dataset.
+
+        Examples:
+            >>> dataset = Dataset.get("my_dataset")
+            >>> success = await dataset.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the dataset was deleted successfully, False otherwise.
+        """
+        try:
+            current_id = self.id
+            dataset = await DatasetModel.get_async(current_id)
+            if not dataset:
+                print(f"Dataset with ID {current_id} does not exist.")
+                return False
+            await DatasetModel.delete_async(dataset)
+            return True
+        except Exception as e:
+            print(f"Error deleting dataset: {e}")
+            return False
         
     def refresh(self) -> Optional["Dataset"]:
         """
@@ -372,6 +656,34 @@ class Dataset(APIBase):
         except Exception as e:
             print(f"Error refreshing dataset: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Dataset"]:
+        """
+        Asynchronously refresh the dataset's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> dataset = Dataset.get("my_dataset")
+            >>> refreshed_dataset = await dataset.refresh_async()
+            >>> print(refreshed_dataset)
+            Dataset(dataset_name=my_dataset, collection_date=2023-10-01, dataset_type=Default, id=UUID('...'))
+
+        Returns:
+            Optional["Dataset"]: The refreshed dataset, or None if an error occurred.
+        """
+        try:
+            db_instance = await DatasetModel.get_async(self.id)
+            if not db_instance:
+                print(f"Dataset with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing dataset: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -401,6 +713,7 @@ class Dataset(APIBase):
             print(f"Error getting dataset info: {e}")
             return None
         
+    @invalidates_cached_entity
     def set_info(self, dataset_info: dict) -> Optional["Dataset"]:
         """
         Set the additional information of the dataset.
@@ -461,6 +774,7 @@ class Dataset(APIBase):
             print(f"Error getting associated experiments: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Associate the dataset with an experiment.
@@ -502,6 +816,7 @@ class Dataset(APIBase):
             print(f"Error associating dataset with experiment: {e}")
             return None 
 
+    @invalidates_cached_entity
     def unassociate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Unassociate the dataset from an experiment.
@@ -652,8 +967,13 @@ class Dataset(APIBase):
         season_name: str = None,
         site_name: str = None,
         record_files: List[str] = None,
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        record_info: List[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Add new records to the dataset.
 
@@ -681,8 +1001,13 @@ class Dataset(APIBase):
             site_name (str, optional): The name of the site. Defaults to None.
             record_files (List[str], optional): The files associated with the records. Defaults to None.
             record_info (List[dict], optional): Additional information about the records. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: A tuple containing a success flag and a list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name and not season_name and not site_name:
@@ -715,14 +1040,20 @@ class Dataset(APIBase):
                     insert_on_create=False
                 )
                 dataset_records.append(dataset_record)
-            success, inserted_record_ids = DatasetRecord.insert(dataset_records)
-            if not success:
+            result = DatasetRecord.insert(
+                dataset_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+            if not result.success:
                 print(f"Failed to add records for dataset {self.dataset_name}.")
-                return False, []
-            return success, inserted_record_ids
+            return result
         except Exception as e:
             print(f"Error adding records to dataset {self.dataset_name}: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     def search_records(
         self,
@@ -731,6 +1062,7 @@ class Dataset(APIBase):
         season_name: str = None,
         site_name: str = None,
         record_info: dict = None,
+        lightweight: bool = False,
     ) -> List[DatasetRecord]:
         """
         Search for records in the dataset.
@@ -754,6 +1086,7 @@ class Dataset(APIBase):
             season_name (str, optional): The name of the season. Defaults to None.
             site_name (str, optional): The name of the site. Defaults to None.
             record_info (dict, optional): Additional information about the records. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
         Returns:
             List[DatasetRecord]: A list of records matching the search criteria.
         """
@@ -767,7 +1100,61 @@ class Dataset(APIBase):
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching records in dataset {self.dataset_name}: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        record_info: dict = None,
+        lightweight: bool = False,
+    ) -> AsyncGenerator[DatasetRecord, None]:
+        """
+        Asynchronously search for records in the dataset.
+
+        Examples:
+            >>> dataset = Dataset.get("my_dataset")
+            >>> records = dataset.search_records_async(
+            ...     collection_date=date.today(),
+            ...     experiment_name="experiment1",
+            ...     season_name="season1",
+            ...     site_name="site1",
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            DatasetRecord(id=UUID(...), dataset_name='my_dataset', timestamp='2023-10-01T12:00:00', dataset_data={...}, experiment_name='experiment1', season_name='season1', site_name='site1')
+
+        Args:
+            collection_date (date, optional): The collection date of the records. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            record_info (dict, optional): Additional information about the records. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[DatasetRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = DatasetRecord.search_async(
+                collection_date=collection_date,
+                dataset_name=self.dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -781,7 +1168,8 @@ class Dataset(APIBase):
         end_timestamp: Optional[datetime] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> List[DatasetRecord]:
         """
         Filter records in the dataset based on criteria.
@@ -806,6 +1194,7 @@ class Dataset(APIBase):
             experiment_names (Optional[List[str]], optional): The names of the experiments. Defaults to None.
             season_names (Optional[List[str]], optional): The names of the seasons. Defaults to None.
             site_names (Optional[List[str]], optional): The names of the sites. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
         Returns:
             List[DatasetRecord]: A list of filtered records.
         """
@@ -816,9 +1205,42 @@ class Dataset(APIBase):
                 end_timestamp=end_timestamp,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering records in dataset {self.dataset_name}: {e}")
             return []
+
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this dataset and return them as a pandas DataFrame.
+
+        Examples:
+            >>> dataset = Dataset.get(dataset_name="Dataset A")
+            >>> frame = dataset.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `dataset_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return DatasetRecord.to_dataframe(flatten=flatten, **search_parameters, dataset_name=self.dataset_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this dataset and return them as a pandas DataFrame.
+
+        Examples:
+            >>> dataset = Dataset.get(dataset_name="Dataset A")
+            >>> frame = dataset.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `dataset_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return DatasetRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, dataset_names=[self.dataset_name])
@@ -19,19 +19,27 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, AsyncGenerator, Callable, TYPE_CHECKING
 from uuid import UUID
 import os, mimetypes
-from tqdm import tqdm
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
-from gemini.api.base import APIBase, FileHandlerMixin
+from gemini.api.uploads import process_and_insert_chunks, upload_file_deduplicated
+from gemini.api.journal import IngestionJournal
+from gemini.api.base import APIBase, FileHandlerMixin, get_minio_storage_provider
+from gemini.api.presign import record_download_urls_async
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
 from gemini.db.models.columnar.dataset_records import DatasetRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.dataset_records_immv import DatasetRecordsIMMVModel
 
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class DatasetRecord(APIBase, FileHandlerMixin):
     """
     Represents a record within a dataset, including metadata and associations to experiments, seasons, and sites.
@@ -207,33 +215,86 @@ class DatasetRecord(APIBase, FileHandlerMixin):
     
 
     @classmethod
-    def insert(cls, records: List["DatasetRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["DatasetRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of dataset records into the database.
 
         Args:
             records (List[DatasetRecord]): The list of dataset records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to the GEMINI_UPLOAD_WORKERS environment variable, or 8.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Journaled work is skipped, so a failed import can be re-run from the start. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: A tuple containing a boolean indicating success and a list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 print(f"No records provided to insert.")
-                return False, []
+                return BulkInsertResult(error="No records provided to insert.")
             records = cls.verify_records(records)
-            records = [cls.process_record(record) for record in tqdm(records, desc="Processing Records for Dataset: " + records[0].dataset_name)]
-            records_to_insert = []
-            for record in records:
-                record_dict = record.model_dump()
-                record_dict = {k: v for k, v in record_dict.items() if v is not None}
-                records_to_insert.append(record_dict)
-            print(f"Inserting {len(records_to_insert)} records.")
-            inserted_record_ids = DatasetRecordModel.insert_bulk('dataset_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} records.")
-            return True, inserted_record_ids
+            process = lambda record: cls.process_record(record, raise_errors=True)
+            if journal is not None:
+                process = journal.journaled(process, lambda record: cls.create_file_uri(record, check_exists=False))
+
+            def insert_chunk(chunk: List["DatasetRecord"], chunk_index: int) -> BulkInsertResult:
+                records_to_insert = []
+                for record in chunk:
+                    record_dict = record.model_dump()
+                    record_dict = {k: v for k, v in record_dict.items() if v is not None}
+                    records_to_insert.append(record_dict)
+                if journal is not None:
+                    return journal.insert_batches(
+                        DatasetRecordModel,
+                        'dataset_records_unique',
+                        records_to_insert,
+                        start_chunk=chunk_index,
+                        use_copy=use_copy,
+                        on_chunk=on_chunk,
+                        id_resolution=id_resolution
+                    )
+                return DatasetRecordModel.insert_bulk_chunked(
+                    'dataset_records_unique',
+                    records_to_insert,
+                    start_chunk=chunk_index,
+                    use_copy=use_copy,
+                    on_chunk=on_chunk,
+                    id_resolution=id_resolution
+                )
+
+            print(f"Inserting {len(records)} records.")
+            # Each chunk is uploaded and then inserted, so chunk indices refer to positions in records
+            result = process_and_insert_chunks(
+                process,
+                records,
+                insert_chunk,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                workers=upload_workers,
+                desc="Processing Records for Dataset: " + records[0].dataset_name
+            )
+            print(f"Inserted {result.inserted} records, skipped {result.skipped} existing records, {result.failed} failed.")
+            if result.failed > 0:
+                print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+            elif result.upload_failures:
+                print(f"{len(result.upload_failures)} file uploads failed, resume from chunk {result.next_chunk} to retry them.")
+            return result
         except Exception as e:
             print(f"Error inserting records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
 
     @classmethod
     def get(
@@ -318,9 +379,56 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error getting DatasetRecord by id: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["DatasetRecord"]:
+        """
+        Asynchronously retrieve a dataset record by its ID.
+
+        Examples:
+            >>> record = await DatasetRecord.get_by_id_async(UUID('...'))
+            >>> record
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), dataset_name='example_dataset', dataset_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+
+        Args:
+            id (UUID | int | str): The ID of the dataset record.
+        Returns:
+            Optional["DatasetRecord"]: The retrieved dataset record, or None if not found.
+        """
+        try:
+            db_instance = await DatasetRecordModel.get_async(id)
+            if not db_instance:
+                print(f"DatasetRecord with id {id} not found.")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting DatasetRecord by id: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["DatasetRecord"]]:
+    async def get_download_urls_async(cls, record_ids: List[UUID | int | str]) -> List[dict]:
+        """
+        Asynchronously retrieve pre-signed download URLs for the files of dataset records, reading the records in one query.
+
+        Examples:
+            >>> urls = await DatasetRecord.get_download_urls_async([UUID('...'), UUID('...')])
+            >>> urls[0]["url"]
+            'https://storage.example.org/gemini/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Args:
+            record_ids (List[UUID | int | str]): The IDs of the dataset records, at most `MAX_PRESIGN_BATCH`.
+        Returns:
+            List[dict]: One entry per ID with `record_id`, `record_file`, `url`, `expires_at` and `error`, or an empty list if an error occurred.
+        """
+        try:
+            return await record_download_urls_async(DatasetRecordModel, record_ids)
+        except Exception as e:
+            print(f"Error getting DatasetRecord download URLs: {e}")
+            return []
+
+    @classmethod
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["DatasetRecord"]]:
         """
         Retrieve all dataset records.
 
@@ -333,6 +441,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
 
         Args:
             limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
         Returns:
             Optional[List["DatasetRecord"]]: A list of dataset records, or None if an error occurred.
         """
@@ -341,6 +450,39 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             if not records or len(records) == 0:
                 print(f"No DatasetRecords found.")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(record) for record in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all DatasetRecords: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["DatasetRecord"]]:
+        """
+        Asynchronously retrieve all dataset records.
+
+        Examples:
+            >>> records = await DatasetRecord.get_all_async(limit=10)
+            >>> for record in records:
+            ...     print(record)
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), dataset_name='example_dataset', dataset_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), dataset_name='another_dataset', dataset_data={...}, experiment_name='another_experiment', season_name='another_season', site_name='another_site')
+
+        Args:
+            limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
+        Returns:
+            Optional[List["DatasetRecord"]]: A list of dataset records, or None if an error occurred.
+        """
+        try:
+            records = await DatasetRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print(f"No DatasetRecords found.")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(record) for record in records]
             return records
         except Exception as e:
@@ -358,6 +500,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         site_name: str = None,
         collection_date: date = None,
         record_info: dict = None,
+        lightweight: bool = False,
     ) -> Generator["DatasetRecord", None, None]:
         """
         Search for dataset records based on various criteria.
@@ -384,13 +527,15 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             site_name (str, optional): The name of the site. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
         Yields:
             Generator["DatasetRecord", None, None]: A generator of matching dataset records.
         """
         try:
             if not any([dataset_name, dataset_data, experiment_name, season_name, site_name, collection_date, record_info]):
                 raise ValueError("At least one parameter must be provided.")
-            records = DatasetRecordsIMMVModel.stream(
+            stream = DatasetRecordsIMMVModel.stream_rows if lightweight else DatasetRecordsIMMVModel.stream
+            records = stream(
                 dataset_name=dataset_name,
                 experiment_name=experiment_name,
                 season_name=season_name,
@@ -399,6 +544,9 @@ class DatasetRecord(APIBase, FileHandlerMixin):
                 dataset_data=dataset_data,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -406,6 +554,170 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             print(f"Error searching DatasetRecords: {e}")
             yield None
 
+    @classmethod
+    async def search_async(
+        cls,
+        dataset_name: str = None,
+        dataset_data: dict = None,
+        experiment_name: str = None,    
+        season_name: str = None,
+        site_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False,
+    ) -> AsyncGenerator["DatasetRecord", None]:
+        """
+        Asynchronously search for dataset records based on various criteria.
+
+        Examples:
+            >>> records = DatasetRecord.search_async(
+            ...     dataset_name="example_dataset",
+            ...     experiment_name="example_experiment",
+            ...     season_name="example_season",
+            ...     site_name="example_site",
+            ...     collection_date=date(2023, 10, 1),
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), dataset_name='example_dataset', dataset_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), dataset_name='another_dataset', dataset_data={...}, experiment_name='another_experiment', season_name='another_season', site_name='another_site')
+            
+        Args:
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_data (dict, optional): The data content. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
+        Yields:
+            Generator["DatasetRecord", None, None]: A generator of matching dataset records.
+        """
+        try:
+            if not any([dataset_name, dataset_data, experiment_name, season_name, site_name, collection_date, record_info]):
+                raise ValueError("At least one parameter must be provided.")
+            stream = DatasetRecordsIMMVModel.stream_rows_async if lightweight else DatasetRecordsIMMVModel.stream_async
+            records = stream(
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                collection_date=collection_date,
+                dataset_data=dataset_data,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching DatasetRecords: {e}")
+            yield None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        dataset_data: dict = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["DatasetRecord"], Optional[str]]:
+        """
+        Retrieve a page of dataset records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> dataset_records, next_cursor = DatasetRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_dataset_records, next_cursor = DatasetRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of dataset records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_data (dict, optional): The data content. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[DatasetRecord], Optional[str]]: The dataset records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = DatasetRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            season_name=season_name,
+            site_name=site_name,
+            collection_date=collection_date,
+            dataset_data=dataset_data,
+            record_info=record_info
+        )
+        dataset_records = [cls.model_validate(record) for record in records]
+        return dataset_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        dataset_data: dict = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["DatasetRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of dataset records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> dataset_records, next_cursor = await DatasetRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_dataset_records, next_cursor = await DatasetRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of dataset records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            dataset_data (dict, optional): The data content. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[DatasetRecord], Optional[str]]: The dataset records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await DatasetRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            season_name=season_name,
+            site_name=site_name,
+            collection_date=collection_date,
+            dataset_data=dataset_data,
+            record_info=record_info
+        )
+        dataset_records = [cls.model_validate(record) for record in records]
+        return dataset_records, next_cursor
+
+
     @classmethod
     def filter(
         cls,
@@ -414,7 +726,8 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         end_timestamp: datetime = None,
         experiment_names: List[str] = None,
         season_names: List[str] = None,
-        site_names: List[str] = None
+        site_names: List[str] = None,
+        lightweight: bool = False
     ) -> Generator["DatasetRecord", None, None]:
         """
         Filter dataset records based on various criteria.
@@ -440,6 +753,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             experiment_names (List[str], optional): The names of the experiments. Defaults to None.
             season_names (List[str], optional): The names of the seasons. Defaults to None.
             site_names (List[str], optional): The names of the sites. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of DatasetRecord instances. Defaults to False.
         Yields:
             Generator["DatasetRecord", None, None]: A generator of matching dataset records.
         """
@@ -454,6 +768,9 @@ class DatasetRecord(APIBase, FileHandlerMixin):
                 season_names=season_names,
                 site_names=site_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -461,6 +778,50 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             print(f"Error filtering DatasetRecords: {e}")
             yield None
 
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for dataset records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = DatasetRecord.to_dataframe(dataset_name="Dataset A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'dataset_data.value', 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `dataset_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = DatasetRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting dataset records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter dataset records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = DatasetRecord.filter_to_dataframe(dataset_names=["Dataset A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `dataset_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = DatasetRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered dataset records to a DataFrame: {e}")
+            return None
+
     
     def update(
         self,
@@ -505,6 +866,50 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error updating DatasetRecord: {e}")
             return None
+
+    async def update_async(
+        self,
+        dataset_data: dict = None,
+        record_info: dict = None
+    ) -> Optional["DatasetRecord"]:
+        """
+        Asynchronously update the details of a dataset record.
+
+        Examples:
+            >>> record = DatasetRecord.get_by_id(UUID('...'))
+            >>> updated_record = await record.update_async(
+            ...     dataset_data={"new_key": "new_value"},
+            ...     record_info={"new_info_key": "new_info_value"}
+            ... )
+            >>> print(updated_record)
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), dataset_name='example_dataset', dataset_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+
+        Args:
+            dataset_data (dict, optional): The new data content. Defaults to None.
+            record_info (dict, optional): The new additional info. Defaults to None.
+        Returns:
+            Optional["DatasetRecord"]: The updated dataset record, or None if an error occurred.
+        """
+        try:
+            if not any([dataset_data, record_info]):
+                print(f"At least one parameter must be provided to update the DatasetRecord.")
+                return None
+            current_id = self.id
+            dataset_record = await DatasetRecordModel.get_async(current_id)
+            if not dataset_record:
+                print(f"DatasetRecord with id {current_id} not found.")
+                return None
+            dataset_record = await DatasetRecordModel.update_async(
+                dataset_record,
+                dataset_data=dataset_data,
+                record_info=record_info
+            )
+            dataset_record = self.model_validate(dataset_record)
+            await self.refresh_async()
+            return dataset_record
+        except Exception as e:
+            print(f"Error updating DatasetRecord: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -530,6 +935,31 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error deleting DatasetRecord: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete a dataset record.
+
+        Examples:
+            >>> record = DatasetRecord.get_by_id(UUID('...'))
+            >>> result = await record.delete_async()
+            >>> print(result)
+            True
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        try:
+            current_id = self.id
+            dataset_record = await DatasetRecordModel.get_async(current_id)
+            if not dataset_record:
+                print(f"DatasetRecord with id {current_id} not found.")
+                return False
+            await DatasetRecordModel.delete_async(dataset_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting DatasetRecord: {e}")
+            return False
         
     def refresh(self) -> Optional["DatasetRecord"]:
         """
@@ -559,6 +989,35 @@ class DatasetRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error refreshing DatasetRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["DatasetRecord"]:
+        """
+        Asynchronously refresh the dataset record's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> record = DatasetRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await record.refresh_async()
+            >>> print(refreshed_record)
+            DatasetRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), dataset_name='example_dataset', dataset_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+   
+
+        Returns:
+            Optional["DatasetRecord"]: The refreshed dataset record, or None if an error occurred.
+        """
+        try:
+            db_instance = await DatasetRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"DatasetRecord with id {self.id} not found.")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing DatasetRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -625,7 +1084,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             return None
     
     @classmethod
-    def create_file_uri(cls, record: "DatasetRecord") -> Optional[str]:
+    def create_file_uri(cls, record: "DatasetRecord", check_exists: bool = True) -> Optional[str]:
         """
         Create a file URI for the dataset record.
 
@@ -645,6 +1104,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (DatasetRecord): The dataset record.
+            check_exists (bool, optional): Require `record_file` to be an existing local file. Defaults to True.
         Returns:
             Optional[str]: The file URI, or None if an error occurred.
         """
@@ -653,7 +1113,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             if not original_file_path:
                 print(f"record_file is required to create file URI.")
                 return None
-            if not os.path.exists(original_file_path):
+            if check_exists and not os.path.exists(original_file_path):
                 print(f"File {original_file_path} does not exist.")
                 return None
             # Assuming the file is stored in a specific structure, we can create a file URI
@@ -672,7 +1132,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
 
 
     @classmethod
-    def process_record(cls, record: "DatasetRecord") -> "DatasetRecord":
+    def process_record(cls, record: "DatasetRecord", raise_errors: bool = False) -> "DatasetRecord":
         """
         Process the dataset record for storage, including file upload and metadata generation.
 
@@ -695,6 +1155,7 @@ class DatasetRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (DatasetRecord): The dataset record to process.
+            raise_errors (bool, optional): Raise upload errors instead of printing them and returning the record unchanged. Defaults to False.
         Returns:
             DatasetRecord: The processed dataset record.
         """
@@ -702,8 +1163,13 @@ class DatasetRecord(APIBase, FileHandlerMixin):
             file = record.record_file
             if not file:
                 return record
+            if not os.path.exists(file) and file == cls.create_file_uri(record, check_exists=False):
+                # Already uploaded, e.g. by the earlier attempt of a resumed insert
+                return record
             file_key = cls.create_file_uri(record)
             if not file_key:
+                if raise_errors:
+                    raise ValueError(f"Failed to create file URI for record: {record}")
                 print(f"Failed to create file URI for record: {record}")
                 return record
             content_type, _ = mimetypes.guess_type(file)
@@ -716,16 +1182,20 @@ class DatasetRecord(APIBase, FileHandlerMixin):
                 "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
                 "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
             }
-            cls.minio_storage_provider.upload_file(
+            content_hash, _ = upload_file_deduplicated(
+                get_minio_storage_provider(),
                 object_name=file_key,
-                input_file_path=file,
+                file_path=file,
                 bucket_name="gemini",
                 content_type=content_type,
                 metadata=file_metadata
             )
             record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": content_hash}
             return record
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error processing record: {e}")
             return record
 
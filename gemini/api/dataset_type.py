@@ -156,6 +156,31 @@ class DatasetType(APIBase):
             print(f"Error getting dataset type by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["DatasetType"]:
+        """
+        Asynchronously retrieve a dataset type by its ID.
+
+        Examples:
+            >>> await DatasetType.get_by_id_async(...)
+            DatasetType(dataset_type_name='example_dataset_type', id=...)
+
+        Args:
+            id (UUID | int | str): The ID of the dataset type.
+        Returns:
+            Optional["DatasetType"]: The dataset type, or None if not found.
+        """
+        try:
+            db_instance = await DatasetTypeModel.get_async(id)
+            if not db_instance:
+                print(f"Dataset type with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting dataset type by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["DatasetType"]]:
         """
@@ -180,6 +205,30 @@ class DatasetType(APIBase):
             print(f"Error getting all dataset types: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["DatasetType"]]:
+        """
+        Asynchronously retrieve all dataset types.
+
+        Examples:
+            >>> await DatasetType.get_all_async()
+            [DatasetType(dataset_type_name='example_dataset_type', id=...), DatasetType(dataset_type_name='another_dataset_type', id=...)]
+
+
+        Returns:
+            Optional[List["DatasetType"]]: A list of all dataset types, or None if an error occurred.
+        """
+        try:
+            instances = await DatasetTypeModel.all_async()
+            if not instances or len(instances) == 0:
+                print("No dataset types found.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error getting all dataset types: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -218,6 +267,119 @@ class DatasetType(APIBase):
             print(f"Error searching dataset types: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        dataset_type_name: str = None,
+        dataset_type_info: dict = None
+    ) -> Optional[List["DatasetType"]]:
+        """
+        Asynchronously search for dataset types based on various criteria.
+
+        Examples:
+            >>> await DatasetType.search_async(dataset_type_name="example_dataset_type")
+            [DatasetType(dataset_type_name='example_dataset_type', id=...)]
+
+
+        Args:
+            dataset_type_name (str, optional): The name of the dataset type. Defaults to None.
+            dataset_type_info (dict, optional): Additional information about the dataset type. Defaults to None.
+        Returns:
+            Optional[List["DatasetType"]]: A list of matching dataset types, or None if an error occurred.
+        """
+        try:
+            if not any([dataset_type_name, dataset_type_info]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            instances = await DatasetTypeModel.search_async(
+                dataset_type_name=dataset_type_name,
+                dataset_type_info=dataset_type_info
+            )
+            if not instances or len(instances) == 0:
+                print("No dataset types found with the provided search parameters.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error searching dataset types: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_type_name: str = None,
+        dataset_type_info: dict = None
+    ) -> tuple[List["DatasetType"], Optional[str]]:
+        """
+        Retrieve a page of dataset types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> dataset_types, next_cursor = DatasetType.paginate(page_limit=50)
+            >>> more_dataset_types, next_cursor = DatasetType.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of dataset types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_type_name (str, optional): The name of the dataset type. Defaults to None.
+            dataset_type_info (dict, optional): Additional information about the dataset type. Defaults to None.
+        Returns:
+            tuple[List[DatasetType], Optional[str]]: The dataset types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([dataset_type_name, dataset_type_info]):
+            instances, next_cursor = DatasetTypeModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                dataset_type_name=dataset_type_name,
+                dataset_type_info=dataset_type_info
+            )
+        else:
+            instances, next_cursor = DatasetTypeModel.paginate(page_limit=page_limit, cursor=cursor)
+        dataset_types = [cls.model_validate(instance) for instance in instances]
+        return dataset_types, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_type_name: str = None,
+        dataset_type_info: dict = None
+    ) -> tuple[List["DatasetType"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of dataset types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> dataset_types, next_cursor = await DatasetType.paginate_async(page_limit=50)
+            >>> more_dataset_types, next_cursor = await DatasetType.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of dataset types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_type_name (str, optional): The name of the dataset type. Defaults to None.
+            dataset_type_info (dict, optional): Additional information about the dataset type. Defaults to None.
+        Returns:
+            tuple[List[DatasetType], Optional[str]]: The dataset types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([dataset_type_name, dataset_type_info]):
+            instances, next_cursor = await DatasetTypeModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                dataset_type_name=dataset_type_name,
+                dataset_type_info=dataset_type_info
+            )
+        else:
+            instances, next_cursor = await DatasetTypeModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        dataset_types = [cls.model_validate(instance) for instance in instances]
+        return dataset_types, next_cursor
+
+
     def update(
             self,
             dataset_type_name: str = None,
@@ -261,6 +423,49 @@ class DatasetType(APIBase):
             print(f"Error updating dataset type: {e}")
             return None
 
+    async def update_async(
+            self,
+            dataset_type_name: str = None,
+            dataset_type_info: dict = None
+        ) -> Optional["DatasetType"]:
+        """
+        Asynchronously update the details of the dataset type.
+
+        Examples:
+            >>> dataset_type = DatasetType.get("example_dataset_type")
+            >>> updated_dataset_type = await dataset_type.update_async(dataset_type_name="new_name", dataset_type_info{"description": "Updated description"})
+            >>> print(updated_dataset_type)
+            DatasetType(dataset_type_name='new_name', id=...)
+
+        Args:
+            dataset_type_name (str, optional): The new name of the dataset type. Defaults to None.
+            dataset_type_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional["DatasetType"]: The updated dataset type, or None if an error occurred.
+        """
+        try:
+            if not any([dataset_type_name, dataset_type_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            dataset_type = await DatasetTypeModel.get_async(current_id)
+            if not dataset_type:
+                 print(f"Dataset type with ID {current_id} does not exist.")
+                 return None
+
+            dataset_type = await DatasetTypeModel.update_async(
+                dataset_type,
+                dataset_type_name=dataset_type_name,
+                dataset_type_info=dataset_type_info,
+            )
+            instance = self.model_validate(dataset_type)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating dataset type: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the dataset type.
@@ -286,6 +491,31 @@ class DatasetType(APIBase):
             print(f"Error deleting dataset type: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the dataset type.
+
+        Examples:
+            >>> dataset_type = DatasetType.get("example_dataset_type")
+            >>> success = await dataset_type.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the dataset type was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            dataset_type = await DatasetTypeModel.get_async(current_id)
+            if not dataset_type:
+                 print(f"Dataset type with ID {current_id} does not exist.")
+                 return False
+            await DatasetTypeModel.delete_async(dataset_type)
+            return True
+        except Exception as e:
+            print(f"Error deleting dataset type: {e}")
+            return False
+
     def refresh(self) -> Optional["DatasetType"]:
         """
         Refresh the dataset type's data from the database. It is rarely called by the user
@@ -314,6 +544,34 @@ class DatasetType(APIBase):
             print(f"Error refreshing dataset type: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["DatasetType"]:
+        """
+        Asynchronously refresh the dataset type's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> dataset_type = DatasetType.get("example_dataset_type")
+            >>> refreshed_dataset_type = await dataset_type.refresh_async()
+            >>> print(refreshed_dataset_type)
+            DatasetType(dataset_type_name='example_dataset_type', id=...)
+
+        Returns:
+            Optional["DatasetType"]: The refreshed dataset type, or None if an error occurred.
+        """
+        try:
+            db_instance = await DatasetTypeModel.get_async(self.id)
+            if not db_instance:
+                print(f"Dataset type with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing dataset type: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the dataset type.
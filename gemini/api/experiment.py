@@ -27,6 +27,7 @@ from pydantic import Field, AliasChoices
 from gemini.api.types import ID
 
 from gemini.api.base import APIBase
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.api.enums import (
     GEMINIDataFormat,
     GEMINIDatasetType,
@@ -172,6 +173,9 @@ class Experiment(APIBase):
             Optional["Experiment"]: The experiment, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, experiment_name=experiment_name)
+            if cached is not None:
+                return cached
             db_instance = ExperimentModel.get_by_parameters(
                 experiment_name=experiment_name,
             )
@@ -179,6 +183,7 @@ class Experiment(APIBase):
                 print(f"Experiment with name {experiment_name} not found.")
                 return None
             instance = cls.model_validate(db_instance)
+            entity_cache.put(cls, instance, experiment_name=experiment_name)
             return instance
         except Exception as e:
             print("Error getting experiment:", e)
@@ -200,11 +205,45 @@ class Experiment(APIBase):
             Optional["Experiment"]: The experiment, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             db_instance = ExperimentModel.get(id)
             if not db_instance:
                 print(f"Experiment with ID {id} does not exist.")
                 return None
             instance = cls.model_validate(db_instance)
+            entity_cache.put(cls, instance)
+            return instance
+        except Exception as e:
+            print("Error getting experiment by ID:", e)
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Experiment"]:
+        """
+        Asynchronously retrieve an experiment by its ID.
+
+        Examples:
+            >>> experiment = await Experiment.get_by_id_async(UUID('...'))
+            >>> print(experiment)
+            Experiment(experiment_name=My Experiment, experiment_start_date=2023-10-01, experiment_end_date=2023-10-01, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the experiment.
+        Returns:
+            Optional["Experiment"]: The experiment, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            db_instance = await ExperimentModel.get_async(id)
+            if not db_instance:
+                print(f"Experiment with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            entity_cache.put(cls, instance)
             return instance
         except Exception as e:
             print("Error getting experiment by ID:", e)
@@ -234,6 +273,31 @@ class Experiment(APIBase):
         except Exception as e:
             print("Error getting all experiments:", e)
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Experiment"]]:
+        """
+        Asynchronously retrieve all experiments.
+
+        Examples:
+            >>> experiments = await Experiment.get_all_async()
+            >>> for exp in experiments:
+            ...     print(exp)
+            Experiment(experiment_name=Experiment 1, experiment_start_date=2023-10-01, experiment_end_date=2023-10-01, id=UUID(...))
+
+        Returns:
+            Optional[List["Experiment"]]: A list of all experiments, or None if an error occurred.
+        """
+        try:
+            experiments = await ExperimentModel.all_async()
+            if not experiments or len(experiments) == 0:
+                print("No experiments found.")
+                return None
+            experiments = [cls.model_validate(experiment) for experiment in experiments]
+            return experiments
+        except Exception as e:
+            print("Error getting all experiments:", e)
+            return None
         
     @classmethod
     def search(
@@ -278,7 +342,139 @@ class Experiment(APIBase):
         except Exception as e:
             print("Error searching experiments:", e)
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        experiment_name: str = None,
+        experiment_info: dict = None,
+        experiment_start_date: date = None,
+        experiment_end_date: date = None
+    ) -> Optional[List["Experiment"]]:
+        """
+        Asynchronously search for experiments based on various criteria.
+
+        Examples:
+            >>> experiments = await Experiment.search_async(experiment_name="My Experiment")
+            >>> for exp in experiments:
+            ...     print(exp)
+            Experiment(experiment_name=My Experiment, experiment_start_date=2023-10-01, experiment_end_date=2023-10-01, id=UUID(...))
+
+        Args:
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            experiment_info (dict, optional): Additional information. Defaults to None.
+            experiment_start_date (date, optional): The start date. Defaults to None.
+            experiment_end_date (date, optional): The end date. Defaults to None.
+        Returns:
+            Optional[List["Experiment"]]: A list of matching experiments, or None if an error occurred.
+        """
+        try:
+            if not any([experiment_name, experiment_info, experiment_start_date, experiment_end_date]):
+                print("At least one parameter must be provided for search.")
+                return None
+            experiments = await ExperimentModel.search_async(
+                experiment_name=experiment_name,
+                experiment_info=experiment_info,
+                experiment_start_date=experiment_start_date,
+                experiment_end_date=experiment_end_date
+            )
+            if not experiments or len(experiments) == 0:
+                print("No experiments found with the provided search parameters.")
+                return None
+            experiments = [cls.model_validate(experiment) for experiment in experiments]
+            return experiments
+        except Exception as e:
+            print("Error searching experiments:", e)
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        experiment_name: str = None,
+        experiment_info: dict = None,
+        experiment_start_date: date = None,
+        experiment_end_date: date = None
+    ) -> tuple[List["Experiment"], Optional[str]]:
+        """
+        Retrieve a page of experiments using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> experiments, next_cursor = Experiment.paginate(page_limit=50)
+            >>> more_experiments, next_cursor = Experiment.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of experiments in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            experiment_info (dict, optional): Additional information. Defaults to None.
+            experiment_start_date (date, optional): The start date. Defaults to None.
+            experiment_end_date (date, optional): The end date. Defaults to None.
+        Returns:
+            tuple[List[Experiment], Optional[str]]: The experiments in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([experiment_name, experiment_info, experiment_start_date, experiment_end_date]):
+            instances, next_cursor = ExperimentModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                experiment_info=experiment_info,
+                experiment_start_date=experiment_start_date,
+                experiment_end_date=experiment_end_date
+            )
+        else:
+            instances, next_cursor = ExperimentModel.paginate(page_limit=page_limit, cursor=cursor)
+        experiments = [cls.model_validate(instance) for instance in instances]
+        return experiments, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        experiment_name: str = None,
+        experiment_info: dict = None,
+        experiment_start_date: date = None,
+        experiment_end_date: date = None
+    ) -> tuple[List["Experiment"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of experiments using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> experiments, next_cursor = await Experiment.paginate_async(page_limit=50)
+            >>> more_experiments, next_cursor = await Experiment.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of experiments in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            experiment_info (dict, optional): Additional information. Defaults to None.
+            experiment_start_date (date, optional): The start date. Defaults to None.
+            experiment_end_date (date, optional): The end date. Defaults to None.
+        Returns:
+            tuple[List[Experiment], Optional[str]]: The experiments in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([experiment_name, experiment_info, experiment_start_date, experiment_end_date]):
+            instances, next_cursor = await ExperimentModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                experiment_info=experiment_info,
+                experiment_start_date=experiment_start_date,
+                experiment_end_date=experiment_end_date
+            )
+        else:
+            instances, next_cursor = await ExperimentModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        experiments = [cls.model_validate(instance) for instance in instances]
+        return experiments, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         experiment_name: str = None, 
@@ -327,7 +523,58 @@ class Experiment(APIBase):
         except Exception as e:
             print("Error updating experiment:", e)
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        experiment_name: str = None, 
+        experiment_info: dict = None,
+        experiment_start_date: date = None,
+        experiment_end_date: date = None
+    ) -> Optional["Experiment"]:
+        """
+        Asynchronously update the details of the experiment.
+
+        Examples:
+            >>> experiment = Experiment.get("My Experiment")
+            >>> updated_experiment = await experiment.update_async(experiment_name="Updated Experiment")
+            >>> print(updated_experiment)
+            Experiment(experiment_name=Updated Experiment, experiment_start_date=2023-10-01, experiment_end_date=2023-10-01, id=UUID(...))
+
+        Args:
+            experiment_name (str, optional): The new name. Defaults to None.
+            experiment_info (dict, optional): The new information. Defaults to None.
+            experiment_start_date (date, optional): The new start date. Defaults to None.
+            experiment_end_date (date, optional): The new end date. Defaults to None.
+        Returns:
+            Optional["Experiment"]: The updated experiment, or None if an error occurred.
+        """
+        try:
+            if not any([experiment_name, experiment_info, experiment_start_date, experiment_end_date]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            experiment = await ExperimentModel.get_async(current_id)
+            if not experiment:
+                print(f"Experiment with ID {current_id} does not exist.")
+                return None
+            
+            updated_experiment = await ExperimentModel.update_async(
+                experiment,
+                experiment_name=experiment_name,
+                experiment_info=experiment_info,
+                experiment_start_date=experiment_start_date,
+                experiment_end_date=experiment_end_date
+            )
+            updated_experiment = self.model_validate(updated_experiment)
+            await self.refresh_async()
+            return updated_experiment
+        except Exception as e:
+            print("Error updating experiment:", e)
+            return None
         
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete the experiment.
@@ -352,6 +599,32 @@ class Experiment(APIBase):
         except Exception as e:
             print("Error deleting experiment:", e)
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the experiment.
+
+        Examples:
+            >>> experiment = Experiment.get("My Experiment")
+            >>> success = await experiment.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the experiment was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            experiment = await ExperimentModel.get_async(current_id)
+            if not experiment:
+                print(f"Experiment with ID {current_id} does not exist.")
+                return False
+            await ExperimentModel.delete_async(experiment)
+            return True
+        except Exception as e:
+            print("Error deleting experiment:", e)
+            return False
         
     def refresh(self) -> Optional["Experiment"]:
         """
@@ -380,6 +653,34 @@ class Experiment(APIBase):
         except Exception as e:
             print("Error refreshing experiment:", e)
             return None
+
+    async def refresh_async(self) -> Optional["Experiment"]:
+        """
+        Asynchronously refresh the experiment's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> experiment = Experiment.get("My Experiment")
+            >>> refreshed_experiment = await experiment.refresh_async()
+            >>> print(refreshed_experiment)
+            Experiment(experiment_name=My Experiment, experiment_start_date=2023-10-01, experiment_end_date=2023-10-01, id=UUID(...))
+
+        Returns:
+            Optional["Experiment"]: The refreshed experiment, or None if an error occurred.
+        """
+        try:
+            db_instance = await ExperimentModel.get_async(self.id)
+            if not db_instance:
+                print(f"Experiment with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print("Error refreshing experiment:", e)
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -409,6 +710,7 @@ class Experiment(APIBase):
             print("Error getting experiment info:", e)
             return None
         
+    @invalidates_cached_entity
     def set_info(self, experiment_info: dict) -> Optional["Experiment"]:
         """
         Set the additional information of the experiment.
@@ -578,6 +880,7 @@ class Experiment(APIBase):
             print("Error creating new cultivar:", e)
             return None
 
+    @invalidates_cached_entity
     def associate_cultivar(
         self,
         cultivar_population: str,
@@ -610,6 +913,7 @@ class Experiment(APIBase):
             print("Error associating cultivar:", e)
             return None
 
+    @invalidates_cached_entity
     def unassociate_cultivar(
         self,
         cultivar_population: str,
@@ -739,6 +1043,7 @@ class Experiment(APIBase):
             print("Error creating new procedure:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_procedure(
         self,
         procedure_name: str,
@@ -769,6 +1074,7 @@ class Experiment(APIBase):
             print("Error associating procedure:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_procedure(
         self,
         procedure_name: str,
@@ -900,6 +1206,7 @@ class Experiment(APIBase):
             print("Error creating new script:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_script(
         self,
         script_name: str,
@@ -930,6 +1237,7 @@ class Experiment(APIBase):
             print("Error associating script:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_script(
         self,
         script_name: str,
@@ -1057,6 +1365,7 @@ class Experiment(APIBase):
             print("Error creating new model:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_model(
         self,
         model_name: str,
@@ -1087,6 +1396,7 @@ class Experiment(APIBase):
             print("Error associating model:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_model(
         self,
         model_name: str,
@@ -1223,6 +1533,7 @@ class Experiment(APIBase):
             print("Error creating new sensor:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_sensor(
         self,
         sensor_name: str,
@@ -1253,6 +1564,7 @@ class Experiment(APIBase):
             print("Error associating sensor:", e)
             return None
     
+    @invalidates_cached_entity
     def unassociate_sensor(
         self,
         sensor_name: str,
@@ -1377,6 +1689,7 @@ class Experiment(APIBase):
             print("Error creating new sensor platform:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_sensor_platform(
         self,
         sensor_platform_name: str,
@@ -1407,6 +1720,7 @@ class Experiment(APIBase):
             print("Error associating sensor platform:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_sensor_platform(
         self,
         sensor_platform_name: str,
@@ -1540,6 +1854,7 @@ class Experiment(APIBase):
             print("Error creating new site:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_site(
         self,
         site_name: str,
@@ -1570,6 +1885,7 @@ class Experiment(APIBase):
             print("Error associating site:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_site(
         self,
         site_name: str,
@@ -1701,6 +2017,7 @@ class Experiment(APIBase):
             print("Error creating new dataset:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_dataset(
         self,
         dataset_name: str,
@@ -1731,6 +2048,7 @@ class Experiment(APIBase):
             print("Error associating dataset:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_dataset(
         self,
         dataset_name: str,
@@ -1866,6 +2184,7 @@ class Experiment(APIBase):
             print("Error creating new trait:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_trait(
         self,
         trait_name: str,
@@ -1896,6 +2215,7 @@ class Experiment(APIBase):
             print("Error associating trait:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_trait(
         self,
         trait_name: str,
@@ -2034,6 +2354,7 @@ class Experiment(APIBase):
             print("Error creating new plot:", e)
             return None
         
+    @invalidates_cached_entity
     def associate_plot(
         self,
         plot_number: int,
@@ -2078,6 +2399,7 @@ class Experiment(APIBase):
             print("Error associating plot:", e)
             return None
         
+    @invalidates_cached_entity
     def unassociate_plot(
         self,
         plot_number: int,
@@ -0,0 +1,327 @@
+"""
+Resumable ingestion journal for large imports.
+
+An `IngestionJournal` is a small SQLite database, usually kept in the
+data directory being imported, that records which record files were
+uploaded and which insert batches were committed. Record inserts given a
+journal skip files whose upload is already journaled (and which have not
+changed on disk since, and were uploaded to the key the record needs) and
+batches that were already committed, so an import that died halfway picks
+up where it stopped.
+
+`gemini ingest-status <path>` prints the progress stored in a journal.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
+
+# Default journal file name inside a data directory
+JOURNAL_FILE_NAME = ".gemini_ingest_journal.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    source_path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    object_name TEXT,
+    content_hash TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    scope TEXT NOT NULL,
+    batch_key TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    inserted INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (scope, batch_key)
+);
+"""
+
+
+class IngestionJournal:
+    """
+    SQLite journal of file uploads and insert batches of an import.
+
+    Features:
+    - Per-file upload state, keyed by source path, size and modification time, checked against the target object
+    - Per-batch insert state, keyed by a hash of the batch rows
+    - Safe to use from the concurrent upload workers
+    - Progress summary for the `ingest-status` command
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open or create a journal.
+
+        Examples:
+            >>> journal = IngestionJournal.for_directory("Dataset_2024/Davis/2024-07-01/Amiga_Phone/Phone")
+            >>> sensor.insert_records(timestamps=timestamps, record_files=files, ..., journal=journal)
+            >>> journal.status()["files"]
+            {'uploaded': 100000}
+
+        Args:
+            path (str | Path): The journal file, or a directory to keep it in.
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / JOURNAL_FILE_NAME
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def for_directory(cls, data_directory: Union[str, Path]) -> "IngestionJournal":
+        """
+        Opens the journal kept in a data directory.
+
+        Args:
+            data_directory (str | Path): The directory being imported.
+
+        Returns:
+            IngestionJournal: The journal at `<data_directory>/.gemini_ingest_journal.sqlite`.
+        """
+        return cls(Path(data_directory) / JOURNAL_FILE_NAME)
+
+    def close(self) -> None:
+        """
+        Closes the journal database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "IngestionJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def completed_upload(self, source_path: Union[str, Path], object_name: Optional[str] = None) -> Optional[dict]:
+        """
+        Retrieves the journaled upload of a file, if it is complete and the file is unchanged.
+
+        Args:
+            source_path (str | Path): The local file.
+            object_name (str, optional): The key the file is needed at. An upload to another key, e.g. by an import
+                of the same directory for another experiment or sensor, does not count. Any key matches if None.
+
+        Returns:
+            dict: The object name and content hash of the upload, or None.
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT object_name, content_hash FROM files "
+                "WHERE source_path = ? AND status = 'uploaded' AND size = ? AND mtime_ns = ?",
+                (os.path.abspath(source_path), stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row is None or (object_name is not None and row[0] != object_name):
+            return None
+        return {"object_name": row[0], "content_hash": row[1]}
+
+    def record_upload(
+        self,
+        source_path: Union[str, Path],
+        object_name: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Journals the outcome of a file upload.
+
+        Args:
+            source_path (str | Path): The local file.
+            object_name (str, optional): The key the file was uploaded to.
+            content_hash (str, optional): The SHA-256 of the file.
+            error (str, optional): The error of a failed upload.
+        """
+        try:
+            stat = os.stat(source_path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        except OSError:
+            size, mtime_ns = None, None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(source_path), size, mtime_ns, object_name, content_hash,
+                    "failed" if error else "uploaded", error, time.time()
+                )
+            )
+
+    def journaled(
+        self,
+        process: Callable[[Any], Any],
+        object_name: Optional[Callable[[Any], Optional[str]]] = None
+    ) -> Callable[[Any], Any]:
+        """
+        Wraps a record processing function, e.g. `SensorRecord.process_record`, with the journal.
+
+        Records whose file upload is journaled get the stored object name and
+        hash without being processed again. Other records are processed and
+        the outcome is journaled.
+
+        Args:
+            process (Callable): Uploads the file of a record and returns the record, raising on failure.
+            object_name (Callable, optional): Returns the key `process` uploads a record's file to, e.g.
+                `SensorRecord.create_file_uri`. Journaled uploads to other keys are repeated. Defaults to None.
+
+        Returns:
+            Callable: The journaled processing function.
+        """
+        def process_journaled(record: Any) -> Any:
+            source_path = record.record_file
+            if not source_path or not os.path.isfile(source_path):
+                return process(record)
+            upload = None
+            target = object_name(record) if object_name is not None else None
+            if object_name is None or target:
+                upload = self.completed_upload(source_path, target)
+            if upload is not None:
+                record.record_file = upload["object_name"]
+                if upload["content_hash"]:
+                    record.record_info = {**(record.record_info or {}), "file_sha256": upload["content_hash"]}
+                return record
+            try:
+                record = process(record)
+            except Exception as e:
+                self.record_upload(source_path, error=str(e))
+                raise
+            content_hash = (record.record_info or {}).get("file_sha256")
+            self.record_upload(source_path, object_name=record.record_file, content_hash=content_hash)
+            return record
+        return process_journaled
+
+    def insert_batches(
+        self,
+        model_class: type,
+        constraint: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        start_chunk: int = 0,
+        use_copy: bool = False,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]] = None,
+        id_resolution: Optional[str] = None
+    ) -> BulkInsertResult:
+        """
+        Inserts rows in batches, skipping batches the journal records as committed.
+
+        Batches are identified by a hash of their rows, so a restarted import
+        with the same input recognises the batches it committed before.
+
+        Args:
+            model_class (type): The database model, e.g. `SensorRecordModel`.
+            constraint (str): The unique constraint for conflict resolution.
+            rows (list): The rows to insert.
+            batch_size (int, optional): Number of rows per batch. Inserts everything in one batch if None.
+            start_chunk (int, optional): Index of the first batch in `rows`, used for the reported chunk indices. Defaults to 0.
+            use_copy (bool, optional): Insert with `copy_bulk` instead of `insert_bulk`. Defaults to False.
+            on_chunk (Callable, optional): Called with the result of every batch, including skipped ones.
+            id_resolution (str, optional): "trigger" or "batch", see `prepare_bulk_insert`. Defaults to the database configuration.
+
+        Returns:
+            BulkInsertResult: The combined result. Journaled batches count as skipped rows.
+        """
+        batch_size = batch_size or max(len(rows), 1)
+        result = BulkInsertResult(next_chunk=start_chunk)
+        for offset in range(0, len(rows), batch_size):
+            batch = rows[offset:offset + batch_size]
+            batch_key = _batch_key(batch)
+            if self._batch_committed(constraint, batch_key):
+                chunk_result = BulkInsertChunkResult(chunk_index=result.next_chunk, skipped=len(batch))
+                result.chunks.append(chunk_result)
+                if on_chunk is not None:
+                    on_chunk(chunk_result)
+                result.next_chunk += 1
+                continue
+            batch_result = model_class.insert_bulk_chunked(
+                constraint,
+                batch,
+                start_chunk=result.next_chunk,
+                use_copy=use_copy,
+                on_chunk=on_chunk,
+                id_resolution=id_resolution
+            )
+            chunk_result = batch_result.chunks[0]
+            result.chunks.append(chunk_result)
+            result.inserted_ids.extend(batch_result.inserted_ids)
+            self._record_batch(constraint, batch_key, len(batch), chunk_result)
+            if chunk_result.error is not None:
+                break
+            result.next_chunk += 1
+        return result
+
+    def status(self) -> dict:
+        """
+        Summarises the progress stored in the journal.
+
+        Returns:
+            dict: File counts by status, batch and row counts by status, recent errors and the last update time.
+        """
+        with self._lock:
+            files = dict(self._connection.execute("SELECT status, count(*) FROM files GROUP BY status").fetchall())
+            batches = {
+                status: {"batches": count, "rows": rows, "inserted": inserted, "skipped": skipped}
+                for status, count, rows, inserted, skipped in self._connection.execute(
+                    "SELECT status, count(*), sum(row_count), sum(inserted), sum(skipped) FROM batches GROUP BY status"
+                )
+            }
+            errors = [
+                {"file": source_path, "error": error}
+                for source_path, error in self._connection.execute(
+                    "SELECT source_path, error FROM files WHERE status = 'failed' ORDER BY updated_at DESC LIMIT 10"
+                )
+            ]
+            last_update = self._connection.execute(
+                "SELECT max(updated_at) FROM (SELECT updated_at FROM files UNION ALL SELECT updated_at FROM batches)"
+            ).fetchone()[0]
+        return {
+            "journal": str(self.path),
+            "files": files,
+            "batches": batches,
+            "recent_errors": errors,
+            "updated_at": last_update
+        }
+
+    def _batch_committed(self, scope: str, batch_key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM batches WHERE scope = ? AND batch_key = ? AND status = 'committed'",
+                (scope, batch_key)
+            ).fetchone()
+        return row is not None
+
+    def _record_batch(self, scope: str, batch_key: str, row_count: int, chunk_result: BulkInsertChunkResult) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    scope, batch_key, row_count, chunk_result.inserted, chunk_result.skipped,
+                    "failed" if chunk_result.error else "committed", chunk_result.error, time.time()
+                )
+            )
+
+
+def _batch_key(rows: List[Dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(json.dumps(row, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -20,7 +20,7 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
@@ -30,6 +30,7 @@ from gemini.api.base import APIBase
 from gemini.api.dataset import Dataset, GEMINIDatasetType
 from gemini.api.model_run import ModelRun
 from gemini.api.model_record import ModelRecord
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.models import ModelModel
 from gemini.db.models.associations import ExperimentModelModel, ModelDatasetModel
 from gemini.db.models.views.experiment_views import ExperimentModelsViewModel
@@ -39,6 +40,8 @@ from gemini.db.models.views.run_views import ModelRunsViewModel
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from gemini.api.journal import IngestionJournal
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment
     from gemini.api.dataset import Dataset
     from gemini.api.model_run import ModelRun
@@ -191,6 +194,31 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error getting model by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Model"]:
+        """
+        Asynchronously retrieve a model by its ID.
+
+        Examples:
+            >>> model = await Model.get_by_id_async(UUID('...'))
+            Model(model_name=example_model, model_url=http://example.com/model, id=UUID('...'))
+
+        Args:
+            id (UUID | int | str): The ID of the model.
+        Returns:
+            Optional["Model"]: The model, or None if not found.
+        """
+        try:
+            db_instance = await ModelModel.get_async(id)
+            if not db_instance:
+                print(f"Model with ID {id} does not exist.")
+                return None
+            model = cls.model_validate(db_instance)
+            return model
+        except Exception as e:
+            print(f"Error getting model by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["Model"]]:
@@ -217,6 +245,32 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error getting all models: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Model"]]:
+        """
+        Asynchronously retrieve all models.
+
+        Examples:
+            >>> models = await Model.get_all_async()
+            >>> for model in models:
+            ...     print(model)
+            Model(model_name=example_model1, model_url=http://example.com/model1, id=UUID('...'))
+            Model(model_name=example_model2, model_url=http://example.com/model2, id=UUID('...'))
+
+        Returns:
+            Optional[List["Model"]]: List of all models, or None if not found.
+        """
+        try:
+            models = await ModelModel.all_async()
+            if not models or len(models) == 0:
+                print("No models found.")
+                return None
+            models = [cls.model_validate(model) for model in models]
+            return models
+        except Exception as e:
+            print(f"Error getting all models: {e}")
+            return None
         
     @classmethod
     def search(
@@ -261,6 +315,137 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error searching models: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        model_name: str = None,
+        model_info: dict = None,
+        model_url: str = None,
+        experiment_name: str = None
+    ) -> Optional[List["Model"]]:
+        """
+        Asynchronously search for models based on various criteria.
+
+        Examples:
+            >>> models = await Model.search_async(model_name="example_model")
+            >>> for model in models:
+            ...     print(model)
+            Model(model_name=example_model, model_url=http://example.com/model, id=UUID('...'))
+
+        Args:
+            model_name (str, optional): The name of the model. Defaults to None.
+            model_url (str, optional): The URL of the model. Defaults to None.
+            model_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment to filter by. Defaults to None.
+        Returns:
+            Optional[List["Model"]]: List of matching models, or None if not found.
+        """
+        try:
+            if not any([model_name, model_info, model_url, experiment_name]):
+                print("At least one search parameter must be provided.")
+                return None
+            models = await ExperimentModelsViewModel.search_async(
+                model_name=model_name,
+                model_info=model_info,
+                model_url=model_url,
+                experiment_name=experiment_name
+            )
+            if not models or len(models) == 0:
+                print("No models found with the provided search parameters.")
+                return None
+            models = [cls.model_validate(model) for model in models]
+            return models
+        except Exception as e:
+            print(f"Error searching models: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        model_name: str = None,
+        model_info: dict = None,
+        model_url: str = None,
+        experiment_name: str = None
+    ) -> tuple[List["Model"], Optional[str]]:
+        """
+        Retrieve a page of models using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> models, next_cursor = Model.paginate(page_limit=50)
+            >>> more_models, next_cursor = Model.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of models in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            model_name (str, optional): The name of the model. Defaults to None.
+            model_url (str, optional): The URL of the model. Defaults to None.
+            model_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment to filter by. Defaults to None.
+        Returns:
+            tuple[List[Model], Optional[str]]: The models in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([model_name, model_info, model_url, experiment_name]):
+            instances, next_cursor = ExperimentModelsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                model_name=model_name,
+                model_info=model_info,
+                model_url=model_url,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = ModelModel.paginate(page_limit=page_limit, cursor=cursor)
+        models = [cls.model_validate(instance) for instance in instances]
+        return models, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        model_name: str = None,
+        model_info: dict = None,
+        model_url: str = None,
+        experiment_name: str = None
+    ) -> tuple[List["Model"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of models using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> models, next_cursor = await Model.paginate_async(page_limit=50)
+            >>> more_models, next_cursor = await Model.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of models in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            model_name (str, optional): The name of the model. Defaults to None.
+            model_url (str, optional): The URL of the model. Defaults to None.
+            model_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment to filter by. Defaults to None.
+        Returns:
+            tuple[List[Model], Optional[str]]: The models in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([model_name, model_info, model_url, experiment_name]):
+            instances, next_cursor = await ExperimentModelsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                model_name=model_name,
+                model_info=model_info,
+                model_url=model_url,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await ModelModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        models = [cls.model_validate(instance) for instance in instances]
+        return models, next_cursor
+
         
     def update(
         self,
@@ -304,6 +489,49 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error updating model: {e}")
             return None
+
+    async def update_async(
+        self,
+        model_name: str = None,
+        model_url: str = None,
+        model_info: dict = None
+    ) -> Optional["Model"]:
+        """
+        Asynchronously update the details of the model.
+
+        Examples:
+            >>> model = Model.get("example_model")
+            >>> updated_model = await model.update_async(model_name="new_example_model")
+            >>> print(updated_model)
+            Model(model_name=new_example_model, model_url=http://example.com/model, id=UUID('...'))
+        Args:
+            model_name (str, optional): The new name. Defaults to None.
+            model_url (str, optional): The new URL. Defaults to None.
+            model_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional["Model"]: The updated model, or None if an error occurred.
+        """
+        try:
+            if not any([model_name, model_url, model_info]):
+                print("At least one update parameter must be provided.")
+                return None
+            current_id = self.id
+            model = await ModelModel.get_async(current_id)
+            if not model:
+                print(f"Model with ID {current_id} does not exist.")
+                return None
+            model = await ModelModel.update_async(
+                model,
+                model_name=model_name,
+                model_url=model_url,
+                model_info=model_info
+            )
+            model = self.model_validate(model)
+            await self.refresh_async()
+            return model
+        except Exception as e:
+            print(f"Error updating model: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -329,6 +557,31 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error deleting model: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the model.
+
+        Examples:
+            >>> model = Model.get("example_model")
+            >>> success = await model.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the model was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            model = await ModelModel.get_async(current_id)
+            if not model:
+                print(f"Model with ID {current_id} does not exist.")
+                return False
+            await ModelModel.delete_async(model)
+            return True
+        except Exception as e:
+            print(f"Error deleting model: {e}")
+            return False
         
     def refresh(self) -> Optional["Model"]:
         """
@@ -356,6 +609,33 @@ class Model(APIBase):
         except Exception as e:
             print(f"Error refreshing model: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Model"]:
+        """
+        Asynchronously refresh the model's data from the database.
+
+        Examples:
+            >>> model = Model.get("example_model")
+            >>> refreshed_model = await model.refresh_async()
+            >>> print(refreshed_model)
+            Model(model_name=example_model, model_url=http://example.com/model, id=UUID('...'))
+
+        Returns:
+            Optional["Model"]: The refreshed model, or None if an error occurred.
+        """
+        try:
+            db_instance = await ModelModel.get_async(self.id)
+            if not db_instance:
+                print(f"Model with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing model: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -812,8 +1092,13 @@ class Model(APIBase):
         season_name: str = None,
         site_name: str = None,
         record_files: List[str] = [],
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        record_info: List[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert multiple model records for this model.
 
@@ -845,8 +1130,13 @@ class Model(APIBase):
             site_name (str, optional): The site name. Defaults to None.
             record_files (List[str], optional): List of record file paths. Defaults to [].
             record_info (List[dict], optional): List of additional record information dictionaries. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name and not season_name and not site_name:
@@ -885,14 +1175,20 @@ class Model(APIBase):
                 )
                 model_records.append(model_record)
 
-            success, inserted_record_ids = ModelRecord.insert(model_records)
-            if not success:
+            result = ModelRecord.insert(
+                model_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+            if not result.success:
                 print("Failed to insert model records.")
-                return False, []
-            return success, inserted_record_ids
+            return result
         except Exception as e:
             print(f"Error inserting model records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     def search_records(
         self,
@@ -901,7 +1197,8 @@ class Model(APIBase):
         experiment_name: str = None,
         season_name: str = None,
         site_name: str = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> List[ModelRecord]:
         """
         Search for model records associated with this model based on search parameters.
@@ -927,6 +1224,7 @@ class Model(APIBase):
             season_name (str, optional): The season name to filter by. Defaults to None.
             site_name (str, optional): The site name to filter by. Defaults to None.
             record_info (dict, optional): Additional record information to filter by. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
         Returns:
             Optional[List[ModelRecord]]: List of matching model records, or None if not found.
         """
@@ -941,7 +1239,65 @@ class Model(APIBase):
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching model records: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator[ModelRecord, None]:
+        """
+        Asynchronously search for model records associated with this model based on search parameters.
+
+        Examples:
+            >>> model = Model.get("example_model")
+            >>> records = model.search_records_async(
+            ...     collection_date=date.today(),
+            ...     dataset_name="example_dataset",
+            ...     experiment_name="example_experiment",
+            ...     season_name="example_season",
+            ...     site_name="example_site",
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            ModelRecord(id=UUID(...), model_name='example_model', dataset_name='example_dataset', timestamp='2023-10-01T12:00:00', model_data={...}, experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+
+        Args:
+            collection_date (date, optional): The collection date to filter by. Defaults to None.
+            dataset_name (str, optional): The dataset name to filter by. Defaults to None.
+            experiment_name (str, optional): The experiment name to filter by. Defaults to None.
+            season_name (str, optional): The season name to filter by. Defaults to None.
+            site_name (str, optional): The site name to filter by. Defaults to None.
+            record_info (dict, optional): Additional record information to filter by. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[ModelRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = ModelRecord.search_async(
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                model_name=self.model_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -955,7 +1311,8 @@ class Model(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> List[ModelRecord]:
         """
         Filter model records associated with this model using a custom filter function.
@@ -981,6 +1338,7 @@ class Model(APIBase):
             experiment_names (Optional[List[str]], optional): List of experiment names to filter by. Defaults
             season_names (Optional[List[str]], optional): List of season names to filter by. Defaults to None.
             site_names (Optional[List[str]], optional): List of site names to filter by. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
         Returns:
             Optional[List[ModelRecord]]: List of filtered model records, or None if not found.
         """
@@ -992,10 +1350,43 @@ class Model(APIBase):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering model records: {e}")
             return []
 
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this model and return them as a pandas DataFrame.
+
+        Examples:
+            >>> model = Model.get(model_name="Model A")
+            >>> frame = model.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `model_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ModelRecord.to_dataframe(flatten=flatten, **search_parameters, model_name=self.model_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this model and return them as a pandas DataFrame.
+
+        Examples:
+            >>> model = Model.get(model_name="Model A")
+            >>> frame = model.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `model_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ModelRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, model_names=[self.model_name])
+
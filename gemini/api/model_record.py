@@ -19,19 +19,27 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, AsyncGenerator, Callable, TYPE_CHECKING
 import os, mimetypes
 from uuid import UUID
-from tqdm import tqdm
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
-from gemini.api.base import APIBase, FileHandlerMixin
+from gemini.api.uploads import process_and_insert_chunks, upload_file_deduplicated
+from gemini.api.journal import IngestionJournal
+from gemini.api.base import APIBase, FileHandlerMixin, get_minio_storage_provider
+from gemini.api.presign import record_download_urls_async
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
 from gemini.db.models.columnar.model_records import ModelRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.model_records_immv import ModelRecordsIMMVModel
 
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class ModelRecord(APIBase, FileHandlerMixin):
     """
     Represents a record of a model, including metadata, associations to datasets and experiments, and file handling capabilities.
@@ -222,34 +230,87 @@ class ModelRecord(APIBase, FileHandlerMixin):
             raise None
         
     @classmethod
-    def insert(cls, records: List["ModelRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["ModelRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of model records into the database.
 
         Args:
             records (List[ModelRecord]): List of model records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to the GEMINI_UPLOAD_WORKERS environment variable, or 8.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Journaled work is skipped, so a failed import can be re-run from the start. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
     
 
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 print(f"No records provided for insertion.")
-                return False, []
-            records = [cls.process_record(record) for record in tqdm(records, desc="Processing ModelRecords")]
-            records_to_insert = []
-            for record in records:
-                record_dict = record.model_dump()
-                record_dict = {k: v for k, v in record_dict.items() if v is not None}
-                records_to_insert.append(record_dict)
-            print(f"Inserting {len(records_to_insert)} records.")
-            inserted_record_ids = ModelRecordModel.insert_bulk('model_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} records.")
-            return True, inserted_record_ids
+                return BulkInsertResult(error="No records provided for insertion.")
+            process = lambda record: cls.process_record(record, raise_errors=True)
+            if journal is not None:
+                process = journal.journaled(process, lambda record: cls.create_file_uri(record, check_exists=False))
+
+            def insert_chunk(chunk: List["ModelRecord"], chunk_index: int) -> BulkInsertResult:
+                records_to_insert = []
+                for record in chunk:
+                    record_dict = record.model_dump()
+                    record_dict = {k: v for k, v in record_dict.items() if v is not None}
+                    records_to_insert.append(record_dict)
+                if journal is not None:
+                    return journal.insert_batches(
+                        ModelRecordModel,
+                        'model_records_unique',
+                        records_to_insert,
+                        start_chunk=chunk_index,
+                        use_copy=use_copy,
+                        on_chunk=on_chunk,
+                        id_resolution=id_resolution
+                    )
+                return ModelRecordModel.insert_bulk_chunked(
+                    'model_records_unique',
+                    records_to_insert,
+                    start_chunk=chunk_index,
+                    use_copy=use_copy,
+                    on_chunk=on_chunk,
+                    id_resolution=id_resolution
+                )
+
+            print(f"Inserting {len(records)} records.")
+            # Each chunk is uploaded and then inserted, so chunk indices refer to positions in records
+            result = process_and_insert_chunks(
+                process,
+                records,
+                insert_chunk,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                workers=upload_workers,
+                desc="Processing ModelRecords"
+            )
+            print(f"Inserted {result.inserted} records, skipped {result.skipped} existing records, {result.failed} failed.")
+            if result.failed > 0:
+                print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+            elif result.upload_failures:
+                print(f"{len(result.upload_failures)} file uploads failed, resume from chunk {result.next_chunk} to retry them.")
+            return result
         except Exception as e:
             print(f"Error inserting ModelRecords: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     @classmethod
     def get(
@@ -344,9 +405,57 @@ class ModelRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error getting ModelRecord by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ModelRecord"]:
+        """
+        Asynchronously retrieve a model record by its ID
+
+        Examples:
+            >>> model_record = await ModelRecord.get_by_id_async(UUID('...'))
+            >>> print(model_record)
+            ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
+            
+        Args:
+            id (UUID | int | str): The unique identifier of the model record.
+
+        Returns:
+            Optional["ModelRecord"]: The model record, or None if not found.
+        """
+        try:
+            db_instance = await ModelRecordModel.get_async(id)
+            if not db_instance:
+                print(f"No ModelRecord found with ID: {id}")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting ModelRecord by ID: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["ModelRecord"]]:
+    async def get_download_urls_async(cls, record_ids: List[UUID | int | str]) -> List[dict]:
+        """
+        Asynchronously retrieve pre-signed download URLs for the files of model records, reading the records in one query.
+
+        Examples:
+            >>> urls = await ModelRecord.get_download_urls_async([UUID('...'), UUID('...')])
+            >>> urls[0]["url"]
+            'https://storage.example.org/gemini/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Args:
+            record_ids (List[UUID | int | str]): The IDs of the model records, at most `MAX_PRESIGN_BATCH`.
+        Returns:
+            List[dict]: One entry per ID with `record_id`, `record_file`, `url`, `expires_at` and `error`, or an empty list if an error occurred.
+        """
+        try:
+            return await record_download_urls_async(ModelRecordModel, record_ids)
+        except Exception as e:
+            print(f"Error getting ModelRecord download URLs: {e}")
+            return []
+
+    @classmethod
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ModelRecord"]]:
         """
         Retrieve all model records, up to a specified limit.
 
@@ -359,6 +468,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
 
         Args:
             limit (int): The maximum number of model records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
 
         Returns:
             Optional[List["ModelRecord"]]: List of model records, or None if not found.
@@ -368,6 +478,40 @@ class ModelRecord(APIBase, FileHandlerMixin):
             if not records or len(records) == 0:
                 print(f"No ModelRecords found.")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(record) for record in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all ModelRecords: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ModelRecord"]]:
+        """
+        Asynchronously retrieve all model records, up to a specified limit.
+
+        Examples:
+            >>> model_records = await ModelRecord.get_all_async(limit=10)
+            >>> for record in model_records:
+            ...     print(record)
+            ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
+            ModelRecord(id=UUID(...), timestamp=2023-10-02 12:00:00, model_name=example_model2, model_data={...}, dataset_name=example_dataset2, experiment_name=example_experiment2, site_name=example_site2, season_name=example_season2)
+
+        Args:
+            limit (int): The maximum number of model records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
+
+        Returns:
+            Optional[List["ModelRecord"]]: List of model records, or None if not found.
+        """
+        try:
+            records = await ModelRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print(f"No ModelRecords found.")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(record) for record in records]
             return records
         except Exception as e:
@@ -384,7 +528,8 @@ class ModelRecord(APIBase, FileHandlerMixin):
         site_name: str = None,
         season_name: str = None,
         collection_date: date = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Generator["ModelRecord", None, None]:
         """
         Search for model records based on various criteria.
@@ -411,6 +556,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             season_name (str): The name of the associated season. Optional.
             collection_date (date): The collection date of the model record. Optional.
             record_info (dict): Additional information about the model record. Optional.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
 
 
         Returns:
@@ -420,7 +566,8 @@ class ModelRecord(APIBase, FileHandlerMixin):
             if not any([model_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
                 print(f"At least one parameter must be provided for search.")
                 return
-            records = ModelRecordsIMMVModel.stream(
+            stream = ModelRecordsIMMVModel.stream_rows if lightweight else ModelRecordsIMMVModel.stream
+            records = stream(
                 model_name=model_name,
                 model_data=model_data,
                 dataset_name=dataset_name,
@@ -430,6 +577,9 @@ class ModelRecord(APIBase, FileHandlerMixin):
                 collection_date=collection_date,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -437,6 +587,181 @@ class ModelRecord(APIBase, FileHandlerMixin):
             print(f"Error searching ModelRecords: {e}")
             yield None
 
+    @classmethod
+    async def search_async(
+        cls,
+        model_name: str = None,
+        model_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator["ModelRecord", None]:
+        """
+        Asynchronously search for model records based on various criteria.
+
+        Examples:
+            >>> async for record in ModelRecord.search_async(
+            ...     model_name="example_model",
+            ...     dataset_name="example_dataset",
+            ...     experiment_name="example_experiment",
+            ...     site_name="example_site",
+            ...     season_name="example_season",
+            ...     collection_date=date.today(),
+            ...     record_info={"info_key": "info_value"}
+            ... ):
+            ...     print(record)
+            ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
+
+        Args:
+            model_name (str): The name of the model. Optional.
+            model_data (dict): The data content of the model record. Optional.
+            dataset_name (str): The name of the associated dataset. Optional.
+            experiment_name (str): The name of the associated experiment. Optional.
+            site_name (str): The name of the associated site. Optional.
+            season_name (str): The name of the associated season. Optional.
+            collection_date (date): The collection date of the model record. Optional.
+            record_info (dict): Additional information about the model record. Optional.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
+
+
+        Returns:
+            Optional[List["ModelRecord"]]: List of matching model records, or None if not found.
+        """
+        try:
+            if not any([model_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
+                print(f"At least one parameter must be provided for search.")
+                return
+            stream = ModelRecordsIMMVModel.stream_rows_async if lightweight else ModelRecordsIMMVModel.stream_async
+            records = stream(
+                model_name=model_name,
+                model_data=model_data,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                site_name=site_name,
+                season_name=season_name,
+                collection_date=collection_date,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching ModelRecords: {e}")
+            yield None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        model_name: str = None,
+        model_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ModelRecord"], Optional[str]]:
+        """
+        Retrieve a page of model records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> model_records, next_cursor = ModelRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_model_records, next_cursor = ModelRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of model records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            model_name (str): The name of the model. Optional.
+            model_data (dict): The data content of the model record. Optional.
+            dataset_name (str): The name of the associated dataset. Optional.
+            experiment_name (str): The name of the associated experiment. Optional.
+            site_name (str): The name of the associated site. Optional.
+            season_name (str): The name of the associated season. Optional.
+            collection_date (date): The collection date of the model record. Optional.
+            record_info (dict): Additional information about the model record. Optional.
+        Returns:
+            tuple[List[ModelRecord], Optional[str]]: The model records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = ModelRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            model_name=model_name,
+            model_data=model_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        model_records = [cls.model_validate(record) for record in records]
+        return model_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        model_name: str = None,
+        model_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ModelRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of model records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> model_records, next_cursor = await ModelRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_model_records, next_cursor = await ModelRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of model records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            model_name (str): The name of the model. Optional.
+            model_data (dict): The data content of the model record. Optional.
+            dataset_name (str): The name of the associated dataset. Optional.
+            experiment_name (str): The name of the associated experiment. Optional.
+            site_name (str): The name of the associated site. Optional.
+            season_name (str): The name of the associated season. Optional.
+            collection_date (date): The collection date of the model record. Optional.
+            record_info (dict): Additional information about the model record. Optional.
+        Returns:
+            tuple[List[ModelRecord], Optional[str]]: The model records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await ModelRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            model_name=model_name,
+            model_data=model_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        model_records = [cls.model_validate(record) for record in records]
+        return model_records, next_cursor
+
+
     @classmethod
     def filter(
         cls,
@@ -446,7 +771,8 @@ class ModelRecord(APIBase, FileHandlerMixin):
         end_timestamp: datetime = None,
         experiment_names: List[str] = None,
         site_names: List[str] = None,
-        season_names: List[str] = None
+        season_names: List[str] = None,
+        lightweight: bool = False
     ) -> Generator["ModelRecord", None, None]:
         """
         Filter model records based on custom logic.
@@ -472,6 +798,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             experiment_names (List[str]): List of experiment names to filter by. Optional.
             site_names (List[str]): List of site names to filter by. Optional.
             season_names (List[str]): List of season names to filter by. Optional.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ModelRecord instances. Defaults to False.
 
         Returns:
             Optional[List["ModelRecord"]]: List of filtered model records, or None if not found.
@@ -489,6 +816,9 @@ class ModelRecord(APIBase, FileHandlerMixin):
                 site_names=site_names,
                 season_names=season_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -496,6 +826,50 @@ class ModelRecord(APIBase, FileHandlerMixin):
             print(f"Error filtering ModelRecords: {e}")
             yield None
 
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for model records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ModelRecord.to_dataframe(model_name="Model A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'model_data.value', 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `model_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ModelRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting model records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter model records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ModelRecord.filter_to_dataframe(model_names=["Model A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `model_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ModelRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered model records to a DataFrame: {e}")
+            return None
+
     def update(
         self,
         model_data: dict = None,
@@ -536,6 +910,47 @@ class ModelRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error updating ModelRecord: {e}")
             return None
+
+    async def update_async(
+        self,
+        model_data: dict = None,
+        record_info: dict = None
+    ) -> Optional["ModelRecord"]:
+        """
+        Asynchronously update the details of the model record.
+
+        Examples:
+            >>> model_record = ModelRecord.get_by_id(UUID('...'))
+            >>> updated_record = await model_record.update_async(
+            ...     model_data={"new_key": "new_value"},
+            ...     record_info={"new_info_key": "new_info_value"}
+            ... )
+            >>> print(updated_record)
+            ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
+
+        Returns:
+            Optional["ModelRecord"]: The updated model record, or None if an error occurred.
+        """
+        try:
+            if not any([model_data, record_info]):
+                print(f"At least one parameter must be provided for update.")
+                return None
+            current_id = self.id
+            model_record = await ModelRecordModel.get_async(current_id)
+            if not model_record:
+                print(f"No ModelRecord found with ID: {current_id}")
+                return None
+            model_record = await ModelRecordModel.update_async(
+                model_record,
+                model_data=model_data,
+                record_info=record_info
+            )
+            model_record = self.model_validate(model_record)
+            await self.refresh_async()
+            return model_record
+        except Exception as e:
+            print(f"Error updating ModelRecord: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -561,6 +976,31 @@ class ModelRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error deleting ModelRecord: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the model record.
+
+        Examples:
+            >>> model_record = ModelRecord.get_by_id(UUID('...'))
+            >>> deleted = await model_record.delete_async()
+            >>> print(deleted)
+            True
+
+        Returns:
+            bool: True if the model record was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            model_record = await ModelRecordModel.get_async(current_id)
+            if not model_record:
+                print(f"No ModelRecord found with ID: {current_id}")
+                return False
+            await ModelRecordModel.delete_async(model_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting ModelRecord: {e}")
+            return False
         
     def refresh(self) -> Optional["ModelRecord"]:
         """
@@ -589,6 +1029,34 @@ class ModelRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error refreshing ModelRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["ModelRecord"]:
+        """
+        Asynchronously refresh the model record's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> model_record = ModelRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await model_record.refresh_async()
+            >>> print(refreshed_record)
+            ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
+
+        Returns:
+            Optional["ModelRecord"]: The refreshed model record, or None if an error occurred.
+        """
+        try:
+            db_instance = await ModelRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"No ModelRecord found with ID: {self.id}")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing ModelRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -649,7 +1117,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             return None
         
     @classmethod
-    def create_file_uri(cls, record: "ModelRecord") -> Optional[str]:
+    def create_file_uri(cls, record: "ModelRecord", check_exists: bool = True) -> Optional[str]:
         """
         Create a file URI for the given model record.
 
@@ -670,6 +1138,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             >>> print(file_uri)
             model_data/example_experiment/example_model/example_dataset/2023-10-01/example_site/example_season/1700000000000.txt
 
+            check_exists (bool, optional): Require `record_file` to be an existing local file. Defaults to True.
         Returns:
             Optional[str]: The file URI, or None if creation failed.
         """
@@ -678,7 +1147,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             if not original_file_path:
                 print(f"record_file is required to create file URI.")
                 return None
-            if not os.path.exists(original_file_path):
+            if check_exists and not os.path.exists(original_file_path):
                 print(f"File {original_file_path} does not exist.")
                 return None
             collection_date = record.collection_date.strftime("%Y-%m-%d")
@@ -697,7 +1166,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
 
 
     @classmethod
-    def process_record(cls, record: "ModelRecord") -> "ModelRecord":
+    def process_record(cls, record: "ModelRecord", raise_errors: bool = False) -> "ModelRecord":
         """
         Process a model record (custom logic).
 
@@ -721,6 +1190,7 @@ class ModelRecord(APIBase, FileHandlerMixin):
             ModelRecord(id=UUID(...), timestamp=2023-10-01 12:00:00, model_name=example_model, model_data={...}, dataset_name=example_dataset, experiment_name=example_experiment, site_name=example_site, season_name=example_season)
         Args:
             record (ModelRecord): The model record to process.
+            raise_errors (bool, optional): Raise upload errors instead of printing them and returning the record unchanged. Defaults to False.
 
         Returns:
             ModelRecord: The processed model record.
@@ -730,8 +1200,13 @@ class ModelRecord(APIBase, FileHandlerMixin):
             if not file:
                 print(f"record_file is required to process ModelRecord.")
                 return record
+            if not os.path.exists(file) and file == cls.create_file_uri(record, check_exists=False):
+                # Already uploaded, e.g. by the earlier attempt of a resumed insert
+                return record
             file_key = cls.create_file_uri(record)
             if not file_key:
+                if raise_errors:
+                    raise ValueError(f"Failed to create file URI for ModelRecord: {record}")
                 print(f"Failed to create file URI for ModelRecord: {record}")
                 return record
             content_type, _ = mimetypes.guess_type(file)
@@ -745,16 +1220,20 @@ class ModelRecord(APIBase, FileHandlerMixin):
                 "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
                 "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
             }
-            cls.minio_storage_provider.upload_file(
+            content_hash, _ = upload_file_deduplicated(
+                get_minio_storage_provider(),
                 object_name=file_key,
-                input_file_path=file,
+                file_path=file,
                 bucket_name="gemini",
                 content_type=content_type,
                 metadata=file_metadata
             )
             record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": content_hash}
             return record
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error processing ModelRecord: {e}")
             return record
 
@@ -174,6 +174,32 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error getting model run by id: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ModelRun"]:
+        """
+        Asynchronously retrieve a model run by its ID.
+
+        Examples:
+            >>> model_run = await ModelRun.get_by_id_async(UUID('12345678-1234-1234-1234-123456789012'))
+            >>> print(model_run)
+            ModelRun(id=UUID('12345678-1234-1234-1234-123456789012'), model_id=None, model_run_info={})
+
+        Args:
+            id (UUID | int | str): The ID of the model run.
+        Returns:
+            Optional["ModelRun"]: The model run, or None if not found.
+        """
+        try:
+            db_instance = await ModelRunModel.get_async(id)
+            if not db_instance:
+                print(f"Model run with id {id} not found.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting model run by id: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["ModelRun"]]:
@@ -198,6 +224,30 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error getting all model runs: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["ModelRun"]]:
+        """
+        Asynchronously retrieve all model runs.
+
+        Examples:
+            >>> model_runs = await ModelRun.get_all_async()
+            >>> print(model_runs)
+            [ModelRun(id=UUID('...'), model_id=None, model_run_info={}), ModelRun(id=UUID('...'), model_id=None, model_run_info={})]
+
+        Returns:
+            Optional[List["ModelRun"]]: List of all model runs, or None if not found.
+        """
+        try:
+            model_runs = await ModelRunModel.all_async()
+            if not model_runs or len(model_runs) == 0:
+                print("No model runs found.")
+                return None
+            model_runs = [cls.model_validate(model_run) for model_run in model_runs]
+            return model_runs
+        except Exception as e:
+            print(f"Error getting all model runs: {e}")
+            return None
         
     @classmethod
     def search(
@@ -235,6 +285,43 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error searching model runs: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        model_run_info: dict = None,
+        model_name: str = None
+    ) -> Optional[List["ModelRun"]]:
+        """
+        Asynchronously search for model runs based on various criteria.
+
+        Examples:
+            >>> model_runs = await ModelRun.search_async(model_run_info={"run_id": "12345"}, model_name="example_model")
+            >>> print(model_runs)
+            [ModelRun(id=UUID('...'), model_id=None, model_run_info={'run_id': '12345'})]
+
+        Args:
+            model_run_info (dict, optional): The run information to search for. Defaults to None.
+            model_name (str, optional): The name of the model. Defaults to None.
+        Returns:
+            Optional[List["ModelRun"]]: List of matching model runs, or None if not found.
+        """
+        try:
+            if not any([model_name, model_run_info]):
+                print("At least one of model_name or model_run_info must be provided.")
+                return None
+            model_runs = await ModelRunsViewModel.search_async(
+                model_run_info=model_run_info,
+                model_name=model_name
+            )
+            if not model_runs or len(model_runs) == 0:
+                print("No model runs found for the given search criteria.")
+                return None
+            model_runs = [cls.model_validate(model_run) for model_run in model_runs]
+            return model_runs
+        except Exception as e:
+            print(f"Error searching model runs: {e}")
+            return None
         
     def update(self, model_run_info: dict = None) -> Optional["ModelRun"]:
         """
@@ -270,6 +357,41 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error updating model run: {e}")
             return None
+
+    async def update_async(self, model_run_info: dict = None) -> Optional["ModelRun"]:
+        """
+        Asynchronously update the details of the model run.
+
+        Examples:
+            >>> model_run = ModelRun.get_by_id(UUID('12345678-1234-1234-1234-123456789012'))
+            >>> updated_run = await model_run.update_async(model_run_info={"run_id": "67890"})
+            >>> print(updated_run)
+            ModelRun(id=UUID('12345678-1234-1234-1234-123456789012'), model_id=None, model_run_info={'run_id': '67890'})
+
+        Args:
+            model_run_info (dict, optional): The new run information. Defaults to None.
+        Returns:
+            Optional["ModelRun"]: The updated model run, or None if an error occurred.
+        """
+        try:
+            if not model_run_info:
+                print("Model run info cannot be empty.")
+                return None
+            current_id = self.id
+            model_run = await ModelRunModel.get_async(current_id)
+            if not model_run:
+                print(f"Model run with id {current_id} does not exist.")
+                return None
+            model_run = await ModelRunModel.update_async(
+                model_run,
+                model_run_info=model_run_info   
+            )
+            instance = self.model_validate(model_run)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating model run: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -295,6 +417,31 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error deleting model run: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the model run.
+
+        Examples:
+            >>> model_run = ModelRun.get_by_id(UUID('12345678-1234-1234-1234-123456789012'))
+            >>> success = await model_run.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the model run was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            model_run = await ModelRunModel.get_async(current_id)
+            if not model_run:
+                print(f"Model run with id {current_id} does not exist.")
+                return False
+            await ModelRunModel.delete_async(model_run)
+            return True
+        except Exception as e:
+            print(f"Error deleting model run: {e}")
+            return False
         
     def refresh(self) -> Optional["ModelRun"]:
         """
@@ -323,6 +470,34 @@ class ModelRun(APIBase):
         except Exception as e:
             print(f"Error refreshing model run: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["ModelRun"]:
+        """
+        Asynchronously refresh the model run's data from the database. It is rarely called by the user
+        as it is automatically called on access.
+
+        Examples:
+            >>> model_run = ModelRun.get_by_id(UUID('12345678-1234-1234-1234-123456789012'))
+            >>> refreshed_run = await model_run.refresh_async()
+            >>> print(refreshed_run)
+            ModelRun(id=UUID('12345678-1234-1234-1234-123456789012'), model_id=None, model_run_info={})
+
+        Returns:
+            Optional["ModelRun"]: The refreshed model run, or None if an error occurred.
+        """
+        try:
+            db_instance = await ModelRunModel.get_async(self.id)
+            if not db_instance:
+                print(f"Model run with id {self.id} not found.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing model run: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -0,0 +1,391 @@
+"""
+Parquet export of GEMINI records to local disk or object storage.
+
+`ParquetExporter` streams the result of a `gemini.filter_*_records`
+function into Hive-style partitioned Parquet files, one file per
+collection date and entity, e.g.
+
+    sensor_records/collection_date=2023-10-01/sensor_name=Sensor%20A/part-0.parquet
+
+Rows are read over a server side cursor ordered by partition and written
+in row groups, so memory use is bounded by the row group size whatever the
+size of the export. Files are written to a local directory or uploaded
+through a storage provider (MinIO, S3 or local storage).
+
+A `_manifest.json` next to the partitions records the row count and a
+checksum of every exported partition. The checksums are computed in the
+database before any rows are read, and partitions whose checksum did not
+change since the last export are skipped. Partitions of an earlier export
+with the same filter that no longer have any rows are deleted.
+
+Filters other than the entity names, e.g. timestamp bounds or experiment
+names, can select part of a partition. The manifest records them for every
+partition, and an export with a different filter is refused instead of
+replacing complete partitions with partial ones.
+
+Requires pyarrow (`pip install gemini-framework[parquet]`), which is
+imported on first use.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+from urllib.parse import quote, unquote
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import text
+
+from gemini.db.core.base import get_db_engine
+from gemini.storage.interfaces.storage_provider import StorageProvider
+from gemini.storage.exceptions import StorageFileNotFoundError
+
+# Filter function and entity name column per record type
+EXPORT_SOURCES: Dict[str, Tuple[str, str]] = {
+    "sensor": ("gemini.filter_sensor_records", "sensor_name"),
+    "trait": ("gemini.filter_trait_records", "trait_name"),
+    "dataset": ("gemini.filter_dataset_records", "dataset_name"),
+    "procedure": ("gemini.filter_procedure_records", "procedure_name"),
+    "script": ("gemini.filter_script_records", "script_name"),
+    "model": ("gemini.filter_model_records", "model_name"),
+}
+
+MANIFEST_NAME = "_manifest.json"
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+
+def _import_pyarrow() -> Tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow, install it with `pip install gemini-framework[parquet]`") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_type(pa: Any, column: str) -> Any:
+    if column == "timestamp":
+        return pa.timestamp("us", tz="UTC")
+    if column == "collection_date":
+        return pa.date32()
+    if column.startswith("plot_") and column.endswith("number"):
+        return pa.int32()
+    if column.endswith("_value"):
+        return pa.float64()
+    return pa.string()
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+class ParquetExporter:
+    """
+    Exports records to partitioned Parquet files with incremental re-exports.
+
+    Features:
+    - Partitioning by collection date and entity name
+    - Bounded memory, rows written in row groups from a server side cursor
+    - Local directories or storage providers as destination
+    - Manifest of partition checksums, unchanged partitions are skipped
+    - Partitions whose records were all deleted are removed
+    - Partitions are only replaced by exports with the same filter
+    """
+
+    def __init__(
+        self,
+        record_type: str,
+        destination: Union[str, Path, StorageProvider],
+        prefix: str = "",
+        bucket_name: Optional[str] = None,
+        row_group_size: int = 50000
+    ):
+        """
+        Initialize the exporter.
+
+        Examples:
+            >>> exporter = ParquetExporter("sensor", "/data/exports")
+            >>> exporter.export(experiment_names=["Experiment A"])
+            {'partitions': 12, 'written': 12, 'skipped': 0, 'rows': 1200000}
+
+            >>> exporter = ParquetExporter("trait", get_minio_storage_provider(), prefix="training")
+
+        Args:
+            record_type (str): One of "sensor", "trait", "dataset", "procedure", "script" or "model".
+            destination (str | Path | StorageProvider): A local directory or a storage provider to upload to.
+            prefix (str, optional): Path prefix of the export inside the destination. Defaults to "".
+            bucket_name (str, optional): Bucket to upload to, for providers that support several buckets.
+            row_group_size (int, optional): Rows per Parquet row group, which bounds memory use. Defaults to 50000.
+        """
+        if record_type not in EXPORT_SOURCES:
+            raise ValueError(f"Unsupported record type {record_type}, expected one of {', '.join(EXPORT_SOURCES)}")
+        self.record_type = record_type
+        self.function_name, self.entity_column = EXPORT_SOURCES[record_type]
+        self.destination = destination
+        self.bucket_name = bucket_name
+        self.row_group_size = row_group_size
+        self.root = "/".join(part for part in (prefix.strip("/"), f"{record_type}_records") if part)
+
+    def export(self, force: bool = False, **filter_parameters: Any) -> dict:
+        """
+        Exports the records matching the filter parameters.
+
+        Args:
+            force (bool, optional): Rewrite every partition, even if unchanged or exported with a different filter. Defaults to False.
+            **filter_parameters: The parameters of the record type's `filter_records`, e.g. start_timestamp or sensor_names.
+
+        Returns:
+            dict: The number of partitions found, written, skipped and removed, and the number of rows written.
+
+        Raises:
+            ValueError: If partitions of the export were exported with a different filter and `force` is not set.
+        """
+        manifest = self._read_manifest()
+        partitions = self._partition_summary(filter_parameters)
+        partition_filter = self._partition_filter(filter_parameters)
+        conflicts = [
+            path for path in (self._partition_path(*key) for key in partitions)
+            if path in manifest["partitions"] and manifest["partitions"][path].get("filter", {}) != partition_filter
+        ]
+        if conflicts and not force:
+            raise ValueError(
+                f"{len(conflicts)} partitions, e.g. {conflicts[0]}, were exported with a different filter than "
+                f"{partition_filter}. Export to another prefix, or pass force=True to replace them with the rows of this filter."
+            )
+        changed = [
+            key for key, summary in partitions.items()
+            if force or manifest["partitions"].get(self._partition_path(*key), {}).get("checksum") != summary["checksum"]
+        ]
+        removed = self._removed_partitions(filter_parameters, partitions, partition_filter, manifest)
+        for partition_path in removed:
+            self._unpublish(partition_path, manifest)
+        rows_written = 0
+        if changed:
+            rows_written = self._write_partitions(filter_parameters, changed, partitions, partition_filter, manifest)
+        return {
+            "partitions": len(partitions),
+            "written": len(changed),
+            "skipped": len(partitions) - len(changed),
+            "removed": len(removed),
+            "rows": rows_written
+        }
+
+    def _removed_partitions(
+        self,
+        filter_parameters: Dict[str, Any],
+        partitions: Dict[Tuple[Any, str], dict],
+        partition_filter: Dict[str, Any],
+        manifest: dict
+    ) -> List[str]:
+        # Exported partitions the same filter no longer selects any rows of
+        current = {self._partition_path(*key) for key in partitions}
+        entity_names = filter_parameters.get(f"{self.entity_column}s")
+        entity_names = None if entity_names is None else {str(name) for name in entity_names}
+        removed = []
+        for partition_path, entry in manifest["partitions"].items():
+            if partition_path in current or entry.get("filter", {}) != partition_filter:
+                continue
+            if entity_names is not None:
+                entity_name = unquote(partition_path.rsplit(f"/{self.entity_column}=", 1)[-1])
+                if entity_name not in entity_names:
+                    continue
+            removed.append(partition_path)
+        return removed
+
+    def _partition_filter(self, filter_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # The parameters that can select part of a partition, entity names select whole partitions
+        partition_filter = {}
+        for key, value in filter_parameters.items():
+            if value is None or key == f"{self.entity_column}s":
+                continue
+            if isinstance(value, (list, tuple, set)):
+                partition_filter[key] = sorted(_to_string(item) for item in value)
+            else:
+                partition_filter[key] = _to_string(value)
+        return partition_filter
+
+    def _function_call(self, filter_parameters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        parameters = {key: value for key, value in filter_parameters.items() if value is not None}
+        arguments = ", ".join(f"p_{key} => :{key}" for key in parameters)
+        return f"{self.function_name}({arguments})", parameters
+
+    def _partition_summary(self, filter_parameters: Dict[str, Any]) -> Dict[Tuple[Any, str], dict]:
+        call, parameters = self._function_call(filter_parameters)
+        # Order independent checksum of the full row text, computed without sending rows to the client
+        query = text(
+            f"SELECT r.collection_date, r.{self.entity_column}, count(*), "
+            f"sum(hashtextextended(r::text, 0))::text "
+            f"FROM {call} r GROUP BY 1, 2"
+        )
+        with get_db_engine().get_engine().connect() as conn:
+            result = conn.execute(query, parameters)
+            return {
+                (collection_date, entity_name): {"rows": count, "checksum": checksum}
+                for collection_date, entity_name, count, checksum in result
+            }
+
+    def _partition_path(self, collection_date: Any, entity_name: str) -> str:
+        return (
+            f"{self.root}/collection_date={collection_date}/"
+            f"{self.entity_column}={quote(str(entity_name), safe='')}"
+        )
+
+    def _write_partitions(
+        self,
+        filter_parameters: Dict[str, Any],
+        changed: List[Tuple[Any, str]],
+        partitions: Dict[Tuple[Any, str], dict],
+        partition_filter: Dict[str, Any],
+        manifest: dict
+    ) -> int:
+        pa, pq = _import_pyarrow()
+        call, parameters = self._function_call(filter_parameters)
+        parameters["partition_dates"] = [key[0] for key in changed]
+        parameters["partition_names"] = [key[1] for key in changed]
+        query = text(
+            f"SELECT r.* FROM {call} r "
+            f"JOIN unnest(CAST(:partition_dates AS date[]), CAST(:partition_names AS text[])) AS p(collection_date, entity_name) "
+            f"ON r.collection_date = p.collection_date AND r.{self.entity_column} = p.entity_name "
+            f"ORDER BY r.collection_date, r.{self.entity_column}, r.timestamp"
+        )
+        rows_written = 0
+        staging = Path(tempfile.mkdtemp(prefix="gemini-export-"))
+        try:
+            with get_db_engine().get_engine().connect() as conn:
+                result = conn.execution_options(yield_per=self.row_group_size).execute(query, parameters)
+                columns = list(result.keys())
+                schema = pa.schema([(column, _arrow_type(pa, column)) for column in columns])
+                key_index = (columns.index("collection_date"), columns.index(self.entity_column))
+                writer = None
+                current_key = None
+                staged_file = None
+                for partition in result.partitions():
+                    # A row group may span partitions, split it where the partition key changes
+                    start = 0
+                    for index, row in enumerate(partition):
+                        key = (row[key_index[0]], row[key_index[1]])
+                        if key == current_key:
+                            continue
+                        if writer is not None:
+                            self._write_row_group(pa, writer, schema, columns, partition[start:index])
+                            writer.close()
+                            self._publish(staged_file, current_key, partitions, partition_filter, manifest)
+                        start = index
+                        current_key = key
+                        staged_file = staging / f"{len(manifest['partitions'])}.parquet"
+                        writer = pq.ParquetWriter(str(staged_file), schema)
+                    if writer is not None:
+                        self._write_row_group(pa, writer, schema, columns, partition[start:])
+                    rows_written += len(partition)
+                if writer is not None:
+                    writer.close()
+                    self._publish(staged_file, current_key, partitions, partition_filter, manifest)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return rows_written
+
+    def _write_row_group(self, pa: Any, writer: Any, schema: Any, columns: List[str], rows: list) -> None:
+        if not rows:
+            return
+        arrays = []
+        for column, values in zip(columns, zip(*rows)):
+            arrow_type = schema.field(column).type
+            if arrow_type == pa.string():
+                values = [_to_string(value) for value in values]
+            arrays.append(pa.array(values, type=arrow_type))
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    def _publish(
+        self,
+        staged_file: Path,
+        key: Tuple[Any, str],
+        partitions: Dict[Tuple[Any, str], dict],
+        partition_filter: Dict[str, Any],
+        manifest: dict
+    ) -> None:
+        partition_path = self._partition_path(*key)
+        object_name = f"{partition_path}/part-0.parquet"
+        if isinstance(self.destination, StorageProvider):
+            with open(staged_file, "rb") as data_stream:
+                self.destination.upload_file(
+                    object_name=object_name,
+                    data_stream=data_stream,
+                    content_type=PARQUET_CONTENT_TYPE,
+                    **self._bucket_arguments()
+                )
+        else:
+            target = Path(self.destination) / object_name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(staged_file), str(target))
+        manifest["partitions"][partition_path] = {
+            "file": object_name,
+            "rows": partitions[key]["rows"],
+            "checksum": partitions[key]["checksum"],
+            "filter": partition_filter,
+            "exported_at": datetime.now(timezone.utc).isoformat()
+        }
+        # Written after every partition so an interrupted export resumes where it stopped
+        self._write_manifest(manifest)
+
+    def _unpublish(self, partition_path: str, manifest: dict) -> None:
+        object_name = manifest["partitions"][partition_path]["file"]
+        if isinstance(self.destination, StorageProvider):
+            try:
+                self.destination.delete_file(object_name, **self._bucket_arguments())
+            except StorageFileNotFoundError:
+                pass
+        else:
+            target = Path(self.destination) / object_name
+            target.unlink(missing_ok=True)
+            # Drop the partition directories left empty
+            for directory in (target.parent, target.parent.parent):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    break
+        del manifest["partitions"][partition_path]
+        self._write_manifest(manifest)
+
+    def _bucket_arguments(self) -> dict:
+        return {"bucket_name": self.bucket_name} if self.bucket_name else {}
+
+    def _read_manifest(self) -> dict:
+        object_name = f"{self.root}/{MANIFEST_NAME}"
+        try:
+            if isinstance(self.destination, StorageProvider):
+                with tempfile.TemporaryDirectory() as directory:
+                    path = self.destination.download_file(object_name, Path(directory) / MANIFEST_NAME, **self._bucket_arguments())
+                    manifest = json.loads(Path(path).read_text())
+            else:
+                manifest = json.loads((Path(self.destination) / object_name).read_text())
+        except (StorageFileNotFoundError, FileNotFoundError):
+            manifest = {}
+        manifest.setdefault("record_type", self.record_type)
+        manifest.setdefault("partitions", {})
+        return manifest
+
+    def _write_manifest(self, manifest: dict) -> None:
+        object_name = f"{self.root}/{MANIFEST_NAME}"
+        content = json.dumps(manifest, indent=2, sort_keys=True, default=str).encode("utf-8")
+        if isinstance(self.destination, StorageProvider):
+            with tempfile.TemporaryFile() as data_stream:
+                data_stream.write(content)
+                data_stream.seek(0)
+                self.destination.upload_file(
+                    object_name=object_name,
+                    data_stream=data_stream,
+                    content_type="application/json",
+                    **self._bucket_arguments()
+                )
+        else:
+            target = Path(self.destination) / object_name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staged = target.with_suffix(".tmp")
+            staged.write_bytes(content)
+            os.replace(staged, target)
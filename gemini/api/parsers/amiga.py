@@ -3,6 +3,7 @@ from gemini.api.season import Season
 from gemini.api.site import Site
 from gemini.api.sensor_platform import SensorPlatform
 from gemini.api.sensor import Sensor
+from gemini.api.journal import IngestionJournal
 
 import os, re
 from typing import List
@@ -78,7 +79,7 @@ class AMIGAPhoneParser:
         
         return True
 
-    def parse(self, data_directory: str):
+    def parse(self, data_directory: str, resume: bool = True):
 
         if not self.validate(data_directory):
             return
@@ -159,14 +160,20 @@ class AMIGAPhoneParser:
             rgb_file_number = int(rgb_file_name.split('.')[0][-5:])
             data_map['data'][rgb_file_number]['rgb_file'] = rgb_file
 
-        self.upload_metadata_files(data_map)
-        self.upload_confidence_files(data_map)
-        self.upload_depth_files(data_map)
-        self.upload_flir_files(data_map)
-        self.upload_rgb_files(data_map)
+        # Journal in the data directory, so that a failed parse can be re-run without repeating uploads and inserts
+        journal = IngestionJournal.for_directory(data_directory) if resume else None
+        try:
+            self.upload_metadata_files(data_map, journal=journal)
+            self.upload_confidence_files(data_map, journal=journal)
+            self.upload_depth_files(data_map, journal=journal)
+            self.upload_flir_files(data_map, journal=journal)
+            self.upload_rgb_files(data_map, journal=journal)
+        finally:
+            if journal is not None:
+                journal.close()
 
 
-    def upload_metadata_files(self, data_map: dict):
+    def upload_metadata_files(self, data_map: dict, journal: IngestionJournal = None):
         metadata_sensor = Sensor.get(sensor_name="AMIGA Phone Camera Metadata", experiment_name="GEMINI")
         data_records = data_map['data']
         # Sort by timestamp key
@@ -180,16 +187,17 @@ class AMIGAPhoneParser:
         site_name = data_map['site']
                 
         # Upload Data
-        metadata_sensor.add_records(
+        metadata_sensor.insert_records(
             timestamps=data_timestamps,
             collection_date=data_map['collection_date'],
             experiment_name=experiment_name,
             season_name=season_name,
             site_name=site_name,
-            record_files=data_record_files
+            record_files=data_record_files,
+            journal=journal
         )
 
-    def upload_confidence_files(self, data_map: dict):
+    def upload_confidence_files(self, data_map: dict, journal: IngestionJournal = None):
         confidence_sensor = Sensor.get(sensor_name="AMIGA Phone Confidence", experiment_name="GEMINI")
         data_records = data_map['data']
         # Sort by timestamp key
@@ -202,16 +210,17 @@ class AMIGAPhoneParser:
         site_name = data_map['site']
         
         # Upload Data
-        confidence_sensor.add_records(
+        confidence_sensor.insert_records(
             timestamps=data_timestamps,
             collection_date=data_map['collection_date'],
             experiment_name=experiment_name,
             season_name=season_name,
             site_name=site_name,
-            record_files=data_record_files
+            record_files=data_record_files,
+            journal=journal
         )
 
-    def upload_depth_files(self, data_map: dict):
+    def upload_depth_files(self, data_map: dict, journal: IngestionJournal = None):
         depth_sensor = Sensor.get(sensor_name="AMIGA Phone Depth Sensor", experiment_name="GEMINI")
         data_records = data_map['data']
         data_records.sort(key=lambda x: x['timestamp'])
@@ -223,16 +232,17 @@ class AMIGAPhoneParser:
         site_name = data_map['site']
 
         # Upload Data
-        depth_sensor.add_records(
+        depth_sensor.insert_records(
             timestamps=data_timestamps,
             collection_date=data_map['collection_date'],
             experiment_name=experiment_name,
             season_name=season_name,
             site_name=site_name,
-            record_files=data_record_files
+            record_files=data_record_files,
+            journal=journal
         )
 
-    def upload_flir_files(self, data_map: dict):
+    def upload_flir_files(self, data_map: dict, journal: IngestionJournal = None):
         flir_sensor = Sensor.get(sensor_name="AMIGA Phone Thermal Camera", experiment_name="GEMINI")
         data_records = data_map['data']
         # Sort by timestamp key
@@ -245,16 +255,17 @@ class AMIGAPhoneParser:
         site_name = data_map['site']
         
         # Upload Data
-        flir_sensor.add_records(
+        flir_sensor.insert_records(
             timestamps=data_timestamps,
             collection_date=data_map['collection_date'],
             experiment_name=experiment_name,
             season_name=season_name,
             site_name=site_name,
-            record_files=data_record_files
+            record_files=data_record_files,
+            journal=journal
         )
 
-    def upload_rgb_files(self, data_map: dict):
+    def upload_rgb_files(self, data_map: dict, journal: IngestionJournal = None):
         rgb_sensor = Sensor.get(sensor_name="AMIGA Phone RGB Camera", experiment_name="GEMINI")
         data_records = data_map['data']
         # Sort by timestamp key
@@ -267,12 +278,13 @@ class AMIGAPhoneParser:
         site_name = data_map['site']
         
         # Upload Data
-        rgb_sensor.add_records(
+        rgb_sensor.insert_records(
             timestamps=data_timestamps,
             collection_date=data_map['collection_date'],
             experiment_name=experiment_name,
             season_name=season_name,
             site_name=site_name,
-            record_files=data_record_files
+            record_files=data_record_files,
+            journal=journal
         )
 
@@ -256,6 +256,32 @@ class Plant(APIBase):
         except Exception as e:
             print(f"Error getting plant by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Plant"]:
+        """
+        Asynchronously retrieve a plant by its ID.
+
+        Examples:
+            >>> plant = await Plant.get_by_id_async(UUID('...'))
+            >>> plant
+            Plant(plot_id=UUID(...), plant_number=1, plant_info={'height': 100}, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the plant.
+        Returns:
+            Optional[Plant]: The plant instance, or None if not found.
+        """
+        try:
+            db_instance = await PlantModel.get_async(id)
+            if not db_instance:
+                print(f"Plant with ID {id} does not exist.")
+                return None
+            plant = cls.model_validate(db_instance) if db_instance else None
+            return plant
+        except Exception as e:
+            print(f"Error getting plant by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["Plant"]]:
@@ -280,6 +306,30 @@ class Plant(APIBase):
         except Exception as e:
             print(f"Error getting all plants: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Plant"]]:
+        """
+        Asynchronously retrieve all plants.
+
+        Examples:
+            >>> plants = await Plant.get_all_async()
+            >>> plants
+            [Plant(plot_id=UUID(...), plant_number=1, plant_info={'height': 100}, id=UUID(...)), ...]
+
+        Returns:
+            Optional[List[Plant]]: A list of all plants, or None if not found.
+        """
+        try:
+            plants = await PlantModel.all_async()
+            if not plants or len(plants) == 0:
+                print("No plants found.")
+                return None
+            plants = [cls.model_validate(plant) for plant in plants]
+            return plants
+        except Exception as e:
+            print(f"Error getting all plants: {e}")
+            return None
         
     @classmethod
     def search(
@@ -338,6 +388,181 @@ class Plant(APIBase):
         except Exception as e:
             print(f"Error searching for plants: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls, 
+        plant_number: int = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None
+    ) -> Optional[List["Plant"]]:
+        """
+        Asynchronously search for plants based on various criteria.
+
+        Examples:
+            >>> plants = await Plant.search_async(plant_number=1)
+            >>> plants
+            [Plant(plot_id=UUID(...), plant_number=1, plant_info={'height': 100}, id=UUID(...)), ...]
+
+        Args:
+            plant_number (int, optional): The number of the plant within the plot. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+        Returns:
+            Optional[List[Plant]]: A list of matching plants, or None if not found.
+        """
+        try:
+            if not any([plant_number, cultivar_accession, cultivar_population, experiment_name, season_name, site_name, plot_number, plot_row_number, plot_column_number]):
+                print("At least one search parameter must be provided.")
+                return None
+            plants = await PlantViewModel.search_async(
+                plant_number=plant_number,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number
+            )
+            if not plants or len(plants) == 0:
+                print("No plants found with the provided search parameters.")
+                return None
+            plants = [cls.model_validate(plant) for plant in plants]
+            return plants
+        except Exception as e:
+            print(f"Error searching for plants: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        plant_number: int = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None
+    ) -> tuple[List["Plant"], Optional[str]]:
+        """
+        Retrieve a page of plants using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> plants, next_cursor = Plant.paginate(page_limit=50)
+            >>> more_plants, next_cursor = Plant.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of plants in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            plant_number (int, optional): The number of the plant within the plot. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+        Returns:
+            tuple[List[Plant], Optional[str]]: The plants in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([plant_number, cultivar_accession, cultivar_population, experiment_name, season_name, site_name, plot_number, plot_row_number, plot_column_number]):
+            instances, next_cursor = PlantViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                plant_number=plant_number,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number
+            )
+        else:
+            instances, next_cursor = PlantModel.paginate(page_limit=page_limit, cursor=cursor)
+        plants = [cls.model_validate(instance) for instance in instances]
+        return plants, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        plant_number: int = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None
+    ) -> tuple[List["Plant"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of plants using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> plants, next_cursor = await Plant.paginate_async(page_limit=50)
+            >>> more_plants, next_cursor = await Plant.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of plants in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            plant_number (int, optional): The number of the plant within the plot. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+        Returns:
+            tuple[List[Plant], Optional[str]]: The plants in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([plant_number, cultivar_accession, cultivar_population, experiment_name, season_name, site_name, plot_number, plot_row_number, plot_column_number]):
+            instances, next_cursor = await PlantViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                plant_number=plant_number,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number
+            )
+        else:
+            instances, next_cursor = await PlantModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        plants = [cls.model_validate(instance) for instance in instances]
+        return plants, next_cursor
+
         
     def update(
         self,
@@ -379,6 +604,47 @@ class Plant(APIBase):
         except Exception as e:
             print(f"Error updating plant: {e}")
             return None
+
+    async def update_async(
+        self,
+        plant_number: int = None,
+        plant_info: dict = None
+    ) -> Optional["Plant"]:
+        """
+        Asynchronously update the details of the plant.
+
+        Examples:
+            >>> plant = Plant.get_by_id(UUID('...'))
+            >>> updated_plant = await plant.update_async(plant_number=2, plant_info={"height": 150})
+            >>> updated_plant
+            Plant(plot_id=UUID(...), plant_number=2, plant_info={'height': 150}, id=UUID(...))
+
+        Args:
+            plant_number (int, optional): The new plant number. Defaults to None.
+            plant_info (dict, optional): The new plant information. Defaults to None.
+        Returns:
+            Optional[Plant]: The updated plant instance, or None if an error occurred.
+        """
+        try:
+            if not plant_info and not plant_number:
+                print("At least one parameter must be provided for update.")
+                return None
+            current_id = self.id
+            plant = await PlantModel.get_async(current_id)
+            if not plant:
+                print(f"Plant with ID {current_id} does not exist.")
+                return None
+            plant = await PlantModel.update_async(
+                plant,
+                plant_number=plant_number,
+                plant_info=plant_info
+            )
+            plant = self.model_validate(plant)
+            await self.refresh_async()  # Update the current instance
+            return plant
+        except Exception as e:
+            print(f"Error updating plant: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -405,6 +671,31 @@ class Plant(APIBase):
             print(f"Error deleting plant: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the plant.
+
+        Examples:
+            >>> plant = Plant.get_by_id(UUID('...'))
+            >>> deleted = await plant.delete_async()
+            >>> deleted
+            True
+
+        Returns:
+            bool: True if the plant was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            plant = await PlantModel.get_async(current_id)
+            if not plant:
+                print(f"Plant with ID {current_id} does not exist.")
+                return False
+            await PlantModel.delete_async(plant)
+            return True
+        except Exception as e:
+            print(f"Error deleting plant: {e}")
+            return False
+
     def refresh(self) -> Optional["Plant"]:
         """
         Refresh the plant's data from the database.
@@ -431,6 +722,33 @@ class Plant(APIBase):
         except Exception as e:
             print(f"Error refreshing plant: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Plant"]:
+        """
+        Asynchronously refresh the plant's data from the database.
+
+        Examples:
+            >>> plant = Plant.get_by_id(UUID('...'))
+            >>> refreshed_plant = await plant.refresh_async()
+            >>> refreshed_plant
+            Plant(plot_id=UUID(...), plant_number=1, plant_info={'height': 100}, id=UUID(...))
+
+        Returns:
+            Optional[Plant]: The refreshed plant instance, or None if an error occurred.
+        """
+        try:
+            db_instance = await PlantModel.get_async(self.id)
+            if not db_instance:
+                print(f"Plant with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing plant: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
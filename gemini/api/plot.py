@@ -26,6 +26,7 @@ from uuid import UUID
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
 from gemini.api.base import APIBase
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.api.cultivar import Cultivar
 from gemini.db.models.plots import PlotModel
 from gemini.db.models.associations import PlotCultivarModel
@@ -210,6 +211,9 @@ class Plot(APIBase):
             Optional[Plot]: The plot instance, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, plot_number=plot_number, plot_row_number=plot_row_number, plot_column_number=plot_column_number, experiment_name=experiment_name, season_name=season_name, site_name=site_name)
+            if cached is not None:
+                return cached
             plot = PlotViewModel.get_by_parameters(
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
@@ -222,6 +226,7 @@ class Plot(APIBase):
                 print(f"Plot with number {plot_number}, row {plot_row_number}, column {plot_column_number} not found.")
                 return None
             plot = cls.model_validate(plot)
+            entity_cache.put(cls, plot, plot_number=plot_number, plot_row_number=plot_row_number, plot_column_number=plot_column_number, experiment_name=experiment_name, season_name=season_name, site_name=site_name)
             return plot
         except Exception as e:
             print(f"Error getting plot: {e}")
@@ -243,11 +248,45 @@ class Plot(APIBase):
             Optional[Plot]: The plot instance, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             plot = PlotViewModel.get_by_parameters(plot_id=id)
             if not plot:
                 print(f"Plot with ID {id} does not exist.")
                 return None
             plot = cls.model_validate(plot)
+            entity_cache.put(cls, plot)
+            return plot
+        except Exception as e:
+            print(f"Error getting plot by ID: {e}")
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Plot"]:
+        """
+        Asynchronously retrieve a plot by its ID.
+
+        Examples:
+            >>> plot = await Plot.get_by_id_async(UUID('...'))
+            >>> print(plot)
+            Plot(plot_number=1, plot_row_number=2, plot_column_number=3, id=UUID('...'))
+            
+        Args:
+            id (UUID | int | str): The ID of the plot.
+        Returns:
+            Optional[Plot]: The plot instance, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            plot = await PlotViewModel.get_by_parameters_async(plot_id=id)
+            if not plot:
+                print(f"Plot with ID {id} does not exist.")
+                return None
+            plot = cls.model_validate(plot)
+            entity_cache.put(cls, plot)
             return plot
         except Exception as e:
             print(f"Error getting plot by ID: {e}")
@@ -279,6 +318,33 @@ class Plot(APIBase):
         except Exception as e:
             print(f"Error getting all plots: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Plot"]]:
+        """
+        Asynchronously retrieve all plots.
+
+        Examples:
+            >>> plots = await Plot.get_all_async()
+            >>> for plot in plots:
+            ...     print(plot)
+            Plot(plot_number=1, plot_row_number=2, plot_column_number=3, id=UUID(...))
+            Plot(plot_number=2, plot_row_number=3, plot_column_number=4, id=UUID(...))
+
+
+        Returns:
+            Optional[List[Plot]]: A list of all plots, or None if not found.
+        """
+        try:
+            plots = await PlotModel.all_async()
+            if not plots or len(plots) == 0:
+                print("No plots found.")
+                return None
+            plots = [cls.model_validate(plot) for plot in plots]
+            return plots
+        except Exception as e:
+            print(f"Error getting all plots: {e}")
+            return None
         
     @classmethod
     def search(
@@ -336,7 +402,176 @@ class Plot(APIBase):
         except Exception as e:
             print(f"Error searching plots: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None
+    ) -> Optional[List["Plot"]]:
+        """
+        Asynchronously search for plots based on various criteria.
+
+        Examples:
+            >>> plots = await Plot.search_async(plot_number=1, plot_row_number=2)
+            >>> for plot in plots:
+            ...     print(plot)
+            Plot(plot_number=1, plot_row_number=2, plot_column_number=3, id=UUID(...))
+
+        Args:
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The row number of the plot. Defaults to None.
+            plot_column_number (int, optional): The column number of the plot. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+        Returns:
+            Optional[List[Plot]]: A list of matching plots, or None if not found.
+        """
+        try:
+            if not any([plot_number, plot_row_number, plot_column_number, experiment_name, season_name, site_name]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            plots = await PlotViewModel.search_async(
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population
+            )
+            if not plots or len(plots) == 0:
+                print("No plots found with the provided search parameters.")
+                return None
+            plots = [cls.model_validate(plot) for plot in plots]
+            return plots if plots else None
+        except Exception as e:
+            print(f"Error searching plots: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None
+    ) -> tuple[List["Plot"], Optional[str]]:
+        """
+        Retrieve a page of plots using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> plots, next_cursor = Plot.paginate(page_limit=50)
+            >>> more_plots, next_cursor = Plot.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of plots in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The row number of the plot. Defaults to None.
+            plot_column_number (int, optional): The column number of the plot. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+        Returns:
+            tuple[List[Plot], Optional[str]]: The plots in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([plot_number, plot_row_number, plot_column_number, experiment_name, season_name, site_name, cultivar_accession, cultivar_population]):
+            instances, next_cursor = PlotViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population
+            )
+        else:
+            instances, next_cursor = PlotModel.paginate(page_limit=page_limit, cursor=cursor)
+        plots = [cls.model_validate(instance) for instance in instances]
+        return plots, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        cultivar_accession: str = None,
+        cultivar_population: str = None
+    ) -> tuple[List["Plot"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of plots using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> plots, next_cursor = await Plot.paginate_async(page_limit=50)
+            >>> more_plots, next_cursor = await Plot.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of plots in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The row number of the plot. Defaults to None.
+            plot_column_number (int, optional): The column number of the plot. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            cultivar_accession (str, optional): The accession of the cultivar. Defaults to None.
+            cultivar_population (str, optional): The population of the cultivar. Defaults to None.
+        Returns:
+            tuple[List[Plot], Optional[str]]: The plots in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([plot_number, plot_row_number, plot_column_number, experiment_name, season_name, site_name, cultivar_accession, cultivar_population]):
+            instances, next_cursor = await PlotViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                cultivar_accession=cultivar_accession,
+                cultivar_population=cultivar_population
+            )
+        else:
+            instances, next_cursor = await PlotModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        plots = [cls.model_validate(instance) for instance in instances]
+        return plots, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         plot_number: int = None,
@@ -387,6 +622,58 @@ class Plot(APIBase):
         except Exception as e:
             print(f"Error updating plot: {e}")
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        plot_info: dict = None,
+        plot_geometry_info: dict = None
+    ) -> Optional["Plot"]:
+        """
+        Asynchronously update the details of the plot.
+
+        Examples:
+            >>> plot = Plot.get_by_id(UUID('...'))
+            >>> updated_plot = await plot.update_async(plot_number=2, plot_row_number=3)
+            >>> print(updated_plot)
+            Plot(plot_number=2, plot_row_number=3, plot_column_number=3, id=UUID('...'))
+
+        Args:
+            plot_number (int, optional): The new plot number. Defaults to None.
+            plot_row_number (int, optional): The new row number. Defaults to None.
+            plot_column_number (int, optional): The new column number. Defaults to None.
+            plot_info (dict, optional): The new plot information. Defaults to None.
+            plot_geometry_info (dict, optional): The new geometry information. Defaults to None.
+        Returns:
+            Optional[Plot]: The updated plot instance, or None if an error occurred.
+        """
+        try:
+            if not any([plot_number, plot_row_number, plot_column_number, plot_info, plot_geometry_info]):
+                print("At least one parameter must be provided.")
+                return None
+
+            current_id = self.id
+            plot = await PlotModel.get_async(current_id)
+            if not plot:
+                print(f"Plot with ID {current_id} does not exist.")
+                return None
+            plot = await PlotModel.update_async(
+                plot,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                plot_info=plot_info,
+                plot_geometry_info=plot_geometry_info
+            )
+            plot = self.model_validate(plot)
+            await self.refresh_async()
+            return plot
+        except Exception as e:
+            print(f"Error updating plot: {e}")
+            return None
         
     def refresh(self) -> Optional["Plot"]:
         """
@@ -416,7 +703,37 @@ class Plot(APIBase):
         except Exception as e:
             print(f"Error refreshing plot: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Plot"]:
+        """
+        Asynchronously refresh the plot's data from the database.
+
+        Examples:
+            >>> plot = Plot.get_by_id(UUID('...'))
+            >>> refreshed_plot = await plot.refresh_async()
+            >>> print(refreshed_plot)
+            Plot(plot_number=1, plot_row_number=2, plot_column_number=3, id=UUID('...'))
+
+        Returns:
+            Optional[Plot]: The refreshed plot instance, or None if an error occurred.
+        """
+        try:
+            db_instance = await PlotViewModel.get_by_parameters_async(plot_id=self.id)
+            if not db_instance:
+                print(f"Plot with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            instance_dict = dict(instance)
+            for key, value in instance_dict.items():
+                if hasattr(self, key) and key != "id":
+                    value = getattr(instance, key)
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing plot: {e}")
+            return None
         
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete the plot.
@@ -441,6 +758,32 @@ class Plot(APIBase):
         except Exception as e:
             print(f"Error deleting plot: {e}")
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the plot.
+
+        Examples:
+            >>> plot = Plot.get_by_id(UUID('...'))
+            >>> deleted = await plot.delete_async()
+            >>> print(deleted)
+            True
+
+        Returns:
+            bool: True if the plot was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            plot = await PlotModel.get_async(current_id)
+            if not plot:
+                print(f"Plot with ID {current_id} does not exist.")
+                return False
+            await PlotModel.delete_async(plot)
+            return True
+        except Exception as e:
+            print(f"Error deleting plot: {e}")
+            return False
         
     def get_info(self) -> Optional[dict]:
         """
@@ -470,6 +813,7 @@ class Plot(APIBase):
             print(f"Error getting plot info: {e}")
             return None
         
+    @invalidates_cached_entity
     def set_info(self, plot_info: dict) -> Optional["Plot"]:
         """
         Set the additional information of the plot.
@@ -560,6 +904,7 @@ class Plot(APIBase):
             print(f"Error checking if plot belongs to experiment: {e}")
             return False
 
+    @invalidates_cached_entity
     def associate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Associate this plot with an experiment.
@@ -601,6 +946,7 @@ class Plot(APIBase):
             print(f"Error assigning experiment to plot: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_experiment(self) -> Optional["Experiment"]:
         """
         Unassociate this plot from its experiment.
@@ -694,6 +1040,7 @@ class Plot(APIBase):
             print(f"Error checking if plot belongs to season: {e}")
             return False
 
+    @invalidates_cached_entity
     def associate_season(self, season_name: str, experiment_name: str) -> Optional["Season"]:
         """
         Associate this plot with a season.
@@ -737,6 +1084,7 @@ class Plot(APIBase):
             print(f"Error assigning season to plot: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_season(self) -> Optional["Season"]:
         """
         Unassociate this plot from its season.
@@ -825,6 +1173,7 @@ class Plot(APIBase):
             print(f"Error checking if plot belongs to site: {e}")
             return False
 
+    @invalidates_cached_entity
     def associate_site(self, site_name: str) -> Optional["Site"]:
         """
         Associate this plot with a site.
@@ -866,6 +1215,7 @@ class Plot(APIBase):
             print(f"Error assigning site to plot: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_site(self) -> Optional["Site"]:
         """
         Unassociate this plot from its site.
@@ -923,6 +1273,7 @@ class Plot(APIBase):
             print(f"Error getting associated cultivars: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_cultivar(
         self,
         cultivar_accession: str,
@@ -972,6 +1323,7 @@ class Plot(APIBase):
             print(f"Error assigning cultivar to plot: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_cultivar(
         self,
         cultivar_accession: str,
@@ -0,0 +1,101 @@
+"""
+Background prefetching of record files for data-loading loops.
+
+`prefetch_record_files` wraps an iterable of records, e.g. the generator
+returned by `SensorRecord.search` or `Sensor.search_records`, and yields
+each record together with its file. The files of the next records are
+fetched on a thread pool while the caller works on the current one, so a
+training or preprocessing loop does not wait on storage latency for every
+file.
+
+Records come out in input order. At most `depth` files are fetched ahead
+of the caller, which bounds the memory held when yielding file contents.
+"""
+
+from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+from gemini.api.base import get_file_cache, get_minio_storage_provider
+from gemini.api.uploads import DEFAULT_UPLOAD_WORKERS
+
+T = TypeVar("T")
+
+DEFAULT_PREFETCH_DEPTH = 8
+
+
+def prefetch_record_files(
+    records: Iterable[T],
+    depth: int = DEFAULT_PREFETCH_DEPTH,
+    workers: Optional[int] = None,
+    as_bytes: bool = False,
+    use_cache: bool = True,
+    validate: bool = True,
+    bucket_name: str = "gemini",
+    raise_errors: bool = False
+) -> Iterator[Tuple[T, Optional[Union[Path, bytes]]]]:
+    """
+    Yields records with their files, fetching the files of the next records in the background.
+
+    Paths point into the local file cache (see `get_file_cache`). Contents are read from the
+    cache, or straight from storage if `use_cache` is False.
+
+    Examples:
+        >>> records = SensorRecord.search(sensor_name="Camera A", collection_date=date(2024, 7, 1), lightweight=True)
+        >>> for record, path in prefetch_record_files(records, depth=16):
+        ...     image = Image.open(path)
+        >>> for record, content in prefetch_record_files(records, as_bytes=True, use_cache=False):
+        ...     image = decode_image(content)
+
+    Args:
+        records (Iterable): The records, with a `record_file` attribute. Read lazily, in the calling thread.
+        depth (int, optional): Number of files fetched ahead of the caller. Defaults to 8.
+        workers (int, optional): Number of fetch threads. Defaults to the smaller of `depth` and `DEFAULT_UPLOAD_WORKERS`.
+        as_bytes (bool, optional): Yield the file contents instead of a local path. Defaults to False.
+        use_cache (bool, optional): Fetch contents through the local file cache. Paths always do. Defaults to True.
+        validate (bool, optional): Check cached copies against the stored files. Defaults to True.
+        bucket_name (str, optional): The bucket of the record files. Defaults to `gemini`.
+        raise_errors (bool, optional): Raise when a file cannot be fetched, instead of yielding None for it. Defaults to False.
+
+    Yields:
+        Tuple: Each record with its local path or contents, or None if it has no file or the fetch failed.
+    """
+    depth = max(depth, 1)
+    workers = max(workers or min(depth, DEFAULT_UPLOAD_WORKERS), 1)
+
+    def fetch(record: Any) -> Optional[Union[Path, bytes]]:
+        record_file = getattr(record, "record_file", None)
+        if not record_file:
+            return None
+        if not use_cache and as_bytes:
+            response = get_minio_storage_provider().download_file_stream(record_file, bucket_name=bucket_name)
+            try:
+                return response.read()
+            finally:
+                response.close()
+                response.release_conn()
+        path = get_file_cache().get(record_file, bucket_name=bucket_name, validate=validate)
+        return path.read_bytes() if as_bytes else path
+
+    def result(record: Any, future: Future) -> Tuple[Any, Optional[Union[Path, bytes]]]:
+        try:
+            return record, future.result()
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Error fetching record file {getattr(record, 'record_file', None)}: {e}")
+            return record, None
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gemini-prefetch")
+    pending: Deque[Tuple[Any, Future]] = deque()
+    try:
+        for record in records:
+            pending.append((record, executor.submit(fetch, record)))
+            if len(pending) > depth:
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+    finally:
+        # Stop fetching ahead when the caller stops iterating early
+        executor.shutdown(wait=False, cancel_futures=True)
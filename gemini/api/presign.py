@@ -0,0 +1,170 @@
+"""
+Pre-signed download URLs for record files.
+
+A pre-signed URL lets a client download an object straight from storage,
+without the bytes passing through the REST API. Signing is a local
+computation, but bulk downloads ask for the same files over and over, so
+`PresignedURLCache` keeps the URLs it signed and hands them out again
+while they have enough validity left.
+
+The validity of new URLs defaults to the `GEMINI_PRESIGNED_URL_EXPIRY`
+environment variable, in seconds (1 hour if unset).
+"""
+
+import os
+import time
+import threading
+from uuid import UUID
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from gemini.api.base import get_minio_storage_provider
+
+DEFAULT_PRESIGNED_URL_EXPIRY = timedelta(seconds=int(os.getenv("GEMINI_PRESIGNED_URL_EXPIRY", "3600")))
+
+# Maximum number of record IDs per batch request
+MAX_PRESIGN_BATCH = 5000
+
+
+class PresignedURLCache:
+    """
+    In-process cache of pre-signed download URLs.
+
+    Features:
+    - Reuses a URL while at least `min_remaining` of its validity is left
+    - Bounded size with least recently used eviction
+    - Safe to use from multiple threads
+    """
+
+    def __init__(
+        self,
+        expires: timedelta = DEFAULT_PRESIGNED_URL_EXPIRY,
+        min_remaining: Optional[timedelta] = None,
+        max_entries: int = 100000
+    ):
+        """
+        Create a cache.
+
+        Args:
+            expires (timedelta, optional): Validity of new URLs. Defaults to `DEFAULT_PRESIGNED_URL_EXPIRY`.
+            min_remaining (timedelta, optional): Validity a cached URL must have left to be reused. Defaults to half of `expires`.
+            max_entries (int, optional): Maximum number of cached URLs. Defaults to 100000.
+        """
+        self.expires = expires
+        self.min_remaining = expires / 2 if min_remaining is None else min_remaining
+        self.max_entries = max_entries
+        self._urls: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_url(self, object_name: str, bucket_name: str = "gemini") -> Tuple[str, datetime]:
+        """
+        Retrieves a pre-signed download URL for an object, signing a new one if none is cached.
+
+        The object is not checked for existence.
+
+        Examples:
+            >>> url, expires_at = get_presigned_url_cache().get_url("sensor_data/Experiment A/.../1719835200000.jpg")
+
+        Args:
+            object_name (str): The key of the object.
+            bucket_name (str, optional): The bucket. Defaults to `gemini`.
+
+        Returns:
+            Tuple[str, datetime]: The URL and the time it expires.
+        """
+        key = (bucket_name, object_name)
+        now = time.time()
+        with self._lock:
+            cached = self._urls.get(key)
+            if cached is not None and cached[1] - now >= self.min_remaining.total_seconds():
+                self._urls.move_to_end(key)
+                return cached[0], _utc(cached[1])
+        url = get_minio_storage_provider().get_download_url(
+            object_name,
+            expires=self.expires,
+            bucket_name=bucket_name,
+            check_exists=False
+        )
+        expires_at = now + self.expires.total_seconds()
+        with self._lock:
+            self._urls[key] = (url, expires_at)
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.max_entries:
+                self._urls.popitem(last=False)
+        return url, _utc(expires_at)
+
+    def clear(self) -> None:
+        """
+        Removes every cached URL.
+        """
+        with self._lock:
+            self._urls.clear()
+
+
+_presigned_url_cache: Optional[PresignedURLCache] = None
+_presigned_url_cache_lock = threading.Lock()
+
+
+def get_presigned_url_cache() -> PresignedURLCache:
+    """
+    Retrieves the pre-signed URL cache shared by the process, creating it on first use.
+
+    Returns:
+        PresignedURLCache: The cache.
+    """
+    global _presigned_url_cache
+    if _presigned_url_cache is None:
+        with _presigned_url_cache_lock:
+            if _presigned_url_cache is None:
+                _presigned_url_cache = PresignedURLCache()
+    return _presigned_url_cache
+
+
+async def record_download_urls_async(model_class: Any, record_ids: Iterable[Any], bucket_name: str = "gemini") -> List[Dict[str, Any]]:
+    """
+    Retrieves pre-signed download URLs for the files of records, reading the records in one query.
+
+    Args:
+        model_class: The database model of the records, e.g. `SensorRecordModel`.
+        record_ids (Iterable): The record IDs, at most `MAX_PRESIGN_BATCH`.
+        bucket_name (str, optional): The bucket of the record files. Defaults to `gemini`.
+
+    Returns:
+        List[dict]: One entry per ID, in input order, with `record_id`, `record_file`, `url`,
+            `expires_at` and `error`, which is set for missing records or records without a file.
+
+    Raises:
+        ValueError: If more than `MAX_PRESIGN_BATCH` IDs are given.
+    """
+    record_ids = [str(record_id) for record_id in record_ids]
+    if len(record_ids) > MAX_PRESIGN_BATCH:
+        raise ValueError(f"At most {MAX_PRESIGN_BATCH} record IDs can be presigned at once, got {len(record_ids)}.")
+    canonical_ids = [_canonical_uuid(record_id) for record_id in record_ids]
+    valid_ids = [record_id for record_id in dict.fromkeys(canonical_ids) if record_id is not None]
+    records = await model_class.get_many_async(valid_ids) if valid_ids else []
+    record_files = {_canonical_uuid(record.id): record.record_file for record in records}
+    cache = get_presigned_url_cache()
+    urls = []
+    for record_id, canonical_id in zip(record_ids, canonical_ids):
+        entry = {"record_id": record_id, "record_file": None, "url": None, "expires_at": None, "error": None}
+        if canonical_id not in record_files:
+            entry["error"] = "Record not found"
+        elif not record_files[canonical_id]:
+            entry["error"] = "Record has no file"
+        else:
+            entry["record_file"] = record_files[canonical_id]
+            entry["url"], entry["expires_at"] = cache.get_url(record_files[canonical_id], bucket_name=bucket_name)
+        urls.append(entry)
+    return urls
+
+
+def _canonical_uuid(value: Any) -> Optional[str]:
+    try:
+        return str(value if isinstance(value, UUID) else UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def _utc(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
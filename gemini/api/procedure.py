@@ -20,7 +20,7 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
@@ -30,6 +30,7 @@ from gemini.api.base import APIBase
 from gemini.api.dataset import Dataset, GEMINIDatasetType
 from gemini.api.procedure_run import ProcedureRun
 from gemini.api.procedure_record import ProcedureRecord
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.procedures import ProcedureModel
 from gemini.db.models.associations import ExperimentProcedureModel, ProcedureDatasetModel
 from gemini.db.models.views.experiment_views import ExperimentProceduresViewModel
@@ -39,6 +40,8 @@ from gemini.db.models.views.run_views import ProcedureRunsViewModel
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from gemini.api.journal import IngestionJournal
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment
     from gemini.api.dataset import Dataset
     from gemini.api.procedure_run import ProcedureRun
@@ -185,6 +188,32 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error getting procedure by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Procedure"]:
+        """
+        Asynchronously retrieve a procedure by its ID.
+
+        Examples:
+            >>> await Procedure.get_by_id_async(UUID('...'))
+            Procedure(procedure_name='MyProcedure', id=UUID('...'))
+
+
+        Args:
+            id (UUID | int | str): The ID of the procedure.
+        Returns:
+            Optional[Procedure]: The procedure, or None if not found.
+        """
+        try:
+            db_instance = await ProcedureModel.get_async(id)
+            if not db_instance:
+                print(f"Procedure with ID {id} does not exist.")
+                return None
+            procedure = cls.model_validate(db_instance)
+            return procedure
+        except Exception as e:
+            print(f"Error getting procedure by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["Procedure"]]:
@@ -211,6 +240,32 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error getting all procedures: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Procedure"]]:
+        """
+        Asynchronously retrieve all procedures.
+
+        Examples:
+            >>> procedures = await Procedure.get_all_async()
+            >>> for proc in procedures:
+            ...     print(proc)
+            Procedure(procedure_name='Procedure1', id=UUID('...'))
+            Procedure(procedure_name='Procedure2', id=UUID('...'))
+
+        Returns:
+            Optional[List[Procedure]]: List of all procedures, or None if not found.
+        """
+        try:
+            procedures = await ProcedureModel.all_async()
+            if not procedures or len(procedures) == 0:
+                print("No procedures found.")
+                return None
+            procedures = [cls.model_validate(procedure) for procedure in procedures]
+            return procedures
+        except Exception as e:
+            print(f"Error getting all procedures: {e}")
+            return None
         
     @classmethod
     def search(
@@ -253,6 +308,129 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error searching procedures: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        procedure_name: str = None,
+        procedure_info: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["Procedure"]]:
+        """
+        Asynchronously search for procedures based on various criteria.
+
+        Examples:
+            >>> procedures = await Procedure.search_async(procedure_name="MyProcedure")
+            >>> for proc in procedures:
+            ...     print(proc)
+            Procedure(procedure_name='MyProcedure', id=UUID('...'))
+
+
+        Args:
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List[Procedure]]: List of matching procedures, or None if not found.
+        """
+        try:
+            if not any([procedure_name, procedure_info, experiment_name]):
+                print("At least one search parameter must be provided.")
+                return None
+            procedures = await ExperimentProceduresViewModel.search_async(
+                procedure_name=procedure_name,
+                procedure_info=procedure_info,
+                experiment_name=experiment_name
+            )
+            if not procedures or len(procedures) == 0:
+                print("No procedures found with the provided search parameters.")
+                return None
+            procedures = [cls.model_validate(procedure) for procedure in procedures]
+            return procedures
+        except Exception as e:
+            print(f"Error searching procedures: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        procedure_name: str = None,
+        procedure_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Procedure"], Optional[str]]:
+        """
+        Retrieve a page of procedures using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> procedures, next_cursor = Procedure.paginate(page_limit=50)
+            >>> more_procedures, next_cursor = Procedure.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of procedures in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Procedure], Optional[str]]: The procedures in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([procedure_name, procedure_info, experiment_name]):
+            instances, next_cursor = ExperimentProceduresViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                procedure_name=procedure_name,
+                procedure_info=procedure_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = ProcedureModel.paginate(page_limit=page_limit, cursor=cursor)
+        procedures = [cls.model_validate(instance) for instance in instances]
+        return procedures, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        procedure_name: str = None,
+        procedure_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Procedure"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of procedures using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> procedures, next_cursor = await Procedure.paginate_async(page_limit=50)
+            >>> more_procedures, next_cursor = await Procedure.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of procedures in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Procedure], Optional[str]]: The procedures in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([procedure_name, procedure_info, experiment_name]):
+            instances, next_cursor = await ExperimentProceduresViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                procedure_name=procedure_name,
+                procedure_info=procedure_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await ProcedureModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        procedures = [cls.model_validate(instance) for instance in instances]
+        return procedures, next_cursor
+
         
     def update(
         self,
@@ -294,6 +472,47 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error updating procedure: {e}")
             return None
+
+    async def update_async(
+        self,
+        procedure_name: str = None,
+        procedure_info: dict = None
+    ) -> Optional["Procedure"]:
+        """
+        Asynchronously update the details of the procedure.
+
+        Examples:
+            >>> procedure = Procedure.get("MyProcedure")
+            >>> updated_procedure = await procedure.update_async(procedure_name="UpdatedProcedure")
+            >>> print(updated_procedure)
+            Procedure(procedure_name='UpdatedProcedure', id=UUID('...'))
+
+        Args:
+            procedure_name (str, optional): The new name. Defaults to None.
+            procedure_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[Procedure]: The updated procedure, or None if an error occurred.
+        """
+        try:
+            if not any([procedure_name, procedure_info]):
+                print("At least one parameter must be provided.")
+                return None
+            current_id = self.id
+            procedure = await ProcedureModel.get_async(current_id)
+            if not procedure:
+                print(f"Procedure with ID {current_id} does not exist.")
+                return None
+            procedure = await ProcedureModel.update_async(
+                procedure,
+                procedure_name=procedure_name,
+                procedure_info=procedure_info
+            )
+            procedure = self.model_validate(procedure)
+            await self.refresh_async()
+            return procedure
+        except Exception as e:
+            print(f"Error updating procedure: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -319,6 +538,31 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error deleting procedure: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the procedure.
+
+        Examples:
+            >>> procedure = Procedure.get("MyProcedure")
+            >>> success = await procedure.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the procedure was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            procedure = await ProcedureModel.get_async(current_id)
+            if not procedure:
+                print(f"Procedure with ID {current_id} does not exist.")
+                return False
+            await ProcedureModel.delete_async(procedure)
+            return True
+        except Exception as e:
+            print(f"Error deleting procedure: {e}")
+            return False
         
     def refresh(self) -> Optional["Procedure"]:
         """
@@ -346,6 +590,33 @@ class Procedure(APIBase):
         except Exception as e:
             print(f"Error refreshing procedure: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Procedure"]:
+        """
+        Asynchronously refresh the procedure's data from the database.
+
+        Examples:
+            >>> procedure = Procedure.get("MyProcedure")
+            >>> refreshed_procedure = await procedure.refresh_async()
+            >>> print(refreshed_procedure)
+            Procedure(procedure_name='MyProcedure', id=UUID('...'))
+
+        Returns:
+            Optional[Procedure]: The refreshed procedure, or None if an error occurred.
+        """
+        try:
+            db_instance = await ProcedureModel.get_async(self.id)
+            if not db_instance:
+                print(f"Procedure with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing procedure: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -800,8 +1071,13 @@ class Procedure(APIBase):
         season_name: str = None,
         site_name: str = None,
         record_files: List[str] = [],
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        record_info: List[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert multiple procedure records for this procedure.
 
@@ -831,8 +1107,13 @@ class Procedure(APIBase):
             site_name (str, optional): The name of the site. Defaults to None.
             record_files (List[str], optional): List of file paths or URIs. Defaults to [].
             record_info (List[dict], optional): List of additional info. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name and not season_name and not site_name:
@@ -871,14 +1152,20 @@ class Procedure(APIBase):
                 )
                 procedure_records.append(procedure_record)
 
-            success, inserted_record_ids = ProcedureRecord.insert(procedure_records)
-            if not success:
+            result = ProcedureRecord.insert(
+                procedure_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+            if not result.success:
                 print("Failed to insert procedure records.")
-                return False, []
-            return success, inserted_record_ids
+            return result
         except Exception as e:
             print(f"Error inserting procedure records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     def search_records(
         self,
@@ -887,7 +1174,8 @@ class Procedure(APIBase):
         experiment_name: str = None,
         season_name: str = None,
         site_name: str = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> List[ProcedureRecord]:
         """
         Search for procedure records associated with this procedure based on search parameters.
@@ -914,6 +1202,7 @@ class Procedure(APIBase):
             season_name (str, optional): The name of the season. Defaults to None.
             site_name (str, optional): The name of the site. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
         Returns:
             List[ProcedureRecord]: List of matching procedure records, or empty list if not found.
         """
@@ -928,7 +1217,66 @@ class Procedure(APIBase):
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching procedure records: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator[ProcedureRecord, None]:
+        """
+        Asynchronously search for procedure records associated with this procedure based on search parameters.
+
+        Examples:
+            >>> procedure = Procedure.get("MyProcedure")
+            >>> records = procedure.search_records_async(
+            ...     collection_date=date(2023, 1, 1),
+            ...     dataset_name="MyDataset",
+            ...     experiment_name="MyExperiment",
+            ...     season_name="MySeason",
+            ...     site_name="MySite",
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 1, 1, 12, 0), procedure_name='MyProcedure', dataset_name='MyDataset', experiment_name='MyExperiment', season_name='MySeason', site_name='MySite')
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 1, 2, 12, 0), procedure_name='MyProcedure', dataset_name='MyDataset', experiment_name='MyExperiment', season_name='MySeason', site_name='MySite')
+
+        Args:
+            collection_date (date, optional): The collection date. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[ProcedureRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = ProcedureRecord.search_async(
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                procedure_name=self.procedure_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -942,7 +1290,8 @@ class Procedure(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> List[ProcedureRecord]:
         """
         Filter procedure records associated with this procedure using a custom filter function.
@@ -969,6 +1318,7 @@ class Procedure(APIBase):
             experiment_names (Optional[List[str]], optional): List of experiment names. Defaults to None.
             season_names (Optional[List[str]], optional): List of season names. Defaults to None.
             site_names (Optional[List[str]], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
         Returns:
             List[ProcedureRecord]: List of filtered procedure records, or empty list if not found.
         """
@@ -980,9 +1330,42 @@ class Procedure(APIBase):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering procedure records: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this procedure and return them as a pandas DataFrame.
+
+        Examples:
+            >>> procedure = Procedure.get(procedure_name="Procedure A")
+            >>> frame = procedure.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `procedure_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ProcedureRecord.to_dataframe(flatten=flatten, **search_parameters, procedure_name=self.procedure_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this procedure and return them as a pandas DataFrame.
+
+        Examples:
+            >>> procedure = Procedure.get(procedure_name="Procedure A")
+            >>> frame = procedure.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `procedure_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ProcedureRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, procedure_names=[self.procedure_name])
\ No newline at end of file
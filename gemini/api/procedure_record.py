@@ -21,20 +21,28 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, AsyncGenerator, Callable, TYPE_CHECKING
 import os, mimetypes
 from uuid import UUID
-from tqdm import tqdm
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
-from gemini.api.base import APIBase, FileHandlerMixin
+from gemini.api.uploads import process_and_insert_chunks, upload_file_deduplicated
+from gemini.api.journal import IngestionJournal
+from gemini.api.base import APIBase, FileHandlerMixin, get_minio_storage_provider
+from gemini.api.presign import record_download_urls_async
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
 from gemini.db.models.columnar.procedure_records import ProcedureRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.procedure_records_immv import ProcedureRecordsIMMVModel
 
 
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class ProcedureRecord(APIBase, FileHandlerMixin):
     """
     Represents a record of a procedure, including metadata, associations to datasets, experiments, sites, and seasons, and file handling capabilities.
@@ -222,32 +230,85 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             raise None
         
     @classmethod
-    def insert(cls, records: List["ProcedureRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["ProcedureRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of procedure records into the database.
 
         Args:
             records (List[ProcedureRecord]): The records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to the GEMINI_UPLOAD_WORKERS environment variable, or 8.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Journaled work is skipped, so a failed import can be re-run from the start. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 print(f"No records provided for insertion.")
-                return False, []
-            records = [cls.process_record(record) for record in tqdm(records, desc="Processing ProcedureRecords")]
-            records_to_insert = []
-            for record in records:
-                record_dict = record.model_dump()
-                record_dict = {k: v for k, v in record_dict.items() if v is not None}
-                records_to_insert.append(record_dict)
-            print(f"Inserting {len(records_to_insert)} records.")
-            inserted_record_ids = ProcedureRecordModel.insert_bulk('procedure_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} records.")
-            return True, inserted_record_ids
+                return BulkInsertResult(error="No records provided for insertion.")
+            process = lambda record: cls.process_record(record, raise_errors=True)
+            if journal is not None:
+                process = journal.journaled(process, lambda record: cls.create_file_uri(record, check_exists=False))
+
+            def insert_chunk(chunk: List["ProcedureRecord"], chunk_index: int) -> BulkInsertResult:
+                records_to_insert = []
+                for record in chunk:
+                    record_dict = record.model_dump()
+                    record_dict = {k: v for k, v in record_dict.items() if v is not None}
+                    records_to_insert.append(record_dict)
+                if journal is not None:
+                    return journal.insert_batches(
+                        ProcedureRecordModel,
+                        'procedure_records_unique',
+                        records_to_insert,
+                        start_chunk=chunk_index,
+                        use_copy=use_copy,
+                        on_chunk=on_chunk,
+                        id_resolution=id_resolution
+                    )
+                return ProcedureRecordModel.insert_bulk_chunked(
+                    'procedure_records_unique',
+                    records_to_insert,
+                    start_chunk=chunk_index,
+                    use_copy=use_copy,
+                    on_chunk=on_chunk,
+                    id_resolution=id_resolution
+                )
+
+            print(f"Inserting {len(records)} records.")
+            # Each chunk is uploaded and then inserted, so chunk indices refer to positions in records
+            result = process_and_insert_chunks(
+                process,
+                records,
+                insert_chunk,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                workers=upload_workers,
+                desc="Processing ProcedureRecords"
+            )
+            print(f"Inserted {result.inserted} records, skipped {result.skipped} existing records, {result.failed} failed.")
+            if result.failed > 0:
+                print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+            elif result.upload_failures:
+                print(f"{len(result.upload_failures)} file uploads failed, resume from chunk {result.next_chunk} to retry them.")
+            return result
         except Exception as e:
             print(f"Error inserting ProcedureRecords: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     @classmethod
     def get(
@@ -339,9 +400,56 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error getting ProcedureRecord by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ProcedureRecord"]:
+        """
+        Asynchronously retrieve a procedure record by its ID.
+
+        Examples:
+            >>> record = await ProcedureRecord.get_by_id_async(UUID('...'))
+            >>> print(record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), procedure_name='SampleProcedure', dataset_name='SampleDataset', experiment_name='SampleExperiment', site_name='SampleSite', season_name='SampleSeason')
+
+        Args:
+            id (UUID | int | str): The ID of the procedure record.
+        Returns:
+            Optional[ProcedureRecord]: The procedure record, or None if not found.
+        """
+        try:
+            db_instance = await ProcedureRecordModel.get_async(id)
+            if not db_instance:
+                print(f"No ProcedureRecord found with ID: {id}")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting ProcedureRecord by ID: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["ProcedureRecord"]]:
+    async def get_download_urls_async(cls, record_ids: List[UUID | int | str]) -> List[dict]:
+        """
+        Asynchronously retrieve pre-signed download URLs for the files of procedure records, reading the records in one query.
+
+        Examples:
+            >>> urls = await ProcedureRecord.get_download_urls_async([UUID('...'), UUID('...')])
+            >>> urls[0]["url"]
+            'https://storage.example.org/gemini/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Args:
+            record_ids (List[UUID | int | str]): The IDs of the procedure records, at most `MAX_PRESIGN_BATCH`.
+        Returns:
+            List[dict]: One entry per ID with `record_id`, `record_file`, `url`, `expires_at` and `error`, or an empty list if an error occurred.
+        """
+        try:
+            return await record_download_urls_async(ProcedureRecordModel, record_ids)
+        except Exception as e:
+            print(f"Error getting ProcedureRecord download URLs: {e}")
+            return []
+
+    @classmethod
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ProcedureRecord"]]:
         """
         Retrieve all procedure records, up to a specified limit.
 
@@ -354,6 +462,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
 
         Args:
             limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
         Returns:
             Optional[List[ProcedureRecord]]: List of procedure records, or None if not found.
         """
@@ -362,6 +471,39 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             if not records or len(records) == 0:
                 print(f"No ProcedureRecords found.")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(record) for record in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all ProcedureRecords: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ProcedureRecord"]]:
+        """
+        Asynchronously retrieve all procedure records, up to a specified limit.
+
+        Examples:
+            >>> records = await ProcedureRecord.get_all_async(limit=10)
+            >>> for record in records:
+            ...     print(record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), procedure_name='SampleProcedure', dataset_name='SampleDataset', experiment_name='SampleExperiment', site_name='SampleSite', season_name='SampleSeason')
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), procedure_name='AnotherProcedure', dataset_name='AnotherDataset', experiment_name='AnotherExperiment', site_name='AnotherSite', season_name='AnotherSeason')
+
+        Args:
+            limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
+        Returns:
+            Optional[List[ProcedureRecord]]: List of procedure records, or None if not found.
+        """
+        try:
+            records = await ProcedureRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print(f"No ProcedureRecords found.")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(record) for record in records]
             return records
         except Exception as e:
@@ -378,7 +520,8 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         site_name: str = None,
         season_name: str = None,
         collection_date: date = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Generator["ProcedureRecord", None, None]:
         """
         Search for procedure records based on various criteria.
@@ -407,6 +550,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             season_name (str, optional): The name of the season. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
         Yields:
             ProcedureRecord: Matching procedure records.
         """
@@ -414,7 +558,8 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             if not any([procedure_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
                 print(f"At least one parameter must be provided for search.")
                 return
-            records = ProcedureRecordsIMMVModel.stream(
+            stream = ProcedureRecordsIMMVModel.stream_rows if lightweight else ProcedureRecordsIMMVModel.stream
+            records = stream(
                 procedure_name=procedure_name,
                 procedure_data=procedure_data,
                 dataset_name=dataset_name,
@@ -424,6 +569,9 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
                 collection_date=collection_date,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -431,6 +579,181 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             print(f"Error searching ProcedureRecords: {e}")
             yield None
 
+    @classmethod
+    async def search_async(
+        cls,
+        procedure_name: str = None,
+        procedure_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator["ProcedureRecord", None]:
+        """
+        Asynchronously search for procedure records based on various criteria.
+
+        Examples:
+            >>> records = ProcedureRecord.search_async(
+            ...     procedure_name="SampleProcedure",
+            ...     dataset_name="SampleDataset",
+            ...     experiment_name="SampleExperiment",
+            ...     site_name="SampleSite",
+            ...     season_name="SampleSeason",
+            ...     collection_date=date(2023, 10, 1),
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), procedure_name='SampleProcedure', dataset_name='SampleDataset', experiment_name='SampleExperiment', site_name='SampleSite', season_name='SampleSeason')
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), procedure_name='AnotherProcedure', dataset_name='AnotherDataset', experiment_name='AnotherExperiment', site_name='AnotherSite', season_name='AnotherSeason')
+
+        Args:
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
+        Yields:
+            ProcedureRecord: Matching procedure records.
+        """
+        try:
+            if not any([procedure_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
+                print(f"At least one parameter must be provided for search.")
+                return
+            stream = ProcedureRecordsIMMVModel.stream_rows_async if lightweight else ProcedureRecordsIMMVModel.stream_async
+            records = stream(
+                procedure_name=procedure_name,
+                procedure_data=procedure_data,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                site_name=site_name,
+                season_name=season_name,
+                collection_date=collection_date,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching ProcedureRecords: {e}")
+            yield None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        procedure_name: str = None,
+        procedure_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ProcedureRecord"], Optional[str]]:
+        """
+        Retrieve a page of procedure records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> procedure_records, next_cursor = ProcedureRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_procedure_records, next_cursor = ProcedureRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of procedure records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[ProcedureRecord], Optional[str]]: The procedure records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = ProcedureRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            procedure_name=procedure_name,
+            procedure_data=procedure_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        procedure_records = [cls.model_validate(record) for record in records]
+        return procedure_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        procedure_name: str = None,
+        procedure_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ProcedureRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of procedure records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> procedure_records, next_cursor = await ProcedureRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_procedure_records, next_cursor = await ProcedureRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of procedure records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+            procedure_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[ProcedureRecord], Optional[str]]: The procedure records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await ProcedureRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            procedure_name=procedure_name,
+            procedure_data=procedure_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        procedure_records = [cls.model_validate(record) for record in records]
+        return procedure_records, next_cursor
+
+
 
     @classmethod
     def filter(
@@ -441,7 +764,8 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         end_timestamp: datetime = None,
         experiment_names: List[str] = None,
         site_names: List[str] = None,
-        season_names: List[str] = None
+        season_names: List[str] = None,
+        lightweight: bool = False
     ) -> Generator["ProcedureRecord", None, None]:
         """
         Filter procedure records based on custom logic.
@@ -469,6 +793,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ProcedureRecord instances. Defaults to False.
         Yields:
             ProcedureRecord: Filtered procedure records.
         """
@@ -485,6 +810,9 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
                 site_names=site_names,
                 season_names=season_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -492,6 +820,50 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             print(f"Error filtering ProcedureRecords: {e}")
             yield None
 
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for procedure records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ProcedureRecord.to_dataframe(procedure_name="Procedure A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'procedure_data.value', 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `procedure_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ProcedureRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting procedure records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter procedure records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ProcedureRecord.filter_to_dataframe(procedure_names=["Procedure A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `procedure_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ProcedureRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered procedure records to a DataFrame: {e}")
+            return None
+
     def update(
         self,
         procedure_data: dict = None,
@@ -535,6 +907,50 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error updating ProcedureRecord: {e}")
             return None
+
+    async def update_async(
+        self,
+        procedure_data: dict = None,
+        record_info: dict = None
+    ) -> Optional["ProcedureRecord"]:
+        """
+        Asynchronously update the details of the procedure record.
+
+        Examples:
+            >>> record = ProcedureRecord.get_by_id(UUID('...'))
+            >>> updated_record = await record.update_async(
+            ...     procedure_data={"new_key": "new_value"},
+            ...     record_info={"new_info_key": "new_info_value"}
+            ... )
+            >>> print(updated_record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), procedure_name='SampleProcedure', dataset_name='SampleDataset', experiment_name='SampleExperiment', site_name='SampleSite', season_name='SampleSeason')
+
+        Args:
+            procedure_data (dict, optional): The new procedure data. Defaults to None.
+            record_info (dict, optional): The new record information. Defaults to None.
+        Returns:
+            Optional[ProcedureRecord]: The updated procedure record, or None if an error occurred.
+        """
+        try:
+            if not any([procedure_data, record_info]):
+                print(f"At least one parameter must be provided for update.")
+                return None
+            current_id = self.id
+            procedure_record = await ProcedureRecordModel.get_async(current_id)
+            if not procedure_record:
+                print(f"No ProcedureRecord found with ID: {current_id}")
+                return None
+            procedure_record = await ProcedureRecordModel.update_async(
+                procedure_record,
+                procedure_data=procedure_data,
+                record_info=record_info
+            )
+            procedure_record = self.model_validate(procedure_record)
+            await self.refresh_async()
+            return procedure_record
+        except Exception as e:
+            print(f"Error updating ProcedureRecord: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -560,6 +976,31 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error deleting ProcedureRecord: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the procedure record.
+
+        Examples:
+            >>> record = ProcedureRecord.get_by_id(UUID('...'))
+            >>> success = await record.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the procedure record was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            procedure_record = await ProcedureRecordModel.get_async(current_id)
+            if not procedure_record:
+                print(f"No ProcedureRecord found with ID: {current_id}")
+                return False
+            await ProcedureRecordModel.delete_async(procedure_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting ProcedureRecord: {e}")
+            return False
         
     def refresh(self) -> Optional["ProcedureRecord"]:
         """
@@ -587,6 +1028,33 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error refreshing ProcedureRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["ProcedureRecord"]:
+        """
+        Asynchronously refresh the procedure record's data from the database.
+
+        Examples:
+            >>> record = ProcedureRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await record.refresh_async()
+            >>> print(refreshed_record)
+            ProcedureRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), procedure_name='SampleProcedure', dataset_name='SampleDataset', experiment_name='SampleExperiment', site_name='SampleSite', season_name='SampleSeason')
+
+        Returns:
+            Optional[ProcedureRecord]: The refreshed procedure record, or None if an error occurred.
+        """
+        try:
+            db_instance = await ProcedureRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"No ProcedureRecord found with ID: {self.id}")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing ProcedureRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -651,7 +1119,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             return None
         
     @classmethod
-    def create_file_uri(cls, record: "ProcedureRecord") -> Optional[str]:
+    def create_file_uri(cls, record: "ProcedureRecord", check_exists: bool = True) -> Optional[str]:
         """
         Create a file URI for the given procedure record.
 
@@ -672,6 +1140,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (ProcedureRecord): The procedure record for which to create the file URI.
+            check_exists (bool, optional): Require `record_file` to be an existing local file. Defaults to True.
         Returns:
             Optional[str]: The file URI, or None if creation failed.
         """
@@ -680,7 +1149,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             if not original_file_path:
                 print(f"record_file is required to create file URI.")
                 return None
-            if not os.path.exists(original_file_path):
+            if check_exists and not os.path.exists(original_file_path):
                 print(f"File {original_file_path} does not exist.")
                 return None
             collection_date = record.collection_date.strftime("%Y-%m-%d")
@@ -699,7 +1168,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
 
 
     @classmethod
-    def process_record(cls, record: "ProcedureRecord") -> "ProcedureRecord":
+    def process_record(cls, record: "ProcedureRecord", raise_errors: bool = False) -> "ProcedureRecord":
         """
         Process a procedure record (custom logic, e.g., file upload).
 
@@ -720,6 +1189,7 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (ProcedureRecord): The procedure record to process.
+            raise_errors (bool, optional): Raise upload errors instead of printing them and returning the record unchanged. Defaults to False.
         Returns:
             ProcedureRecord: The processed procedure record.
         """
@@ -728,8 +1198,13 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
             if not file:
                 print(f"record_file is required to process ProcedureRecord.")
                 return record
+            if not os.path.exists(file) and file == cls.create_file_uri(record, check_exists=False):
+                # Already uploaded, e.g. by the earlier attempt of a resumed insert
+                return record
             file_key = cls.create_file_uri(record)
             if not file_key:
+                if raise_errors:
+                    raise ValueError(f"Failed to create file URI for ProcedureRecord: {record}")
                 print(f"Failed to create file URI for ProcedureRecord: {record}")
                 return record
             content_type, _ = mimetypes.guess_type(file)
@@ -743,16 +1218,20 @@ class ProcedureRecord(APIBase, FileHandlerMixin):
                 "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
                 "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
             }
-            cls.minio_storage_provider.upload_file(
+            content_hash, _ = upload_file_deduplicated(
+                get_minio_storage_provider(),
                 object_name=file_key,
-                input_file_path=file,
+                file_path=file,
                 bucket_name="gemini",
                 content_type=content_type,
                 metadata=file_metadata
             )
             record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": content_hash}
             return record
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error processing ProcedureRecord: {e}")
             return record
 
@@ -172,6 +172,31 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error getting ProcedureRun by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ProcedureRun"]:
+        """
+        Asynchronously retrieve a procedure run by its ID.
+
+        Examples:
+            >>> await ProcedureRun.get_by_id_async(UUID(...))
+            ProcedureRun(id=UUID(...), procedure_id=UUID(...), procedure_run_info={"status": "completed"})
+
+        Args:
+            id (UUID | int | str): The ID of the procedure run.
+        Returns:
+            Optional[ProcedureRun]: The procedure run, or None if not found.
+        """
+        try:
+            db_instance = await ProcedureRunModel.get_async(id)
+            if not db_instance:
+                print(f"ProcedureRun with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting ProcedureRun by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["ProcedureRun"]]:
@@ -195,6 +220,29 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error getting all ProcedureRuns: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["ProcedureRun"]]:
+        """
+        Asynchronously retrieve all procedure runs.
+
+        Examples:
+            >>> await ProcedureRun.get_all_async()
+            [ProcedureRun(id=UUID(...), procedure_id=UUID(...), procedure_run_info={"status": "completed"}), ...]
+
+        Returns:
+            Optional[List[ProcedureRun]]: List of all procedure runs, or None if not found.
+        """
+        try:
+            procedure_runs = await ProcedureRunModel.all_async()
+            if not procedure_runs or len(procedure_runs) == 0:
+                print("No ProcedureRuns found.")
+                return None
+            procedure_runs = [cls.model_validate(procedure_run) for procedure_run in procedure_runs]
+            return procedure_runs
+        except Exception as e:
+            print(f"Error getting all ProcedureRuns: {e}")
+            return None
         
     @classmethod
     def search(
@@ -231,6 +279,42 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error searching ProcedureRuns: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        procedure_run_info: dict = None,
+        procedure_name: str = None
+    ) -> Optional[List["ProcedureRun"]]:
+        """
+        Asynchronously search for procedure runs based on various criteria.
+
+        Examples:
+            >>> await ProcedureRun.search_async({"status": "completed"}, "DataProcessing")
+            [ProcedureRun(id=UUID(...), procedure_id=UUID(...), procedure_run_info={"status": "completed"}), ...]
+
+        Args:
+            procedure_run_info (dict, optional): The run information to search for. Defaults to None.
+            procedure_name (str, optional): The name of the procedure. Defaults to None.
+        Returns:
+            Optional[List[ProcedureRun]]: List of matching procedure runs, or None if not found.
+        """
+        try:
+            if not any([procedure_name, procedure_run_info]):
+                print("Either procedure_name or procedure_run_info must be provided.")
+                return None
+            procedure_runs = await ProcedureRunsViewModel.search_async(
+                procedure_run_info=procedure_run_info,
+                procedure_name=procedure_name
+            )
+            if not procedure_runs or len(procedure_runs) == 0:
+                print("No ProcedureRuns found with the provided search parameters.")
+                return None
+            procedure_runs = [cls.model_validate(procedure_run) for procedure_run in procedure_runs]
+            return procedure_runs
+        except Exception as e:
+            print(f"Error searching ProcedureRuns: {e}")
+            return None
         
     def update(self, procedure_run_info: dict = None) -> Optional["ProcedureRun"]:
         """
@@ -266,6 +350,41 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error updating ProcedureRun: {e}")
             return None
+
+    async def update_async(self, procedure_run_info: dict = None) -> Optional["ProcedureRun"]:
+        """
+        Asynchronously update the details of the procedure run.
+
+        Examples:
+            >>> procedure_run = ProcedureRun.get_by_id(UUID(...))
+            >>> updated_run = await procedure_run.update_async({"status": "completed"})
+            >>> print(updated_run)
+            ProcedureRun(id=UUID(...), procedure_id=UUID(...), procedure_run_info={"status": "completed"})
+
+        Args:
+            procedure_run_info (dict, optional): The new run information. Defaults to None.
+        Returns:
+            Optional[ProcedureRun]: The updated procedure run, or None if an error occurred.
+        """
+        try:
+            if not procedure_run_info:
+                print("procedure_run_info must be provided.")
+                return None
+            current_id = self.id
+            procedure_run = await ProcedureRunModel.get_async(id=current_id)
+            if not procedure_run:
+                print(f"ProcedureRun with ID {current_id} does not exist.")
+                return None
+            procedure_run = await ProcedureRunModel.update_async(
+                procedure_run,
+                procedure_run_info=procedure_run_info
+            )
+            instance = self.model_validate(procedure_run)
+            await self.refresh_async()
+            return instance 
+        except Exception as e:
+            print(f"Error updating ProcedureRun: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -291,6 +410,31 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error deleting ProcedureRun: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the procedure run.
+
+        Examples:
+            >>> procedure_run = ProcedureRun.get_by_id(UUID(...))
+            >>> success = await procedure_run.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the procedure run was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            procedure_run = await ProcedureRunModel.get_async(current_id)
+            if not procedure_run:
+                print(f"ProcedureRun with ID {current_id} does not exist.")
+                return False
+            await ProcedureRunModel.delete_async(procedure_run)
+            return True
+        except Exception as e:
+            print(f"Error deleting ProcedureRun: {e}")
+            return False
         
     def refresh(self) -> Optional["ProcedureRun"]:
         """
@@ -318,6 +462,33 @@ class ProcedureRun(APIBase):
         except Exception as e:
             print(f"Error refreshing ProcedureRun: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["ProcedureRun"]:
+        """
+        Asynchronously refresh the procedure run's data from the database.
+
+        Examples:
+            >>> procedure_run = ProcedureRun.get_by_id(UUID(...))
+            >>> refreshed_run = await procedure_run.refresh_async()
+            >>> print(refreshed_run)
+            ProcedureRun(id=UUID(...), procedure_id=UUID(...), procedure_run_info={"status": "in_progress"})
+
+        Returns:
+            Optional[ProcedureRun]: The refreshed procedure run, or None if an error occurred.
+        """
+        try:
+            db_instance = await ProcedureRunModel.get_async(self.id)
+            if not db_instance:
+                print(f"ProcedureRun with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing ProcedureRun: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
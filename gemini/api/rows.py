@@ -0,0 +1,165 @@
+"""
+Lightweight record objects for bulk reads.
+
+Building a Pydantic model for every row of a large search dominates the
+cost of exporting records. The functions in this module instead build
+tuple-backed `RecordRow` objects straight from result rows, without
+validation. A `RecordRow` has one field per field of its API class,
+supports attribute access, `model_dump` and `to_model`, and is accepted
+wherever the NDJSON endpoints expect a record.
+"""
+
+from collections import namedtuple
+from operator import attrgetter, itemgetter
+from typing import Any, AsyncIterable, AsyncGenerator, Callable, Dict, Generator, Iterable, Tuple
+
+from pydantic import AliasChoices
+
+_row_types: Dict[type, type] = {}
+
+
+class RecordRow(tuple):
+    """
+    Base class of the tuple-backed rows created by `record_row_type`.
+    """
+
+    __slots__ = ()
+
+    __api_class__: type = None
+
+    def model_dump(self, exclude_none: bool = False, **kwargs: Any) -> dict:
+        """
+        Converts the row to a dictionary keyed by field name.
+
+        Args:
+            exclude_none (bool): Leave out fields whose value is None. Defaults to False.
+
+        Returns:
+            dict: The field values.
+        """
+        if exclude_none:
+            return {name: value for name, value in zip(self._fields, self) if value is not None}
+        return dict(zip(self._fields, self))
+
+    def to_model(self) -> Any:
+        """
+        Validates the row into an instance of its API class.
+
+        Returns:
+            APIBase: The validated record.
+        """
+        return self.__api_class__.model_validate(self.model_dump())
+
+
+def record_row_type(api_class: type) -> type:
+    """
+    Retrieves the `RecordRow` type for an API class, creating it on first use.
+
+    Examples:
+        >>> SensorRecordRow = record_row_type(SensorRecord)
+        >>> SensorRecordRow._fields[:3]
+        ('id', 'timestamp', 'collection_date')
+
+    Args:
+        api_class (type): The API class, e.g. `SensorRecord`.
+
+    Returns:
+        type: A named tuple subclass of `RecordRow` with the fields of the API class.
+    """
+    row_type = _row_types.get(api_class)
+    if row_type is None:
+        fields = tuple(api_class.model_fields)
+        base = namedtuple(f"{api_class.__name__}Row", fields)
+        row_type = type(base.__name__, (RecordRow, base), {"__slots__": (), "__api_class__": api_class})
+        _row_types[api_class] = row_type
+    return row_type
+
+
+def field_aliases(api_class: type) -> Dict[str, Tuple[str, ...]]:
+    """
+    Retrieves the column names each field of an API class can be read from.
+
+    Args:
+        api_class (type): The API class, e.g. `SensorRecord`.
+
+    Returns:
+        dict: For each field, its own name followed by its validation aliases.
+    """
+    names = {}
+    for field_name, field in api_class.model_fields.items():
+        candidates = [field_name]
+        if isinstance(field.validation_alias, AliasChoices):
+            candidates.extend(choice for choice in field.validation_alias.choices if isinstance(choice, str))
+        elif isinstance(field.validation_alias, str):
+            candidates.append(field.validation_alias)
+        names[field_name] = tuple(candidates)
+    return names
+
+
+def _row_builder(api_class: type, first: Any) -> Callable[[Any], RecordRow]:
+    row_type = record_row_type(api_class)
+    make = row_type._make
+    candidates = field_aliases(api_class)
+    if hasattr(first, "_fields"):
+        # Result rows, values are read by position
+        positions = {key: index for index, key in enumerate(first._fields)}
+        indexes = [
+            next((positions[name] for name in candidates[field] if name in positions), None)
+            for field in row_type._fields
+        ]
+        if None not in indexes and len(indexes) > 1:
+            getter = itemgetter(*indexes)
+            return lambda row: make(getter(row))
+        return lambda row: make([None if index is None else row[index] for index in indexes])
+    # ORM instances, values are read by attribute
+    attributes = [
+        next((name for name in candidates[field] if hasattr(first, name)), None)
+        for field in row_type._fields
+    ]
+    if None not in attributes and len(attributes) > 1:
+        getter = attrgetter(*attributes)
+        return lambda instance: make(getter(instance))
+    return lambda instance: make([None if name is None else getattr(instance, name) for name in attributes])
+
+
+def to_record_rows(api_class: type, records: Iterable[Any]) -> Generator[RecordRow, None, None]:
+    """
+    Converts result rows or ORM instances to `RecordRow`s of an API class without validation.
+
+    The mapping from columns to fields is worked out once, from the first row.
+
+    Examples:
+        >>> rows = to_record_rows(SensorRecord, SensorRecordsIMMVModel.stream_rows(sensor_name="Sensor A"))
+        >>> next(rows).sensor_name
+        'Sensor A'
+
+    Args:
+        api_class (type): The API class whose fields the rows have.
+        records (Iterable): Result rows or ORM instances.
+
+    Yields:
+        RecordRow: The records.
+    """
+    build = None
+    for record in records:
+        if build is None:
+            build = _row_builder(api_class, record)
+        yield build(record)
+
+
+async def to_record_rows_async(api_class: type, records: AsyncIterable[Any]) -> AsyncGenerator[RecordRow, None]:
+    """
+    Asynchronously converts result rows or ORM instances to `RecordRow`s of an API class without validation.
+
+    Args:
+        api_class (type): The API class whose fields the rows have.
+        records (AsyncIterable): Result rows or ORM instances.
+
+    Yields:
+        RecordRow: The records.
+    """
+    build = None
+    async for record in records:
+        if build is None:
+            build = _row_builder(api_class, record)
+        yield build(record)
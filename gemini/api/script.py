@@ -20,7 +20,7 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
@@ -30,6 +30,7 @@ from gemini.api.base import APIBase
 from gemini.api.script_run import ScriptRun
 from gemini.api.script_record import ScriptRecord
 from gemini.api.dataset import Dataset, GEMINIDatasetType
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.scripts import ScriptModel
 from gemini.db.models.script_runs import ScriptRunModel
 from gemini.db.models.experiments import ExperimentModel
@@ -40,6 +41,8 @@ from gemini.db.models.views.run_views import ScriptRunsViewModel
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from gemini.api.journal import IngestionJournal
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment
     from gemini.api.dataset import Dataset
     from gemini.api.script_run import ScriptRun
@@ -199,6 +202,32 @@ class Script(APIBase):
             print(f"Error getting script by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Script"]:
+        """
+        Asynchronously retrieve a script by its ID.
+
+        Examples:
+            >>> script = await Script.get_by_id_async(UUID('...'))
+            >>> print(script)
+            Script(script_name=example_script, script_url=http://example.com/script.py, script_extension=.py, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the script.
+        Returns:
+            Optional[Script]: The script, or None if not found.
+        """
+        try:
+            db_instance = await ScriptModel.get_async(id)
+            if not db_instance:
+                print(f"Script with ID {id} does not exist.")
+                return None
+            script = cls.model_validate(db_instance)
+            return script
+        except Exception as e:
+            print(f"Error getting script by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["Script"]]:
         """
@@ -225,6 +254,32 @@ class Script(APIBase):
             print(f"Error getting all scripts: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Script"]]:
+        """
+        Asynchronously retrieve all scripts.
+
+        Examples:
+            >>> scripts = await Script.get_all_async()
+            >>> for script in scripts:
+            ...     print(script)
+            Script(script_name=example_script1, script_url=http://example.com/script1.py, script_extension=.py, id=UUID(...))
+            Script(script_name=example_script2, script_url=http://example.com/script2.py, script_extension=.py, id=UUID(...))
+
+        Returns:
+            Optional[List[Script]]: List of all scripts, or None if not found.
+        """
+        try:
+            scripts = await ScriptModel.all_async()
+            if not scripts or len(scripts) == 0:
+                print("No scripts found.")
+                return None
+            scripts = [cls.model_validate(script) for script in scripts]
+            return scripts
+        except Exception as e:
+            print(f"Error getting all scripts: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -273,6 +328,147 @@ class Script(APIBase):
             print(f"Error searching scripts: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        script_name: str = None,
+        script_url: str = None,
+        script_extension: str = None,
+        script_info: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["Script"]]:
+        """
+        Asynchronously search for scripts based on various criteria.
+
+        Examples:
+            >>> scripts = await Script.search_async(script_name="example_script")
+            >>> for script in scripts:
+            ...     print(script)
+            Script(script_name=example_script, script_url=http://example.com/script.py, script_extension=.py, id=UUID(...))
+
+
+        Args:
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_url (str, optional): The URL of the script. Defaults to None.
+            script_extension (str, optional): The file extension. Defaults to None.
+            script_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List[Script]]: List of matching scripts, or None if not found.
+        """
+        try:
+            if not any([script_name, script_info, script_url, script_extension, experiment_name]):
+                print("At least one search parameter must be provided.")
+                return None
+            scripts = await ExperimentScriptsViewModel.search_async(
+                script_name=script_name,
+                script_info=script_info,
+                script_url=script_url,
+                script_extension=script_extension,
+                experiment_name=experiment_name
+            )
+            if not scripts or len(scripts) == 0:
+                print("No scripts found with the provided search parameters.")
+                return None
+            scripts = [cls.model_validate(script) for script in scripts]
+            return scripts
+        except Exception as e:
+            print(f"Error searching scripts: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        script_name: str = None,
+        script_url: str = None,
+        script_extension: str = None,
+        script_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Script"], Optional[str]]:
+        """
+        Retrieve a page of scripts using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> scripts, next_cursor = Script.paginate(page_limit=50)
+            >>> more_scripts, next_cursor = Script.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of scripts in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_url (str, optional): The URL of the script. Defaults to None.
+            script_extension (str, optional): The file extension. Defaults to None.
+            script_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Script], Optional[str]]: The scripts in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([script_name, script_url, script_extension, script_info, experiment_name]):
+            instances, next_cursor = ExperimentScriptsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                script_name=script_name,
+                script_info=script_info,
+                script_url=script_url,
+                script_extension=script_extension,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = ScriptModel.paginate(page_limit=page_limit, cursor=cursor)
+        scripts = [cls.model_validate(instance) for instance in instances]
+        return scripts, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        script_name: str = None,
+        script_url: str = None,
+        script_extension: str = None,
+        script_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Script"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of scripts using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> scripts, next_cursor = await Script.paginate_async(page_limit=50)
+            >>> more_scripts, next_cursor = await Script.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of scripts in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_url (str, optional): The URL of the script. Defaults to None.
+            script_extension (str, optional): The file extension. Defaults to None.
+            script_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Script], Optional[str]]: The scripts in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([script_name, script_url, script_extension, script_info, experiment_name]):
+            instances, next_cursor = await ExperimentScriptsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                script_name=script_name,
+                script_info=script_info,
+                script_url=script_url,
+                script_extension=script_extension,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await ScriptModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        scripts = [cls.model_validate(instance) for instance in instances]
+        return scripts, next_cursor
+
+
     def update(
         self,
         script_name: str = None,
@@ -320,6 +516,53 @@ class Script(APIBase):
             print(f"Error updating script: {e}")
             return None
 
+    async def update_async(
+        self,
+        script_name: str = None,
+        script_url: str = None,
+        script_extension: str = None,
+        script_info: dict = None
+    ) -> Optional["Script"]:
+        """
+        Asynchronously update the details of the script.
+
+        Examples:
+            >>> script = Script.get(script_name="example_script")
+            >>> updated_script = await script.update_async(script_name="new_example_script")
+            >>> print(updated_script)
+            Script(script_name=new_example_script, script_url=http://example.com/script.py, script_extension=.py, id=UUID(...))
+
+        Args:
+            script_name (str, optional): The new name. Defaults to None.
+            script_url (str, optional): The new URL. Defaults to None.
+            script_extension (str, optional): The new file extension. Defaults to None.
+            script_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[Script]: The updated script, or None if an error occurred.
+        """
+        try:
+            if not any([script_name, script_url, script_extension, script_info]):
+                print("At least one update parameter must be provided.")
+                return None
+            current_id = self.id
+            script = await ScriptModel.get_async(current_id)
+            if not script:
+                print(f"Script with ID {current_id} does not exist.")
+                return None
+            script = await ScriptModel.update_async(
+                script,
+                script_name=script_name,
+                script_url=script_url,
+                script_extension=script_extension,
+                script_info=script_info
+            )
+            script = self.model_validate(script)
+            await self.refresh_async()
+            return script
+        except Exception as e:
+            print(f"Error updating script: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the script.
@@ -345,6 +588,31 @@ class Script(APIBase):
             print(f"Error deleting script: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the script.
+
+        Examples:
+            >>> script = Script.get(script_name="example_script")
+            >>> success = await script.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the script was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            script = await ScriptModel.get_async(current_id)
+            if not script:
+                print(f"Script with ID {current_id} does not exist.")
+                return False
+            await ScriptModel.delete_async(script)
+            return True
+        except Exception as e:
+            print(f"Error deleting script: {e}")
+            return False
+
     def refresh(self) -> Optional["Script"]:
         """
         Refresh the script's data from the database.
@@ -372,6 +640,33 @@ class Script(APIBase):
             print(f"Error refreshing script: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["Script"]:
+        """
+        Asynchronously refresh the script's data from the database.
+
+        Examples:
+            >>> script = Script.get(script_name="example_script")
+            >>> refreshed_script = await script.refresh_async()
+            >>> print(refreshed_script)
+            Script(script_name=example_script, script_url=http://example.com/script.py, script_extension=.py, id=UUID(...))
+
+        Returns:
+            Optional[Script]: The refreshed script, or None if an error occurred.
+        """
+        try:
+            db_instance = await ScriptModel.get_async(self.id)
+            if not db_instance:
+                print(f"Script with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing script: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the script.
@@ -824,8 +1119,13 @@ class Script(APIBase):
         season_name: str = None,
         site_name: str = None,
         record_files: List[str] = [],
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        record_info: List[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert multiple script records for this script.
 
@@ -855,8 +1155,13 @@ class Script(APIBase):
             site_name (str, optional): The name of the site. Defaults to None.
             record_files (List[str], optional): List of file paths or URIs. Defaults to [].
             record_info (List[dict], optional): List of additional info. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name and not season_name and not site_name:
@@ -895,14 +1200,20 @@ class Script(APIBase):
                 )
                 script_records.append(script_record)
 
-            success, inserted_record_ids = ScriptRecord.insert(script_records)
-            if not success:
+            result = ScriptRecord.insert(
+                script_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+            if not result.success:
                 print("Failed to insert script records.")
-                return False, []
-            return success, inserted_record_ids
+            return result
         except Exception as e:
             print(f"Error inserting script records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     def search_records(
         self,
@@ -911,7 +1222,8 @@ class Script(APIBase):
         experiment_name: str = None,
         season_name: str = None,
         site_name: str = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Optional[List[ScriptRecord]]:
         """
         Search for script records associated with this script based on search parameters.
@@ -938,6 +1250,7 @@ class Script(APIBase):
             season_name (str, optional): The name of the season. Defaults to None.
             site_name (str, optional): The name of the site. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
         Returns:
             Optional[List[ScriptRecord]]: List of matching script records, or None if not found.
         """
@@ -952,7 +1265,66 @@ class Script(APIBase):
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching script records: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator[ScriptRecord, None]:
+        """
+        Asynchronously search for script records associated with this script based on search parameters.
+
+        Examples:
+            >>> script = Script.get(script_name="example_script")
+            >>> records = script.search_records_async(
+            ...     collection_date=date(2023, 1, 1),
+            ...     dataset_name="example_dataset",
+            ...     experiment_name="example_experiment",
+            ...     season_name="example_season",
+            ...     site_name="example_site",
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            ScriptRecord(id=UUID(...), script_name='example_script', timestamp='2023-01-01T00:00:00', dataset_name='example_dataset', experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+            ScriptRecord(id=UUID(...), script_name='example_script', timestamp='2023-01-02T00:00:00', dataset_name='example_dataset', experiment_name='example_experiment', season_name='example_season', site_name='example_site')
+
+        Args:
+            collection_date (date, optional): The collection date. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[ScriptRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = ScriptRecord.search_async(
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                script_name=self.script_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -966,7 +1338,8 @@ class Script(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> Optional[List[ScriptRecord]]:
         """
         Filter script records associated with this script using a custom filter function.
@@ -993,6 +1366,7 @@ class Script(APIBase):
             experiment_names (Optional[List[str]], optional): List of experiment names. Defaults to None.
             season_names (Optional[List[str]], optional): List of season names. Defaults to None.
             site_names (Optional[List[str]], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
         Returns:
             Optional[List[ScriptRecord]]: List of filtered script records, or None if not found.
         """
@@ -1004,11 +1378,44 @@ class Script(APIBase):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering script records: {e}")
             return []
 
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this script and return them as a pandas DataFrame.
+
+        Examples:
+            >>> script = Script.get(script_name="Script A")
+            >>> frame = script.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `script_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ScriptRecord.to_dataframe(flatten=flatten, **search_parameters, script_name=self.script_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this script and return them as a pandas DataFrame.
+
+        Examples:
+            >>> script = Script.get(script_name="Script A")
+            >>> frame = script.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `script_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return ScriptRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, script_names=[self.script_name])
+
 
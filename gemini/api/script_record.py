@@ -21,18 +21,26 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, AsyncGenerator, Callable, TYPE_CHECKING
 import os, mimetypes
 from uuid import UUID
-from tqdm import tqdm
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
-from gemini.api.base import APIBase, FileHandlerMixin
+from gemini.api.uploads import process_and_insert_chunks, upload_file_deduplicated
+from gemini.api.journal import IngestionJournal
+from gemini.api.base import APIBase, FileHandlerMixin, get_minio_storage_provider
+from gemini.api.presign import record_download_urls_async
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
 from gemini.db.models.columnar.script_records import ScriptRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.script_records_immv import ScriptRecordsIMMVModel
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class ScriptRecord(APIBase, FileHandlerMixin):
     """
     Represents a record of a script, including metadata, associations to datasets, experiments, sites, and seasons, and file handling capabilities.
@@ -220,32 +228,85 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             raise None
         
     @classmethod
-    def insert(cls, records: List["ScriptRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["ScriptRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of script records into the database.
 
         Args:
             records (List[ScriptRecord]): The records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to the GEMINI_UPLOAD_WORKERS environment variable, or 8.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Journaled work is skipped, so a failed import can be re-run from the start. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 print(f"No records provided for insertion.")
-                return False, []
-            records = [cls.process_record(record) for record in tqdm(records, desc="Processing ScriptRecords")]
-            records_to_insert = []
-            for record in records:
-                record_dict = record.model_dump()
-                record_dict = {k: v for k, v in record_dict.items() if v is not None}
-                records_to_insert.append(record_dict)
-            print(f"Inserting {len(records_to_insert)} records.")
-            inserted_record_ids = ScriptRecordModel.insert_bulk('script_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} records.")
-            return True, inserted_record_ids
+                return BulkInsertResult(error="No records provided for insertion.")
+            process = lambda record: cls.process_record(record, raise_errors=True)
+            if journal is not None:
+                process = journal.journaled(process, lambda record: cls.create_file_uri(record, check_exists=False))
+
+            def insert_chunk(chunk: List["ScriptRecord"], chunk_index: int) -> BulkInsertResult:
+                records_to_insert = []
+                for record in chunk:
+                    record_dict = record.model_dump()
+                    record_dict = {k: v for k, v in record_dict.items() if v is not None}
+                    records_to_insert.append(record_dict)
+                if journal is not None:
+                    return journal.insert_batches(
+                        ScriptRecordModel,
+                        'script_records_unique',
+                        records_to_insert,
+                        start_chunk=chunk_index,
+                        use_copy=use_copy,
+                        on_chunk=on_chunk,
+                        id_resolution=id_resolution
+                    )
+                return ScriptRecordModel.insert_bulk_chunked(
+                    'script_records_unique',
+                    records_to_insert,
+                    start_chunk=chunk_index,
+                    use_copy=use_copy,
+                    on_chunk=on_chunk,
+                    id_resolution=id_resolution
+                )
+
+            print(f"Inserting {len(records)} records.")
+            # Each chunk is uploaded and then inserted, so chunk indices refer to positions in records
+            result = process_and_insert_chunks(
+                process,
+                records,
+                insert_chunk,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                workers=upload_workers,
+                desc="Processing ScriptRecords"
+            )
+            print(f"Inserted {result.inserted} records, skipped {result.skipped} existing records, {result.failed} failed.")
+            if result.failed > 0:
+                print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+            elif result.upload_failures:
+                print(f"{len(result.upload_failures)} file uploads failed, resume from chunk {result.next_chunk} to retry them.")
+            return result
         except Exception as e:
             print(f"Error inserting ScriptRecords: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
     @classmethod
     def get(
@@ -337,9 +398,56 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error getting ScriptRecord by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ScriptRecord"]:
+        """
+        Asynchronously retrieve a script record by its ID.
+
+        Examples:
+            >>> script_record = await ScriptRecord.get_by_id_async(UUID('...'))
+            >>> print(script_record)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), script_name='example_script', dataset_name='example_dataset', experiment_name='example_experiment', site_name='example_site', season_name='example_season)
+
+        Args:
+            id (UUID | int | str): The ID of the script record.
+        Returns:
+            Optional[ScriptRecord]: The script record, or None if not found.
+        """
+        try:
+            db_instance = await ScriptRecordModel.get_async(id)
+            if not db_instance:
+                print(f"No ScriptRecord found with ID: {id}")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting ScriptRecord by ID: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["ScriptRecord"]]:
+    async def get_download_urls_async(cls, record_ids: List[UUID | int | str]) -> List[dict]:
+        """
+        Asynchronously retrieve pre-signed download URLs for the files of script records, reading the records in one query.
+
+        Examples:
+            >>> urls = await ScriptRecord.get_download_urls_async([UUID('...'), UUID('...')])
+            >>> urls[0]["url"]
+            'https://storage.example.org/gemini/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Args:
+            record_ids (List[UUID | int | str]): The IDs of the script records, at most `MAX_PRESIGN_BATCH`.
+        Returns:
+            List[dict]: One entry per ID with `record_id`, `record_file`, `url`, `expires_at` and `error`, or an empty list if an error occurred.
+        """
+        try:
+            return await record_download_urls_async(ScriptRecordModel, record_ids)
+        except Exception as e:
+            print(f"Error getting ScriptRecord download URLs: {e}")
+            return []
+
+    @classmethod
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ScriptRecord"]]:
         """
         Retrieve all script records, up to a specified limit.
 
@@ -352,6 +460,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
 
         Args:
             limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
         Returns:
             Optional[List[ScriptRecord]]: List of script records, or None if not found.
         """
@@ -360,6 +469,39 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             if not records or len(records) == 0:
                 print(f"No ScriptRecords found.")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(record) for record in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all ScriptRecords: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["ScriptRecord"]]:
+        """
+        Asynchronously retrieve all script records, up to a specified limit.
+
+        Examples:
+            >>> script_records = await ScriptRecord.get_all_async(limit=10)
+            >>> for record in script_records:
+            ...     print(record)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), script_name='example_script', dataset_name='example_dataset', experiment_name='example_experiment', site_name='example_site', season_name='example_season)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), script_name='another_script', dataset_name='another_dataset', experiment_name='another_experiment', site_name='another_site', season_name='another_season)
+
+        Args:
+            limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
+        Returns:
+            Optional[List[ScriptRecord]]: List of script records, or None if not found.
+        """
+        try:
+            records = await ScriptRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print(f"No ScriptRecords found.")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(record) for record in records]
             return records
         except Exception as e:
@@ -376,7 +518,8 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         site_name: str = None,
         season_name: str = None,
         collection_date: date = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Generator["ScriptRecord", None, None]:
         """
         Search for script records based on various criteria.
@@ -404,6 +547,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             season_name (str, optional): The name of the season. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
         Yields:
             ScriptRecord: Matching script records.
         """
@@ -411,7 +555,8 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             if not any([script_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
                 print(f"At least one parameter must be provided for search.")
                 return
-            records = ScriptRecordsIMMVModel.stream(
+            stream = ScriptRecordsIMMVModel.stream_rows if lightweight else ScriptRecordsIMMVModel.stream
+            records = stream(
                 script_name=script_name,
                 script_data=script_data,
                 dataset_name=dataset_name,
@@ -421,6 +566,9 @@ class ScriptRecord(APIBase, FileHandlerMixin):
                 collection_date=collection_date,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -428,6 +576,180 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             print(f"Error searching ScriptRecords: {e}")
             yield None
 
+    @classmethod
+    async def search_async(
+        cls,
+        script_name: str = None,
+        script_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator["ScriptRecord", None]:
+        """
+        Asynchronously search for script records based on various criteria.
+
+        Examples:
+            >>> script_records = ScriptRecord.search_async(
+            ...     script_name="example_script",
+            ...     dataset_name="example_dataset",
+            ...     experiment_name="example_experiment",
+            ...     site_name="example_site",
+            ...     season_name="example_season",
+            ...     collection_date=date(2023, 10, 1),
+            ...     record_info={"info_key": "info_value"}
+            ... )
+            >>> async for record in script_records:
+            ...     print(record)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), script_name='example_script', dataset_name='example_dataset', experiment_name='example_experiment', site_name='example_site', season_name='example_season)
+
+        Args:
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
+        Yields:
+            ScriptRecord: Matching script records.
+        """
+        try:
+            if not any([script_name, dataset_name, experiment_name, site_name, season_name, collection_date, record_info]):
+                print(f"At least one parameter must be provided for search.")
+                return
+            stream = ScriptRecordsIMMVModel.stream_rows_async if lightweight else ScriptRecordsIMMVModel.stream_async
+            records = stream(
+                script_name=script_name,
+                script_data=script_data,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                site_name=site_name,
+                season_name=season_name,
+                collection_date=collection_date,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching ScriptRecords: {e}")
+            yield None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        script_name: str = None,
+        script_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ScriptRecord"], Optional[str]]:
+        """
+        Retrieve a page of script records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> script_records, next_cursor = ScriptRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_script_records, next_cursor = ScriptRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of script records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[ScriptRecord], Optional[str]]: The script records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = ScriptRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            script_name=script_name,
+            script_data=script_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        script_records = [cls.model_validate(record) for record in records]
+        return script_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        script_name: str = None,
+        script_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["ScriptRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of script records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> script_records, next_cursor = await ScriptRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_script_records, next_cursor = await ScriptRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of script records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            script_name (str, optional): The name of the script. Defaults to None.
+            script_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[ScriptRecord], Optional[str]]: The script records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await ScriptRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            script_name=script_name,
+            script_data=script_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        script_records = [cls.model_validate(record) for record in records]
+        return script_records, next_cursor
+
+
     @classmethod
     def filter(
         cls,
@@ -437,7 +759,8 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         dataset_names: List[str] = None,
         experiment_names: List[str] = None,
         season_names: List[str] = None,
-        site_names: List[str] = None
+        site_names: List[str] = None,
+        lightweight: bool = False
     ) -> Generator["ScriptRecord", None, None]:
         """
         Filter script records based on custom logic.
@@ -465,6 +788,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of ScriptRecord instances. Defaults to False.
         Yields:
             ScriptRecord: Filtered script records.
         """
@@ -481,12 +805,59 @@ class ScriptRecord(APIBase, FileHandlerMixin):
                 season_names=season_names,
                 site_names=site_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
         except Exception as e:
             print(f"Error filtering ScriptRecords: {e}")
             yield None
+
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for script records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ScriptRecord.to_dataframe(script_name="Script A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'script_data.value', 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `script_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ScriptRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting script records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter script records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = ScriptRecord.filter_to_dataframe(script_names=["Script A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `script_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = ScriptRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered script records to a DataFrame: {e}")
+            return None
     
 
     def update(
@@ -532,6 +903,50 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error updating ScriptRecord: {e}")
             return None
+
+    async def update_async(
+        self,
+        script_data: dict = None,
+        record_info: dict = None
+    ) -> Optional["ScriptRecord"]:
+        """
+        Asynchronously update the details of the script record.
+
+        Examples:
+            >>> script_record = ScriptRecord.get_by_id(UUID('...'))
+            >>> updated_record = await script_record.update_async(
+            ...     script_data={"new_key": "new_value"},
+            ...     record_info={"new_info_key": "new_info_value"}
+            ... )
+            >>> print(updated_record)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), script_name='example_script', dataset_name='example_dataset', experiment_name='example_experiment', site_name='example_site', season_name='example_season)
+
+        Args:
+            script_data (dict, optional): The new script data. Defaults to None.
+            record_info (dict, optional): The new record information. Defaults to None.
+        Returns:
+            Optional[ScriptRecord]: The updated script record, or None if an error occurred.
+        """
+        try:
+            if not any([script_data, record_info]):
+                print(f"At least one parameter must be provided for update.")
+                return None
+            current_id = self.id
+            script_record = await ScriptRecordModel.get_async(current_id)
+            if not script_record:
+                print(f"No ScriptRecord found with ID: {current_id}")
+                return None
+            script_record = await ScriptRecordModel.update_async(
+                script_record,
+                script_data=script_data,
+                record_info=record_info
+            )
+            script_record = self.model_validate(script_record)
+            await self.refresh_async()
+            return script_record
+        except Exception as e:
+            print(f"Error updating ScriptRecord: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -557,6 +972,31 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error deleting ScriptRecord: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the script record.
+
+        Examples:
+            >>> script_record = ScriptRecord.get_by_id(UUID('...'))
+            >>> success = await script_record.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the script record was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            script_record = await ScriptRecordModel.get_async(current_id)
+            if not script_record:
+                print(f"No ScriptRecord found with ID: {current_id}")
+                return False
+            await ScriptRecordModel.delete_async(script_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting ScriptRecord: {e}")
+            return False
         
     def refresh(self) -> Optional["ScriptRecord"]:
         """
@@ -584,6 +1024,33 @@ class ScriptRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error refreshing ScriptRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["ScriptRecord"]:
+        """
+        Asynchronously refresh the script record's data from the database.
+
+        Examples:
+            >>> script_record = ScriptRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await script_record.refresh_async()
+            >>> print(refreshed_record)
+            ScriptRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), script_name='example_script', dataset_name='example_dataset', experiment_name='example_experiment', site_name='example_site', season_name='example_season)
+
+        Returns:
+            Optional[ScriptRecord]: The refreshed script record, or None if an error occurred.
+        """
+        try:
+            db_instance = await ScriptRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"No ScriptRecord found with ID: {self.id}")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing ScriptRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -648,7 +1115,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             return None
         
     @classmethod
-    def create_file_uri(cls, record: "ScriptRecord") -> Optional[str]:
+    def create_file_uri(cls, record: "ScriptRecord", check_exists: bool = True) -> Optional[str]:
         """
         Create a file URI for the given script record.
 
@@ -669,6 +1136,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (ScriptRecord): The script record for which to create the file URI.
+            check_exists (bool, optional): Require `record_file` to be an existing local file. Defaults to True.
         Returns:
             Optional[str]: The file URI, or None if creation failed.
         """
@@ -677,7 +1145,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             if not original_file_path:
                 print(f"record_file is required to create file URI.")
                 return None
-            if not os.path.exists(original_file_path):
+            if check_exists and not os.path.exists(original_file_path):
                 print(f"File {original_file_path} does not exist.")
                 return None
             collection_date = record.collection_date.strftime("%Y-%m-%d")
@@ -696,7 +1164,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
 
 
     @classmethod
-    def process_record(cls, record: "ScriptRecord") -> "ScriptRecord":
+    def process_record(cls, record: "ScriptRecord", raise_errors: bool = False) -> "ScriptRecord":
         """
         Process a script record (custom logic, e.g., file upload).
 
@@ -717,6 +1185,7 @@ class ScriptRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (ScriptRecord): The script record to process.
+            raise_errors (bool, optional): Raise upload errors instead of printing them and returning the record unchanged. Defaults to False.
         Returns:
             ScriptRecord: The processed script record.
         """
@@ -725,8 +1194,13 @@ class ScriptRecord(APIBase, FileHandlerMixin):
             if not file:
                 print(f"record_file is required to process ScriptRecord.")
                 return record
+            if not os.path.exists(file) and file == cls.create_file_uri(record, check_exists=False):
+                # Already uploaded, e.g. by the earlier attempt of a resumed insert
+                return record
             file_key = cls.create_file_uri(record)
             if not file_key:
+                if raise_errors:
+                    raise ValueError(f"Failed to create file URI for ScriptRecord: {record}")
                 print(f"Failed to create file URI for ScriptRecord: {record}")
                 return record
             content_type, _ = mimetypes.guess_type(file)
@@ -740,16 +1214,20 @@ class ScriptRecord(APIBase, FileHandlerMixin):
                 "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
                 "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
             }
-            cls.minio_storage_provider.upload_file(
+            content_hash, _ = upload_file_deduplicated(
+                get_minio_storage_provider(),
                 object_name=file_key,
-                input_file_path=file,
+                file_path=file,
                 bucket_name="gemini",
                 content_type=content_type,
                 metadata=file_metadata
             )
             record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": content_hash}
             return record
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error processing ScriptRecord: {e}")
             return record
 
@@ -174,6 +174,32 @@ class ScriptRun(APIBase):
             print(f"Error getting script run by id: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["ScriptRun"]:
+        """
+        Asynchronously retrieve a script run by its ID.
+
+        Examples:
+            >>> script_run = await ScriptRun.get_by_id_async(UUID('...'))
+            >>> print(script_run)
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'completed'})
+
+        Args:
+            id (UUID | int | str): The ID of the script run.
+        Returns:
+            Optional[ScriptRun]: The script run, or None if not found.
+        """
+        try:
+            db_instance = await ScriptRunModel.get_async(id)
+            if not db_instance:
+                print(f"Script run with id {id} not found.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting script run by id: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["ScriptRun"]]:
         """
@@ -200,6 +226,32 @@ class ScriptRun(APIBase):
             print(f"Error getting all script runs: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["ScriptRun"]]:
+        """
+        Asynchronously retrieve all script runs.
+
+        Examples:
+            >>> script_runs = await ScriptRun.get_all_async()
+            >>> for run in script_runs:
+            ...     print(run)
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'completed'})
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'running'})
+
+        Returns:
+            Optional[List[ScriptRun]]: List of all script runs, or None if not found.
+        """
+        try:
+            script_runs = await ScriptRunModel.all_async()
+            if not script_runs or len(script_runs) == 0:
+                print("No script runs found.")
+                return None
+            script_runs = [cls.model_validate(script_run) for script_run in script_runs]
+            return script_runs
+        except Exception as e:
+            print(f"Error getting all script runs: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -239,6 +291,45 @@ class ScriptRun(APIBase):
             print(f"Error searching script runs: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        script_run_info: dict = None,
+        script_name: str = None
+    ) -> Optional[List["ScriptRun"]]:
+        """
+        Asynchronously search for script runs based on various criteria.
+
+        Examples:
+            >>> script_runs = await ScriptRun.search_async(script_run_info={"status": "completed"}, script_name="example_script")
+            >>> for run in script_runs:
+            ...     print(run)
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'completed'})
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'running'})
+
+        Args:
+            script_run_info (dict, optional): The run information to search for. Defaults to None.
+            script_name (str, optional): The name of the script. Defaults to None.
+        Returns:
+            Optional[List[ScriptRun]]: List of matching script runs, or None if not found.
+        """
+        try:
+            if not any([script_name, script_run_info]):
+                print("At least one of script_name or script_run_info must be provided.")
+                return None
+            script_runs = await ScriptRunsViewModel.search_async(
+                script_run_info=script_run_info,
+                script_name=script_name
+            )
+            if not script_runs or len(script_runs) == 0:
+                print("No script runs found for the given search criteria.")
+                return None
+            script_runs = [cls.model_validate(script_run) for script_run in script_runs]
+            return script_runs
+        except Exception as e:
+            print(f"Error searching script runs: {e}")
+            return None
+
     def update(self, script_run_info: dict = None) -> Optional["ScriptRun"]:
         """
         Update the details of the script run.
@@ -274,6 +365,41 @@ class ScriptRun(APIBase):
             print(f"Error updating script run: {e}")
             return None
 
+    async def update_async(self, script_run_info: dict = None) -> Optional["ScriptRun"]:
+        """
+        Asynchronously update the details of the script run.
+
+        Examples:
+            >>> script_run = ScriptRun.get_by_id(UUID('...'))
+            >>> updated_run = await script_run.update_async(script_run_info={"status": "completed"})
+            >>> print(updated_run)
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'completed'})
+
+        Args:
+            script_run_info (dict, optional): The new run information. Defaults to None.
+        Returns:
+            Optional[ScriptRun]: The updated script run, or None if an error occurred.
+        """
+        try:
+            if not script_run_info:
+                print("Model run info cannot be empty.")
+                return None
+            current_id = self.id
+            script_run = await ScriptRunModel.get_async(current_id)
+            if not script_run:
+                print(f"Script run with id {current_id} does not exist.")
+                return None
+            script_run = await ScriptRunModel.update_async(
+                script_run,
+                script_run_info=script_run_info
+            )
+            instance = self.model_validate(script_run)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating script run: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the script run.
@@ -299,6 +425,31 @@ class ScriptRun(APIBase):
             print(f"Error deleting script run: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the script run.
+
+        Examples:
+            >>> script_run = ScriptRun.get_by_id(UUID('...'))
+            >>> success = await script_run.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the script run was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            script_run = await ScriptRunModel.get_async(current_id)
+            if not script_run:
+                print(f"Script run with id {current_id} does not exist.")
+                return False
+            await ScriptRunModel.delete_async(script_run)
+            return True
+        except Exception as e:
+            print(f"Error deleting script run: {e}")
+            return False
+
     def refresh(self) -> Optional["ScriptRun"]:
         """
         Refresh the script run's data from the database.
@@ -326,6 +477,33 @@ class ScriptRun(APIBase):
             print(f"Error refreshing script run: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["ScriptRun"]:
+        """
+        Asynchronously refresh the script run's data from the database.
+
+        Examples:
+            >>> script_run = ScriptRun.get_by_id(UUID('...'))
+            >>> refreshed_run = await script_run.refresh_async()
+            >>> print(refreshed_run)
+            ScriptRun(id=UUID('...'), script_id=UUID('...') script_run_info={'status': 'running'})
+
+        Returns:
+            Optional[ScriptRun]: The refreshed script run, or None if an error occurred.
+        """
+        try:
+            db_instance = await ScriptRunModel.get_async(self.id)
+            if not db_instance:
+                print(f"Script run with id {self.id} not found.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and getattr(self, key) != value:
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing script run: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the script run.
@@ -26,6 +26,7 @@ from uuid import UUID
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
 from gemini.api.base import APIBase
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.db.models.seasons import SeasonModel
 from gemini.db.models.views.experiment_views import ExperimentSeasonsViewModel
 from datetime import date, timedelta
@@ -155,6 +156,9 @@ class Season(APIBase):
             Optional[Season]: The season, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, season_name=season_name, experiment_name=experiment_name)
+            if cached is not None:
+                return cached
             db_instance = ExperimentSeasonsViewModel.get_by_parameters(
                 season_name=season_name,
                 experiment_name=experiment_name,
@@ -163,6 +167,7 @@ class Season(APIBase):
                 print(f"Season with name {season_name} does not exist.")
                 return None
             season = cls.model_validate(db_instance)
+            entity_cache.put(cls, season, season_name=season_name, experiment_name=experiment_name)
             return season
         except Exception as e:
             print(f"Error retrieving season: {e}")
@@ -184,11 +189,45 @@ class Season(APIBase):
             Optional[Season]: The season, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             db_instance = SeasonModel.get(id)
             if not db_instance:
                 print(f"Season with ID {id} does not exist.")
                 return None
             season = cls.model_validate(db_instance)
+            entity_cache.put(cls, season)
+            return season
+        except Exception as e:
+            print(f"Error retrieving season by ID: {e}")
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Season"]:
+        """
+        Asynchronously retrieve a season by its ID.
+
+        Examples:
+            >>> season = await Season.get_by_id_async(UUID('...'))
+            >>> print(season)
+            Season(season_name=Summer 2023, season_start_date=2023-06-01, season_end_date=2023-08-31, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the season.
+        Returns:
+            Optional[Season]: The season, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            db_instance = await SeasonModel.get_async(id)
+            if not db_instance:
+                print(f"Season with ID {id} does not exist.")
+                return None
+            season = cls.model_validate(db_instance)
+            entity_cache.put(cls, season)
             return season
         except Exception as e:
             print(f"Error retrieving season by ID: {e}")
@@ -219,6 +258,31 @@ class Season(APIBase):
         except Exception as e:
             print(f"Error retrieving all seasons: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Season"]]:
+        """
+        Asynchronously retrieve all seasons.
+
+        Examples:
+            >>> seasons = await Season.get_all_async()
+            >>> for season in seasons:
+            ...     print(season)
+            Season(season_name=Summer 2023, season_start_date=2023-06-01, season_end_date=2023-08-31, id=UUID(...))
+
+        Returns:
+            Optional[List[Season]]: List of all seasons, or None if not found.
+        """
+        try:
+            seasons = await SeasonModel.all_async()
+            if not seasons or len(seasons) == 0:
+                print("No seasons found.")
+                return None
+            seasons = [cls.model_validate(season) for season in seasons]
+            return seasons
+        except Exception as e:
+            print(f"Error retrieving all seasons: {e}")
+            return None
         
     @classmethod
     def search(
@@ -267,7 +331,149 @@ class Season(APIBase):
         except Exception as e:
             print(f"Error searching for seasons: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        season_name: str = None,
+        experiment_name: str = None,
+        season_start_date: date = None,
+        season_end_date: date = None,
+        season_info: dict = None
+    ) -> Optional[List["Season"]]:
+        """
+        Asynchronously search for seasons based on various criteria.
+
+        Examples:
+            >>> seasons = await Season.search_async(season_name="Summer 2023")
+            >>> for season in seasons:
+            ...     print(season)
+            Season(season_name=Summer 2023, season_start_date=2023-06-01, season_end_date=2023-08-31, id=UUID(...))
+            Season(season_name=Summer 2023, season_start_date=2023-07-01, season_end_date=2023-09-30, id=UUID(...))
+
+        Args:
+            season_name (str, optional): The name of the season. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_start_date (date, optional): The start date. Defaults to None.
+            season_end_date (date, optional): The end date. Defaults to None.
+            season_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            Optional[List[Season]]: List of matching seasons, or None if not found.
+        """
+        try:
+            if not any([season_name, experiment_name, season_start_date, season_end_date, season_info]):
+                print("At least one search parameter must be provided.")
+                return None
+            seasons = await ExperimentSeasonsViewModel.search_async(
+                season_name=season_name,
+                experiment_name=experiment_name,
+                season_start_date=season_start_date,
+                season_end_date=season_end_date,
+                season_info=season_info
+            )
+            if not seasons or len(seasons) == 0:
+                print("No seasons found matching the search criteria.")
+                return None
+            seasons = [cls.model_validate(season) for season in seasons]
+            return seasons
+        except Exception as e:
+            print(f"Error searching for seasons: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        season_name: str = None,
+        experiment_name: str = None,
+        season_start_date: date = None,
+        season_end_date: date = None,
+        season_info: dict = None
+    ) -> tuple[List["Season"], Optional[str]]:
+        """
+        Retrieve a page of seasons using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> seasons, next_cursor = Season.paginate(page_limit=50)
+            >>> more_seasons, next_cursor = Season.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of seasons in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_start_date (date, optional): The start date. Defaults to None.
+            season_end_date (date, optional): The end date. Defaults to None.
+            season_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[Season], Optional[str]]: The seasons in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([season_name, experiment_name, season_start_date, season_end_date, season_info]):
+            instances, next_cursor = ExperimentSeasonsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                season_name=season_name,
+                experiment_name=experiment_name,
+                season_start_date=season_start_date,
+                season_end_date=season_end_date,
+                season_info=season_info
+            )
+        else:
+            instances, next_cursor = SeasonModel.paginate(page_limit=page_limit, cursor=cursor)
+        seasons = [cls.model_validate(instance) for instance in instances]
+        return seasons, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        season_name: str = None,
+        experiment_name: str = None,
+        season_start_date: date = None,
+        season_end_date: date = None,
+        season_info: dict = None
+    ) -> tuple[List["Season"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of seasons using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> seasons, next_cursor = await Season.paginate_async(page_limit=50)
+            >>> more_seasons, next_cursor = await Season.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of seasons in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_start_date (date, optional): The start date. Defaults to None.
+            season_end_date (date, optional): The end date. Defaults to None.
+            season_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[Season], Optional[str]]: The seasons in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([season_name, experiment_name, season_start_date, season_end_date, season_info]):
+            instances, next_cursor = await ExperimentSeasonsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                season_name=season_name,
+                experiment_name=experiment_name,
+                season_start_date=season_start_date,
+                season_end_date=season_end_date,
+                season_info=season_info
+            )
+        else:
+            instances, next_cursor = await SeasonModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        seasons = [cls.model_validate(instance) for instance in instances]
+        return seasons, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         season_name: str = None,
@@ -314,7 +520,56 @@ class Season(APIBase):
         except Exception as e:
             print(f"Error updating season: {e}")
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        season_name: str = None,
+        season_start_date: date = None,
+        season_end_date: date = None,
+        season_info: dict = None
+    ) -> Optional["Season"]:
+        """
+        Asynchronously update the details of the season.
+
+        Examples:
+            >>> season = Season.get_by_id(UUID('...'))
+            >>> updated_season = await season.update_async(season_name="Updated Summer 2023", season_start_date=date(2023, 6, 15))
+            >>> print(updated_season)
+            Season(season_name=Updated Summer 2023, season_start_date=2023-06-15, season_end_date=2023-08-31, id=UUID(...))
+
+        Args:
+            season_name (str, optional): The new name. Defaults to None.
+            season_start_date (date, optional): The new start date. Defaults to None.
+            season_end_date (date, optional): The new end date. Defaults to None.
+            season_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[Season]: The updated season, or None if an error occurred.
+        """
+        try:
+            if not any([season_start_date, season_end_date, season_info, season_name]):
+                print("At least one update parameter must be provided.")
+                return None
+            current_id = self.id
+            season = await SeasonModel.get_async(current_id)
+            if not season:
+                print(f"Season with ID {current_id} does not exist.")
+                return None
+            season = await SeasonModel.update_async(
+                season,
+                season_name=season_name,
+                season_start_date=season_start_date,
+                season_end_date=season_end_date,
+                season_info=season_info
+            )
+            updated_season = self.model_validate(season)
+            await self.refresh_async()  # Update the current instance
+            return updated_season
+        except Exception as e:
+            print(f"Error updating season: {e}")
+            return None
         
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete the season.
@@ -339,6 +594,32 @@ class Season(APIBase):
         except Exception as e:
             print(f"Error deleting season: {e}")
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the season.
+
+        Examples:
+            >>> season = Season.get_by_id(UUID('...'))
+            >>> success = await season.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the season was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            season = await SeasonModel.get_async(current_id)
+            if not season:
+                print(f"Season with ID {current_id} does not exist.")
+                return False
+            await SeasonModel.delete_async(season)
+            return True
+        except Exception as e:
+            print(f"Error deleting season: {e}")
+            return False
         
     def refresh(self) -> Optional["Season"]:
         """
@@ -366,6 +647,33 @@ class Season(APIBase):
         except Exception as e:
             print(f"Error refreshing season: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Season"]:
+        """
+        Asynchronously refresh the season's data from the database.
+
+        Examples:
+            >>> season = Season.get_by_id(UUID('...'))
+            >>> refreshed_season = await season.refresh_async()
+            >>> print(refreshed_season)
+            Season(season_name=Summer 2023, season_start_date=2023-06-01, season_end_date=2023-08-31, id=UUID(...))
+
+        Returns:
+            Optional[Season]: The refreshed season, or None if an error occurred.
+        """
+        try:
+            db_instance = await SeasonModel.get_async(self.id)
+            if not db_instance:
+                print(f"Season with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing season: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -395,6 +703,7 @@ class Season(APIBase):
             print(f"Error retrieving season info: {e}")
             return None
         
+    @invalidates_cached_entity
     def set_info(self, season_info: dict) -> Optional["Season"]:
         """
         Set the additional information of the season.
@@ -454,6 +763,7 @@ class Season(APIBase):
             print(f"Error retrieving experiment for season: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Associate this season with an experiment.
@@ -493,6 +803,7 @@ class Season(APIBase):
             print(f"Error assigning experiment to season: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_experiment(self) -> Optional["Experiment"]:
         """
         Unassociate this season from its experiment.
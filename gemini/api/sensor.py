@@ -20,16 +20,21 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, AsyncIterable, Callable, Iterable, Iterator, Optional, List, AsyncGenerator, TYPE_CHECKING
+from pathlib import Path
 from uuid import UUID
 from tqdm import tqdm
 
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
+from gemini.api.columns import STREAM_BATCH_SIZE, is_streamed, iter_column_batches
 from gemini.api.base import APIBase
+from gemini.api.archive import stream_records_tar, write_records_tar
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.api.sensor_record import SensorRecord
 from gemini.api.dataset import Dataset, GEMINIDatasetType
 from gemini.api.enums import GEMINISensorType, GEMINIDataType, GEMINIDataFormat
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.sensors import SensorModel
 from gemini.db.models.views.experiment_views import ExperimentSensorsViewModel
 from gemini.db.models.associations import ExperimentSensorModel, SensorPlatformSensorModel, SensorDatasetModel
@@ -38,6 +43,8 @@ from gemini.db.models.views.sensor_platform_sensors_view import SensorPlatformSe
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from gemini.api.journal import IngestionJournal
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment
     from gemini.api.sensor_platform import SensorPlatform
     from gemini.api.dataset import Dataset
@@ -171,6 +178,9 @@ class Sensor(APIBase):
             Optional[Sensor]: The sensor, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, sensor_name=sensor_name, experiment_name=experiment_name)
+            if cached is not None:
+                return cached
             db_instance = SensorModel.get_by_parameters(
                 sensor_name=sensor_name,
                 experiment_name=experiment_name
@@ -179,6 +189,7 @@ class Sensor(APIBase):
                 print(f"Sensor with name {sensor_name} not found.")
                 return None
             sensor = cls.model_validate(db_instance)
+            entity_cache.put(cls, sensor, sensor_name=sensor_name, experiment_name=experiment_name)
             return sensor
         except Exception as e:
             print(f"Error getting sensor: {e}")
@@ -200,11 +211,45 @@ class Sensor(APIBase):
             Optional[Sensor]: The sensor, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             db_instance = SensorModel.get(id)
             if not db_instance:
                 print(f"Sensor with ID {id} does not exist.")
                 return None
             sensor = cls.model_validate(db_instance)
+            entity_cache.put(cls, sensor)
+            return sensor
+        except Exception as e:
+            print(f"Error getting sensor by ID: {e}")
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Sensor"]:
+        """
+        Asynchronously retrieve a sensor by its ID.
+
+        Examples:
+            >>> sensor = await Sensor.get_by_id_async(id=UUID('...'))
+            >>> print(sensor)
+            Sensor(sensor_name=Temperature Sensor, sensor_type_id=1, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+
+        Args:
+            id (UUID | int | str): The ID of the sensor.
+        Returns:
+            Optional[Sensor]: The sensor, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            db_instance = await SensorModel.get_async(id)
+            if not db_instance:
+                print(f"Sensor with ID {id} does not exist.")
+                return None
+            sensor = cls.model_validate(db_instance)
+            entity_cache.put(cls, sensor)
             return sensor
         except Exception as e:
             print(f"Error getting sensor by ID: {e}")
@@ -235,6 +280,32 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error getting all sensors: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Sensor"]]:
+        """
+        Asynchronously retrieve all sensors.
+
+        Examples:
+            >>> sensors = await Sensor.get_all_async()
+            >>> for sensor in sensors:
+            ...     print(sensor)
+            Sensor(sensor_name=Temperature Sensor, sensor_type_id=1, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+            Sensor(sensor_name=Humidity Sensor, sensor_type_id=2, sensor_data_type_id=2, sensor_data_format_id=2, id=UUID('...'))
+
+        Returns:
+            Optional[List[Sensor]]: List of all sensors, or None if not found.
+        """
+        try:
+            sensors = await SensorModel.all_async()
+            if not sensors or len(sensors) == 0:
+                print("No sensors found.")
+                return None
+            sensors = [cls.model_validate(sensor) for sensor in sensors]
+            return sensors
+        except Exception as e:
+            print(f"Error getting all sensors: {e}")
+            return None
         
     @classmethod
     def search(
@@ -294,7 +365,172 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error searching sensors: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        sensor_name: str = None,
+        sensor_type: GEMINISensorType = None,
+        sensor_data_type: GEMINIDataType = None,
+        sensor_data_format: GEMINIDataFormat = None,
+        sensor_info: dict = None,
+        experiment_name: str = None,
+        sensor_platform_name: str = None
+    ) -> Optional[List["Sensor"]]:
+        """
+        Asynchronously search for sensors based on various criteria.
+
+        Examples:
+            >>> sensors = await Sensor.search_async(sensor_name="Temperature Sensor")
+            >>> for sensor in sensors:
+            ...     print(sensor)
+            Sensor(sensor_name=Temperature Sensor, sensor_type_id=1, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+
+            >>> sensors = await Sensor.search_async(sensor_type=GEMINISensorType.Temperature)
+            >>> for sensor in sensors:
+            ...     print(sensor)
+            Sensor(sensor_name=Temperature Sensor, sensor_type_id=1, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+            
+
+        Args:
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_type (GEMINISensorType, optional): The type of the sensor. Defaults to None.
+            sensor_data_type (GEMINIDataType, optional): The data type. Defaults to None.
+            sensor_data_format (GEMINIDataFormat, optional): The data format. Defaults to None.
+            sensor_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+        Returns:
+            Optional[List[Sensor]]: List of matching sensors, or None if not found.
+        """
+        try:
+            if not any([sensor_name, sensor_type, sensor_data_type, sensor_data_format, sensor_info, experiment_name, sensor_platform_name]):
+                print("Must provide at least one search parameter.")
+                return None
+            sensors = await ExperimentSensorsViewModel.search_async(
+                sensor_name=sensor_name,
+                sensor_type=sensor_type.value if sensor_type else None,
+                sensor_data_type=sensor_data_type.value if sensor_data_type else None,
+                sensor_data_format=sensor_data_format.value if sensor_data_format else None,
+                sensor_info=sensor_info,
+                experiment_name=experiment_name,
+                sensor_platform_name=sensor_platform_name
+            )
+            if not sensors or len(sensors) == 0:
+                print("No sensors found with the provided search parameters.")
+                return None
+            sensors = [cls.model_validate(sensor) for sensor in sensors]
+            return sensors
+        except Exception as e:
+            print(f"Error searching sensors: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_name: str = None,
+        sensor_type: GEMINISensorType = None,
+        sensor_data_type: GEMINIDataType = None,
+        sensor_data_format: GEMINIDataFormat = None,
+        sensor_info: dict = None,
+        experiment_name: str = None,
+        sensor_platform_name: str = None
+    ) -> tuple[List["Sensor"], Optional[str]]:
+        """
+        Retrieve a page of sensors using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensors, next_cursor = Sensor.paginate(page_limit=50)
+            >>> more_sensors, next_cursor = Sensor.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensors in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_type (GEMINISensorType, optional): The type of the sensor. Defaults to None.
+            sensor_data_type (GEMINIDataType, optional): The data type. Defaults to None.
+            sensor_data_format (GEMINIDataFormat, optional): The data format. Defaults to None.
+            sensor_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+        Returns:
+            tuple[List[Sensor], Optional[str]]: The sensors in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_name, sensor_type, sensor_data_type, sensor_data_format, sensor_info, experiment_name, sensor_platform_name]):
+            instances, next_cursor = ExperimentSensorsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_name=sensor_name,
+                sensor_type=sensor_type.value if sensor_type else None,
+                sensor_data_type=sensor_data_type.value if sensor_data_type else None,
+                sensor_data_format=sensor_data_format.value if sensor_data_format else None,
+                sensor_info=sensor_info,
+                experiment_name=experiment_name,
+                sensor_platform_name=sensor_platform_name
+            )
+        else:
+            instances, next_cursor = SensorModel.paginate(page_limit=page_limit, cursor=cursor)
+        sensors = [cls.model_validate(instance) for instance in instances]
+        return sensors, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_name: str = None,
+        sensor_type: GEMINISensorType = None,
+        sensor_data_type: GEMINIDataType = None,
+        sensor_data_format: GEMINIDataFormat = None,
+        sensor_info: dict = None,
+        experiment_name: str = None,
+        sensor_platform_name: str = None
+    ) -> tuple[List["Sensor"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of sensors using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensors, next_cursor = await Sensor.paginate_async(page_limit=50)
+            >>> more_sensors, next_cursor = await Sensor.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensors in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_type (GEMINISensorType, optional): The type of the sensor. Defaults to None.
+            sensor_data_type (GEMINIDataType, optional): The data type. Defaults to None.
+            sensor_data_format (GEMINIDataFormat, optional): The data format. Defaults to None.
+            sensor_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+        Returns:
+            tuple[List[Sensor], Optional[str]]: The sensors in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_name, sensor_type, sensor_data_type, sensor_data_format, sensor_info, experiment_name, sensor_platform_name]):
+            instances, next_cursor = await ExperimentSensorsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_name=sensor_name,
+                sensor_type=sensor_type.value if sensor_type else None,
+                sensor_data_type=sensor_data_type.value if sensor_data_type else None,
+                sensor_data_format=sensor_data_format.value if sensor_data_format else None,
+                sensor_info=sensor_info,
+                experiment_name=experiment_name,
+                sensor_platform_name=sensor_platform_name
+            )
+        else:
+            instances, next_cursor = await SensorModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        sensors = [cls.model_validate(instance) for instance in instances]
+        return sensors, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         sensor_name: str = None, 
@@ -346,7 +582,61 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error updating sensor: {e}")
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        sensor_name: str = None, 
+        sensor_type: GEMINISensorType = None,
+        sensor_data_type: GEMINIDataType = None,
+        sensor_data_format: GEMINIDataFormat = None,
+        sensor_info: dict = None
+    ) -> Optional["Sensor"]:
+        """
+        Asynchronously update the details of the sensor.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Temperature Sensor")
+            >>> updated_sensor = await sensor.update_async(sensor_name="New Temperature Sensor", sensor_type=GEMINISensorType.Humidity)
+            >>> print(updated_sensor)
+            Sensor(sensor_name=New Temperature Sensor, sensor_type_id=2, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+
+        Args:
+            sensor_name (str, optional): The new name. Defaults to None.
+            sensor_type (GEMINISensorType, optional): The new type. Defaults to None.
+            sensor_data_type (GEMINIDataType, optional): The new data type. Defaults to None.
+            sensor_data_format (GEMINIDataFormat, optional): The new data format. Defaults to None.
+            sensor_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[Sensor]: The updated sensor, or None if an error occurred.
+        """
+        try:
+            if not any([sensor_type, sensor_data_type, sensor_data_format, sensor_info, sensor_name]):
+                print("At least one update parameter must be provided.")
+                return None
+
+            current_id = self.id
+            sensor = await SensorModel.get_async(current_id)
+            if not sensor:
+                print(f"Sensor with ID {current_id} does not exist.")
+                return None
+            
+            sensor = await SensorModel.update_async(
+                sensor,
+                sensor_name=sensor_name,
+                sensor_type_id=sensor_type.value if sensor_type else None,
+                sensor_data_type_id=sensor_data_type.value if sensor_data_type else None,
+                sensor_data_format_id=sensor_data_format.value if sensor_data_format else None,
+                sensor_info=sensor_info
+            )
+            updated_sensor = self.model_validate(sensor)
+            await self.refresh_async()
+            return updated_sensor
+        except Exception as e:
+            print(f"Error updating sensor: {e}")
+            return None
     
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete the sensor.
@@ -371,6 +661,32 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error deleting sensor: {e}")
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the sensor.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Temperature Sensor")
+            >>> success = await sensor.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the sensor was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            sensor = await SensorModel.get_async(current_id)
+            if not sensor:
+                print(f"Sensor with ID {current_id} does not exist.")
+                return False
+            await SensorModel.delete_async(sensor)
+            return True
+        except Exception as e:
+            print(f"Error deleting sensor: {e}")
+            return False
         
     def refresh(self) -> Optional["Sensor"]:
         """
@@ -399,6 +715,34 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error refreshing sensor: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Sensor"]:
+        """
+        Asynchronously refresh the sensor's data from the database.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Temperature Sensor")
+            >>> refreshed_sensor = await sensor.refresh_async()
+            >>> print(refreshed_sensor)
+            Sensor(sensor_name=Temperature Sensor, sensor_type_id=1, sensor_data_type_id=1, sensor_data_format_id=1, id=UUID('...'))
+
+        Returns:
+            Optional[Sensor]: The refreshed sensor, or None if an error occurred.
+        """
+        try:
+            db_instance = await SensorModel.get_async(self.id)
+            if not db_instance:
+                print(f"Sensor with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    actual_value = getattr(instance, key)
+                    setattr(self, key, actual_value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing sensor: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -428,6 +772,7 @@ class Sensor(APIBase):
             print(f"Error getting sensor info: {e}")
             return None
         
+    @invalidates_cached_entity
     def set_info(self, sensor_info: dict) -> Optional["Sensor"]:
         """
         Set the additional information of the sensor.
@@ -487,6 +832,7 @@ class Sensor(APIBase):
             print(f"Error getting associated sensor platforms: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_sensor_platform(self, sensor_platform_name: str) -> Optional["SensorPlatform"]:
         """
         Associate this sensor with a sensor platform.
@@ -528,6 +874,7 @@ class Sensor(APIBase):
             print(f"Error associating sensor platform: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_sensor_platform(self, sensor_platform_name: str) -> Optional["SensorPlatform"]:
         """
         Unassociate this sensor from a sensor platform.
@@ -623,6 +970,7 @@ class Sensor(APIBase):
             print(f"Error getting associated experiments: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Associate this sensor with an experiment.
@@ -664,6 +1012,7 @@ class Sensor(APIBase):
             print(f"Error associating experiment: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Unassociate this sensor from an experiment.
@@ -800,6 +1149,7 @@ class Sensor(APIBase):
             print(f"Error creating new dataset: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_dataset(self, dataset_name: str) -> Optional["Dataset"]:
         """
         Associate this sensor with a dataset.
@@ -932,22 +1282,123 @@ class Sensor(APIBase):
         except Exception as e:
             print(f"Error inserting sensor record: {e}")
             return False, []
+
+    async def insert_record_stream_async(
+        self,
+        file_stream: AsyncIterable[bytes],
+        file_name: str,
+        timestamp: datetime = None,
+        collection_date: date = None,
+        dataset_name: str = None,
+        sensor_data: dict = {},
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = -1,
+        plot_row_number: int = -1,
+        plot_column_number: int = -1,
+        record_info: dict = {},
+        content_type: str = None
+    ) -> tuple[bool, List[str]]:
+        """
+        Asynchronously insert a sensor record for this sensor, streaming its file to storage.
+
+        Like `insert_record`, except that the file is read from an async stream, e.g. an
+        HTTP request body, and uploaded in parts as it arrives instead of from a local path.
+
+        Examples:
+            >>> sensor = await Sensor.get_by_id_async(id=UUID('...'))
+            >>> success, record_ids = await sensor.insert_record_stream_async(
+            ...     file_stream=request.stream(),
+            ...     file_name="flight_01.mp4",
+            ...     timestamp=datetime(2024, 7, 1, 12, 0, 0),
+            ...     experiment_name="Experiment A",
+            ...     season_name="Season 1",
+            ...     site_name="Site A"
+            ... )
+
+        Args:
+            file_stream (AsyncIterable[bytes]): The content of the record file, chunk by chunk.
+            file_name (str): The original file name, which sets the extension of the stored file.
+            timestamp (datetime, optional): The timestamp of the record. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            sensor_data (dict, optional): The sensor data. Defaults to {{}}.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to -1.
+            plot_row_number (int, optional): The plot row number. Defaults to -1.
+            plot_column_number (int, optional): The plot column number. Defaults to -1.
+            record_info (dict, optional): Additional info. Defaults to {{}}.
+            content_type (str, optional): MIME type of the file. Defaults to a guess from the file name.
+        Returns:
+            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+        """
+        try:
+            if not experiment_name or not season_name or not site_name:
+                raise ValueError("Experiment name, season name, and site name must be provided.")
+            if not file_name:
+                raise ValueError("A file name must be provided.")
+
+            timestamp = timestamp if timestamp else datetime.now()
+            collection_date = collection_date if collection_date else timestamp.date()
+            sensor_name = self.sensor_name
+
+            if not dataset_name:
+                dataset_name = f"{sensor_name} Dataset {collection_date}"
+
+            sensor_record = SensorRecord.create(
+                timestamp=timestamp,
+                collection_date=collection_date,
+                sensor_name=sensor_name,
+                sensor_data=sensor_data,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number if plot_number != -1 else None,
+                plot_row_number=plot_row_number if plot_row_number != -1 else None,
+                plot_column_number=plot_column_number if plot_column_number != -1 else None,
+                record_file=file_name,
+                record_info=record_info if record_info else {},
+                insert_on_create=False
+            )
+            if sensor_record is None:
+                raise ValueError("Failed to create sensor record.")
+            success, inserted_record_ids = await SensorRecord.insert_streamed_async(
+                sensor_record,
+                file_stream,
+                content_type=content_type
+            )
+            if not success:
+                print("Failed to insert sensor record.")
+                return False, []
+            return success, inserted_record_ids
+        except Exception as e:
+            print(f"Error inserting streamed sensor record: {e}")
+            return False, []
         
     def insert_records(
         self,
-        timestamps: List[datetime] = None,
+        timestamps: Iterable[datetime] = None,
         collection_date: date = None,
-        sensor_data: List[dict] = [],
+        sensor_data: Iterable[dict] = [],
         dataset_name: str = None,
         experiment_name: str = None,
         season_name: str = None,
         site_name: str = None,
-        plot_numbers: List[int] = None,
-        plot_row_numbers: List[int] = None,
-        plot_column_numbers: List[int] = None,
-        record_files: List[str] = None,
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        plot_numbers: Iterable[int] = None,
+        plot_row_numbers: Iterable[int] = None,
+        plot_column_numbers: Iterable[int] = None,
+        record_files: Iterable[str] = None,
+        record_info: Iterable[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert multiple sensor records for this sensor.
 
@@ -971,24 +1422,54 @@ class Sensor(APIBase):
             True [UUID('...'), UUID('...')]
 
         Args:
-            timestamps (List[datetime], optional): List of timestamps. Defaults to None.
+            timestamps (Iterable[datetime], optional): List or other iterable of timestamps. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
-            sensor_data (List[dict], optional): List of sensor data. Defaults to [].
+            sensor_data (Iterable[dict], optional): List or other iterable of sensor data. Defaults to [].
             dataset_name (str, optional): The name of the dataset. Defaults to None.
             experiment_name (str, optional): The name of the experiment. Defaults to None.
             season_name (str, optional): The name of the season. Defaults to None.
             site_name (str, optional): The name of the site. Defaults to None.
-            plot_numbers (List[int], optional): List of plot numbers. Defaults to None.
-            plot_row_numbers (List[int], optional): List of plot row numbers. Defaults to None.
-            plot_column_numbers (List[int], optional): List of plot column numbers. Defaults to None.
-            record_files (List[str], optional): List of file paths or URIs. Defaults to None.
-            record_info (List[dict], optional): List of additional info. Defaults to [].
+            plot_numbers (Iterable[int], optional): List or other iterable of plot numbers. Defaults to None.
+            plot_row_numbers (Iterable[int], optional): List or other iterable of plot row numbers. Defaults to None.
+            plot_column_numbers (Iterable[int], optional): List or other iterable of plot column numbers. Defaults to None.
+            record_files (Iterable[str], optional): List or other iterable of file paths or URIs. Defaults to None.
+            record_info (Iterable[dict], optional): List or other iterable of additional info. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+                If any column is a generator or another iterable without a length, the columns are read,
+                validated, uploaded and inserted in batches of this size (10000 if None), so memory use stays flat.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name or not season_name or not site_name:
                 raise ValueError("Experiment name, season name, and site name must be provided.")
+
+            if is_streamed(timestamps, sensor_data, plot_numbers, plot_row_numbers, plot_column_numbers, record_files, record_info):
+                return self._insert_record_batches(
+                    {
+                        "timestamps": timestamps,
+                        "sensor_data": sensor_data,
+                        "plot_numbers": plot_numbers,
+                        "plot_row_numbers": plot_row_numbers,
+                        "plot_column_numbers": plot_column_numbers,
+                        "record_files": record_files,
+                        "record_info": record_info
+                    },
+                    collection_date,
+                    dataset_name,
+                    experiment_name,
+                    season_name,
+                    site_name,
+                    batch_size,
+                    start_chunk,
+                    on_chunk,
+                    journal,
+                    id_resolution
+                )
             
             if len(timestamps) == 0:
                 raise ValueError("At least one timestamp must be provided.")
@@ -1019,12 +1500,170 @@ class Sensor(APIBase):
                 )
                 sensor_records.append(sensor_record)
 
-            success, inserted_record_ids = SensorRecord.insert(sensor_records)
-            return success, inserted_record_ids
+            return SensorRecord.insert(
+                sensor_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                journal=journal,
+                id_resolution=id_resolution
+            )
         except Exception as e:
             print(f"Error inserting sensor records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
+    def _insert_record_batches(
+        self,
+        columns: dict,
+        collection_date: Optional[date],
+        dataset_name: Optional[str],
+        experiment_name: str,
+        season_name: str,
+        site_name: str,
+        batch_size: Optional[int],
+        start_chunk: int,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]],
+        journal: Optional["IngestionJournal"],
+        id_resolution: Optional[str]
+    ) -> BulkInsertResult:
+        stream_batch_size = batch_size or STREAM_BATCH_SIZE
+        result = BulkInsertResult(next_chunk=start_chunk)
+        complete = True
+        for chunk_index, batch in enumerate(iter_column_batches(columns, stream_batch_size)):
+            if collection_date is None:
+                # Shared by the whole stream, as in the list based path
+                collection_date = batch["timestamps"][0].date()
+            if chunk_index < start_chunk:
+                # Committed by the earlier attempt of a resumed insert
+                continue
+            batch_result = self.insert_record_columns(
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                batch_size=batch_size,
+                **batch,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+            for chunk_result in batch_result.chunks:
+                # Every batch is inserted as one chunk, numbered within the whole stream
+                chunk_result.chunk_index = chunk_index
+                if on_chunk is not None:
+                    on_chunk(chunk_result)
+            result.chunks.extend(batch_result.chunks)
+            result.inserted_ids.extend(batch_result.inserted_ids)
+            result.upload_failures.extend(
+                failure._replace(index=chunk_index * stream_batch_size + failure.index)
+                for failure in batch_result.upload_failures
+            )
+            if batch_result.error is not None or batch_result.failed > 0:
+                result.error = batch_result.error
+                print(f"Stopped after inserting {len(result.inserted_ids)} records.")
+                break
+            complete = complete and not batch_result.upload_failures
+            if complete:
+                result.next_chunk = chunk_index + 1
+        return result
+
+    def insert_record_columns(
+        self,
+        timestamps: Any = None,
+        collection_date: Any = None,
+        sensor_data: Any = None,
+        record_files: Any = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_numbers: Any = None,
+        plot_row_numbers: Any = None,
+        plot_column_numbers: Any = None,
+        record_info: Any = None,
+        frame: "DataFrame" = None,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        use_copy: bool = False,
+        journal: "IngestionJournal" = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
+        """
+        Insert sensor records for this sensor from columns of values, e.g. NumPy arrays or the columns of a DataFrame.
+
+        Unlike `insert_records`, no SensorRecord is built per row, see `SensorRecord.insert_columns`.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Temperature Sensor")
+            >>> success, record_ids = sensor.insert_record_columns(
+            ...     timestamps=frame["timestamp"],
+            ...     sensor_data=frame["sensor_data"],
+            ...     plot_numbers=frame["plot_number"],
+            ...     plot_row_numbers=frame["plot_row_number"],
+            ...     plot_column_numbers=frame["plot_column_number"],
+            ...     dataset_name="Sensor Dataset 1",
+            ...     experiment_name="Experiment 1",
+            ...     season_name="Spring",
+            ...     site_name="Site A"
+            ... )
+            >>> print(success, len(record_ids))
+            True 10000
+
+        Args:
+            timestamps (list | numpy.ndarray | pandas.Series, optional): The timestamp of each record.
+            collection_date (date | list, optional): The collection date, shared or per record. Defaults to the date of each timestamp.
+            sensor_data (list, optional): The data of each record.
+            record_files (list, optional): The file path of each record.
+            dataset_name (str, optional): The name of the dataset. Defaults to "<sensor name> Dataset <collection date>".
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_numbers (list | numpy.ndarray | pandas.Series, optional): The plot number of each record.
+            plot_row_numbers (list | numpy.ndarray | pandas.Series, optional): The plot row number of each record.
+            plot_column_numbers (list | numpy.ndarray | pandas.Series, optional): The plot column number of each record.
+            record_info (list, optional): Additional info of each record.
+            frame (pandas.DataFrame, optional): Columns named after the record fields, used for the columns not passed as arguments.
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Defaults to False.
+            journal (IngestionJournal, optional): Journal that lets a failed import be re-run without repeating completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
+        Returns:
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
+        """
+        try:
+            if not experiment_name or not season_name or not site_name:
+                raise ValueError("Experiment name, season name, and site name must be provided.")
+            if not dataset_name:
+                dataset_name = f"{self.sensor_name} Dataset {collection_date}"
+            return SensorRecord.insert_columns(
+                sensor_name=self.sensor_name,
+                dataset_name=dataset_name,
+                timestamps=timestamps,
+                collection_date=collection_date,
+                sensor_data=sensor_data,
+                record_files=record_files,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_numbers=plot_numbers,
+                plot_row_numbers=plot_row_numbers,
+                plot_column_numbers=plot_column_numbers,
+                record_info=record_info,
+                frame=frame,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                use_copy=use_copy,
+                journal=journal,
+                id_resolution=id_resolution
+            )
+        except Exception as e:
+            print(f"Error inserting sensor records: {e}")
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
     def search_records(
         self,
         collection_date: date = None,
@@ -1035,7 +1674,8 @@ class Sensor(APIBase):
         plot_number: int = None,
         plot_row_number: int = None,
         plot_column_number: int = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> List[SensorRecord]:
         """
         Search for sensor records associated with this sensor based on search parameters.
@@ -1068,6 +1708,7 @@ class Sensor(APIBase):
             plot_row_number (int, optional): The plot row number. Defaults to None.
             plot_column_number (int, optional): The plot column number. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
         Returns:
             List[SensorRecord]: List of matching sensor records, or empty list if not found.
         """
@@ -1085,7 +1726,78 @@ class Sensor(APIBase):
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
                 plot_column_number=plot_column_number,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching sensor records: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator[SensorRecord, None]:
+        """
+        Asynchronously search for sensor records associated with this sensor based on search parameters.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Temperature Sensor")
+            >>> records = sensor.search_records_async(
+            ...     collection_date=date(2023, 1, 1),
+            ...     dataset_name="Sensor Dataset 1",
+            ...     experiment_name="Experiment 1",
+            ...     season_name="Spring",
+            ...     site_name="Site A",
+            ...     plot_number=1,
+            ...     plot_row_number=1,
+            ...     plot_column_number=1,
+            ...     record_info={"notes": "First record"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            SensorRecord(id=UUID('...'), sensor_name='Temperature Sensor', timestamp='2023-01-01T00:00:00', dataset_name='Sensor Dataset 1', experiment_name='Experiment 1', season_name='Spring', site_name='Site A', plot_number=1)
+            SensorRecord(id=UUID('...'), sensor_name='Temperature Sensor', timestamp='2023-01-01T00:00:00', dataset_name='Sensor Dataset 1', experiment_name='Experiment 1', season_name='Spring', site_name='Site A', plot_number=2)
+
+        Args:
+            collection_date (date, optional): The collection date. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[SensorRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = SensorRecord.search_async(
+                sensor_name=self.sensor_name,
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -1099,7 +1811,8 @@ class Sensor(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> List[SensorRecord]:
         """
         Filter sensor records associated with this sensor using a custom filter function.
@@ -1127,6 +1840,7 @@ class Sensor(APIBase):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
         Returns:
             List[SensorRecord]: List of filtered sensor records, or empty list if not found.
         """
@@ -1138,12 +1852,83 @@ class Sensor(APIBase):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering sensor records: {e}")
             return []
 
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this sensor and return them as a pandas DataFrame.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Sensor A")
+            >>> frame = sensor.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `sensor_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return SensorRecord.to_dataframe(flatten=flatten, **search_parameters, sensor_name=self.sensor_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this sensor and return them as a pandas DataFrame.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="Sensor A")
+            >>> frame = sensor.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `sensor_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return SensorRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, sensor_names=[self.sensor_name])
+
+    def filter_records_archive(self, **filter_parameters) -> Iterator[bytes]:
+        """
+        Filter records of this sensor and stream their files as one tar archive.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="FLIR Camera")
+            >>> with open("flir_2024-07-01.tar", "wb") as archive:
+            ...     for chunk in sensor.filter_records_archive(start_timestamp=datetime(2024, 7, 1), end_timestamp=datetime(2024, 7, 2)):
+            ...         archive.write(chunk)
+
+        Args:
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Yields:
+            bytes: The archive, chunk by chunk, with one member per record file named by its object key.
+        """
+        return stream_records_tar(self.filter_records(**filter_parameters, lightweight=True))
+
+    def download_records_archive(self, destination: str | Path, **filter_parameters) -> Optional[Path]:
+        """
+        Filter records of this sensor and write their files to a tar archive.
+
+        Examples:
+            >>> sensor = Sensor.get(sensor_name="FLIR Camera")
+            >>> sensor.download_records_archive("flir_2024-07-01.tar", start_timestamp=datetime(2024, 7, 1), end_timestamp=datetime(2024, 7, 2))
+            PosixPath('flir_2024-07-01.tar')
+
+        Args:
+            destination (str | Path): The archive file to write.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[Path]: The written archive, or None if an error occurred.
+        """
+        try:
+            return write_records_tar(self.filter_records(**filter_parameters, lightweight=True), destination)
+        except Exception as e:
+            print(f"Error writing sensor records archive: {e}")
+            return None
+
 
 
@@ -176,6 +176,31 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error retrieving SensorPlatform by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["SensorPlatform"]:
+        """
+        Asynchronously retrieve a sensor platform by its ID.
+
+        Examples:
+            >>> await SensorPlatform.get_by_id_async(UUID('...'))
+            SensorPlatform(id=UUID(...), sensor_platform_name="MySensorPlatform")
+
+        Args:
+            id (UUID | int | str): The ID of the sensor platform.
+        Returns:
+            Optional[SensorPlatform]: The sensor platform, or None if not found.
+        """
+        try:
+            db_instance = await SensorPlatformModel.get_async(id)
+            if not db_instance:
+                print(f"SensorPlatform with ID {id} not found.")
+                return None
+            sensor_platform = cls.model_validate(db_instance)
+            return sensor_platform
+        except Exception as e:
+            print(f"Error retrieving SensorPlatform by ID: {e}")
+            return None
         
     @classmethod
     def get_all(cls) -> Optional[List["SensorPlatform"]]:
@@ -199,6 +224,29 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error retrieving all SensorPlatforms: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["SensorPlatform"]]:
+        """
+        Asynchronously retrieve all sensor platforms.
+
+        Examples:
+            >>> await SensorPlatform.get_all_async()
+            [SensorPlatform(id=UUID(...), sensor_platform_name="Platform1"), SensorPlatform(id=UUID(...), sensor_platform_name="Platform2")]
+
+        Returns:
+            Optional[List[SensorPlatform]]: List of all sensor platforms, or None if not found.
+        """
+        try:
+            sensor_platforms = await SensorPlatformModel.all_async()
+            if not sensor_platforms or len(sensor_platforms) == 0:
+                print("No SensorPlatforms found.")
+                return None
+            sensor_platforms = [cls.model_validate(sp) for sp in sensor_platforms]
+            return sensor_platforms
+        except Exception as e:
+            print(f"Error retrieving all SensorPlatforms: {e}")
+            return None
         
     @classmethod
     def search(
@@ -239,6 +287,127 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error searching SensorPlatforms: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        sensor_platform_name: str = None,
+        sensor_platform_info: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["SensorPlatform"]]:
+        """
+        Asynchronously search for sensor platforms based on various criteria.
+
+        Examples:
+            >>> await SensorPlatform.search_async(sensor_platform_name="MySensorPlatform")
+            [SensorPlatform(id=UUID(...), sensor_platform_name="MySensorPlatform")]
+
+
+        Args:
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+            sensor_platform_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List[SensorPlatform]]: List of matching sensor platforms, or None if not found.
+        """
+        try:
+            if not any([sensor_platform_name, sensor_platform_info, experiment_name]):
+                print("At least one search parameter must be provided.")
+                return None
+            instances = await ExperimentSensorPlatformsViewModel.search_async(
+                sensor_platform_name=sensor_platform_name,
+                sensor_platform_info=sensor_platform_info,
+                experiment_name=experiment_name
+            )
+            if not instances or len(instances) == 0:
+                print("No SensorPlatforms found matching the search criteria.")
+                return None
+            sensor_platforms = [cls.model_validate(instance) for instance in instances]
+            return sensor_platforms
+        except Exception as e:
+            print(f"Error searching SensorPlatforms: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_platform_name: str = None,
+        sensor_platform_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["SensorPlatform"], Optional[str]]:
+        """
+        Retrieve a page of sensor platforms using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensor_platforms, next_cursor = SensorPlatform.paginate(page_limit=50)
+            >>> more_sensor_platforms, next_cursor = SensorPlatform.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor platforms in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+            sensor_platform_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[SensorPlatform], Optional[str]]: The sensor platforms in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_platform_name, sensor_platform_info, experiment_name]):
+            instances, next_cursor = ExperimentSensorPlatformsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_platform_name=sensor_platform_name,
+                sensor_platform_info=sensor_platform_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = SensorPlatformModel.paginate(page_limit=page_limit, cursor=cursor)
+        sensor_platforms = [cls.model_validate(instance) for instance in instances]
+        return sensor_platforms, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_platform_name: str = None,
+        sensor_platform_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["SensorPlatform"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of sensor platforms using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensor_platforms, next_cursor = await SensorPlatform.paginate_async(page_limit=50)
+            >>> more_sensor_platforms, next_cursor = await SensorPlatform.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor platforms in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_platform_name (str, optional): The name of the sensor platform. Defaults to None.
+            sensor_platform_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[SensorPlatform], Optional[str]]: The sensor platforms in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_platform_name, sensor_platform_info, experiment_name]):
+            instances, next_cursor = await ExperimentSensorPlatformsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_platform_name=sensor_platform_name,
+                sensor_platform_info=sensor_platform_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await SensorPlatformModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        sensor_platforms = [cls.model_validate(instance) for instance in instances]
+        return sensor_platforms, next_cursor
+
         
     def update(
         self,
@@ -279,6 +448,46 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error updating SensorPlatform: {e}")
             return None
+
+    async def update_async(
+        self,
+        sensor_platform_name: str = None,
+        sensor_platform_info: dict = None
+    ) -> Optional["SensorPlatform"]:
+        """
+        Asynchronously update the details of the sensor platform.
+
+        Examples:
+            >>> sensor_platform = SensorPlatform.get(sensor_platform_name="MySensorPlatform")
+            >>> updated_platform = await sensor_platform.update_async(sensor_platform_name="UpdatedPlatformName")
+            SensorPlatform(id=UUID(...), sensor_platform_name="UpdatedPlatformName")
+
+        Args:
+            sensor_platform_name (str, optional): The new name. Defaults to None.
+            sensor_platform_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[SensorPlatform]: The updated sensor platform, or None if an error occurred.
+        """
+        try:
+            if not any([sensor_platform_name, sensor_platform_info]):
+                print("At least one update parameter must be provided.")
+                return None
+            current_id = self.id
+            platform = await SensorPlatformModel.get_async(current_id)
+            if not platform:
+                print(f"SensorPlatform with ID {current_id} not found.")
+                return None
+            platform = await SensorPlatformModel.update_async(
+                platform, 
+                sensor_platform_info=sensor_platform_info,
+                sensor_platform_name=sensor_platform_name
+            )
+            platform = self.model_validate(platform)
+            await self.refresh_async()
+            return platform
+        except Exception as e:
+            print(f"Error updating SensorPlatform: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -303,6 +512,30 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error deleting SensorPlatform: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the sensor platform.
+
+        Examples:
+            >>> sensor_platform = SensorPlatform.get(sensor_platform_name="MySensorPlatform")
+            >>> await sensor_platform.delete_async()
+            True
+
+        Returns:
+            bool: True if the sensor platform was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            platform = await SensorPlatformModel.get_async(current_id)
+            if not platform:
+                print(f"SensorPlatform with ID {current_id} not found.")
+                return False
+            await SensorPlatformModel.delete_async(platform)
+            return True
+        except Exception as e:
+            print(f"Error deleting SensorPlatform: {e}")
+            return False
         
     def refresh(self) -> Optional["SensorPlatform"]:
         """
@@ -329,6 +562,32 @@ class SensorPlatform(APIBase):
         except Exception as e:
             print(f"Error refreshing SensorPlatform: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["SensorPlatform"]:
+        """
+        Asynchronously refresh the sensor platform's data from the database.
+
+        Examples:
+            >>> sensor_platform = SensorPlatform.get(sensor_platform_name="MySensorPlatform")
+            >>> await sensor_platform.refresh_async()
+            SensorPlatform(id=UUID(...), sensor_platform_name="MySensorPlatform")
+
+        Returns:
+            Optional[SensorPlatform]: The refreshed sensor platform, or None if an error occurred.
+        """
+        try:
+            db_instance = await SensorPlatformModel.get_async(self.id)
+            if not db_instance:
+                print(f"SensorPlatform with ID {self.id} not found.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing SensorPlatform: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
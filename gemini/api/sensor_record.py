@@ -8,6 +8,7 @@ This module includes the following methods:
 - `exists`: Check if a sensor record with the given parameters exists.
 - `create`: Create a new sensor record.
 - `insert`: Insert a list of sensor records into the database.
+- `insert_columns`: Insert sensor records given as columns, without building a record per row.
 - `get`: Retrieve a sensor record by its parameters.
 - `get_by_id`: Retrieve a sensor record by its ID.
 - `get_all`: Retrieve all sensor records.
@@ -22,19 +23,29 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
-import os, mimetypes
-from tqdm import tqdm   
+from typing import Any, Optional, List, Generator, AsyncGenerator, AsyncIterable, Callable, TYPE_CHECKING
+import os, mimetypes, asyncio
 from uuid import UUID
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
-from gemini.api.base import APIBase, FileHandlerMixin
+from gemini.api.uploads import process_and_insert_chunks, upload_file_deduplicated
+from gemini.api.journal import IngestionJournal
+from gemini.api.base import APIBase, FileHandlerMixin, get_minio_storage_provider
+from gemini.api.presign import record_download_urls_async
+from gemini.storage.multipart import upload_stream_async
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
+from gemini.api.columns import build_rows, check_plot_columns, collect_columns, date_column, dict_column, int_column, timestamp_column
 from gemini.db.models.columnar.sensor_records import SensorRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.sensor_records_immv import SensorRecordsIMMVModel
 
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class SensorRecord(APIBase, FileHandlerMixin):
     """
     Represents a record of sensor data, including metadata, associations to datasets, experiments, sites, seasons, and plots, and file handling capabilities.
@@ -258,33 +269,241 @@ class SensorRecord(APIBase, FileHandlerMixin):
             return None
     
     @classmethod
-    def insert(cls, records: List["SensorRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["SensorRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of sensor records into the database.
 
         Args:
             records (List[SensorRecord]): The records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to the GEMINI_UPLOAD_WORKERS environment variable, or 8.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Journaled work is skipped, so a failed import can be re-run from the start. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 raise ValueError("No records provided for insertion.")
-                return False, []
-            records = [cls.process_record(record) for record in tqdm(records, desc="Processing Records for Sensor: " + records[0].sensor_name)]
-            records_to_insert = []
-            for record in records:
-                record_to_insert = record.model_dump()
-                record_to_insert = {k: v for k, v in record_to_insert.items() if v is not None}
-                records_to_insert.append(record_to_insert)
-            print(f"Inserting {len(records_to_insert)} records.")
-            inserted_record_ids = SensorRecordModel.insert_bulk('sensor_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} records.")
-            return True, inserted_record_ids
+            process = lambda record: cls.process_record(record, raise_errors=True)
+            if journal is not None:
+                process = journal.journaled(process, lambda record: cls.create_file_uri(record, check_exists=False))
+            print(f"Inserting {len(records)} records.")
+            # Each chunk is uploaded and then inserted, so chunk indices refer to positions in records
+            result = process_and_insert_chunks(
+                process,
+                records,
+                lambda chunk, chunk_index: cls._insert_rows(
+                    [{k: v for k, v in record.model_dump().items() if v is not None} for record in chunk],
+                    use_copy,
+                    None,
+                    chunk_index,
+                    on_chunk,
+                    journal,
+                    id_resolution
+                ),
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                workers=upload_workers,
+                desc="Processing Records for Sensor: " + records[0].sensor_name
+            )
+            return cls._report_insert(result)
         except Exception as e:
             print(f"Error inserting records: {e}")
-            return False, []
-        
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
+    @classmethod
+    def insert_columns(
+        cls,
+        sensor_name: str,
+        dataset_name: str,
+        timestamps: Any = None,
+        collection_date: Any = None,
+        sensor_data: Any = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_numbers: Any = None,
+        plot_row_numbers: Any = None,
+        plot_column_numbers: Any = None,
+        record_files: Any = None,
+        record_info: Any = None,
+        frame: "DataFrame" = None,
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        upload_workers: int = None,
+        journal: IngestionJournal = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
+        """
+        Insert sensor records given as columns, without building a SensorRecord per row.
+
+        The shared fields are checked once and each column in a single pass, and
+        the rows go straight to the bulk insert. Records with files are uploaded
+        as with `insert` first.
+
+        Examples:
+            >>> success, record_ids = SensorRecord.insert_columns(
+            ...     sensor_name="TemperatureSensor",
+            ...     dataset_name="WeatherData",
+            ...     experiment_name="ClimateExperiment",
+            ...     season_name="Autumn",
+            ...     site_name="SiteA",
+            ...     frame=pd.DataFrame({
+            ...         "timestamp": pd.date_range("2023-10-01", periods=3, freq="h"),
+            ...         "plot_number": [1, 2, 3],
+            ...         "plot_row_number": [1, 1, 1],
+            ...         "plot_column_number": [1, 2, 3],
+            ...         "sensor_data": [{"temperature": 22.5}, {"temperature": 23.0}, {"temperature": 21.8}]
+            ...     })
+            ... )
+            >>> print(success, len(record_ids))
+            True 3
+
+        Args:
+            sensor_name (str): The name of the sensor.
+            dataset_name (str): The name of the dataset.
+            timestamps (list | numpy.ndarray | pandas.Series, optional): The timestamp of each record.
+            collection_date (date | list, optional): The collection date, shared or per record. Defaults to the date of each timestamp.
+            sensor_data (list, optional): The data of each record.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_numbers (list | numpy.ndarray | pandas.Series, optional): The plot number of each record.
+            plot_row_numbers (list | numpy.ndarray | pandas.Series, optional): The plot row number of each record.
+            plot_column_numbers (list | numpy.ndarray | pandas.Series, optional): The plot column number of each record.
+            record_files (list, optional): The file path of each record.
+            record_info (list, optional): Additional info of each record.
+            frame (pandas.DataFrame, optional): Columns named after the record fields (timestamp, plot_number, sensor_data, ...), used for the columns not passed as arguments.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            upload_workers (int, optional): Number of files uploaded concurrently. Defaults to None.
+            journal (IngestionJournal, optional): Journal of completed uploads and batches. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
+        Returns:
+            BulkInsertResult: The counts of every chunk, the inserted record IDs, upload failures and the chunk to resume from. Unpacks to (success, inserted record IDs).
+        """
+        try:
+            if not any([experiment_name, season_name, site_name]):
+                raise ValueError("At least one of experiment_name, season_name, or site_name must be provided.")
+            if not sensor_name:
+                raise ValueError("Sensor name is required.")
+            if not dataset_name:
+                raise ValueError("Dataset name is required.")
+            columns = collect_columns({
+                "timestamp": timestamps,
+                "collection_date": collection_date,
+                "sensor_data": sensor_data,
+                "plot_number": plot_numbers,
+                "plot_row_number": plot_row_numbers,
+                "plot_column_number": plot_column_numbers,
+                "record_file": record_files,
+                "record_info": record_info
+            }, frame)
+            if columns["timestamp"] is None:
+                raise ValueError("Timestamps are required.")
+            columns["timestamp"] = timestamp_column(columns["timestamp"])
+            columns["collection_date"] = date_column(columns["collection_date"] or columns["timestamp"])
+            columns["sensor_data"] = dict_column(columns["sensor_data"], "sensor_data")
+            columns["record_info"] = dict_column(columns["record_info"], "record_info")
+            for name in ("plot_number", "plot_row_number", "plot_column_number"):
+                columns[name] = int_column(columns[name], name)
+            check_plot_columns(columns["plot_number"], columns["plot_row_number"], columns["plot_column_number"])
+            sensor_data_column = columns["sensor_data"] or [None] * len(columns["timestamp"])
+            record_file_column = columns["record_file"] or [None] * len(columns["timestamp"])
+            missing = sum(1 for data, file in zip(sensor_data_column, record_file_column) if not data and not file)
+            if missing:
+                raise ValueError(f"Either sensor_data or record_file must be provided, {missing} records have neither.")
+            rows = build_rows(
+                {
+                    "sensor_name": sensor_name,
+                    "dataset_name": dataset_name,
+                    "experiment_name": experiment_name,
+                    "season_name": season_name,
+                    "site_name": site_name
+                },
+                columns
+            )
+            if columns["record_file"] is not None:
+                # Files are uploaded through process_record, which works on records
+                records = [cls.model_construct(**row) for row in rows]
+                return cls.insert(
+                    records,
+                    use_copy=use_copy,
+                    batch_size=batch_size,
+                    start_chunk=start_chunk,
+                    on_chunk=on_chunk,
+                    upload_workers=upload_workers,
+                    journal=journal,
+                    id_resolution=id_resolution
+                )
+            if batch_size and start_chunk:
+                rows = rows[start_chunk * batch_size:]
+                print(f"Resuming insertion from chunk {start_chunk}.")
+            print(f"Inserting {len(rows)} records.")
+            return cls._report_insert(cls._insert_rows(rows, use_copy, batch_size, start_chunk, on_chunk, journal, id_resolution))
+        except Exception as e:
+            print(f"Error inserting records: {e}")
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
+    @classmethod
+    def _insert_rows(
+        cls,
+        records_to_insert: List[dict],
+        use_copy: bool,
+        batch_size: Optional[int],
+        start_chunk: int,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]],
+        journal: Optional[IngestionJournal],
+        id_resolution: Optional[str] = None
+    ) -> BulkInsertResult:
+        if journal is not None:
+            return journal.insert_batches(
+                SensorRecordModel,
+                'sensor_records_unique',
+                records_to_insert,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                use_copy=use_copy,
+                on_chunk=on_chunk,
+                id_resolution=id_resolution
+            )
+        return SensorRecordModel.insert_bulk_chunked(
+            'sensor_records_unique',
+            records_to_insert,
+            batch_size=batch_size,
+            start_chunk=start_chunk,
+            use_copy=use_copy,
+            on_chunk=on_chunk,
+            id_resolution=id_resolution
+        )
+
+    @classmethod
+    def _report_insert(cls, result: BulkInsertResult) -> BulkInsertResult:
+        print(f"Inserted {result.inserted} records, skipped {result.skipped} existing records, {result.failed} failed.")
+        if result.failed > 0:
+            print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+        elif result.upload_failures:
+            print(f"{len(result.upload_failures)} file uploads failed, resume from chunk {result.next_chunk} to retry them.")
+        return result
+
     @classmethod
     def get(
         cls,
@@ -390,9 +609,56 @@ class SensorRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error getting sensor record by ID: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["SensorRecord"]:
+        """
+        Asynchronously retrieve a sensor record by its ID.
+
+        Examples:
+            >>> sensor_record = await SensorRecord.get_by_id_async(UUID('...'))
+            >>> print(sensor_record)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='TemperatureSensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteA', season_name='Autumn', plot_number=1)
+
+        Args:
+            id (UUID | int | str): The ID of the sensor record.
+        Returns:
+            Optional[SensorRecord]: The sensor record, or None if not found.
+        """
+        try:
+            db_instance = await SensorRecordModel.get_async(id)
+            if not db_instance:
+                print(f"No sensor record found with ID: {id}")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting sensor record by ID: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["SensorRecord"]]:
+    async def get_download_urls_async(cls, record_ids: List[UUID | int | str]) -> List[dict]:
+        """
+        Asynchronously retrieve pre-signed download URLs for the files of sensor records, reading the records in one query.
+
+        Examples:
+            >>> urls = await SensorRecord.get_download_urls_async([UUID('...'), UUID('...')])
+            >>> urls[0]["url"]
+            'https://storage.example.org/gemini/...?X-Amz-Algorithm=AWS4-HMAC-SHA256&...'
+
+        Args:
+            record_ids (List[UUID | int | str]): The IDs of the sensor records, at most `MAX_PRESIGN_BATCH`.
+        Returns:
+            List[dict]: One entry per ID with `record_id`, `record_file`, `url`, `expires_at` and `error`, or an empty list if an error occurred.
+        """
+        try:
+            return await record_download_urls_async(SensorRecordModel, record_ids)
+        except Exception as e:
+            print(f"Error getting SensorRecord download URLs: {e}")
+            return []
+
+    @classmethod
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["SensorRecord"]]:
         """
         Retrieve all sensor records, up to a specified limit.
 
@@ -405,6 +671,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
 
         Args:
             limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
         Returns:
             Optional[List[SensorRecord]]: List of sensor records, or None if not found.
         """
@@ -413,6 +680,39 @@ class SensorRecord(APIBase, FileHandlerMixin):
             if not records or len(records) == 0:
                 print("No sensor records found.")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(record) for record in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all sensor records: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["SensorRecord"]]:
+        """
+        Asynchronously retrieve all sensor records, up to a specified limit.
+
+        Examples:
+            >>> sensor_records = await SensorRecord.get_all_async(limit=10)
+            >>> for record in sensor_records:
+            ...     print(record)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='TemperatureSensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteA', season_name='Autumn', plot_number=1)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='HumiditySensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteB', season_name='Winter', plot_number=2)
+
+        Args:
+            limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
+        Returns:
+            Optional[List[SensorRecord]]: List of sensor records, or None if not found.
+        """
+        try:
+            records = await SensorRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print("No sensor records found.")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(record) for record in records]
             return records
         except Exception as e:
@@ -432,7 +732,8 @@ class SensorRecord(APIBase, FileHandlerMixin):
         plot_row_number: int = None,
         plot_column_number: int = None,
         collection_date: date = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Generator["SensorRecord", None, None]:
         """
         Search for sensor records based on various criteria.
@@ -466,6 +767,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
             plot_column_number (int, optional): The plot column number. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
         Yields:
             SensorRecord: Matching sensor records.
         """
@@ -473,7 +775,8 @@ class SensorRecord(APIBase, FileHandlerMixin):
             if not any([sensor_name, dataset_name, experiment_name, site_name, season_name, plot_number, plot_row_number, plot_column_number]):
                 print("At least one search parameter must be provided.")
                 return
-            records = SensorRecordsIMMVModel.stream(
+            stream = SensorRecordsIMMVModel.stream_rows if lightweight else SensorRecordsIMMVModel.stream
+            records = stream(
                 sensor_name=sensor_name,
                 sensor_data=sensor_data,
                 dataset_name=dataset_name,
@@ -486,6 +789,9 @@ class SensorRecord(APIBase, FileHandlerMixin):
                 collection_date=collection_date,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -493,6 +799,210 @@ class SensorRecord(APIBase, FileHandlerMixin):
             print(f"Error searching sensor records: {e}")
             yield from []
 
+    @classmethod
+    async def search_async(
+        cls,
+        sensor_name: str = None,
+        sensor_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator["SensorRecord", None]:
+        """
+        Asynchronously search for sensor records based on various criteria.
+
+        Examples:
+            >>> sensor_records = SensorRecord.search_async(
+            ...     sensor_name="TemperatureSensor",
+            ...     dataset_name="WeatherData",
+            ...     experiment_name="ClimateExperiment",
+            ...     site_name="SiteA",
+            ...     season_name="Autumn",
+            ...     plot_number=1,
+            ...     plot_row_number=1,
+            ...     plot_column_number=1,
+            ...     collection_date=date(2023, 10, 1),
+            ...     record_info={"notes": "Initial record"}
+            ... )
+            >>> async for record in sensor_records:
+            ...     print(record)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='TemperatureSensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteA', season_name='Autumn', plot_number=1)
+
+        Args:
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
+        Yields:
+            SensorRecord: Matching sensor records.
+        """
+        try:
+            if not any([sensor_name, dataset_name, experiment_name, site_name, season_name, plot_number, plot_row_number, plot_column_number]):
+                print("At least one search parameter must be provided.")
+                return
+            stream = SensorRecordsIMMVModel.stream_rows_async if lightweight else SensorRecordsIMMVModel.stream_async
+            records = stream(
+                sensor_name=sensor_name,
+                sensor_data=sensor_data,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                site_name=site_name,
+                season_name=season_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                collection_date=collection_date,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching sensor records: {e}")
+            return
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_name: str = None,
+        sensor_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["SensorRecord"], Optional[str]]:
+        """
+        Retrieve a page of sensor records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> sensor_records, next_cursor = SensorRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_sensor_records, next_cursor = SensorRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[SensorRecord], Optional[str]]: The sensor records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = SensorRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            sensor_name=sensor_name,
+            sensor_data=sensor_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            plot_number=plot_number,
+            plot_row_number=plot_row_number,
+            plot_column_number=plot_column_number,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        sensor_records = [cls.model_validate(record) for record in records]
+        return sensor_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_name: str = None,
+        sensor_data: dict = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["SensorRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of sensor records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> sensor_records, next_cursor = await SensorRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_sensor_records, next_cursor = await SensorRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_name (str, optional): The name of the sensor. Defaults to None.
+            sensor_data (dict, optional): The data content. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[SensorRecord], Optional[str]]: The sensor records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await SensorRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            sensor_name=sensor_name,
+            sensor_data=sensor_data,
+            dataset_name=dataset_name,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            plot_number=plot_number,
+            plot_row_number=plot_row_number,
+            plot_column_number=plot_column_number,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        sensor_records = [cls.model_validate(record) for record in records]
+        return sensor_records, next_cursor
+
+
     @classmethod
     def filter(
         cls,
@@ -502,7 +1012,8 @@ class SensorRecord(APIBase, FileHandlerMixin):
         dataset_names: List[str] = None,
         experiment_names: List[str] = None,
         season_names: List[str] = None,
-        site_names: List[str] = None
+        site_names: List[str] = None,
+        lightweight: bool = False
     ) -> Generator["SensorRecord", None, None]:
         """
         Filter sensor records based on custom logic.
@@ -530,6 +1041,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of SensorRecord instances. Defaults to False.
         Yields:
             SensorRecord: Filtered sensor records.
         """
@@ -543,12 +1055,59 @@ class SensorRecord(APIBase, FileHandlerMixin):
                 site_names=site_names,
                 season_names=season_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
         except Exception as e:
             print(f"Error filtering sensor records: {e}")
             yield from []
+
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for sensor records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = SensorRecord.to_dataframe(sensor_name="Sensor A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'sensor_data.value', 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `sensor_data` and `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = SensorRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting sensor records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter sensor records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = SensorRecord.filter_to_dataframe(sensor_names=["Sensor A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `sensor_data` and `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = SensorRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered sensor records to a DataFrame: {e}")
+            return None
     
 
     def update(
@@ -594,6 +1153,50 @@ class SensorRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error updating sensor record: {e}")
             return None
+
+    async def update_async(
+        self,
+        sensor_data: dict = None,
+        record_info: dict = None
+    ) -> Optional["SensorRecord"]:
+        """
+        Asynchronously update the details of the sensor record.
+
+        Examples:
+            >>> sensor_record = SensorRecord.get_by_id(UUID('...'))
+            >>> updated_record = await sensor_record.update_async(
+            ...     sensor_data={"temperature": 23.0},
+            ...     record_info={"notes": "Updated record"}
+            ... )
+            >>> print(updated_record)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='TemperatureSensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteA', season_name='Autumn', plot_number=1)
+
+        Args:
+            sensor_data (dict, optional): The new sensor data. Defaults to None.
+            record_info (dict, optional): The new record information. Defaults to None.
+        Returns:
+            Optional[SensorRecord]: The updated sensor record, or None if an error occurred.
+        """
+        try:
+            if not any([sensor_data, record_info]):
+                print("At least one update parameter must be provided.")
+                return None
+            current_id = self.id
+            sensor_record = await SensorRecordModel.get_async(current_id)
+            if not sensor_record:
+                print(f"No sensor record found with ID: {current_id}")
+                return None
+            sensor_record = await SensorRecordModel.update_async(
+                sensor_record,
+                sensor_data=sensor_data,
+                record_info=record_info
+            )
+            sensor_record = self.model_validate(sensor_record)
+            await self.refresh_async()
+            return sensor_record
+        except Exception as e:
+            print(f"Error updating sensor record: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -619,6 +1222,31 @@ class SensorRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error deleting sensor record: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the sensor record.
+
+        Examples:
+            >>> sensor_record = SensorRecord.get_by_id(UUID('...'))
+            >>> success = await sensor_record.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the sensor record was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            sensor_record = await SensorRecordModel.get_async(current_id)
+            if not sensor_record:
+                print(f"No sensor record found with ID: {current_id}")
+                return False
+            await SensorRecordModel.delete_async(sensor_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting sensor record: {e}")
+            return False
         
     def refresh(self) -> Optional["SensorRecord"]:
         """
@@ -646,6 +1274,33 @@ class SensorRecord(APIBase, FileHandlerMixin):
         except Exception as e:
             print(f"Error refreshing SensorRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["SensorRecord"]:
+        """
+        Asynchronously refresh the sensor record's data from the database.
+
+        Examples:
+            >>> sensor_record = SensorRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await sensor_record.refresh_async()
+            >>> print(refreshed_record)
+            SensorRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), sensor_name='TemperatureSensor', dataset_name='WeatherData', experiment_name='ClimateExperiment', site_name='SiteA', season_name='Autumn', plot_number=1)
+
+        Returns:
+            Optional[SensorRecord]: The refreshed sensor record, or None if an error occurred.
+        """
+        try:
+            db_instance = await SensorRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"SensorRecord with id {self.id} not found.")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing SensorRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -711,7 +1366,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
             return None
     
     @classmethod
-    def create_file_uri(cls, record: "SensorRecord") -> Optional[str]:
+    def create_file_uri(cls, record: "SensorRecord", check_exists: bool = True) -> Optional[str]:
         """
         Create a file URI for the given sensor record.
 
@@ -735,6 +1390,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (SensorRecord): The sensor record for which to create the file URI.
+            check_exists (bool, optional): Require `record_file` to be an existing local file. Defaults to True.
         Returns:
             Optional[str]: The file URI, or None if creation failed.
         """
@@ -743,7 +1399,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
             if not original_file_path:
                 print(f"record_file is required to create file URI.")
                 return None
-            if not os.path.exists(original_file_path):
+            if check_exists and not os.path.exists(original_file_path):
                 print(f"File {original_file_path} does not exist.")
                 return None
             collection_date = record.collection_date.strftime("%Y-%m-%d")
@@ -762,7 +1418,76 @@ class SensorRecord(APIBase, FileHandlerMixin):
 
 
     @classmethod
-    def process_record(cls, record: "SensorRecord") -> "SensorRecord":
+    def _file_metadata(cls, record: "SensorRecord") -> dict:
+        # Object metadata stored with the record file
+        return {
+            "Sensor-Name": record.sensor_name,
+            "Dataset-Name": record.dataset_name,
+            "Experiment-Name": record.experiment_name,
+            "Site-Name": record.site_name,
+            "Season-Name": record.season_name,
+            "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
+            "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
+        }
+
+    @classmethod
+    async def insert_streamed_async(
+        cls,
+        record: "SensorRecord",
+        file_stream: AsyncIterable[bytes],
+        content_type: Optional[str] = None
+    ) -> BulkInsertResult:
+        """
+        Asynchronously insert a sensor record, uploading its file from a stream as it arrives.
+
+        The file goes straight to object storage in parts, without a local copy, so it
+        can be as large as storage allows. `record.record_file` is the original file
+        name, which sets the extension of the stored file.
+
+        Examples:
+            >>> record = SensorRecord.create(
+            ...     timestamp=datetime(2024, 7, 1, 12, 0, 0),
+            ...     sensor_name="Drone RGB Camera",
+            ...     dataset_name="Drone Flights",
+            ...     experiment_name="Experiment A",
+            ...     site_name="Site A",
+            ...     season_name="Season 1",
+            ...     record_file="flight_01.mp4",
+            ...     insert_on_create=False
+            ... )
+            >>> success, inserted_ids = await SensorRecord.insert_streamed_async(record, request.stream())
+
+        Args:
+            record (SensorRecord): The record to insert.
+            file_stream (AsyncIterable[bytes]): The content of the record file, chunk by chunk.
+            content_type (str, optional): MIME type of the file. Defaults to a guess from the file name.
+        Returns:
+            BulkInsertResult: The result of the insert. Unpacks to (success, inserted record IDs).
+        """
+        try:
+            file_key = cls.create_file_uri(record, check_exists=False)
+            if not file_key:
+                raise ValueError(f"Failed to create file URI for SensorRecord: {record}")
+            content_type = content_type or mimetypes.guess_type(record.record_file)[0]
+            result = await upload_stream_async(
+                get_minio_storage_provider(),
+                object_name=file_key,
+                bucket_name="gemini",
+                chunks=file_stream,
+                content_type=content_type,
+                metadata=cls._file_metadata(record)
+            )
+            record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": result["sha256"]}
+            record_to_insert = {k: v for k, v in record.model_dump().items() if v is not None}
+            result = await asyncio.to_thread(cls._insert_rows, [record_to_insert], False, None, 0, None, None)
+            return cls._report_insert(result)
+        except Exception as e:
+            print(f"Error inserting streamed SensorRecord: {e}")
+            return BulkInsertResult(error=str(e))
+
+    @classmethod
+    def process_record(cls, record: "SensorRecord", raise_errors: bool = False) -> "SensorRecord":
         """
         Process a sensor record (custom logic, e.g., file upload).
 
@@ -786,6 +1511,7 @@ class SensorRecord(APIBase, FileHandlerMixin):
 
         Args:
             record (SensorRecord): The sensor record to process.
+            raise_errors (bool, optional): Raise upload errors instead of printing them and returning the record unchanged. Defaults to False.
         Returns:
             SensorRecord: The processed sensor record.
         """
@@ -794,30 +1520,29 @@ class SensorRecord(APIBase, FileHandlerMixin):
             if not file:
                 print(f"record_file is required to process SensorRecord.")
                 return record
+            if not os.path.exists(file) and file == cls.create_file_uri(record, check_exists=False):
+                # Already uploaded, e.g. by the earlier attempt of a resumed insert
+                return record
             file_key = cls.create_file_uri(record)
             if not file_key:
+                if raise_errors:
+                    raise ValueError(f"Failed to create file URI for SensorRecord: {record}")
                 print(f"Failed to create file URI for SensorRecord: {record}")
                 return record
             content_type, _ = mimetypes.guess_type(file)
-            # Generate Metadata for upload
-            file_metadata = {
-                "Sensor-Name": record.sensor_name,
-                "Dataset-Name": record.dataset_name,
-                "Experiment-Name": record.experiment_name,
-                "Site-Name": record.site_name,
-                "Season-Name": record.season_name,
-                "Collection-Date": record.collection_date.isoformat() if record.collection_date else None,
-                "Timestamp": record.timestamp.isoformat() if record.timestamp else None,
-            }
-            cls.minio_storage_provider.upload_file(
+            content_hash, _ = upload_file_deduplicated(
+                get_minio_storage_provider(),
                 object_name=file_key,
-                input_file_path=file,
+                file_path=file,
                 bucket_name="gemini",
                 content_type=content_type,
-                metadata=file_metadata
+                metadata=cls._file_metadata(record)
             )
             record.record_file = file_key
+            record.record_info = {**(record.record_info or {}), "file_sha256": content_hash}
             return record
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error processing SensorRecord: {e}")
             return record
\ No newline at end of file
@@ -156,6 +156,31 @@ class SensorType(APIBase):
             print(f"Error getting sensor type by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["SensorType"]:
+        """
+        Asynchronously retrieve a sensor type by its ID.
+
+        Examples:
+            >>> await SensorType.get_by_id_async(UUID('...'))
+            SensorType(sensor_type_name='TemperatureSensor', id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the sensor type.
+        Returns:
+            Optional[SensorType]: The sensor type, or None if not found.
+        """
+        try:
+            db_instance = await SensorTypeModel.get_async(id)
+            if not db_instance:
+                print(f"Sensor type with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting sensor type by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["SensorType"]]:
         """
@@ -179,6 +204,29 @@ class SensorType(APIBase):
             print(f"Error getting all sensor types: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["SensorType"]]:
+        """
+        Asynchronously retrieve all sensor types.
+
+        Examples:
+            >>> await SensorType.get_all_async()
+            [SensorType(sensor_type_name='TemperatureSensor', id=UUID(...)), ...]
+
+        Returns:
+            Optional[List[SensorType]]: List of all sensor types, or None if not found.
+        """
+        try:
+            instances = await SensorTypeModel.all_async()
+            if not instances or len(instances) == 0:
+                print("No sensor types found.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error getting all sensor types: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -216,6 +264,118 @@ class SensorType(APIBase):
             print(f"Error searching sensor types: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        sensor_type_name: str = None,
+        sensor_type_info: dict = None
+    ) -> Optional[List["SensorType"]]:
+        """
+        Asynchronously search for sensor types based on various criteria.
+
+        Examples:
+            >>> await SensorType.search_async(sensor_type_name="TemperatureSensor")
+            [SensorType(sensor_type_name='TemperatureSensor', id=UUID(...))]
+
+        Args:
+            sensor_type_name (str, optional): The name of the sensor type. Defaults to None.
+            sensor_type_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            Optional[List[SensorType]]: List of matching sensor types, or None if not found.
+        """
+        try:
+            if not any([sensor_type_name, sensor_type_info]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            instances = await SensorTypeModel.search_async(
+                sensor_type_name=sensor_type_name,
+                sensor_type_info=sensor_type_info
+            )
+            if not instances or len(instances) == 0:
+                print("No sensor types found with the provided search parameters.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error searching sensor types: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_type_name: str = None,
+        sensor_type_info: dict = None
+    ) -> tuple[List["SensorType"], Optional[str]]:
+        """
+        Retrieve a page of sensor types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensor_types, next_cursor = SensorType.paginate(page_limit=50)
+            >>> more_sensor_types, next_cursor = SensorType.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_type_name (str, optional): The name of the sensor type. Defaults to None.
+            sensor_type_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[SensorType], Optional[str]]: The sensor types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_type_name, sensor_type_info]):
+            instances, next_cursor = SensorTypeModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_type_name=sensor_type_name,
+                sensor_type_info=sensor_type_info
+            )
+        else:
+            instances, next_cursor = SensorTypeModel.paginate(page_limit=page_limit, cursor=cursor)
+        sensor_types = [cls.model_validate(instance) for instance in instances]
+        return sensor_types, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        sensor_type_name: str = None,
+        sensor_type_info: dict = None
+    ) -> tuple[List["SensorType"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of sensor types using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sensor_types, next_cursor = await SensorType.paginate_async(page_limit=50)
+            >>> more_sensor_types, next_cursor = await SensorType.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sensor types in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            sensor_type_name (str, optional): The name of the sensor type. Defaults to None.
+            sensor_type_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[SensorType], Optional[str]]: The sensor types in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([sensor_type_name, sensor_type_info]):
+            instances, next_cursor = await SensorTypeModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                sensor_type_name=sensor_type_name,
+                sensor_type_info=sensor_type_info
+            )
+        else:
+            instances, next_cursor = await SensorTypeModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        sensor_types = [cls.model_validate(instance) for instance in instances]
+        return sensor_types, next_cursor
+
+
     def update(
         self,
         sensor_type_name: str = None,
@@ -258,6 +418,48 @@ class SensorType(APIBase):
             print(f"Error updating sensor type: {e}")
             return None
 
+    async def update_async(
+        self,
+        sensor_type_name: str = None,
+        sensor_type_info: dict = None,
+    ) -> Optional["SensorType"]:
+        """
+        Asynchronously update the details of the sensor type.
+
+        Examples:
+            >>> sensor_type = SensorType.get("TemperatureSensor")
+            >>> await sensor_type.update_async(sensor_type_name="NewTemperatureSensor")
+            SensorType(sensor_type_name='NewTemperatureSensor', id=UUID(...))
+
+        Args:
+            sensor_type_name (str, optional): The new name. Defaults to None.
+            sensor_type_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[SensorType]: The updated sensor type, or None if an error occurred.
+        """
+        try:
+            if not any([sensor_type_name, sensor_type_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            sensor_type = await SensorTypeModel.get_async(current_id)
+            if not sensor_type:
+                print(f"Sensor type with ID {current_id} does not exist.")
+                return None
+
+            sensor_type = await SensorTypeModel.update_async(
+                sensor_type,
+                sensor_type_name=sensor_type_name,
+                sensor_type_info=sensor_type_info
+            )
+            instance = self.model_validate(sensor_type)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating sensor type: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the sensor type.
@@ -282,6 +484,30 @@ class SensorType(APIBase):
             print(f"Error deleting sensor type: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the sensor type.
+
+        Examples:
+            >>> sensor_type = SensorType.get("TemperatureSensor")
+            >>> await sensor_type.delete_async()
+            True
+
+        Returns:
+            bool: True if the sensor type was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            sensor_type = await SensorTypeModel.get_async(current_id)
+            if not sensor_type:
+                print(f"Sensor type with ID {current_id} does not exist.")
+                return False
+            await SensorTypeModel.delete_async(sensor_type)
+            return True
+        except Exception as e:
+            print(f"Error deleting sensor type: {e}")
+            return False
+
     def refresh(self) -> Optional["SensorType"]:
         """
         Refresh the sensor type's data from the database.
@@ -308,6 +534,32 @@ class SensorType(APIBase):
             print(f"Error refreshing sensor type: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["SensorType"]:
+        """
+        Asynchronously refresh the sensor type's data from the database.
+
+        Examples:
+            >>> sensor_type = SensorType.get("TemperatureSensor")
+            >>> await sensor_type.refresh_async()
+            SensorType(sensor_type_name='TemperatureSensor', id=UUID(...))
+
+        Returns:
+            Optional[SensorType]: The refreshed sensor type, or None if an error occurred.
+        """
+        try:
+            db_instance = await SensorTypeModel.get_async(self.id)
+            if not db_instance:
+                print(f"Sensor type with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing sensor type: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the sensor type.
@@ -26,6 +26,7 @@ from uuid import UUID
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
 from gemini.api.base import APIBase
+from gemini.api.cache import entity_cache, invalidates_cached_entity, clears_entity_cache
 from gemini.db.models.sites import SiteModel
 from gemini.db.models.associations import ExperimentSiteModel
 from gemini.db.models.views.experiment_views import ExperimentSitesViewModel
@@ -155,6 +156,9 @@ class Site(APIBase):
             Optional[Site]: The site, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_key(cls, site_name=site_name, experiment_name=experiment_name)
+            if cached is not None:
+                return cached
             db_instance = ExperimentSitesViewModel.get_by_parameters(
                 site_name=site_name,
                 experiment_name=experiment_name
@@ -163,6 +167,7 @@ class Site(APIBase):
                 print(f"Site with name {site_name} not found.")
                 return None
             instance = cls.model_validate(db_instance)
+            entity_cache.put(cls, instance, site_name=site_name, experiment_name=experiment_name)
             return instance
         except Exception as e:
             print(f"Error getting site: {e}")
@@ -185,11 +190,46 @@ class Site(APIBase):
             Optional[Site]: The site, or None if not found.
         """
         try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
             db_instance = SiteModel.get(id)
             if not db_instance:
                 print(f"Site with ID {id} does not exist.")
                 return None
             site = cls.model_validate(db_instance)
+            entity_cache.put(cls, site)
+            return site
+        except Exception as e:
+            print(f"Error getting site by ID: {e}")
+            return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Site"]:
+        """
+        Asynchronously retrieve a site by its ID.
+
+
+        Examples:
+            >>> site = await Site.get_by_id_async(UUID('...'))
+            >>> print(site)
+            Site(site_name=Test Site, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the site.
+        Returns:
+            Optional[Site]: The site, or None if not found.
+        """
+        try:
+            cached = entity_cache.get_by_id(cls, id)
+            if cached is not None:
+                return cached
+            db_instance = await SiteModel.get_async(id)
+            if not db_instance:
+                print(f"Site with ID {id} does not exist.")
+                return None
+            site = cls.model_validate(db_instance)
+            entity_cache.put(cls, site)
             return site
         except Exception as e:
             print(f"Error getting site by ID: {e}")
@@ -218,6 +258,30 @@ class Site(APIBase):
         except Exception as e:
             print(f"Error getting all sites: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Site"]]:
+        """
+        Asynchronously retrieve all sites.
+
+        Examples:
+            >>> sites = await Site.get_all_async()
+            >>> print(sites)
+            [Site(site_name=Site1, id=UUID(...)), Site(site_name=Site2, id=UUID(...))]
+
+        Returns:
+            Optional[List[Site]]: List of all sites, or None if not found.
+        """
+        try:
+            sites = await SiteModel.all_async()
+            if not sites or len(sites) == 0:
+                print("No sites found.")
+                return None
+            sites = [cls.model_validate(site) for site in sites]
+            return sites
+        except Exception as e:
+            print(f"Error getting all sites: {e}")
+            return None
         
     @classmethod
     def search(
@@ -268,7 +332,157 @@ class Site(APIBase):
         except Exception as e:
             print(f"Error searching sites: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls,
+        site_name: str = None,
+        site_city: str = None,
+        site_state: str = None,
+        site_country: str = None,
+        site_info: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["Site"]]:
+        """
+        Asynchronously search for sites based on various criteria.
+
+        Examples:
+            >>> sites = await Site.search_async(site_name="Test Site")
+            >>> print(sites)
+            [Site(site_name=Test Site, id=UUID(...))]
+
+        Args:
+            site_name (str, optional): The name of the site. Defaults to None.
+            site_city (str, optional): The city. Defaults to None.
+            site_state (str, optional): The state. Defaults to None.
+            site_country (str, optional): The country. Defaults to None.
+            site_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List[Site]]: List of matching sites, or None if not found.
+        """
+        try:
+            if not any([site_name, site_city, site_state, site_country, site_info, experiment_name]):
+                print("No search parameters provided.")
+                return None
+
+            sites = await ExperimentSitesViewModel.search_async(
+                site_name=site_name,
+                site_city=site_city,
+                site_state=site_state,
+                site_country=site_country,
+                site_info=site_info,
+                experiment_name=experiment_name
+            )
+            if not sites or len(sites) == 0:
+                print("No sites found matching the search criteria.")
+                return None
+            sites = [cls.model_validate(site) for site in sites]
+            return sites
+        except Exception as e:
+            print(f"Error searching sites: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        site_name: str = None,
+        site_city: str = None,
+        site_state: str = None,
+        site_country: str = None,
+        site_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Site"], Optional[str]]:
+        """
+        Retrieve a page of sites using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sites, next_cursor = Site.paginate(page_limit=50)
+            >>> more_sites, next_cursor = Site.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sites in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            site_city (str, optional): The city. Defaults to None.
+            site_state (str, optional): The state. Defaults to None.
+            site_country (str, optional): The country. Defaults to None.
+            site_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Site], Optional[str]]: The sites in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([site_name, site_city, site_state, site_country, site_info, experiment_name]):
+            instances, next_cursor = ExperimentSitesViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                site_name=site_name,
+                site_city=site_city,
+                site_state=site_state,
+                site_country=site_country,
+                site_info=site_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = SiteModel.paginate(page_limit=page_limit, cursor=cursor)
+        sites = [cls.model_validate(instance) for instance in instances]
+        return sites, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        site_name: str = None,
+        site_city: str = None,
+        site_state: str = None,
+        site_country: str = None,
+        site_info: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Site"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of sites using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> sites, next_cursor = await Site.paginate_async(page_limit=50)
+            >>> more_sites, next_cursor = await Site.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of sites in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            site_city (str, optional): The city. Defaults to None.
+            site_state (str, optional): The state. Defaults to None.
+            site_country (str, optional): The country. Defaults to None.
+            site_info (dict, optional): Additional information. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Site], Optional[str]]: The sites in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([site_name, site_city, site_state, site_country, site_info, experiment_name]):
+            instances, next_cursor = await ExperimentSitesViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                site_name=site_name,
+                site_city=site_city,
+                site_state=site_state,
+                site_country=site_country,
+                site_info=site_info,
+                experiment_name=experiment_name
+            )
+        else:
+            instances, next_cursor = await SiteModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        sites = [cls.model_validate(instance) for instance in instances]
+        return sites, next_cursor
+
         
+    @invalidates_cached_entity
     def update(
         self,
         site_name: str = None,
@@ -319,7 +533,60 @@ class Site(APIBase):
         except Exception as e:
             print(f"Error updating site: {e}")
             return None
+
+    @invalidates_cached_entity
+    async def update_async(
+        self,
+        site_name: str = None,
+        site_city: str = None,
+        site_state: str = None,
+        site_country: str = None,
+        site_info: dict = None
+    ) -> Optional["Site"]:
+        """
+        Asynchronously update the details of the site.
+
+        Examples:
+            >>> site = Site.get("Test Site")
+            >>> updated_site = await site.update_async(site_city="New City", site_state="New State")
+            >>> print(updated_site)
+            Site(site_name=Test Site, id=UUID(...))
+
+        Args:
+            site_name (str, optional): The new name. Defaults to None.
+            site_city (str, optional): The new city. Defaults to None.
+            site_state (str, optional): The new state. Defaults to None.
+            site_country (str, optional): The new country. Defaults to None.
+            site_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[Site]: The updated site, or None if an error occurred.
+        """
+        try:
+            if not any([site_city, site_state, site_country, site_info, site_name]):
+                raise ValueError("At least one update parameter must be provided.")
+            
+            current_id = self.id
+            site = await SiteModel.get_async(current_id)
+            if not site:
+                print(f"Site with ID {current_id} does not exist.")
+                return None
+            
+            updated_site = await SiteModel.update_async(
+                site,
+                site_name=site_name,
+                site_city=site_city,
+                site_state=site_state,
+                site_country=site_country,
+                site_info=site_info
+            )
+            updated_site = self.model_validate(updated_site)
+            await self.refresh_async()
+            return updated_site
+        except Exception as e:
+            print(f"Error updating site: {e}")
+            return None
     
+    @clears_entity_cache
     def delete(self) -> bool:
         """
         Delete the site.
@@ -345,6 +612,33 @@ class Site(APIBase):
         except Exception as e:
             print(f"Error deleting site: {e}")
             return False
+
+    @clears_entity_cache
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the site.
+
+        Examples:
+            >>> site = Site.get("Test Site")
+            >>> deleted = await site.delete_async()
+            >>> print(deleted)
+            True
+
+        Returns:
+            bool: True if the site was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            site = await SiteModel.get_async(current_id)
+            if not site:
+                print(f"Site with ID {current_id} does not exist.")
+                return False
+            
+            await SiteModel.delete_async(site)
+            return True
+        except Exception as e:
+            print(f"Error deleting site: {e}")
+            return False
         
     def refresh(self) -> Optional["Site"]:
         """
@@ -373,6 +667,34 @@ class Site(APIBase):
         except Exception as e:
             print(f"Error refreshing site: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Site"]:
+        """
+        Asynchronously refresh the site's data from the database.
+
+        Examples:
+            >>> site = Site.get("Test Site")
+            >>> refreshed_site = await site.refresh_async()
+            >>> print(refreshed_site)
+            Site(site_name=Test Site, id=UUID(...))
+
+        Returns:
+            Optional[Site]: The refreshed site, or None if an error occurred.
+        """
+        try:
+            db_instance = await SiteModel.get_async(self.id)
+            if not db_instance:
+                print(f"Site with ID {self.id} does not exist.")
+                return self
+            
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing site: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -403,6 +725,7 @@ class Site(APIBase):
             print(f"Error getting site info: {e}")
             return None
         
+    @invalidates_cached_entity
     def set_info(self, site_info: dict) -> Optional["Site"]:
         """
         Set the additional information of the site.
@@ -463,6 +786,7 @@ class Site(APIBase):
             print(f"Error getting associated experiments: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Associate this site with an experiment.
@@ -504,6 +828,7 @@ class Site(APIBase):
             print(f"Error associating experiment: {e}")
             return None
 
+    @invalidates_cached_entity
     def unassociate_experiment(self, experiment_name: str) -> Optional["Experiment"]:
         """
         Unassociate this site from an experiment.
@@ -646,6 +971,7 @@ class Site(APIBase):
             print(f"Error creating new plot: {e}")
             return None
 
+    @invalidates_cached_entity
     def associate_plot(
         self,
         plot_number: int,
@@ -691,6 +1017,7 @@ class Site(APIBase):
             return None
             
 
+    @invalidates_cached_entity
     def unassociate_plot(
         self,
         plot_number: int,
@@ -20,16 +20,18 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, List, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
 from pydantic import Field, AliasChoices
 from gemini.api.types import ID
+from gemini.api.columns import STREAM_BATCH_SIZE, is_streamed, iter_column_batches
 from gemini.api.base import APIBase
 from gemini.api.dataset import Dataset
 from gemini.api.trait_record import TraitRecord
 from gemini.api.enums import GEMINITraitLevel, GEMINIDatasetType
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.traits import TraitModel
 from gemini.db.models.views.experiment_views import ExperimentTraitsViewModel
 from gemini.db.models.views.dataset_views import TraitDatasetsViewModel
@@ -37,6 +39,7 @@ from gemini.db.models.associations import ExperimentTraitModel, TraitDatasetMode
 from datetime import date, datetime
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from gemini.api.experiment import Experiment
     from gemini.api.dataset import Dataset
 
@@ -198,6 +201,31 @@ class Trait(APIBase):
             print(f"Error getting trait by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["Trait"]:
+        """
+        Asynchronously retrieve a trait by its ID.
+
+        Examples:
+            >>> await Trait.get_by_id_async(UUID('...'))
+            Trait(trait_name=Leaf Area Index, id=UUID(...))
+
+        Args:
+            id (UUID | int | str): The ID of the trait.
+        Returns:
+            Optional[Trait]: The trait, or None if not found.
+        """
+        try:
+            trait = await TraitModel.get_async(id)
+            if not trait:
+                print(f"Trait with ID {id} does not exist.")
+                return None
+            trait = cls.model_validate(trait)
+            return trait
+        except Exception as e:
+            print(f"Error getting trait by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["Trait"]]:
         """
@@ -220,6 +248,29 @@ class Trait(APIBase):
         except Exception as e:
             print(f"Error getting all traits: {e}")
             return None
+
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["Trait"]]:
+        """
+        Asynchronously retrieve all traits.
+
+        Examples:
+            >>> await Trait.get_all_async()
+            [Trait(trait_name=Leaf Area Index, id=UUID(...)), Trait(trait_name=Plant Height, id=UUID(...))]
+
+        Returns:
+            Optional[List[Trait]]: List of all traits, or None if not found.
+        """
+        try:
+            traits = await TraitModel.all_async()
+            if not traits or len(traits) == 0:
+                print("No traits found.")
+                return None
+            traits = [cls.model_validate(trait) for trait in traits]
+            return traits
+        except Exception as e:
+            print(f"Error getting all traits: {e}")
+            return None
         
     @classmethod
     def search(
@@ -269,6 +320,154 @@ class Trait(APIBase):
         except Exception as e:
             print(f"Error searching traits: {e}")
             return None
+
+    @classmethod
+    async def search_async(
+        cls, 
+        trait_name: str = None,
+        trait_units: str = None,
+        trait_level: GEMINITraitLevel = None,
+        trait_info: dict = None,
+        trait_metrics: dict = None,
+        experiment_name: str = None
+    ) -> Optional[List["Trait"]]:
+        """
+        Asynchronously search for traits based on various criteria.
+
+        Examples:
+            >>> await Trait.search_async(trait_name="Leaf Area Index")
+            [Trait(trait_name=Leaf Area Index, id=UUID(...))]
+
+        Args:
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_units (str, optional): The units of the trait. Defaults to None.
+            trait_level (GEMINITraitLevel, optional): The level of the trait. Defaults to None.
+            trait_info (dict, optional): Additional information. Defaults to None.
+            trait_metrics (dict, optional): Metrics associated with the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            Optional[List[Trait]]: List of matching traits, or None if not found.
+        """
+        try:
+            if not any([experiment_name, trait_name, trait_units, trait_level, trait_info, trait_metrics]):
+                print("At least one search parameter must be provided.")
+                return None
+            
+            traits = await ExperimentTraitsViewModel.search_async(
+                experiment_name=experiment_name,
+                trait_name=trait_name,
+                trait_units=trait_units,
+                trait_level_id=trait_level.value if trait_level else None,
+                trait_info=trait_info,
+                trait_metrics=trait_metrics
+            )
+            if not traits or len(traits) == 0:
+                print("No traits found with the provided search parameters.")
+                return None
+            traits = [cls.model_validate(trait) for trait in traits]
+            return traits if traits else None
+        except Exception as e:
+            print(f"Error searching traits: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        trait_name: str = None,
+        trait_units: str = None,
+        trait_level: GEMINITraitLevel = None,
+        trait_info: dict = None,
+        trait_metrics: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Trait"], Optional[str]]:
+        """
+        Retrieve a page of traits using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> traits, next_cursor = Trait.paginate(page_limit=50)
+            >>> more_traits, next_cursor = Trait.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of traits in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_units (str, optional): The units of the trait. Defaults to None.
+            trait_level (GEMINITraitLevel, optional): The level of the trait. Defaults to None.
+            trait_info (dict, optional): Additional information. Defaults to None.
+            trait_metrics (dict, optional): Metrics associated with the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Trait], Optional[str]]: The traits in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([trait_name, trait_units, trait_level, trait_info, trait_metrics, experiment_name]):
+            instances, next_cursor = ExperimentTraitsViewModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                trait_name=trait_name,
+                trait_units=trait_units,
+                trait_level_id=trait_level.value if trait_level else None,
+                trait_info=trait_info,
+                trait_metrics=trait_metrics
+            )
+        else:
+            instances, next_cursor = TraitModel.paginate(page_limit=page_limit, cursor=cursor)
+        traits = [cls.model_validate(instance) for instance in instances]
+        return traits, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        trait_name: str = None,
+        trait_units: str = None,
+        trait_level: GEMINITraitLevel = None,
+        trait_info: dict = None,
+        trait_metrics: dict = None,
+        experiment_name: str = None
+    ) -> tuple[List["Trait"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of traits using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> traits, next_cursor = await Trait.paginate_async(page_limit=50)
+            >>> more_traits, next_cursor = await Trait.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of traits in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_units (str, optional): The units of the trait. Defaults to None.
+            trait_level (GEMINITraitLevel, optional): The level of the trait. Defaults to None.
+            trait_info (dict, optional): Additional information. Defaults to None.
+            trait_metrics (dict, optional): Metrics associated with the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+        Returns:
+            tuple[List[Trait], Optional[str]]: The traits in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([trait_name, trait_units, trait_level, trait_info, trait_metrics, experiment_name]):
+            instances, next_cursor = await ExperimentTraitsViewModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                experiment_name=experiment_name,
+                trait_name=trait_name,
+                trait_units=trait_units,
+                trait_level_id=trait_level.value if trait_level else None,
+                trait_info=trait_info,
+                trait_metrics=trait_metrics
+            )
+        else:
+            instances, next_cursor = await TraitModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        traits = [cls.model_validate(instance) for instance in instances]
+        return traits, next_cursor
+
             
     def update(
         self,
@@ -321,6 +520,58 @@ class Trait(APIBase):
         except Exception as e:
             print(f"Error updating trait: {e}")
             return None
+
+    async def update_async(
+        self,
+        trait_name: str = None, 
+        trait_units: str = None,
+        trait_level: GEMINITraitLevel = None,
+        trait_info: dict = None,
+        trait_metrics: dict = None,
+    ) -> Optional["Trait"]:
+        """
+        Asynchronously update the details of the trait.
+
+        Examples:
+            >>> trait = Trait.get("Leaf Area Index")
+            >>> updated_trait = await trait.update_async(trait_name="New Leaf Area Index", trait_units="m^2")
+            >>> print(updated_trait)
+            Trait(trait_name=New Leaf Area Index, id=UUID(...))
+
+        Args:
+            trait_name (str, optional): The new name. Defaults to None.
+            trait_units (str, optional): The new units. Defaults to None.
+            trait_level (GEMINITraitLevel, optional): The new level. Defaults to None.
+            trait_info (dict, optional): The new information. Defaults to None.
+            trait_metrics (dict, optional): The new metrics. Defaults to None.
+        Returns:
+            Optional[Trait]: The updated trait, or None if an error occurred.
+        """
+        try:
+            if not any([trait_units, trait_level, trait_info, trait_metrics, trait_name]):
+                print("At least one update parameter must be provided.")
+                return None
+
+            current_id = self.id
+            trait = await TraitModel.get_async(current_id)
+            if not trait:
+                print(f"Trait with ID {current_id} does not exist.")
+                return None
+            
+            trait = await TraitModel.update_async(
+                trait,
+                trait_name=trait_name,
+                trait_units=trait_units,
+                trait_level_id=trait_level.value if trait_level else None,
+                trait_info=trait_info,
+                trait_metrics=trait_metrics
+            )
+            trait = self.model_validate(trait)
+            await self.refresh_async()
+            return trait 
+        except Exception as e:
+            print(f"Error updating trait: {e}")
+            return None
     
     def delete(self) -> bool:
         """
@@ -346,6 +597,31 @@ class Trait(APIBase):
         except Exception as e:
             print(f"Error deleting trait: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the trait.
+
+        Examples:
+            >>> trait = Trait.get("Leaf Area Index")
+            >>> success = await trait.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the trait was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            trait = await TraitModel.get_async(current_id)
+            if not trait:
+                print(f"Trait with ID {current_id} does not exist.")
+                return False
+            await TraitModel.delete_async(trait)
+            return True
+        except Exception as e:
+            print(f"Error deleting trait: {e}")
+            return False
         
     def refresh(self) -> Optional["Trait"]:
         """
@@ -373,6 +649,33 @@ class Trait(APIBase):
         except Exception as e:
             print(f"Error refreshing trait: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["Trait"]:
+        """
+        Asynchronously refresh the trait's data from the database.
+
+        Examples:
+            >>> trait = Trait.get("Leaf Area Index")
+            >>> refreshed_trait = await trait.refresh_async()
+            >>> print(refreshed_trait)
+            Trait(trait_name=Leaf Area Index, id=UUID(...))
+
+        Returns:
+            Optional[Trait]: The refreshed trait, or None if an error occurred.
+        """
+        try:
+            db_instance = await TraitModel.get_async(self.id)
+            if not db_instance:
+                print(f"Trait with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing trait: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
@@ -768,18 +1071,22 @@ class Trait(APIBase):
         
     def insert_records(
         self,
-        timestamps: List[datetime] = None,
+        timestamps: Iterable[datetime] = None,
         collection_date: date = None,
-        trait_values: List[float] = [],
+        trait_values: Iterable[float] = [],
         dataset_name: str = None,
         experiment_name: str = None,
         season_name: str = None,
         site_name: str = None,
-        plot_numbers: List[int] = None,
-        plot_row_numbers: List[int] = None,
-        plot_column_numbers: List[int] = None,
-        record_info: List[dict] = []
-    ) -> tuple[bool, List[str]]:
+        plot_numbers: Iterable[int] = None,
+        plot_row_numbers: Iterable[int] = None,
+        plot_column_numbers: Iterable[int] = None,
+        record_info: Iterable[dict] = [],
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert multiple trait records for this trait.
 
@@ -802,23 +1109,50 @@ class Trait(APIBase):
             True [UUID(...), UUID(...)]
 
         Args:
-            timestamps (List[datetime], optional): List of timestamps. Defaults to None.
+            timestamps (Iterable[datetime], optional): List or other iterable of timestamps. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
-            trait_values (List[float], optional): List of trait values. Defaults to [].
+            trait_values (Iterable[float], optional): List or other iterable of trait values. Defaults to [].
             dataset_name (str, optional): The name of the dataset. Defaults to None.
             experiment_name (str, optional): The name of the experiment. Defaults to None.
             season_name (str, optional): The name of the season. Defaults to None.
             site_name (str, optional): The name of the site. Defaults to None.
-            plot_numbers (List[int], optional): List of plot numbers. Defaults to None.
-            plot_row_numbers (List[int], optional): List of plot row numbers. Defaults to None.
-            plot_column_numbers (List[int], optional): List of plot column numbers. Defaults to None.
-            record_info (List[dict], optional): List of additional info. Defaults to [].
+            plot_numbers (Iterable[int], optional): List or other iterable of plot numbers. Defaults to None.
+            plot_row_numbers (Iterable[int], optional): List or other iterable of plot row numbers. Defaults to None.
+            plot_column_numbers (Iterable[int], optional): List or other iterable of plot column numbers. Defaults to None.
+            record_info (Iterable[dict], optional): List or other iterable of additional info. Defaults to [].
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+                If any column is a generator or another iterable without a length, the columns are read,
+                validated, uploaded and inserted in batches of this size (10000 if None), so memory use stays flat.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not experiment_name or not season_name or not site_name:
                 raise ValueError("Experiment name, season name, and site name must be provided.")
+
+            if is_streamed(timestamps, trait_values, plot_numbers, plot_row_numbers, plot_column_numbers, record_info):
+                return self._insert_record_batches(
+                    {
+                        "timestamps": timestamps,
+                        "trait_values": trait_values,
+                        "plot_numbers": plot_numbers,
+                        "plot_row_numbers": plot_row_numbers,
+                        "plot_column_numbers": plot_column_numbers,
+                        "record_info": record_info
+                    },
+                    collection_date,
+                    dataset_name,
+                    experiment_name,
+                    season_name,
+                    site_name,
+                    batch_size,
+                    start_chunk,
+                    on_chunk,
+                    id_resolution
+                )
             
             if len(timestamps) == 0:
                 raise ValueError("At least one timestamp must be provided.")
@@ -848,12 +1182,153 @@ class Trait(APIBase):
                 )
                 trait_records.append(trait_record)
 
-            success, inserted_record_ids = TraitRecord.insert(trait_records)
-            return success, inserted_record_ids
+            return TraitRecord.insert(
+                trait_records,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                id_resolution=id_resolution
+            )
         except Exception as e:
             print(f"Error inserting records: {e}")
-            return False, []
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
         
+    def _insert_record_batches(
+        self,
+        columns: dict,
+        collection_date: Optional[date],
+        dataset_name: Optional[str],
+        experiment_name: str,
+        season_name: str,
+        site_name: str,
+        batch_size: Optional[int],
+        start_chunk: int,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]],
+        id_resolution: Optional[str]
+    ) -> BulkInsertResult:
+        result = BulkInsertResult(next_chunk=start_chunk)
+        for chunk_index, batch in enumerate(iter_column_batches(columns, batch_size or STREAM_BATCH_SIZE)):
+            if collection_date is None:
+                # Shared by the whole stream, as in the list based path
+                collection_date = batch["timestamps"][0].date()
+            if chunk_index < start_chunk:
+                # Committed by the earlier attempt of a resumed insert
+                continue
+            batch_result = self.insert_record_columns(
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                batch_size=batch_size,
+                **batch,
+                id_resolution=id_resolution
+            )
+            for chunk_result in batch_result.chunks:
+                # Every batch is inserted as one chunk, numbered within the whole stream
+                chunk_result.chunk_index = chunk_index
+                if on_chunk is not None:
+                    on_chunk(chunk_result)
+            result.chunks.extend(batch_result.chunks)
+            result.inserted_ids.extend(batch_result.inserted_ids)
+            if not batch_result.success:
+                result.error = batch_result.error
+                print(f"Stopped after inserting {len(result.inserted_ids)} records.")
+                break
+            result.next_chunk = chunk_index + 1
+        return result
+
+    def insert_record_columns(
+        self,
+        timestamps: Any = None,
+        collection_date: Any = None,
+        trait_values: Any = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_numbers: Any = None,
+        plot_row_numbers: Any = None,
+        plot_column_numbers: Any = None,
+        record_info: Any = None,
+        frame: "DataFrame" = None,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        use_copy: bool = False,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
+        """
+        Insert trait records for this trait from columns of values, e.g. NumPy arrays or the columns of a DataFrame.
+
+        Unlike `insert_records`, no TraitRecord is built per row, see `TraitRecord.insert_columns`.
+
+        Examples:
+            >>> trait = Trait.get("Leaf Area Index")
+            >>> success, record_ids = trait.insert_record_columns(
+            ...     timestamps=frame["timestamp"],
+            ...     trait_values=frame["value"].to_numpy(),
+            ...     plot_numbers=frame["plot_number"],
+            ...     plot_row_numbers=frame["plot_row_number"],
+            ...     plot_column_numbers=frame["plot_column_number"],
+            ...     dataset_name="Leaf Area Index Dataset 2023-01-01",
+            ...     experiment_name="Experiment 1",
+            ...     season_name="Spring 2023",
+            ...     site_name="Field Site A"
+            ... )
+            >>> print(success, len(record_ids))
+            True 10000
+
+        Args:
+            timestamps (list | numpy.ndarray | pandas.Series, optional): The timestamp of each record.
+            collection_date (date | list, optional): The collection date, shared or per record. Defaults to the date of each timestamp.
+            trait_values (list | numpy.ndarray | pandas.Series, optional): The trait value of each record.
+            dataset_name (str, optional): The name of the dataset. Defaults to "<trait name> Dataset <collection date>".
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_numbers (list | numpy.ndarray | pandas.Series, optional): The plot number of each record.
+            plot_row_numbers (list | numpy.ndarray | pandas.Series, optional): The plot row number of each record.
+            plot_column_numbers (list | numpy.ndarray | pandas.Series, optional): The plot column number of each record.
+            record_info (list, optional): Additional info of each record.
+            frame (pandas.DataFrame, optional): Columns named after the record fields, used for the columns not passed as arguments.
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, the `next_chunk` of the previous result. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Defaults to False.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
+        Returns:
+            BulkInsertResult: The counts of every chunk, the inserted record IDs and the chunk to resume from. Unpacks to (success, inserted record IDs).
+        """
+        try:
+            if not experiment_name or not season_name or not site_name:
+                raise ValueError("Experiment name, season name, and site name must be provided.")
+            if not dataset_name:
+                dataset_name = f"{self.trait_name} Dataset {collection_date}"
+            return TraitRecord.insert_columns(
+                trait_name=self.trait_name,
+                dataset_name=dataset_name,
+                timestamps=timestamps,
+                collection_date=collection_date,
+                trait_values=trait_values,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_numbers=plot_numbers,
+                plot_row_numbers=plot_row_numbers,
+                plot_column_numbers=plot_column_numbers,
+                record_info=record_info,
+                frame=frame,
+                batch_size=batch_size,
+                start_chunk=start_chunk,
+                on_chunk=on_chunk,
+                use_copy=use_copy,
+                id_resolution=id_resolution
+            )
+        except Exception as e:
+            print(f"Error inserting trait records: {e}")
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
     def search_records(
         self,
         collection_date: date = None,
@@ -864,7 +1339,8 @@ class Trait(APIBase):
         plot_number: int = None,
         plot_row_number: int = None,
         plot_column_number: int = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> List[TraitRecord]:
         """
         Search for trait records associated with this trait based on search parameters.
@@ -897,6 +1373,7 @@ class Trait(APIBase):
             plot_row_number (int, optional): The plot row number. Defaults to None.
             plot_column_number (int, optional): The plot column number. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
         Returns:
             List[TraitRecord]: List of matching trait records, or empty list if not found.
         """
@@ -914,7 +1391,78 @@ class Trait(APIBase):
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
                 plot_column_number=plot_column_number,
-                record_info=record_info
+                record_info=record_info,
+                lightweight=lightweight
+            )
+            return records
+        except Exception as e:
+            print(f"Error searching records: {e}")
+            return []
+
+    def search_records_async(
+        self,
+        collection_date: date = None,
+        dataset_name: str = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator[TraitRecord, None]:
+        """
+        Asynchronously search for trait records associated with this trait based on search parameters.
+
+        Examples:
+            >>> trait = Trait.get("Leaf Area Index")
+            >>> records = trait.search_records_async(
+            ...     collection_date=date(2023, 1, 1),
+            ...     dataset_name="Leaf Area Index Dataset 2023-01-01",
+            ...     experiment_name="Experiment 1",
+            ...     season_name="Spring 2023",
+            ...     site_name="Field Site A",
+            ...     plot_number=1,
+            ...     plot_row_number=1,
+            ...     plot_column_number=1,
+            ...     record_info={"description": "Leaf area index measurement"}
+            ... )
+            >>> async for record in records:
+            ...     print(record)
+            TraitRecord(id=UUID(...), trait_name=Leaf Area Index, collection_date=2023-01-01, dataset_name=Leaf Area Index Dataset 2023-01-01, experiment_name=Experiment 1, season_name=Spring 2023, site_name=Field Site A, plot_number=1, plot_row_number=1, plot_column_number=1)
+            TraitRecord(id=UUID(...), trait_name=Leaf Area Index, collection_date=2023-01-01, dataset_name=Leaf Area Index Dataset 2023-01-01, experiment_name=Experiment 1, season_name=Spring 2023, site_name=Field Site A, plot_number=2, plot_row_number=2, plot_column_number=2)
+
+        Args:
+            collection_date (date, optional): The collection date. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
+        Returns:
+            AsyncGenerator[TraitRecord, None]: The matching records, streamed as they are read from the database.
+        """
+        try:
+            record_info = record_info if record_info else {}
+            record_info = {k: v for k, v in record_info.items() if v is not None}
+
+            records = TraitRecord.search_async(
+                trait_name=self.trait_name,
+                collection_date=collection_date,
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                record_info=record_info,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
@@ -928,7 +1476,8 @@ class Trait(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> List[TraitRecord]:
         """
         Filter trait records associated with this trait using a custom filter function.
@@ -955,6 +1504,7 @@ class Trait(APIBase):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
         Returns:
             List[TraitRecord]: List of filtered trait records, or empty list if not found.
         """
@@ -966,9 +1516,42 @@ class Trait(APIBase):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=lightweight
             )
             return records
         except Exception as e:
             print(f"Error filtering trait records: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def search_records_dataframe(self, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for records of this trait and return them as a pandas DataFrame.
+
+        Examples:
+            >>> trait = Trait.get(trait_name="Trait A")
+            >>> frame = trait.search_records_dataframe(experiment_name="Experiment A", flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return TraitRecord.to_dataframe(flatten=flatten, **search_parameters, trait_name=self.trait_name)
+
+    def filter_records_dataframe(self, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter records of this trait and return them as a pandas DataFrame.
+
+        Examples:
+            >>> trait = Trait.get(trait_name="Trait A")
+            >>> frame = trait.filter_records_dataframe(start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter_records`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        return TraitRecord.filter_to_dataframe(flatten=flatten, **filter_parameters, trait_names=[self.trait_name])
\ No newline at end of file
@@ -159,6 +159,31 @@ class TraitLevel(APIBase):
             print(f"Error getting trait level by ID: {e}")
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["TraitLevel"]:
+        """
+        Asynchronously retrieve a trait level by its ID.
+
+        Examples:
+            >>> await TraitLevel.get_by_id_async(UUID('...'))
+            TraitLevel(trait_level_name='example_trait_level', id=UUID('...'))
+
+        Args:
+            id (UUID | int | str): The ID of the trait level.
+        Returns:
+            Optional[TraitLevel]: The trait level, or None if not found.
+        """
+        try:
+            db_instance = await TraitLevelModel.get_async(id)
+            if not db_instance:
+                print(f"Trait level with ID {id} does not exist.")
+                return None
+            instance = cls.model_validate(db_instance)
+            return instance
+        except Exception as e:
+            print(f"Error getting trait level by ID: {e}")
+            return None
+
     @classmethod
     def get_all(cls) -> Optional[List["TraitLevel"]]:
         """
@@ -183,6 +208,30 @@ class TraitLevel(APIBase):
             print(f"Error getting all trait levels: {e}")
             return None
 
+    @classmethod
+    async def get_all_async(cls) -> Optional[List["TraitLevel"]]:
+        """
+        Asynchronously retrieve all trait levels.
+
+        Examples:
+            >>> await TraitLevel.get_all_async()
+            [TraitLevel(trait_level_name='example_trait_level', id=UUID('...')),
+             TraitLevel(trait_level_name='another_trait_level', id=UUID('...'))]
+
+        Returns:
+            Optional[List[TraitLevel]]: List of all trait levels, or None if not found.
+        """
+        try:
+            instances = await TraitLevelModel.all_async()
+            if not instances or len(instances) == 0:
+                print("No trait levels found.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error getting all trait levels: {e}")
+            return None
+
     @classmethod
     def search(
         cls,
@@ -220,6 +269,118 @@ class TraitLevel(APIBase):
             print(f"Error searching trait levels: {e}")
             return None
 
+    @classmethod
+    async def search_async(
+        cls,
+        trait_level_name: str = None,
+        trait_level_info: dict = None
+    ) -> Optional[List["TraitLevel"]]:
+        """
+        Asynchronously search for trait levels based on various criteria.
+
+        Examples:
+            >>> await TraitLevel.search_async(trait_level_name="example_trait_level")
+            [TraitLevel(trait_level_name='example_trait_level', id=UUID('...'))]
+
+        Args:
+            trait_level_name (str, optional): The name of the trait level. Defaults to None.
+            trait_level_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            Optional[List[TraitLevel]]: List of matching trait levels, or None if not found.
+        """
+        try:
+            if not any([trait_level_name, trait_level_info]):
+                print("At least one search parameter must be provided.")
+                return None
+
+            instances = await TraitLevelModel.search_async(
+                trait_level_name=trait_level_name,
+                trait_level_info=trait_level_info
+            )
+            if not instances or len(instances) == 0:
+                print("No trait levels found with the provided search parameters.")
+                return None
+            instances = [cls.model_validate(instance) for instance in instances]
+            return instances
+        except Exception as e:
+            print(f"Error searching trait levels: {e}")
+            return None
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        trait_level_name: str = None,
+        trait_level_info: dict = None
+    ) -> tuple[List["TraitLevel"], Optional[str]]:
+        """
+        Retrieve a page of trait levels using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> trait_levels, next_cursor = TraitLevel.paginate(page_limit=50)
+            >>> more_trait_levels, next_cursor = TraitLevel.paginate(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of trait levels in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            trait_level_name (str, optional): The name of the trait level. Defaults to None.
+            trait_level_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[TraitLevel], Optional[str]]: The trait levels in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([trait_level_name, trait_level_info]):
+            instances, next_cursor = TraitLevelModel.paginate(
+                page_limit=page_limit,
+                cursor=cursor,
+                trait_level_name=trait_level_name,
+                trait_level_info=trait_level_info
+            )
+        else:
+            instances, next_cursor = TraitLevelModel.paginate(page_limit=page_limit, cursor=cursor)
+        trait_levels = [cls.model_validate(instance) for instance in instances]
+        return trait_levels, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        trait_level_name: str = None,
+        trait_level_info: dict = None
+    ) -> tuple[List["TraitLevel"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of trait levels using cursor pagination, optionally filtered by the search criteria.
+
+        Examples:
+            >>> trait_levels, next_cursor = await TraitLevel.paginate_async(page_limit=50)
+            >>> more_trait_levels, next_cursor = await TraitLevel.paginate_async(page_limit=50, cursor=next_cursor)
+
+        Args:
+            page_limit (int, optional): The maximum number of trait levels in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            trait_level_name (str, optional): The name of the trait level. Defaults to None.
+            trait_level_info (dict, optional): Additional information. Defaults to None.
+        Returns:
+            tuple[List[TraitLevel], Optional[str]]: The trait levels in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        if any([trait_level_name, trait_level_info]):
+            instances, next_cursor = await TraitLevelModel.paginate_async(
+                page_limit=page_limit,
+                cursor=cursor,
+                trait_level_name=trait_level_name,
+                trait_level_info=trait_level_info
+            )
+        else:
+            instances, next_cursor = await TraitLevelModel.paginate_async(page_limit=page_limit, cursor=cursor)
+        trait_levels = [cls.model_validate(instance) for instance in instances]
+        return trait_levels, next_cursor
+
+
     def update(
             self,
             trait_level_name: str = None,
@@ -263,6 +424,49 @@ class TraitLevel(APIBase):
             print(f"Error updating trait level: {e}")
             return None
 
+    async def update_async(
+            self,
+            trait_level_name: str = None,
+            trait_level_info: dict = None
+        ) -> Optional["TraitLevel"]:
+        """
+        Asynchronously update the details of the trait level.
+
+        Examples:
+            >>> trait_level = TraitLevel.get("example_trait_level")
+            >>> updated_trait_level = await trait_level.update_async(trait_level_name="new_name", trait_level_info={"description": "Updated description"})
+            >>> print(updated_trait_level)
+            TraitLevel(trait_level_name='new_name', id=UUID('...'))
+
+        Args:
+            trait_level_name (str, optional): The new name. Defaults to None.
+            trait_level_info (dict, optional): The new information. Defaults to None.
+        Returns:
+            Optional[TraitLevel]: The updated trait level, or None if an error occurred.
+        """
+        try:
+            if not any([trait_level_name, trait_level_info]):
+                print("At least one parameter must be provided for update.")
+                return None
+
+            current_id = self.id
+            trait_level = await TraitLevelModel.get_async(current_id)
+            if not trait_level:
+                 print(f"Trait level with ID {current_id} does not exist.")
+                 return None
+
+            trait_level = await TraitLevelModel.update_async(
+                trait_level,
+                trait_level_name=trait_level_name,
+                trait_level_info=trait_level_info,
+            )
+            instance = self.model_validate(trait_level)
+            await self.refresh_async()
+            return instance
+        except Exception as e:
+            print(f"Error updating trait level: {e}")
+            return None
+
     def delete(self) -> bool:
         """
         Delete the trait level.
@@ -288,6 +492,31 @@ class TraitLevel(APIBase):
             print(f"Error deleting trait level: {e}")
             return False
 
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the trait level.
+
+        Examples:
+            >>> trait_level = TraitLevel.get("example_trait_level")
+            >>> deleted = await trait_level.delete_async()
+            >>> print(deleted)
+            True
+
+        Returns:
+            bool: True if the trait level was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            trait_level = await TraitLevelModel.get_async(current_id)
+            if not trait_level:
+                 print(f"Trait level with ID {current_id} does not exist.")
+                 return False
+            await TraitLevelModel.delete_async(trait_level)
+            return True
+        except Exception as e:
+            print(f"Error deleting trait level: {e}")
+            return False
+
     def refresh(self) -> Optional["TraitLevel"]:
         """
         Refresh the trait level's data from the database.
@@ -315,6 +544,33 @@ class TraitLevel(APIBase):
             print(f"Error refreshing trait level: {e}")
             return None
 
+    async def refresh_async(self) -> Optional["TraitLevel"]:
+        """
+        Asynchronously refresh the trait level's data from the database.
+
+        Examples:
+            >>> trait_level = TraitLevel.get("example_trait_level")
+            >>> refreshed_trait_level = await trait_level.refresh_async()
+            >>> print(refreshed_trait_level)
+            TraitLevel(trait_level_name='example_trait_level', id=UUID('...'))
+
+        Returns:
+            Optional[TraitLevel]: The refreshed trait level, or None if an error occurred.
+        """
+        try:
+            db_instance = await TraitLevelModel.get_async(self.id)
+            if not db_instance:
+                print(f"Trait level with ID {self.id} does not exist.")
+                return self
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != "id":
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing trait level: {e}")
+            return None
+
     def get_info(self) -> Optional[dict]:
         """
         Get the additional information of the trait level.
@@ -8,6 +8,7 @@ This module includes the following methods:
 - `exists`: Check if a trait record with the given parameters exists.
 - `create`: Create a new trait record.
 - `insert`: Insert a list of trait records into the database.
+- `insert_columns`: Insert trait records given as columns, without building a record per row.
 - `get`: Retrieve a trait record by its parameters.
 - `get_by_id`: Retrieve a trait record by its ID.
 - `get_all`: Retrieve all trait records.
@@ -21,18 +22,25 @@ This module includes the following methods:
 
 """
 
-from typing import Optional, List, Generator
+from typing import Any, Optional, List, Generator, AsyncGenerator, Callable, TYPE_CHECKING
 from uuid import UUID
 from tqdm import tqdm
 
 from gemini.api.types import ID
 from pydantic import Field, AliasChoices
 from gemini.api.base import APIBase
+from gemini.api.rows import to_record_rows, to_record_rows_async
+from gemini.api.dataframes import records_to_dataframe
+from gemini.api.columns import build_rows, check_plot_columns, collect_columns, date_column, dict_column, float_column, int_column, timestamp_column
 from gemini.db.models.columnar.trait_records import TraitRecordModel
+from gemini.db.core.base import BulkInsertChunkResult, BulkInsertResult
 from gemini.db.models.views.trait_records_immv import TraitRecordsIMMVModel
 
 from datetime import date, datetime
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class TraitRecord(APIBase):
     """
     Represents a record of a trait, including metadata, associations to datasets, experiments, sites, seasons, and plots, and related operations.
@@ -249,32 +257,181 @@ class TraitRecord(APIBase):
             return None
         
     @classmethod
-    def insert(cls, records: List["TraitRecord"]) -> tuple[bool, List[str]]:
+    def insert(
+        cls,
+        records: List["TraitRecord"],
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
         """
         Insert a list of trait records into the database.
 
         Args:
             records (List[TraitRecord]): The records to insert.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Faster for large batches. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Inserts all records in one transaction if None. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Earlier records are neither processed nor inserted again. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
         Returns:
-            tuple[bool, List[str]]: Success status and list of inserted record IDs.
+            BulkInsertResult: The counts of every chunk, the inserted record IDs and the chunk to resume from. Unpacks to (success, inserted record IDs).
         """
         try:
             if not records or len(records) == 0:
                 print(f"No records provided to insert.")
-                return False, []
+                return BulkInsertResult(error="No records provided to insert.")
+            if batch_size and start_chunk:
+                records = records[start_chunk * batch_size:]
+                print(f"Resuming insertion from chunk {start_chunk}.")
             records_to_insert = []
             for record in records:
                 record_dict = record.model_dump()
                 record_dict = {k: v for k, v in record_dict.items() if v is not None}
                 records_to_insert.append(record_dict)
-            print(f"Inserting {len(records_to_insert)} TraitRecords.")
-            inserted_record_ids = TraitRecordModel.insert_bulk('trait_records_unique', records_to_insert)
-            print(f"Inserted {len(inserted_record_ids)} TraitRecords.")
-            return True, inserted_record_ids
+            return cls._insert_rows(records_to_insert, use_copy, batch_size, start_chunk, on_chunk, id_resolution)
         except Exception as e:
             print(f"Error inserting TraitRecords: {e}")
-            return False, []
-        
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
+    @classmethod
+    def insert_columns(
+        cls,
+        trait_name: str,
+        dataset_name: str,
+        timestamps: Any = None,
+        trait_values: Any = None,
+        collection_date: Any = None,
+        experiment_name: str = None,
+        season_name: str = None,
+        site_name: str = None,
+        plot_numbers: Any = None,
+        plot_row_numbers: Any = None,
+        plot_column_numbers: Any = None,
+        record_info: Any = None,
+        frame: "DataFrame" = None,
+        use_copy: bool = False,
+        batch_size: int = None,
+        start_chunk: int = 0,
+        on_chunk: Callable[[BulkInsertChunkResult], None] = None,
+        id_resolution: str = None
+    ) -> BulkInsertResult:
+        """
+        Insert trait records given as columns, without building a TraitRecord per row.
+
+        The shared fields are checked once and each column in a single pass, and
+        the rows go straight to the bulk insert.
+
+        Examples:
+            >>> success, record_ids = TraitRecord.insert_columns(
+            ...     trait_name="Height",
+            ...     dataset_name="Plant Growth Study",
+            ...     experiment_name="Growth Experiment 1",
+            ...     season_name="Spring 2023",
+            ...     site_name="Research Farm A",
+            ...     timestamps=np.array(["2023-10-01T12:00", "2023-10-01T12:05"], dtype="datetime64[s]"),
+            ...     trait_values=np.array([150.5, 148.0]),
+            ...     plot_numbers=[1, 2],
+            ...     plot_row_numbers=[1, 1],
+            ...     plot_column_numbers=[1, 2]
+            ... )
+            >>> print(success, len(record_ids))
+            True 2
+
+        Args:
+            trait_name (str): The name of the trait.
+            dataset_name (str): The name of the dataset.
+            timestamps (list | numpy.ndarray | pandas.Series, optional): The timestamp of each record.
+            trait_values (list | numpy.ndarray | pandas.Series, optional): The trait value of each record.
+            collection_date (date | list, optional): The collection date, shared or per record. Defaults to the date of each timestamp.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            plot_numbers (list | numpy.ndarray | pandas.Series, optional): The plot number of each record.
+            plot_row_numbers (list | numpy.ndarray | pandas.Series, optional): The plot row number of each record.
+            plot_column_numbers (list | numpy.ndarray | pandas.Series, optional): The plot column number of each record.
+            record_info (list, optional): Additional info of each record.
+            frame (pandas.DataFrame, optional): Columns named after the record fields (timestamp, trait_value, plot_number, ...), used for the columns not passed as arguments.
+            use_copy (bool, optional): Stream the rows through the COPY protocol instead of a bulk INSERT. Defaults to False.
+            batch_size (int, optional): Number of records committed per transaction. Defaults to None.
+            start_chunk (int, optional): Chunk to resume from after a failed insert, as reported by the previous call. Defaults to 0.
+            on_chunk (Callable, optional): Called with the inserted, skipped and failed counts of every chunk. Defaults to None.
+            id_resolution (str, optional): "batch" to resolve record IDs once per chunk, "trigger" to leave it to the per-row triggers. Defaults to the database configuration.
+        Returns:
+            BulkInsertResult: The counts of every chunk, the inserted record IDs and the chunk to resume from. Unpacks to (success, inserted record IDs).
+        """
+        try:
+            if not any([experiment_name, site_name, season_name]):
+                raise ValueError("At least one of experiment_name, site_name, or season_name must be provided.")
+            if not trait_name:
+                raise ValueError("Trait name is required.")
+            if not dataset_name:
+                raise ValueError("Dataset name is required.")
+            columns = collect_columns({
+                "timestamp": timestamps,
+                "collection_date": collection_date,
+                "trait_value": trait_values,
+                "plot_number": plot_numbers,
+                "plot_row_number": plot_row_numbers,
+                "plot_column_number": plot_column_numbers,
+                "record_info": record_info
+            }, frame)
+            if columns["timestamp"] is None:
+                raise ValueError("Timestamps are required.")
+            if columns["trait_value"] is None:
+                raise ValueError("Trait values are required.")
+            columns["timestamp"] = timestamp_column(columns["timestamp"])
+            columns["collection_date"] = date_column(columns["collection_date"] or columns["timestamp"])
+            columns["trait_value"] = float_column(columns["trait_value"], "trait_value", required=True)
+            columns["record_info"] = dict_column(columns["record_info"], "record_info")
+            for name in ("plot_number", "plot_row_number", "plot_column_number"):
+                columns[name] = int_column(columns[name], name)
+            check_plot_columns(columns["plot_number"], columns["plot_row_number"], columns["plot_column_number"])
+            rows = build_rows(
+                {
+                    "trait_name": trait_name,
+                    "dataset_name": dataset_name,
+                    "experiment_name": experiment_name,
+                    "season_name": season_name,
+                    "site_name": site_name
+                },
+                columns
+            )
+            if batch_size and start_chunk:
+                rows = rows[start_chunk * batch_size:]
+                print(f"Resuming insertion from chunk {start_chunk}.")
+            return cls._insert_rows(rows, use_copy, batch_size, start_chunk, on_chunk, id_resolution)
+        except Exception as e:
+            print(f"Error inserting TraitRecords: {e}")
+            return BulkInsertResult(next_chunk=start_chunk, error=str(e))
+
+    @classmethod
+    def _insert_rows(
+        cls,
+        records_to_insert: List[dict],
+        use_copy: bool,
+        batch_size: Optional[int],
+        start_chunk: int,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]],
+        id_resolution: Optional[str] = None
+    ) -> BulkInsertResult:
+        print(f"Inserting {len(records_to_insert)} TraitRecords.")
+        result = TraitRecordModel.insert_bulk_chunked(
+            'trait_records_unique',
+            records_to_insert,
+            batch_size=batch_size,
+            start_chunk=start_chunk,
+            use_copy=use_copy,
+            on_chunk=on_chunk,
+            id_resolution=id_resolution
+        )
+        print(f"Inserted {result.inserted} TraitRecords, skipped {result.skipped} existing TraitRecords, {result.failed} failed.")
+        if result.failed > 0:
+            print(f"Insertion stopped at chunk {result.next_chunk}: {result.chunks[-1].error}")
+        return result
+
     @classmethod
     def get(
         cls,
@@ -378,9 +535,34 @@ class TraitRecord(APIBase):
         except Exception as e:
             print(f"Error getting TraitRecord by ID {id}: {e}")
             return None
+
+    @classmethod
+    async def get_by_id_async(cls, id: UUID | int | str) -> Optional["TraitRecord"]:
+        """
+        Asynchronously retrieve a trait record by its ID.
+
+        Examples:
+            >>> await TraitRecord.get_by_id_async(UUID('...'))
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+
+        Args:
+            id (UUID | int | str): The ID of the trait record.
+        Returns:
+            Optional[TraitRecord]: The trait record, or None if not found.
+        """
+        try:
+            db_instance = await TraitRecordModel.get_async(id)
+            if not db_instance:
+                print(f"TraitRecord with ID {id} not found.")
+                return None
+            record = cls.model_validate(db_instance)
+            return record
+        except Exception as e:
+            print(f"Error getting TraitRecord by ID {id}: {e}")
+            return None
         
     @classmethod
-    def get_all(cls, limit: int = 100) -> Optional[List["TraitRecord"]]:
+    def get_all(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["TraitRecord"]]:
         """
         Retrieve all trait records, up to a specified limit.
 
@@ -393,6 +575,7 @@ class TraitRecord(APIBase):
 
         Args:
             limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
         Returns:
             Optional[List[TraitRecord]]: List of trait records, or None if not found.
         """
@@ -401,6 +584,39 @@ class TraitRecord(APIBase):
             if not records or len(records) == 0:
                 print(f"No TraitRecords found")
                 return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
+            records = [cls.model_validate(instance) for instance in records]
+            return records
+        except Exception as e:
+            print(f"Error getting all TraitRecords: {e}")
+            return None
+
+    @classmethod
+    async def get_all_async(cls, limit: int = 100, lightweight: bool = False) -> Optional[List["TraitRecord"]]:
+        """
+        Asynchronously retrieve all trait records, up to a specified limit.
+
+        Examples:
+            >>> await TraitRecord.get_all_async(limit=10)
+            >>> for record in await TraitRecord.get_all_async(limit=10):
+            ...     print(record)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), trait_name='Width', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+
+        Args:
+            limit (int, optional): The maximum number of records to retrieve. Defaults to 100.
+            lightweight (bool, optional): Return tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
+        Returns:
+            Optional[List[TraitRecord]]: List of trait records, or None if not found.
+        """
+        try:
+            records = await TraitRecordModel.all_async(limit=limit)
+            if not records or len(records) == 0:
+                print(f"No TraitRecords found")
+                return None
+            if lightweight:
+                return list(to_record_rows(cls, records))
             records = [cls.model_validate(instance) for instance in records]
             return records
         except Exception as e:
@@ -420,7 +636,8 @@ class TraitRecord(APIBase):
         plot_row_number: int = None,
         plot_column_number: int = None,
         collection_date: date = None,
-        record_info: dict = None
+        record_info: dict = None,
+        lightweight: bool = False
     ) -> Generator["TraitRecord", None, None]:
         """
         Search for trait records based on various criteria.
@@ -443,6 +660,7 @@ class TraitRecord(APIBase):
             plot_column_number (int, optional): The plot column number. Defaults to None.
             collection_date (date, optional): The collection date. Defaults to None.
             record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
         Yields:
             TraitRecord: Matching trait records.
         """
@@ -450,7 +668,8 @@ class TraitRecord(APIBase):
             if not any([dataset_name, trait_name, trait_value, experiment_name, site_name, season_name, plot_number, plot_row_number, plot_column_number, collection_date, record_info]):
                 print("At least one search parameter must be provided.")
                 return
-            records = TraitRecordsIMMVModel.stream(
+            stream = TraitRecordsIMMVModel.stream_rows if lightweight else TraitRecordsIMMVModel.stream
+            records = stream(
                 dataset_name=dataset_name,
                 trait_name=trait_name,
                 trait_value=trait_value,
@@ -463,6 +682,9 @@ class TraitRecord(APIBase):
                 collection_date=collection_date,
                 record_info=record_info
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -470,6 +692,199 @@ class TraitRecord(APIBase):
             print(f"Error searching TraitRecords: {e}")
             yield from []
 
+    @classmethod
+    async def search_async(
+        cls,
+        dataset_name: str = None,
+        trait_name: str = None,
+        trait_value: float = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None,
+        lightweight: bool = False
+    ) -> AsyncGenerator["TraitRecord", None]:
+        """
+        Asynchronously search for trait records based on various criteria.
+
+        Examples:
+            >>> async for record in TraitRecord.search_async(dataset_name="Plant Growth Study", trait_name="Height"):
+            ...     print(record)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 2, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+
+        Args:
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_value (float, optional): The value of the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
+        Yields:
+            TraitRecord: Matching trait records.
+        """
+        try:
+            if not any([dataset_name, trait_name, trait_value, experiment_name, site_name, season_name, plot_number, plot_row_number, plot_column_number, collection_date, record_info]):
+                print("At least one search parameter must be provided.")
+                return
+            stream = TraitRecordsIMMVModel.stream_rows_async if lightweight else TraitRecordsIMMVModel.stream_async
+            records = stream(
+                dataset_name=dataset_name,
+                trait_name=trait_name,
+                trait_value=trait_value,
+                experiment_name=experiment_name,
+                site_name=site_name,
+                season_name=season_name,
+                plot_number=plot_number,
+                plot_row_number=plot_row_number,
+                plot_column_number=plot_column_number,
+                collection_date=collection_date,
+                record_info=record_info
+            )
+            if lightweight:
+                async for record in to_record_rows_async(cls, records):
+                    yield record
+                return
+            async for record in records:
+                record = cls.model_validate(record)
+                yield record
+        except Exception as e:
+            print(f"Error searching TraitRecords: {e}")
+            return
+
+    @classmethod
+    def paginate(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        trait_name: str = None,
+        trait_value: float = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["TraitRecord"], Optional[str]]:
+        """
+        Retrieve a page of trait records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> trait_records, next_cursor = TraitRecord.paginate(page_limit=1000, dataset_name="Dataset1")
+            >>> more_trait_records, next_cursor = TraitRecord.paginate(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of trait records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_value (float, optional): The value of the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[TraitRecord], Optional[str]]: The trait records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = TraitRecordsIMMVModel.paginate(
+            page_limit=page_limit,
+            cursor=cursor,
+            dataset_name=dataset_name,
+            trait_name=trait_name,
+            trait_value=trait_value,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            plot_number=plot_number,
+            plot_row_number=plot_row_number,
+            plot_column_number=plot_column_number,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        trait_records = [cls.model_validate(record) for record in records]
+        return trait_records, next_cursor
+
+    @classmethod
+    async def paginate_async(
+        cls,
+        page_limit: int = 100,
+        cursor: str = None,
+        dataset_name: str = None,
+        trait_name: str = None,
+        trait_value: float = None,
+        experiment_name: str = None,
+        site_name: str = None,
+        season_name: str = None,
+        plot_number: int = None,
+        plot_row_number: int = None,
+        plot_column_number: int = None,
+        collection_date: date = None,
+        record_info: dict = None
+    ) -> tuple[List["TraitRecord"], Optional[str]]:
+        """
+        Asynchronously retrieve a page of trait records using cursor pagination, ordered by timestamp.
+
+        Examples:
+            >>> trait_records, next_cursor = await TraitRecord.paginate_async(page_limit=1000, dataset_name="Dataset1")
+            >>> more_trait_records, next_cursor = await TraitRecord.paginate_async(page_limit=1000, cursor=next_cursor, dataset_name="Dataset1")
+
+        Args:
+            page_limit (int, optional): The maximum number of trait records in the page. Defaults to 100.
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None.
+            dataset_name (str, optional): The name of the dataset. Defaults to None.
+            trait_name (str, optional): The name of the trait. Defaults to None.
+            trait_value (float, optional): The value of the trait. Defaults to None.
+            experiment_name (str, optional): The name of the experiment. Defaults to None.
+            site_name (str, optional): The name of the site. Defaults to None.
+            season_name (str, optional): The name of the season. Defaults to None.
+            plot_number (int, optional): The plot number. Defaults to None.
+            plot_row_number (int, optional): The plot row number. Defaults to None.
+            plot_column_number (int, optional): The plot column number. Defaults to None.
+            collection_date (date, optional): The collection date. Defaults to None.
+            record_info (dict, optional): Additional info. Defaults to None.
+        Returns:
+            tuple[List[TraitRecord], Optional[str]]: The trait records in the page and the cursor for the next page, or None if this is the last page.
+        Raises:
+            ValueError: If the cursor is malformed or the page limit is less than 1.
+        """
+        records, next_cursor = await TraitRecordsIMMVModel.paginate_async(
+            page_limit=page_limit,
+            cursor=cursor,
+            dataset_name=dataset_name,
+            trait_name=trait_name,
+            trait_value=trait_value,
+            experiment_name=experiment_name,
+            site_name=site_name,
+            season_name=season_name,
+            plot_number=plot_number,
+            plot_row_number=plot_row_number,
+            plot_column_number=plot_column_number,
+            collection_date=collection_date,
+            record_info=record_info
+        )
+        trait_records = [cls.model_validate(record) for record in records]
+        return trait_records, next_cursor
+
+
 
     @classmethod
     def filter(
@@ -480,7 +895,8 @@ class TraitRecord(APIBase):
         dataset_names: Optional[List[str]] = None,
         experiment_names: Optional[List[str]] = None,
         season_names: Optional[List[str]] = None,
-        site_names: Optional[List[str]] = None
+        site_names: Optional[List[str]] = None,
+        lightweight: bool = False
     ) -> Generator["TraitRecord", None, None]:
         """
         Filter trait records based on custom logic.
@@ -507,6 +923,7 @@ class TraitRecord(APIBase):
             experiment_names (List[str], optional): List of experiment names. Defaults to None.
             season_names (List[str], optional): List of season names. Defaults to None.
             site_names (List[str], optional): List of site names. Defaults to None.
+            lightweight (bool, optional): Yield tuple-backed RecordRows built without validation instead of TraitRecord instances. Defaults to False.
         Yields:
             TraitRecord: Filtered trait records.
         """
@@ -523,6 +940,9 @@ class TraitRecord(APIBase):
                 season_names=season_names,
                 site_names=site_names
             )
+            if lightweight:
+                yield from to_record_rows(cls, records)
+                return
             for record in records:
                 record = cls.model_validate(record)
                 yield record
@@ -530,6 +950,50 @@ class TraitRecord(APIBase):
             print(f"Error filtering TraitRecords: {e}")
             yield from []
 
+    @classmethod
+    def to_dataframe(cls, flatten: bool = False, **search_parameters) -> Optional["DataFrame"]:
+        """
+        Search for trait records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = TraitRecord.to_dataframe(trait_name="Trait A", experiment_name="Experiment A", flatten=True)
+            >>> frame.columns.tolist()
+            ['id', 'timestamp', ..., 'record_info.notes']
+
+        Args:
+            flatten (bool, optional): Expand `record_info` into one column per key. Defaults to False.
+            **search_parameters: The search parameters, as for `search`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = TraitRecordsIMMVModel.stream_rows(**search_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting trait records to a DataFrame: {e}")
+            return None
+
+    @classmethod
+    def filter_to_dataframe(cls, flatten: bool = False, **filter_parameters) -> Optional["DataFrame"]:
+        """
+        Filter trait records and return them as a pandas DataFrame, built column-wise from the database cursor.
+
+        Examples:
+            >>> frame = TraitRecord.filter_to_dataframe(trait_names=["Trait A"], start_timestamp=datetime(2023, 10, 1), flatten=True)
+
+        Args:
+            flatten (bool, optional): Expand `record_info` into one column per key. Defaults to False.
+            **filter_parameters: The filter parameters, as for `filter`.
+        Returns:
+            Optional[DataFrame]: One row per matching record, or None if an error occurred.
+        """
+        try:
+            rows = TraitRecordModel.filter_records(**filter_parameters)
+            return records_to_dataframe(cls, rows, flatten=flatten)
+        except Exception as e:
+            print(f"Error exporting filtered trait records to a DataFrame: {e}")
+            return None
+
     def update(
         self,
         trait_value: float = None,
@@ -573,6 +1037,50 @@ class TraitRecord(APIBase):
         except Exception as e:
             print(f"Error updating TraitRecord: {e}")
             return None
+
+    async def update_async(
+        self,
+        trait_value: float = None,
+        record_info: dict = None
+    ) -> Optional["TraitRecord"]:
+        """
+        Asynchronously update the details of the trait record.
+
+        Examples:
+            >>> trait_record = TraitRecord.get_by_id(UUID('...'))
+            >>> updated_record = await trait_record.update_async(
+            ...     trait_value=160.0,
+            ...     record_info={"notes": "Updated measurement"}
+            ... )
+            >>> print(updated_record)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+
+        Args:
+            trait_value (float, optional): The new trait value. Defaults to None.
+            record_info (dict, optional): The new record information. Defaults to None.
+        Returns:
+            Optional[TraitRecord]: The updated trait record, or None if an error occurred.
+        """
+        try:
+            if not any([trait_value, record_info]):
+                print("At least one parameter must be provided to update TraitRecord.")
+                return None
+            current_id = self.id
+            trait_record = await TraitRecordModel.get_async(current_id)
+            if not trait_record:
+                print(f"TraitRecord with ID {current_id} not found.")
+                return None
+            trait_record = await TraitRecordModel.update_async(
+                trait_record,
+                trait_value=trait_value,
+                record_info=record_info
+            )
+            trait_record = self.model_validate(trait_record)
+            await self.refresh_async()
+            return trait_record
+        except Exception as e:
+            print(f"Error updating TraitRecord: {e}")
+            return None
         
     def delete(self) -> bool:
         """
@@ -598,6 +1106,31 @@ class TraitRecord(APIBase):
         except Exception as e:
             print(f"Error deleting TraitRecord: {e}")
             return False
+
+    async def delete_async(self) -> bool:
+        """
+        Asynchronously delete the trait record.
+
+        Examples:
+            >>> trait_record = TraitRecord.get_by_id(UUID('...'))
+            >>> success = await trait_record.delete_async()
+            >>> print(success)
+            True
+
+        Returns:
+            bool: True if the trait record was deleted, False otherwise.
+        """
+        try:
+            current_id = self.id
+            trait_record = await TraitRecordModel.get_async(current_id)
+            if not trait_record:
+                print(f"TraitRecord with ID {current_id} not found.")
+                return False
+            await TraitRecordModel.delete_async(trait_record)
+            return True
+        except Exception as e:
+            print(f"Error deleting TraitRecord: {e}")
+            return False
         
     def refresh(self) -> Optional["TraitRecord"]:
         """
@@ -625,6 +1158,33 @@ class TraitRecord(APIBase):
         except Exception as e:
             print(f"Error refreshing TraitRecord: {e}")
             return None
+
+    async def refresh_async(self) -> Optional["TraitRecord"]:
+        """
+        Asynchronously refresh the trait record's data from the database.
+
+        Examples:
+            >>> trait_record = TraitRecord.get_by_id(UUID('...'))
+            >>> refreshed_record = await trait_record.refresh_async()
+            >>> print(refreshed_record)
+            TraitRecord(id=UUID('...'), timestamp=datetime(2023, 10, 1, 12, 0), trait_name='Height', dataset_name='Plant Growth Study', experiment_name='Growth Experiment 1', site_name='Research Farm A', season_name='Spring 2023', plot_number=1, plot_row_number=2, plot_column_number=3)
+
+        Returns:
+            Optional[TraitRecord]: The refreshed trait record, or None if an error occurred.
+        """
+        try:
+            db_instance = await TraitRecordModel.get_async(self.id)
+            if not db_instance:
+                print(f"TraitRecord with ID {self.id} not found.")
+                return None
+            instance = self.model_validate(db_instance)
+            for key, value in instance.model_dump().items():
+                if hasattr(self, key) and key != 'id':
+                    setattr(self, key, value)
+            return self
+        except Exception as e:
+            print(f"Error refreshing TraitRecord: {e}")
+            return None
         
     def get_info(self) -> Optional[dict]:
         """
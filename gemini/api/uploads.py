@@ -0,0 +1,248 @@
+"""
+Concurrent file upload stage for record ingestion.
+
+Record inserts upload the file of every record to object storage before
+the rows are written. Uploads are network bound, so they run on a bounded
+thread pool instead of one after another. The number of workers defaults
+to the `GEMINI_UPLOAD_WORKERS` environment variable (8 if unset), which
+also sizes the connection pool of the shared MinIO client.
+
+Uploaded files carry a SHA-256 of their content in the object metadata.
+`upload_file_deduplicated` compares it with the hash of the local file
+and skips the upload when the object already holds the same bytes, so
+re-running an ingestion does not send unchanged files again.
+"""
+
+import os
+import hashlib
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+from tqdm import tqdm
+
+from gemini.db.core.base import BulkInsertResult
+from gemini.storage.exceptions import StorageError
+
+T = TypeVar("T")
+
+DEFAULT_UPLOAD_WORKERS = max(int(os.getenv("GEMINI_UPLOAD_WORKERS", "8")), 1)
+
+# Object metadata key of the content hash, stored as x-amz-meta-gemini-content-sha256
+CONTENT_HASH_METADATA_KEY = "Gemini-Content-Sha256"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadFailure(NamedTuple):
+    """
+    A record whose file could not be uploaded.
+    """
+    index: int
+    record_file: Optional[str]
+    error: str
+
+
+def process_records_concurrently(
+    process: Callable[[T], T],
+    records: Sequence[T],
+    workers: Optional[int] = None,
+    desc: Optional[str] = None
+) -> Tuple[List[T], List[UploadFailure]]:
+    """
+    Runs a record processing function, e.g. a file upload, over records on a bounded thread pool.
+
+    At most twice as many records as workers are queued at a time. Records whose
+    processing raises are left out of the result and reported as failures.
+
+    Examples:
+        >>> processed, failures = process_records_concurrently(
+        ...     lambda record: SensorRecord.process_record(record, raise_errors=True),
+        ...     records,
+        ...     workers=16
+        ... )
+        >>> len(processed) + len(failures) == len(records)
+        True
+
+    Args:
+        process (Callable): Processes one record and returns it, raising on failure.
+        records (Sequence): The records to process.
+        workers (int, optional): The number of concurrent workers. Defaults to `DEFAULT_UPLOAD_WORKERS`.
+        desc (str, optional): Label of the progress bar.
+
+    Returns:
+        Tuple[List, List[UploadFailure]]: The processed records in their original order, and the failures.
+    """
+    workers = max(workers or DEFAULT_UPLOAD_WORKERS, 1)
+    results: List[Any] = [None] * len(records)
+    failures: List[UploadFailure] = []
+
+    def record_failure(index: int, error: Exception) -> None:
+        failure = UploadFailure(index, getattr(records[index], "record_file", None), str(error))
+        failures.append(failure)
+        print(f"Failed to upload {failure.record_file}: {failure.error}")
+
+    with tqdm(total=len(records), desc=desc) as progress:
+        if workers == 1:
+            for index, record in enumerate(records):
+                try:
+                    results[index] = process(record)
+                except Exception as e:
+                    record_failure(index, e)
+                progress.update(1)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gemini-upload") as executor:
+                pending: Dict[Future, int] = {}
+                queued = iter(range(len(records)))
+                while True:
+                    for index in queued:
+                        pending[executor.submit(process, records[index])] = index
+                        if len(pending) >= workers * 2:
+                            break
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        try:
+                            results[index] = future.result()
+                        except Exception as e:
+                            record_failure(index, e)
+                        progress.update(1)
+
+    if failures:
+        failures.sort(key=lambda failure: failure.index)
+        print(f"{len(failures)} of {len(records)} file uploads failed, their records are not inserted.")
+    failed = {failure.index for failure in failures}
+    return [result for index, result in enumerate(results) if index not in failed], failures
+
+
+def process_and_insert_chunks(
+    process: Callable[[T], T],
+    records: Sequence[T],
+    insert_chunk: Callable[[List[T], int], BulkInsertResult],
+    batch_size: Optional[int] = None,
+    start_chunk: int = 0,
+    workers: Optional[int] = None,
+    desc: Optional[str] = None
+) -> BulkInsertResult:
+    """
+    Uploads and inserts records chunk by chunk, keeping the chunks aligned with the input.
+
+    Chunk `i` always holds the records from `i * batch_size`, whether or not some
+    of their uploads fail, so the `next_chunk` of the result can be passed back as
+    `start_chunk` with the same input. It is the first chunk that was not fully
+    uploaded and committed.
+
+    Examples:
+        >>> result = process_and_insert_chunks(
+        ...     lambda record: SensorRecord.process_record(record, raise_errors=True),
+        ...     records,
+        ...     lambda chunk, chunk_index: insert_rows(chunk, chunk_index),
+        ...     batch_size=1000
+        ... )
+        >>> result.next_chunk
+        10
+
+    Args:
+        process (Callable): Processes one record and returns it, raising on failure.
+        records (Sequence): All records of the insert, including those before `start_chunk`.
+        insert_chunk (Callable): Inserts the processed records of one chunk as a single chunk with the given index.
+        batch_size (int, optional): Number of records per chunk. Processes everything in one chunk if None.
+        start_chunk (int, optional): The chunk to start from. Defaults to 0.
+        workers (int, optional): The number of concurrent uploads. Defaults to `DEFAULT_UPLOAD_WORKERS`.
+        desc (str, optional): Label of the progress bar.
+
+    Returns:
+        BulkInsertResult: The chunk results, inserted IDs, upload failures and the chunk to resume from.
+    """
+    batch_size = batch_size or max(len(records), 1)
+    if start_chunk:
+        print(f"Resuming insertion from chunk {start_chunk}.")
+    result = BulkInsertResult(next_chunk=start_chunk)
+    complete = True
+    for chunk_index in range(start_chunk, -(-len(records) // batch_size)):
+        offset = chunk_index * batch_size
+        processed, failures = process_records_concurrently(
+            process,
+            records[offset:offset + batch_size],
+            workers=workers,
+            desc=desc
+        )
+        result.upload_failures.extend(
+            UploadFailure(offset + failure.index, failure.record_file, failure.error) for failure in failures
+        )
+        chunk_result = insert_chunk(processed, chunk_index)
+        result.chunks.extend(chunk_result.chunks)
+        result.inserted_ids.extend(chunk_result.inserted_ids)
+        if chunk_result.failed > 0:
+            break
+        # Chunks after an incomplete one are inserted, but a resume starts at the incomplete one
+        complete = complete and not failures
+        if complete:
+            result.next_chunk = chunk_index + 1
+    return result
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """
+    Computes the SHA-256 of a file, reading it in chunks.
+
+    Args:
+        file_path (str | Path): The file to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_file_deduplicated(
+    storage_provider: Any,
+    object_name: str,
+    file_path: Union[str, Path],
+    content_type: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    bucket_name: Optional[str] = None
+) -> Tuple[str, bool]:
+    """
+    Uploads a file unless the object already exists with the same content hash.
+
+    Examples:
+        >>> upload_file_deduplicated(get_minio_storage_provider(), "Experiment A/plot_1.tif", "/data/plot_1.tif")
+        ('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08', True)
+        >>> upload_file_deduplicated(get_minio_storage_provider(), "Experiment A/plot_1.tif", "/data/plot_1.tif")
+        ('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08', False)
+
+    Args:
+        storage_provider: The MinIO storage provider.
+        object_name (str): The key of the object.
+        file_path (str | Path): The local file to upload.
+        content_type (str, optional): MIME type of the file.
+        metadata (dict, optional): Additional object metadata. The content hash is added to it.
+        bucket_name (str, optional): The bucket to upload to. Defaults to the provider's bucket.
+
+    Returns:
+        Tuple[str, bool]: The content hash, and whether the file was uploaded.
+    """
+    content_hash = file_sha256(file_path)
+    try:
+        existing = storage_provider.get_file_metadata(object_name, bucket_name=bucket_name)
+        stored_hash = (existing.get("metadata") or {}).get(f"x-amz-meta-{CONTENT_HASH_METADATA_KEY.lower()}")
+        if stored_hash == content_hash:
+            return content_hash, False
+    except StorageError:
+        # Missing object, or one that cannot be inspected, is uploaded
+        pass
+    metadata = {**(metadata or {}), CONTENT_HASH_METADATA_KEY: content_hash}
+    storage_provider.upload_file(
+        object_name=object_name,
+        input_file_path=file_path,
+        bucket_name=bucket_name,
+        content_type=content_type,
+        metadata=metadata
+    )
+    return content_hash, True
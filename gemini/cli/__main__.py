@@ -111,5 +111,29 @@ def update(ctx: GEMINICLIContext):
     ctx.manager.rebuild()
     click.echo(click.style("GEMINI pipeline updated", fg="blue"))
 
+@cli.command(name="ingest-status")
+@click.argument("path", type=click.Path(exists=True))
+def ingest_status(path: str):
+    """
+    Shows the progress of an import from its ingestion journal.
+
+    Args:
+        path (str): The data directory being imported, or the journal file.
+    """
+    from gemini.api.journal import IngestionJournal, JOURNAL_FILE_NAME
+    if os.path.isdir(path) and not os.path.exists(os.path.join(path, JOURNAL_FILE_NAME)):
+        click.echo(click.style(f"No ingestion journal in {path}", fg="red"))
+        return
+    with IngestionJournal(path) as journal:
+        status = journal.status()
+    click.echo(click.style(f"Ingestion journal {status['journal']}", fg="blue"))
+    click.echo("Files: " + (", ".join(f"{count} {state}" for state, count in status["files"].items()) or "none"))
+    for state, batch in status["batches"].items():
+        click.echo(f"Batches {state}: {batch['batches']} ({batch['rows']} rows, {batch['inserted']} inserted, {batch['skipped']} skipped)")
+    if not status["batches"]:
+        click.echo("Batches: none")
+    for error in status["recent_errors"]:
+        click.echo(click.style(f"Failed: {error['file']}: {error['error']}", fg="red"))
+
 # Add the settings command group to the main CLI
 cli.add_command(settings_group)
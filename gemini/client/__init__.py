@@ -0,0 +1,2 @@
+from gemini.client.client import GEMINIClient, APIObject, Resource, RecordResource, FileResource
+from gemini.client.exceptions import GEMINIClientError, GEMINIConnectionError, GEMININotFoundError
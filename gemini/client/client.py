@@ -0,0 +1,833 @@
+"""
+Asynchronous client for the GEMINI REST API.
+
+`GEMINIClient` wraps the controllers in `gemini/rest_api/controllers`
+behind one `httpx.AsyncClient`, so every call shares a connection pool.
+A semaphore caps the number of requests in flight, idempotent calls are
+retried with exponential backoff, and NDJSON record streams are parsed
+line by line into lightweight `APIObject`s as they arrive.
+
+Each controller is an attribute named after its router, e.g.
+`client.sensors` or `client.experiments`, and `client.files` wraps the
+file endpoints. The `*_many` helpers and `GEMINIClient.map` fan calls out
+concurrently within the same limits.
+"""
+
+import json
+import asyncio
+import mimetypes
+from pathlib import Path
+from datetime import date, datetime
+from urllib.parse import quote
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from gemini.client.exceptions import GEMINIClientError, GEMINIConnectionError, GEMININotFoundError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_BUCKET_NAME = "gemini"
+
+# Record IDs per pre-signed URL request, see MAX_PRESIGN_BATCH in gemini/api/presign.py
+PRESIGN_BATCH_SIZE = 5000
+
+# Pagination header of the REST API, see gemini/rest_api/models.py
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Methods that are safe to send again after a failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Router keys of the controllers, see gemini/rest_api/app.py
+RESOURCES = (
+    "cultivars", "data_formats", "data_types", "dataset_types", "datasets",
+    "experiments", "models", "plants", "plots", "procedures", "scripts",
+    "seasons", "sensor_platforms", "sensor_types", "sensors", "sites",
+    "trait_levels", "traits"
+)
+RECORD_RESOURCES = frozenset({"datasets", "models", "procedures", "scripts", "sensors", "traits"})
+
+
+class APIObject(dict):
+    """
+    A JSON object returned by the REST API, with attribute access to its fields.
+
+    Examples:
+        >>> record = APIObject({"id": "1c0e...", "sensor_name": "Sensor A"})
+        >>> record.sensor_name
+        'Sensor A'
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class GEMINIClient:
+    """
+    Asynchronous client for the GEMINI REST API.
+
+    Features:
+    - One connection pool shared by all calls
+    - Configurable number of concurrent requests
+    - Retries of idempotent calls on connection errors and overloaded servers
+    - Incremental parsing of NDJSON record streams
+    - Concurrent bulk helpers for uploads and metadata calls
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        max_connections: int = 20,
+        max_concurrency: int = 10,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Create a client.
+
+        Examples:
+            >>> async with GEMINIClient("http://localhost:8000") as client:
+            ...     sensors = await client.sensors.search(experiment_name="Experiment A")
+            ...     async for record in client.sensors.search_records(sensors[0].id):
+            ...         print(record.timestamp, record.sensor_data)
+
+        Args:
+            base_url (str, optional): URL of the REST API. Defaults to http://localhost:8000.
+            max_connections (int, optional): Size of the connection pool. Defaults to 20.
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 10.
+            timeout (float, optional): Timeout of each request in seconds. Defaults to 30.
+            retries (int, optional): Retries of idempotent calls. Defaults to 3.
+            backoff (float, optional): Delay before the first retry in seconds, doubled on every retry. Defaults to 0.5.
+            headers (dict, optional): Headers sent with every request.
+        """
+        self.base_url = base_url
+        self.max_concurrency = max(max_concurrency, 1)
+        self.retries = max(retries, 0)
+        self.backoff = backoff
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            headers=headers,
+            follow_redirects=True
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        for key in RESOURCES:
+            resource_class = RecordResource if key in RECORD_RESOURCES else Resource
+            setattr(self, key, resource_class(self, key))
+        self.files = FileResource(self)
+
+    async def __aenter__(self) -> "GEMINIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the connection pool.
+        """
+        await self._http.aclose()
+
+    def resource(self, key: str) -> "Resource":
+        """
+        Retrieves the client of a controller by its router key.
+
+        Args:
+            key (str): The router key, e.g. `sensors`.
+
+        Returns:
+            Resource: The controller client.
+        """
+        if key not in RESOURCES:
+            raise ValueError(f"Unknown resource {key!r}, expected one of: {', '.join(RESOURCES)}")
+        return getattr(self, key)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Sends a request and decodes the response.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path, relative to the base URL.
+            params (dict, optional): Query parameters. None values are left out.
+            json_body (Any, optional): JSON body.
+            data (dict, optional): Form fields of a multipart body.
+            files (dict, optional): Files of a multipart body.
+
+        Returns:
+            Any: The decoded JSON, with objects as `APIObject`s, the text of other responses, or None if empty.
+
+        Raises:
+            GEMININotFoundError: If the API answers 404.
+            GEMINIClientError: If the API answers with another error.
+            GEMINIConnectionError: If the API cannot be reached.
+        """
+        response = await self._send(method, path, params=params, json=json_body, data=data, files=files)
+        return _decode(response)
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[APIObject]:
+        """
+        Iterates over a JSON list endpoint page by page, following the `X-Next-Cursor` header.
+
+        Args:
+            path (str): The path of the list endpoint.
+            params (dict, optional): Further query parameters.
+            page_size (int, optional): Items per page. Defaults to 100.
+
+        Yields:
+            APIObject: The items of every page.
+        """
+        params = dict(params or {}, limit=page_size)
+        while True:
+            try:
+                response = await self._send("GET", path, params=params)
+            except GEMININotFoundError:
+                return
+            for item in _decode(response) or []:
+                yield item
+            next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not next_cursor:
+                return
+            params["cursor"] = next_cursor
+
+    async def stream_ndjson(self, path: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[APIObject]:
+        """
+        Streams an NDJSON endpoint, parsing each line as it arrives.
+
+        The concurrency limit applies until the response headers are received,
+        so other calls can be made while a stream is being read.
+
+        Args:
+            path (str): The path of the NDJSON endpoint.
+            params (dict, optional): Query parameters.
+
+        Yields:
+            APIObject: One object per line.
+        """
+        async for item, _ in self._stream_ndjson_page(path, params):
+            yield item
+
+    async def map(
+        self,
+        function: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[R, Exception]]:
+        """
+        Runs an async function over items concurrently, with a bounded number of workers.
+
+        Examples:
+            >>> sensors = await client.map(client.sensors.get, sensor_ids)
+
+        Args:
+            function (Callable): Called with each item, e.g. a client method.
+            items (Iterable): The items.
+            concurrency (int, optional): Number of workers. Defaults to the client's `max_concurrency`.
+            return_exceptions (bool, optional): Return the exceptions of failed calls in place of their results,
+                instead of raising the first one. Defaults to False.
+
+        Returns:
+            list: The results, in the order of the items.
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        queue = iter(enumerate(items))
+
+        async def worker() -> None:
+            for index, item in queue:
+                try:
+                    results[index] = await function(item)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency or self.max_concurrency, len(items)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        return results
+
+    async def _send(self, method: str, path: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        method = method.upper()
+        if kwargs.get("params"):
+            kwargs["params"] = _query_params(kwargs["params"])
+        attempts = self.retries + 1 if method in IDEMPOTENT_METHODS else 1
+        for attempt in range(attempts):
+            last_attempt = attempt + 1 >= attempts
+            try:
+                async with self._semaphore:
+                    request = self._http.build_request(method, path, **kwargs)
+                    response = await self._http.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise GEMINIConnectionError(f"{method} {path} failed: {e}") from e
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    if response.is_error:
+                        await _raise_for_status(response)
+                    return response
+                await response.aclose()
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+        raise GEMINIConnectionError(f"{method} {path} failed")
+
+    async def _stream_ndjson_page(self, path: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Tuple[APIObject, Optional[str]]]:
+        response = await self._send("GET", path, stream=True, params=params)
+        next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        try:
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield APIObject(json.loads(line)), next_cursor
+        finally:
+            await response.aclose()
+
+
+class Resource:
+    """
+    Client of one controller, e.g. `client.sensors`.
+    """
+
+    def __init__(self, client: GEMINIClient, key: str):
+        self.client = client
+        self.key = key
+        self.path = f"/api/{key}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(key={self.key!r})"
+
+    async def all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[APIObject]:
+        """
+        Retrieves all items, or one page of them if `limit` or `cursor` is given.
+
+        Returns:
+            List[APIObject]: The items, empty if there are none.
+        """
+        return await self._list(f"{self.path}/all", {"limit": limit, "cursor": cursor})
+
+    async def search(self, **params: Any) -> List[APIObject]:
+        """
+        Searches items by the query parameters of the controller, e.g. `experiment_name`.
+
+        Returns:
+            List[APIObject]: The matching items, empty if there are none.
+        """
+        return await self._list(self.path, params)
+
+    def iterate(self, page_size: int = DEFAULT_PAGE_SIZE, **params: Any) -> AsyncIterator[APIObject]:
+        """
+        Iterates over all items, or the items matching the query parameters, page by page.
+
+        Examples:
+            >>> async for plot in client.plots.iterate(experiment_name="Experiment A"):
+            ...     print(plot.plot_number)
+
+        Args:
+            page_size (int, optional): Items per page. Defaults to 100.
+            **params: Search parameters.
+
+        Yields:
+            APIObject: The items.
+        """
+        path = self.path if params else f"{self.path}/all"
+        return self.client.paginate(path, params, page_size=page_size)
+
+    async def get(self, id: Any) -> Optional[APIObject]:
+        """
+        Retrieves an item by ID.
+
+        Returns:
+            APIObject: The item, or None if it does not exist.
+        """
+        try:
+            return await self.client.request("GET", f"{self.path}/id/{id}")
+        except GEMININotFoundError:
+            return None
+
+    async def create(self, **fields: Any) -> APIObject:
+        """
+        Creates an item from the input fields of the controller, e.g. `sensor_name`.
+
+        Returns:
+            APIObject: The created item.
+        """
+        return await self.client.request("POST", self.path, json_body=_json_safe(fields))
+
+    async def update(self, id: Any, **fields: Any) -> APIObject:
+        """
+        Updates the given fields of an item.
+
+        Returns:
+            APIObject: The updated item.
+        """
+        return await self.client.request("PATCH", f"{self.path}/id/{id}", json_body=_json_safe(fields))
+
+    async def delete(self, id: Any) -> None:
+        """
+        Deletes an item by ID.
+        """
+        await self.client.request("DELETE", f"{self.path}/id/{id}")
+
+    async def related(self, id: Any, relation: str) -> List[APIObject]:
+        """
+        Retrieves the items associated with an item, e.g. the `experiments` of a sensor.
+
+        Args:
+            id: The item ID.
+            relation (str): The association path, e.g. `experiments` or `sensor_platforms`.
+
+        Returns:
+            List[APIObject]: The associated items, empty if there are none.
+        """
+        return await self._list(f"{self.path}/id/{id}/{relation}")
+
+    async def get_many(self, ids: Iterable[Any]) -> List[Optional[APIObject]]:
+        """
+        Retrieves items by ID concurrently.
+
+        Returns:
+            List[APIObject]: The items in the order of the IDs, None for missing ones.
+        """
+        return await self.client.map(self.get, ids)
+
+    async def create_many(self, items: Iterable[Dict[str, Any]], return_exceptions: bool = True) -> List[Union[APIObject, Exception]]:
+        """
+        Creates items concurrently.
+
+        Args:
+            items (Iterable[dict]): The input fields of each item.
+            return_exceptions (bool, optional): Return the error of a failed create in its place. Defaults to True.
+
+        Returns:
+            list: The created items, in input order.
+        """
+        return await self.client.map(lambda item: self.create(**item), items, return_exceptions=return_exceptions)
+
+    async def delete_many(self, ids: Iterable[Any], return_exceptions: bool = True) -> List[Optional[Exception]]:
+        """
+        Deletes items by ID concurrently.
+
+        Returns:
+            list: None for every deleted item, the error of a failed delete in its place.
+        """
+        return await self.client.map(self.delete, ids, return_exceptions=return_exceptions)
+
+    async def _list(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[APIObject]:
+        try:
+            return await self.client.request("GET", path, params=params) or []
+        except GEMININotFoundError:
+            return []
+
+
+class RecordResource(Resource):
+    """
+    Client of a controller with records: datasets, models, procedures, scripts, sensors and traits.
+    """
+
+    async def add_record(self, id: Any, record_file: Optional[Union[str, Path]] = None, **fields: Any) -> APIObject:
+        """
+        Adds a record, uploading its file if one is given.
+
+        Examples:
+            >>> await client.sensors.add_record(
+            ...     sensor_id,
+            ...     timestamp=datetime.now(),
+            ...     sensor_data={"value": 1.5},
+            ...     dataset_name="Dataset A",
+            ...     record_file="/data/plot_1.tif"
+            ... )
+
+        Args:
+            id: The ID of the sensor, trait, dataset, procedure, script or model.
+            record_file (str | Path, optional): Local file of the record.
+            **fields: The record input fields, e.g. `timestamp`, `sensor_data` and `experiment_name`.
+
+        Returns:
+            APIObject: The added record.
+        """
+        path = f"{self.path}/id/{id}/records"
+        # Fields are sent as parts without a file name, so the body is multipart even without a file
+        parts = {name: (None, str(value)) for name, value in _form_fields(fields).items()}
+        if record_file is None:
+            return await self.client.request("POST", path, files=parts)
+        record_file = Path(record_file)
+        content_type = mimetypes.guess_type(record_file.name)[0] or "application/octet-stream"
+        with open(record_file, "rb") as file:
+            parts["record_file"] = (record_file.name, file, content_type)
+            return await self.client.request("POST", path, files=parts)
+
+    async def add_records(self, id: Any, records: Iterable[Dict[str, Any]], return_exceptions: bool = True) -> List[Union[APIObject, Exception]]:
+        """
+        Adds records concurrently, each with the fields of `add_record`.
+
+        Returns:
+            list: The added records in input order, the error of a failed add in its place.
+        """
+        return await self.client.map(lambda record: self.add_record(id, **record), records, return_exceptions=return_exceptions)
+
+    async def search_records(self, id: Any, page_size: Optional[int] = None, **params: Any) -> AsyncIterator[APIObject]:
+        """
+        Streams the records of an item, e.g. `experiment_name`, `collection_date` or `plot_number` filters.
+
+        Examples:
+            >>> async for record in client.sensors.search_records(sensor_id, experiment_name="Experiment A"):
+            ...     print(record.timestamp, record.sensor_data)
+
+        Args:
+            id: The item ID.
+            page_size (int, optional): Request the records in pages of this size, following the cursor.
+                Streams everything in one response if None.
+            **params: Search parameters.
+
+        Yields:
+            APIObject: The records, parsed as they arrive.
+        """
+        path = f"{self.path}/id/{id}/records"
+        if page_size is None:
+            async for record in self.client.stream_ndjson(path, params):
+                yield record
+            return
+        params = dict(params, limit=page_size)
+        while True:
+            next_cursor = None
+            async for record, next_cursor in self.client._stream_ndjson_page(path, params):
+                yield record
+            if not next_cursor:
+                return
+            params["cursor"] = next_cursor
+
+    def filter_records(self, id: Any, **params: Any) -> AsyncIterator[APIObject]:
+        """
+        Streams the records of an item within a time range and lists of names.
+
+        Examples:
+            >>> async for record in client.sensors.filter_records(sensor_id, start_timestamp=start, dataset_names=["Dataset A"]):
+            ...     print(record.timestamp)
+
+        Args:
+            id: The item ID.
+            **params: `start_timestamp`, `end_timestamp`, and lists like `dataset_names` or `experiment_names`.
+
+        Yields:
+            APIObject: The records, parsed as they arrive.
+        """
+        return self.client.stream_ndjson(f"{self.path}/id/{id}/records/filter", params)
+
+    async def get_record(self, record_id: Any) -> Optional[APIObject]:
+        """
+        Retrieves a record by ID.
+
+        Returns:
+            APIObject: The record, or None if it does not exist.
+        """
+        try:
+            return await self.client.request("GET", f"{self.path}/records/id/{record_id}")
+        except GEMININotFoundError:
+            return None
+
+    async def update_record(self, record_id: Any, **fields: Any) -> APIObject:
+        """
+        Updates the given fields of a record, e.g. `record_info`.
+
+        Returns:
+            APIObject: The updated record.
+        """
+        return await self.client.request("PATCH", f"{self.path}/records/id/{record_id}", json_body=_json_safe(fields))
+
+    async def delete_record(self, record_id: Any) -> None:
+        """
+        Deletes a record by ID.
+        """
+        await self.client.request("DELETE", f"{self.path}/records/id/{record_id}")
+
+    async def get_download_urls(self, record_ids: Iterable[Any]) -> List[APIObject]:
+        """
+        Retrieves pre-signed URLs to download the files of records directly from storage.
+
+        IDs are sent in batches of `PRESIGN_BATCH_SIZE`, concurrently.
+
+        Examples:
+            >>> urls = await client.sensors.get_download_urls(record_ids)
+            >>> [entry.url for entry in urls if entry.error is None]
+
+        Args:
+            record_ids (Iterable): The record IDs.
+
+        Returns:
+            List[APIObject]: One entry per ID, in input order, with `record_id`, `record_file`, `url`, `expires_at` and `error`.
+        """
+        record_ids = [str(record_id) for record_id in record_ids]
+        batches = [record_ids[offset:offset + PRESIGN_BATCH_SIZE] for offset in range(0, len(record_ids), PRESIGN_BATCH_SIZE)]
+        results = await self.client.map(
+            lambda batch: self.client.request("POST", f"{self.path}/records/download_urls", json_body={"record_ids": batch}),
+            batches
+        )
+        return [entry for result in results for entry in result or []]
+
+    async def download_record(self, record_id: Any, destination: Union[str, Path], presigned: Optional[bool] = None) -> Path:
+        """
+        Downloads the file of a record.
+
+        Args:
+            record_id: The record ID.
+            destination (str | Path): The file to write, or a directory to write it to under its own name.
+            presigned (bool, optional): Download straight from storage through a pre-signed URL instead of through
+                the API. Defaults to the server's setting.
+
+        Returns:
+            Path: The written file.
+        """
+        path = f"{self.path}/records/id/{record_id}/download"
+        return await self.client.files._download_to(path, destination, params={"presigned": presigned})
+
+    async def download_records(self, record_ids: Iterable[Any], directory: Union[str, Path], return_exceptions: bool = True) -> List[Union[Path, Exception]]:
+        """
+        Downloads the files of records concurrently into a directory.
+
+        Returns:
+            list: The written files in input order, the error of a failed download in its place.
+        """
+        return await self.client.map(lambda record_id: self.download_record(record_id, directory), record_ids, return_exceptions=return_exceptions)
+
+
+class FileResource:
+    """
+    Client of the file endpoints, `client.files`. File paths are `<bucket_name>/<object_name>`.
+    """
+
+    def __init__(self, client: GEMINIClient):
+        self.client = client
+        self.path = "/api/files"
+
+    async def metadata(self, file_path: str) -> Optional[APIObject]:
+        """
+        Retrieves the metadata of a file.
+
+        Returns:
+            APIObject: Bucket and object name, size, last modified time, content type and ETag, or None if missing.
+        """
+        try:
+            return await self.client.request("GET", f"{self.path}/metadata/{_quote_path(file_path)}")
+        except GEMININotFoundError:
+            return None
+
+    async def list_files(self, prefix: str) -> List[APIObject]:
+        """
+        Lists the files under a prefix, e.g. `gemini/Experiment A`.
+
+        Returns:
+            List[APIObject]: The metadata of each file.
+        """
+        try:
+            return await self.client.request("GET", f"{self.path}/list/{_quote_path(prefix)}") or []
+        except GEMININotFoundError:
+            return []
+
+    async def upload(self, local_path: Union[str, Path], object_name: Optional[str] = None, bucket_name: str = DEFAULT_BUCKET_NAME) -> APIObject:
+        """
+        Uploads a local file, streaming it as the request body.
+
+        The file is read in chunks as it is sent and the API passes them on to storage,
+        so neither side holds the whole file.
+
+        Args:
+            local_path (str | Path): The file to upload.
+            object_name (str, optional): The key to upload to. Defaults to the file name.
+            bucket_name (str, optional): The bucket. Defaults to `gemini`.
+
+        Returns:
+            APIObject: The metadata of the uploaded file.
+        """
+        local_path = Path(local_path)
+        content_type = mimetypes.guess_type(local_path.name)[0] or "application/octet-stream"
+        file_path = f"{bucket_name}/{object_name or local_path.name}"
+        response = await self.client._send(
+            "PUT",
+            f"{self.path}/upload/{_quote_path(file_path)}",
+            content=_FileChunks(local_path),
+            headers={"Content-Type": content_type}
+        )
+        return _decode(response)
+
+    async def upload_many(
+        self,
+        files: Union[Dict[Union[str, Path], str], Iterable[Union[str, Path]]],
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        return_exceptions: bool = True
+    ) -> List[Union[APIObject, Exception]]:
+        """
+        Uploads local files concurrently.
+
+        Examples:
+            >>> await client.files.upload_many({"/data/plot_1.tif": "Experiment A/plot_1.tif", "/data/plot_2.tif": "Experiment A/plot_2.tif"})
+
+        Args:
+            files (dict | Iterable): Local paths mapped to object names, or local paths uploaded under their file names.
+            bucket_name (str, optional): The bucket. Defaults to `gemini`.
+            return_exceptions (bool, optional): Return the error of a failed upload in its place. Defaults to True.
+
+        Returns:
+            list: The metadata of the uploaded files, in input order.
+        """
+        uploads = list(files.items()) if isinstance(files, dict) else [(local_path, None) for local_path in files]
+        return await self.client.map(
+            lambda upload: self.upload(upload[0], upload[1], bucket_name=bucket_name),
+            uploads,
+            return_exceptions=return_exceptions
+        )
+
+    async def metadata_many(self, file_paths: Iterable[str]) -> List[Optional[APIObject]]:
+        """
+        Retrieves the metadata of files concurrently.
+
+        Returns:
+            List[APIObject]: The metadata in input order, None for missing files.
+        """
+        return await self.client.map(self.metadata, file_paths)
+
+    async def download(self, file_path: str, destination: Union[str, Path]) -> Path:
+        """
+        Downloads a file, streaming it to disk.
+
+        Args:
+            file_path (str): The file, `<bucket_name>/<object_name>`.
+            destination (str | Path): The file to write, or a directory to write it to under its own name.
+
+        Returns:
+            Path: The written file.
+        """
+        return await self._download_to(f"{self.path}/download/{_quote_path(file_path)}", destination)
+
+    async def delete(self, file_path: str) -> None:
+        """
+        Deletes a file.
+        """
+        await self.client.request("DELETE", f"{self.path}/delete/{_quote_path(file_path)}")
+
+    async def _download_to(self, path: str, destination: Union[str, Path], params: Optional[Dict[str, Any]] = None) -> Path:
+        response = await self.client._send("GET", path, stream=True, params=params)
+        try:
+            destination = Path(destination)
+            if destination.is_dir():
+                destination = destination / _attachment_name(response)
+            with open(destination, "wb") as file:
+                async for chunk in response.aiter_bytes():
+                    file.write(chunk)
+        finally:
+            await response.aclose()
+        return destination
+
+
+class _FileChunks:
+    """
+    Request body that reads a file in chunks, from the start on every iteration so retries can resend it.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 1024 * 1024):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with open(self.path, "rb") as file:
+            while chunk := await asyncio.to_thread(file.read, self.chunk_size):
+                yield chunk
+
+
+def _decode(response: httpx.Response) -> Any:
+    if not response.content:
+        return None
+    if "json" not in response.headers.get("content-type", ""):
+        return response.text
+    return _wrap(response.json())
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return APIObject(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    return value
+
+
+async def _raise_for_status(response: httpx.Response) -> None:
+    await response.aread()
+    await response.aclose()
+    error, error_description = None, None
+    try:
+        body = response.json()
+        if isinstance(body, dict):
+            error, error_description = body.get("error"), body.get("error_description")
+    except ValueError:
+        pass
+    request = response.request
+    message = f"{request.method} {request.url.path} returned {response.status_code}: {error_description or error or response.text}"
+    exception_class = GEMININotFoundError if response.status_code == 404 else GEMINIClientError
+    raise exception_class(message, status_code=response.status_code, error=error, error_description=error_description)
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: [_form_value(item) for item in value] if isinstance(value, (list, tuple)) else _form_value(value)
+        for name, value in params.items() if value is not None
+    }
+
+
+def _form_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+    return {name: _form_value(value) for name, value in fields.items() if value is not None}
+
+
+def _form_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(_json_safe(value))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return str(value).lower()
+    return value if isinstance(value, (int, float)) else str(value)
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+def _quote_path(file_path: str) -> str:
+    return quote(file_path.strip("/"), safe="/")
+
+
+def _attachment_name(response: httpx.Response) -> str:
+    disposition = response.headers.get("content-disposition", "")
+    for part in disposition.split(";"):
+        name, _, value = part.strip().partition("=")
+        if name.lower() == "filename" and value:
+            return value.strip('"')
+    return response.url.path.rsplit("/", 1)[-1]
@@ -0,0 +1,29 @@
+# gemini/client/exceptions.py
+
+from typing import Optional
+
+
+class GEMINIClientError(Exception):
+    """Base exception for errors of the REST API client."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        error: Optional[str] = None,
+        error_description: Optional[str] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error = error
+        self.error_description = error_description
+
+
+class GEMINIConnectionError(GEMINIClientError):
+    """Raised when the REST API cannot be reached, after all retries."""
+    pass
+
+
+class GEMININotFoundError(GEMINIClientError):
+    """Raised when the REST API answers 404 Not Found."""
+    pass
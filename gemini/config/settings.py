@@ -28,6 +28,10 @@ class GEMINISettings(BaseSettings):
     GEMINI_DB_HOSTNAME : str = "gemini-db"
     GEMINI_DB_NAME : str = "gemini"
     GEMINI_DB_PORT : int = 5432
+    GEMINI_DB_RECORD_ID_RESOLUTION : str = "trigger"
+    GEMINI_DB_MATERIALIZED_VIEW_MAX_STALENESS : float = 60.0
+    GEMINI_DB_SLOW_QUERY_THRESHOLD : float = 0.0
+    GEMINI_DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE : float = 0.0
 
     # Logger Configuration
     GEMINI_LOGGER_CONTAINER_NAME : str = "gemini-logger"
@@ -47,6 +51,7 @@ class GEMINISettings(BaseSettings):
     GEMINI_STORAGE_BUCKET_NAME : str = "gemini"
     GEMINI_STORAGE_ACCESS_KEY : str = "gemini_storage_user"
     GEMINI_STORAGE_SECRET_KEY : str = "gemini_secret"
+    GEMINI_STORAGE_PUBLIC_ENDPOINT : str = ""
 
     # REST API Configuration
     GEMINI_REST_API_CONTAINER_NAME : str = "gemini-rest-api"
@@ -3,6 +3,7 @@ Configuration for the database connection.
 """
 
 import os
+from typing import Optional
 from pydantic import BaseModel, field_validator
 from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 
@@ -27,6 +28,15 @@ class DatabaseConfig(BaseModel):
     pool_class: type = QueuePool
     isolation_level: str = "READ COMMITTED"
     async_pool_class: type = AsyncAdaptedQueuePool
+    # How record names are resolved to IDs on bulk insert:
+    # "trigger" lets the per-row triggers do it, "batch" resolves once per batch in Python
+    record_id_resolution: str = "trigger"
+    # Seconds a materialized view may lag behind its base tables before the background refresher rebuilds it
+    materialized_view_max_staleness: float = 60.0
+    # Seconds above which a statement is logged as a slow query, None disables slow-query capture
+    slow_query_threshold: Optional[float] = None
+    # Share of slow reads (0 to 1) re-run under EXPLAIN (ANALYZE, BUFFERS) to capture their plan
+    slow_query_explain_sample_rate: float = 0.0
 
     @field_validator("database_url", mode="before")
     def validate_database_url(cls, v: str) -> str:
@@ -34,6 +44,24 @@ class DatabaseConfig(BaseModel):
             raise ValueError("Database URL must be provided")
         return v
 
+    @field_validator("record_id_resolution")
+    def validate_record_id_resolution(cls, v: str) -> str:
+        if v not in ("trigger", "batch"):
+            raise ValueError("record_id_resolution must be 'trigger' or 'batch'")
+        return v
+
+    @field_validator("materialized_view_max_staleness")
+    def validate_materialized_view_max_staleness(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("materialized_view_max_staleness must be positive")
+        return v
+
+    @field_validator("slow_query_explain_sample_rate")
+    def validate_slow_query_explain_sample_rate(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError("slow_query_explain_sample_rate must be between 0 and 1")
+        return v
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
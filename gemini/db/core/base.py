@@ -1,7 +1,21 @@
-from typing import Any, List, Optional, Dict
-from uuid import UUID
+"""
+Base models for database interactions in GEMINI.
+
+This module defines the core SQLAlchemy models and utility methods for
+interacting with the GEMINI database, including base classes for
+standard tables, views, materialized views, and columnar tables.
+"""
 
-from sqlalchemy import select, delete
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from uuid import UUID
+from dataclasses import dataclass, field
+import base64
+import json
+import uuid
+import threading
+from datetime import datetime, date
+
+from sqlalchemy import select, delete, tuple_, literal, Select
 from sqlalchemy import TIMESTAMP, JSON, DATE
 from sqlalchemy import MetaData, text
 from sqlalchemy.schema import UniqueConstraint
@@ -11,52 +25,234 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert, JSONB
 
 from gemini.manager import GEMINIManager, GEMINIComponentType
 from gemini.db.core.engine import DatabaseEngine
+from gemini.db.core.refresher import MaterializedViewRefresher
 from gemini.db.config import DatabaseConfig
 
 
-db_config_settings = GEMINIManager().get_component_settings(GEMINIComponentType.DB)
-db_config = DatabaseConfig(
-    database_url=f"postgresql://{db_config_settings['GEMINI_DB_USER']}:{db_config_settings['GEMINI_DB_PASSWORD']}@{db_config_settings['GEMINI_DB_HOSTNAME']}:{db_config_settings['GEMINI_DB_PORT']}/{db_config_settings['GEMINI_DB_NAME']}"
-)
 metadata_obj = MetaData(schema="gemini")
-db_engine = DatabaseEngine(db_config)
 
+# Created on first use so importing the models does not read settings or open pools
+_db_config: Optional[DatabaseConfig] = None
+_db_engine: Optional[DatabaseEngine] = None
+_view_refresher: Optional[MaterializedViewRefresher] = None
+_init_lock = threading.Lock()
 
-class BaseModel(DeclarativeBase, SerializeMixin):
 
-    __abstract__ = True
-    metadata = metadata_obj
+def get_db_config() -> DatabaseConfig:
+    """
+    Retrieves the database configuration, reading the GEMINI DB settings on first use.
 
+    Returns:
+        DatabaseConfig: The database configuration.
+    """
+    global _db_config
+    if _db_config is None:
+        with _init_lock:
+            if _db_config is None:
+                db_config_settings = GEMINIManager().get_component_settings(GEMINIComponentType.DB)
+                _db_config = DatabaseConfig(
+                    database_url=f"postgresql://{db_config_settings['GEMINI_DB_USER']}:{db_config_settings['GEMINI_DB_PASSWORD']}@{db_config_settings['GEMINI_DB_HOSTNAME']}:{db_config_settings['GEMINI_DB_PORT']}/{db_config_settings['GEMINI_DB_NAME']}",
+                    record_id_resolution=db_config_settings['GEMINI_DB_RECORD_ID_RESOLUTION'],
+                    materialized_view_max_staleness=db_config_settings['GEMINI_DB_MATERIALIZED_VIEW_MAX_STALENESS'],
+                    # A threshold of 0 leaves slow-query capture disabled
+                    slow_query_threshold=db_config_settings['GEMINI_DB_SLOW_QUERY_THRESHOLD'] or None,
+                    slow_query_explain_sample_rate=db_config_settings['GEMINI_DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE']
+                )
+    return _db_config
+
+
+def get_db_engine() -> DatabaseEngine:
+    """
+    Retrieves the database engine used by the models, creating it on first use.
 
-"""
-Base models for database interactions in GEMINI.
+    Returns:
+        DatabaseEngine: The database engine.
+    """
+    global _db_engine
+    if _db_engine is None:
+        db_config = get_db_config()
+        with _init_lock:
+            if _db_engine is None:
+                _db_engine = DatabaseEngine(db_config)
+    return _db_engine
 
-This module defines the core SQLAlchemy models and utility methods for
-interacting with the GEMINI database, including base classes for
-standard tables, views, materialized views, and columnar tables.
-"""
 
-from typing import Any
+def get_view_refresher() -> MaterializedViewRefresher:
+    """
+    Retrieves the background refresher for materialized views, creating it on first use.
 
-from sqlalchemy import select, delete
-from sqlalchemy import TIMESTAMP, JSON, DATE
-from sqlalchemy import MetaData, text
-from sqlalchemy.schema import UniqueConstraint
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy_mixins.serialize import SerializeMixin
-from sqlalchemy.dialects.postgresql import insert as pg_insert, JSONB
+    Returns:
+        MaterializedViewRefresher: The materialized view refresher.
+    """
+    global _view_refresher
+    if _view_refresher is None:
+        db_engine = get_db_engine()
+        with _init_lock:
+            if _view_refresher is None:
+                _view_refresher = MaterializedViewRefresher(db_engine, db_engine.config.materialized_view_max_staleness)
+    return _view_refresher
 
-from gemini.manager import GEMINIManager, GEMINIComponentType
-from gemini.db.core.engine import DatabaseEngine
-from gemini.db.config import DatabaseConfig
 
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encodes the sort key values of a row into an opaque pagination cursor.
+
+    Args:
+        values (list): The values of the pagination key columns, in order.
 
-db_config_settings = GEMINIManager().get_component_settings(GEMINIComponentType.DB)
-db_config = DatabaseConfig(
-    database_url=f"postgresql://{db_config_settings['GEMINI_DB_USER']}:{db_config_settings['GEMINI_DB_PASSWORD']}@{db_config_settings['GEMINI_DB_HOSTNAME']}:{db_config_settings['GEMINI_DB_PORT']}/{db_config_settings['GEMINI_DB_NAME']}"
-)
-metadata_obj = MetaData(schema="gemini")
-db_engine = DatabaseEngine(db_config)
+    Returns:
+        str: A URL-safe continuation token.
+    """
+    serialized = []
+    for value in values:
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        serialized.append(value)
+    payload = json.dumps(serialized, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: List[Any]) -> List[Any]:
+    """
+    Decodes a pagination cursor back into typed sort key values.
+
+    Args:
+        cursor (str): The continuation token produced by `encode_cursor`.
+        columns (list): The pagination key columns the cursor was built from.
+
+    Returns:
+        list: The sort key values, converted to the Python type of each column.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the columns.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {e}")
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Invalid pagination cursor: key mismatch")
+    decoded = []
+    for column, value in zip(columns, values):
+        if value is not None:
+            try:
+                if isinstance(column.type, TIMESTAMP):
+                    value = datetime.fromisoformat(value)
+                elif isinstance(column.type, DATE):
+                    value = date.fromisoformat(value)
+                elif getattr(column.type, "as_uuid", False):
+                    value = uuid.UUID(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid pagination cursor: {e}")
+        decoded.append(value)
+    return decoded
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Formats a single value as a CSV field for the COPY protocol.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif not isinstance(value, str):
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+class _CopyStream:
+    """
+    File-like object that renders rows as CSV lines on demand, so COPY can
+    consume the data without the whole payload being built in memory.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], columns: List[str]):
+        self._lines = (
+            ",".join(_copy_value(row.get(column)) for column in columns) + "\n"
+            for row in rows
+        )
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+@dataclass
+class BulkInsertChunkResult:
+    """
+    Outcome of one chunk of a chunked bulk insert.
+
+    Attributes:
+        chunk_index (int): Position of the chunk in the full input, starting at 0.
+        inserted (int): Number of rows written by the chunk.
+        skipped (int): Number of rows ignored because they already existed.
+        failed (int): Number of rows in the chunk if it was rolled back, otherwise 0.
+        error (str, optional): The error that rolled back the chunk.
+    """
+    chunk_index: int
+    inserted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkInsertResult:
+    """
+    Aggregated outcome of a chunked bulk insert.
+
+    Attributes:
+        chunks (list): The result of every chunk that was attempted.
+        inserted_ids (list): IDs of all rows inserted by committed chunks.
+        next_chunk (int): Index of the chunk to resume from. Equals the total
+            number of chunks when every chunk was committed.
+        upload_failures (list): Records of the input whose file could not be
+            uploaded before the insert, see `gemini.api.uploads.UploadFailure`.
+        error (str, optional): An error that stopped the insert outside of a
+            chunk, e.g. invalid input.
+
+    Unpacks to `(success, inserted_ids)`, so callers of the record inserts can
+    keep writing `success, ids = SensorRecord.insert(records)`.
+    """
+    chunks: List[BulkInsertChunkResult] = field(default_factory=list)
+    inserted_ids: List[Any] = field(default_factory=list)
+    next_chunk: int = 0
+    upload_failures: List[Any] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def __iter__(self):
+        return iter((self.success, self.inserted_ids))
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.failed == 0 and not self.upload_failures
+
+    @property
+    def inserted(self) -> int:
+        return sum(chunk.inserted for chunk in self.chunks)
+
+    @property
+    def skipped(self) -> int:
+        return sum(chunk.skipped for chunk in self.chunks)
+
+    @property
+    def failed(self) -> int:
+        return sum(chunk.failed for chunk in self.chunks)
 
 
 class BaseModel(DeclarativeBase, SerializeMixin):
@@ -70,6 +266,9 @@ class BaseModel(DeclarativeBase, SerializeMixin):
     __abstract__ = True
     metadata = metadata_obj
 
+    # Columns used as the keyset for cursor pagination, defaults to the primary key
+    __pagination_keys__ = ()
+
 
     @classmethod
     def set_engine(cls, engine: DatabaseEngine) -> None:
@@ -79,8 +278,8 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Args:
             engine (DatabaseEngine): The database engine instance to use.
         """
-        global db_engine
-        db_engine = engine
+        global _db_engine
+        _db_engine = engine
 
 
     @classmethod
@@ -135,7 +334,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         """
         kwargs = cls.validate_fields(**kwargs)
         instance = cls(**kwargs)
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             session.add(instance)
         return instance
     
@@ -169,7 +368,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
             list: A list of all model instances.
         """
         query = select(cls)
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(query).scalars().all()
         return result
     
@@ -186,7 +385,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
             BaseModel or None: The model instance if found, otherwise None.
         """
         query = select(cls).where(cls.id == id)
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(query).scalar_one_or_none()
         return result
     
@@ -202,19 +401,10 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Returns:
             BaseModel or None: The model instance if found, otherwise None.
         """
-        query = select(cls)
-        kwargs = cls.validate_fields(**kwargs)
-        if kwargs == {}:
+        query = cls._parameters_query(**kwargs)
+        if query is None:
             return None
-        for key, value in kwargs.items():
-            attribute = getattr(cls, key)
-            if isinstance(attribute.type, JSON):
-                query = query.where(attribute.contains(value))
-            elif isinstance(attribute.type, TIMESTAMP):
-                query = query.where(attribute == value)
-            else:
-                query = query.where(attribute == value)
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(query).scalars().first()
         return result
     
@@ -231,7 +421,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Returns:
             BaseModel: The updated model instance.
         """
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             kwargs = cls.validate_fields(**kwargs)
             for key, value in kwargs.items():
                 setattr(instance, key, value)
@@ -304,7 +494,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
             bool: True if deletion was successful, False otherwise.
         """
         try:
-            with db_engine.get_session() as session:
+            with get_db_engine().get_session() as session:
                 session.delete(instance)
             return True
         except Exception as e:
@@ -326,24 +516,154 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         
 
     @classmethod
-    def insert_bulk(cls, constraint: Any, data) -> List[UUID]:
+    def prepare_bulk_insert(cls, session: Any, data: List[Dict[str, Any]], id_resolution: Optional[str] = None) -> None:
+        """
+        Hook called inside the bulk insert transaction before the rows are written.
+
+        Standard tables have nothing to prepare. Record tables use it to resolve
+        names to IDs for the whole batch, see `ColumnarBaseModel.resolve_record_ids`.
+
+        Args:
+            session: The session of the bulk insert transaction.
+            data (list): The rows about to be inserted. May be modified in place.
+            id_resolution (str, optional): "trigger" to leave ID resolution to the row
+                triggers, "batch" to resolve IDs once per batch. Defaults to the database configuration.
+        """
+        pass
+
+
+    @classmethod
+    def insert_bulk(cls, constraint: Any, data, id_resolution: Optional[str] = None) -> List[UUID]:
         """
         Performs a bulk insert operation with conflict handling.
 
         Args:
             constraint: The unique constraint to use for conflict resolution.
             data (list): A list of dictionaries, where each dictionary represents a row to insert.
+            id_resolution (str, optional): "trigger" or "batch", see `prepare_bulk_insert`. Defaults to the database configuration.
 
         Returns:
             list: A list of IDs of the inserted records.
         """
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
+            cls.prepare_bulk_insert(session, data, id_resolution)
             table = cls.__table__
             stmt = pg_insert(table).on_conflict_do_nothing(constraint=constraint).returning(table.c.id)
             inserted_records = session.execute(stmt, data, execution_options={"populate_existing": True})
             inserted_ids = [record.id for record in inserted_records]
             return inserted_ids
         
+
+    @classmethod
+    def copy_bulk(cls, constraint: Any, data: List[Dict[str, Any]], id_resolution: Optional[str] = None) -> List[UUID]:
+        """
+        Performs a bulk insert through the COPY protocol with conflict handling.
+
+        Rows are streamed with COPY into a temporary staging table and then moved
+        into the target table with a single INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+        Row triggers on the target table still fire, so the result is the same as
+        `insert_bulk`, but without sending one bound statement per row.
+
+        Args:
+            constraint: The unique constraint to use for conflict resolution.
+            data (list): A list of dictionaries, where each dictionary represents a row to insert.
+            id_resolution (str, optional): "trigger" or "batch", see `prepare_bulk_insert`. Defaults to the database configuration.
+
+        Returns:
+            list: A list of IDs of the inserted records.
+        """
+        if not data:
+            return []
+        table = cls.__table__
+        # Apply client side column defaults the same way a Core insert would
+        for column in table.columns:
+            default = column.default
+            if default is None or not (default.is_scalar or default.is_callable):
+                continue
+            for row in data:
+                if row.get(column.key) is None:
+                    row[column.key] = default.arg if default.is_scalar else default.arg(None)
+        staging_table = f"{table.name}_staging_{uuid.uuid4().hex[:8]}"
+
+        with get_db_engine().get_session() as session:
+            cls.prepare_bulk_insert(session, data, id_resolution)
+            present = set().union(*(row.keys() for row in data))
+            columns = [column.key for column in table.columns if column.key in present]
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            session.execute(text(
+                f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {table.schema}.{table.name} WITH NO DATA"
+            ))
+            cursor = session.connection().connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {staging_table} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    _CopyStream(data, columns)
+                )
+            finally:
+                cursor.close()
+            inserted_records = session.execute(text(
+                f"INSERT INTO {table.schema}.{table.name} ({column_list}) "
+                f"SELECT {column_list} FROM {staging_table} "
+                f"ON CONFLICT ON CONSTRAINT {constraint} DO NOTHING RETURNING id"
+            ))
+            inserted_ids = [record.id for record in inserted_records]
+            return inserted_ids
+
+
+    @classmethod
+    def insert_bulk_chunked(
+        cls,
+        constraint: Any,
+        data: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        start_chunk: int = 0,
+        use_copy: bool = False,
+        on_chunk: Optional[Callable[[BulkInsertChunkResult], None]] = None,
+        id_resolution: Optional[str] = None
+    ) -> BulkInsertResult:
+        """
+        Performs a bulk insert in fixed-size chunks, committing each chunk in its own transaction.
+
+        A failing chunk is rolled back and stops the insert, leaving every earlier
+        chunk committed. To resume, call again with the rows from
+        `result.next_chunk * batch_size` onwards and `start_chunk=result.next_chunk`.
+        Rows that already exist are skipped, so re-running a committed chunk is harmless.
+
+        Args:
+            constraint: The unique constraint to use for conflict resolution.
+            data (list): The rows to insert, starting at chunk `start_chunk`.
+            batch_size (int, optional): Number of rows per chunk. Inserts everything in one chunk if None.
+            start_chunk (int): Index of the first chunk in `data`, used when resuming. Defaults to 0.
+            use_copy (bool): Insert each chunk with `copy_bulk` instead of `insert_bulk`. Defaults to False.
+            on_chunk (callable, optional): Called with the `BulkInsertChunkResult` of every chunk.
+            id_resolution (str, optional): "trigger" or "batch", see `prepare_bulk_insert`. Defaults to the database configuration.
+
+        Returns:
+            BulkInsertResult: Per-chunk counts, the inserted IDs and the chunk to resume from.
+        """
+        insert_method = cls.copy_bulk if use_copy else cls.insert_bulk
+        batch_size = batch_size or max(len(data), 1)
+        result = BulkInsertResult(next_chunk=start_chunk)
+        for offset in range(0, len(data), batch_size):
+            chunk = data[offset:offset + batch_size]
+            chunk_result = BulkInsertChunkResult(chunk_index=result.next_chunk)
+            try:
+                inserted_ids = insert_method(constraint, chunk, id_resolution=id_resolution)
+                chunk_result.inserted = len(inserted_ids)
+                chunk_result.skipped = len(chunk) - len(inserted_ids)
+                result.inserted_ids.extend(inserted_ids)
+            except Exception as e:
+                chunk_result.failed = len(chunk)
+                chunk_result.error = str(e)
+            result.chunks.append(chunk_result)
+            if on_chunk is not None:
+                on_chunk(chunk_result)
+            if chunk_result.error is not None:
+                break
+            result.next_chunk += 1
+        return result
+        
         
     @classmethod
     def update_bulk(cls, constraint: Any, upsert_on: Any, data) -> List[UUID]:
@@ -358,7 +678,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Returns:
             list: A list of IDs of the upserted records.
         """
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             table = cls.__table__
             stmt = pg_insert(table).on_conflict_do_update(constraint=constraint, set_={upsert_on: stmt.excluded[upsert_on]}).returning(table.c.id)
             inserted_records = session.execute(stmt, data, execution_options={"populate_existing": True})
@@ -377,7 +697,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Returns:
             bool: True if deletion was successful.
         """
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             table = cls.__table__
             stmt = delete(table).where(table.c.id.in_(data))
             session.execute(stmt)
@@ -402,7 +722,7 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         # Check if parameter_name is a valid column in the table
         if parameter_name not in cls.__table__.columns:
             raise ValueError(f"{parameter_name} is not a valid column in {cls.__tablename__}")
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             # Update the parameter value
             setattr(instance, parameter_name, parameter_value)
             session.add(instance)
@@ -448,69 +768,65 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Returns:
             list: A list of matching model instances.
         """
-        with db_engine.get_session() as session:
-            query = select(cls)
-            kwargs = cls.validate_fields(**kwargs)
-            for key, value in kwargs.items():
-                attribute = getattr(cls, key)
-                if isinstance(attribute.type, JSONB):
-                    query = query.where(attribute.contains(value))
-                elif isinstance(attribute.type, TIMESTAMP):
-                    query = query.where(attribute >= value)
-                elif isinstance(attribute.type, DATE):
-                    query = query.where(attribute == value)  
-                else:
-                    query = query.where(attribute == value)
+        query = cls._search_query(**kwargs)
+        with get_db_engine().get_session() as session:
             result = session.execute(query).scalars().all()
         return result
         
 
     @classmethod
-    def paginate(cls, order_by: Any, page_number: int, page_limit: int, **kwargs: Any) -> tuple[int, int, List[BaseModel]]:
+    def _parameters_query(cls, **kwargs: Any) -> Optional[Select]:
         """
-        Paginates through instances of the model based on provided parameters.
-
-        Args:
-            order_by: The column to order the results by.
-            page_number (int): The current page number (1-indexed).
-            page_limit (int): The maximum number of records per page.
-            **kwargs: Keyword arguments to filter the query.
+        Builds the query used by `get_by_parameters`, matching every parameter exactly.
 
         Returns:
-            tuple: A tuple containing (total_records, total_pages, current_page_results).
+            Select or None: The query, or None if no valid parameters were given.
         """
-        with db_engine.get_session() as session:
-            query = session.query(cls)
-            kwargs = cls.validate_fields(**kwargs)
-            for key, value in kwargs.items():
-                attribute = getattr(cls, key)
-                if isinstance(attribute.type, JSON):
-                    query = query.filter(attribute.contains(value))
-                elif isinstance(attribute.type, TIMESTAMP):
-                    query = query.filter(attribute >= value)
-                elif isinstance(attribute.type, DATE):
-                    query = query.filter(attribute == value)
-                else:
-                    query = query.filter(attribute == value)
-            number_of_records = query.count()
-            number_of_pages = number_of_records // page_limit
-            if page_number > 0:
-                query = query.offset((page_number - 1) * page_limit)
-            query = query.limit(page_limit)
-            query_result = query.all()
-        return number_of_records, number_of_pages, query_result
-    
+        query = select(cls)
+        kwargs = cls.validate_fields(**kwargs)
+        if kwargs == {}:
+            return None
+        for key, value in kwargs.items():
+            attribute = getattr(cls, key)
+            if isinstance(attribute.type, JSON):
+                query = query.where(attribute.contains(value))
+            elif isinstance(attribute.type, TIMESTAMP):
+                query = query.where(attribute == value)
+            else:
+                query = query.where(attribute == value)
+        return query
+
 
     @classmethod
-    def stream(cls, **kwargs: Any) -> Any:
+    def _search_query(cls, **kwargs: Any) -> Select:
         """
-        Streams instances of the model in partitions.
+        Builds the query used by `search`, with `contains` for JSONB fields and lower bounds for timestamps.
 
-        Args:
-            **kwargs: Keyword arguments to filter the stream.
+        Returns:
+            Select: The query.
+        """
+        query = select(cls)
+        kwargs = cls.validate_fields(**kwargs)
+        for key, value in kwargs.items():
+            attribute = getattr(cls, key)
+            if isinstance(attribute.type, JSONB):
+                query = query.where(attribute.contains(value))
+            elif isinstance(attribute.type, TIMESTAMP):
+                query = query.where(attribute >= value)
+            elif isinstance(attribute.type, DATE):
+                query = query.where(attribute == value)  
+            else:
+                query = query.where(attribute == value)
+        return query
 
-        Yields:
-            BaseModel: Instances of the model.
+
+    @classmethod
+    def _filter_query(cls, **kwargs: Any) -> Select:
+        """
+        Builds the query used by `paginate` and `stream`, with `contains` for JSON fields and lower bounds for timestamps.
+
+        Returns:
+            Select: The query.
         """
         query = select(cls)
         kwargs = cls.validate_fields(**kwargs)
@@ -524,8 +840,98 @@ class BaseModel(DeclarativeBase, SerializeMixin):
                 query = query.where(attribute == value)
             else:
                 query = query.where(attribute == value)
-        query = query.execution_options(yield_per=1000)
-        with db_engine.get_session() as session:
+        return query
+
+
+    @classmethod
+    def _page_query(cls, page_limit: int, cursor: Optional[str] = None, **kwargs: Any) -> Select:
+        """
+        Builds the query for one page of `paginate`, fetching one extra row to detect the next page.
+
+        Returns:
+            Select: The query.
+
+        Raises:
+            ValueError: If the page limit is not positive or the cursor is malformed.
+        """
+        if page_limit < 1:
+            raise ValueError("page_limit must be at least 1")
+        key_columns = cls.pagination_columns()
+        query = cls._filter_query(**kwargs)
+        if cursor:
+            cursor_values = decode_cursor(cursor, key_columns)
+            query = query.where(
+                tuple_(*key_columns) > tuple_(*[literal(value, column.type) for column, value in zip(key_columns, cursor_values)])
+            )
+        # Fetch one extra row to know whether another page follows
+        return query.order_by(*key_columns).limit(page_limit + 1)
+
+
+    @classmethod
+    def _page_result(cls, query_result: List[Any], page_limit: int) -> tuple[List[BaseModel], Optional[str]]:
+        """
+        Trims the rows fetched by `_page_query` to the page and builds the next cursor.
+
+        Returns:
+            tuple: A tuple containing (current_page_results, next_cursor).
+        """
+        next_cursor = None
+        if len(query_result) > page_limit:
+            query_result = query_result[:page_limit]
+            last_instance = query_result[-1]
+            next_cursor = encode_cursor([getattr(last_instance, column.key) for column in cls.pagination_columns()])
+        return query_result, next_cursor
+
+
+    @classmethod
+    def pagination_columns(cls) -> List[Any]:
+        """
+        Retrieves the columns that make up the keyset used for cursor pagination.
+
+        Returns:
+            list: The `__pagination_keys__` columns if declared, otherwise the primary key columns.
+        """
+        if cls.__pagination_keys__:
+            return [cls.__table__.c[key] for key in cls.__pagination_keys__]
+        return list(cls.__table__.primary_key.columns)
+
+
+    @classmethod
+    def paginate(cls, page_limit: int = 100, cursor: Optional[str] = None, **kwargs: Any) -> tuple[List[BaseModel], Optional[str]]:
+        """
+        Paginates through instances of the model using keyset (cursor) pagination.
+
+        Results are ordered by the model's pagination columns and each page resumes
+        strictly after the last row of the previous page, so fetching a deep page
+        costs the same as fetching the first one.
+
+        Args:
+            page_limit (int): The maximum number of records per page.
+            cursor (str, optional): The continuation token returned with the previous page.
+            **kwargs: Keyword arguments to filter the query.
+
+        Returns:
+            tuple: A tuple containing (current_page_results, next_cursor). `next_cursor` is None on the last page.
+        """
+        query = cls._page_query(page_limit, cursor, **kwargs)
+        with get_db_engine().get_session() as session:
+            query_result = session.execute(query).scalars().all()
+        return cls._page_result(query_result, page_limit)
+    
+
+    @classmethod
+    def stream(cls, **kwargs: Any) -> Any:
+        """
+        Streams instances of the model in partitions.
+
+        Args:
+            **kwargs: Keyword arguments to filter the stream.
+
+        Yields:
+            BaseModel: Instances of the model.
+        """
+        query = cls._filter_query(**kwargs).execution_options(yield_per=1000)
+        with get_db_engine().get_session() as session:
             for partition in session.execute(query).scalars().partitions():
                 for instance in partition:
                     yield instance
@@ -542,26 +948,268 @@ class BaseModel(DeclarativeBase, SerializeMixin):
         Yields:
             BaseModel: Instances of the model.
         """
-        query = select(cls)
-        kwargs = cls.validate_fields(**kwargs)
-        for key, value in kwargs.items():
-            attribute = getattr(cls, key)
-            if isinstance(attribute.type, JSON):
-                query = query.where(attribute.contains(value))
-            elif isinstance(attribute.type, TIMESTAMP):
-                query = query.where(attribute >= value)
-            elif isinstance(attribute.type, DATE):
-                query = query.where(attribute == value)
-            else:
-                query = query.where(attribute == value)
-        query = query.execution_options(yield_per=50)
-        with db_engine.get_engine().connect() as conn:
+        query = cls._filter_query(**kwargs).execution_options(yield_per=50)
+        with get_db_engine().get_engine().connect() as conn:
             result = conn.execute(query).scalars().partitions()
             for partition in result:
                 for instance in partition:
                     yield instance
 
 
+    @classmethod
+    def stream_rows(cls, **kwargs: Any) -> Any:
+        """
+        Streams the matching rows as named tuples, without building ORM instances.
+
+        Args:
+            **kwargs: Keyword arguments to filter the stream.
+
+        Yields:
+            Row: One row per instance, with one field per column of the table.
+        """
+        query = cls._filter_query(**kwargs).with_only_columns(*cls.__table__.columns).execution_options(yield_per=1000)
+        with get_db_engine().get_engine().connect() as conn:
+            for partition in conn.execute(query).partitions():
+                for row in partition:
+                    yield row
+
+
+    @classmethod
+    async def create_async(cls, **kwargs: Any) -> BaseModel:
+        """
+        Asynchronously creates a new instance of the model and adds it to the database.
+
+        Args:
+            **kwargs: Keyword arguments corresponding to the model's fields.
+
+        Returns:
+            BaseModel: The newly created model instance.
+        """
+        kwargs = cls.validate_fields(**kwargs)
+        instance = cls(**kwargs)
+        async with get_db_engine().get_async_session() as session:
+            session.add(instance)
+        return instance
+
+
+    @classmethod
+    async def exists_async(cls, **kwargs: Any) -> bool:
+        """
+        Asynchronously checks if an instance with the given parameters exists in the database.
+
+        Args:
+            **kwargs: Keyword arguments to search for.
+
+        Returns:
+            bool: True if an instance exists, False otherwise.
+        """
+        instance = await cls.get_by_parameters_async(**kwargs)
+        return instance is not None
+
+
+    @classmethod
+    async def all_async(cls) -> List[BaseModel]:
+        """
+        Asynchronously retrieves all instances of the model from the database.
+
+        Returns:
+            list: A list of all model instances.
+        """
+        query = select(cls)
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalars().all()
+        return result
+
+
+    @classmethod
+    async def get_async(cls, id: Any) -> BaseModel | None:
+        """
+        Asynchronously retrieves a single instance of the model by its ID.
+
+        Args:
+            id: The ID of the instance to retrieve.
+
+        Returns:
+            BaseModel or None: The model instance if found, otherwise None.
+        """
+        query = select(cls).where(cls.id == id)
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalar_one_or_none()
+        return result
+
+
+    @classmethod
+    async def get_many_async(cls, ids: List[Any]) -> List[BaseModel]:
+        """
+        Asynchronously retrieves the instances with the given IDs in one query.
+
+        Args:
+            ids (list): The IDs of the instances to retrieve.
+
+        Returns:
+            list: The instances found, in no particular order. Missing IDs are left out.
+        """
+        query = select(cls).where(cls.id.in_(ids))
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalars().all()
+        return result
+
+
+    @classmethod
+    async def get_by_parameters_async(cls, **kwargs: Any) -> BaseModel | None:
+        """
+        Asynchronously retrieves a single instance of the model based on provided parameters.
+
+        Args:
+            **kwargs: Keyword arguments to filter the query.
+
+        Returns:
+            BaseModel or None: The model instance if found, otherwise None.
+        """
+        query = cls._parameters_query(**kwargs)
+        if query is None:
+            return None
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalars().first()
+        return result
+
+
+    @classmethod
+    async def update_async(cls, instance, **kwargs: Any) -> BaseModel:
+        """
+        Asynchronously updates an existing instance of the model with new values.
+
+        Args:
+            instance (BaseModel): The instance to update.
+            **kwargs: Keyword arguments with the new values for the fields.
+
+        Returns:
+            BaseModel: The updated model instance.
+        """
+        async with get_db_engine().get_async_session() as session:
+            kwargs = cls.validate_fields(**kwargs)
+            for key, value in kwargs.items():
+                setattr(instance, key, value)
+            instance = await session.merge(instance)
+        return instance
+
+
+    @classmethod
+    async def get_or_create_async(cls, **kwargs: Any) -> Optional[BaseModel]:
+        """
+        Asynchronously retrieves an existing instance or creates a new one if it doesn't exist.
+
+        Args:
+            **kwargs: Keyword arguments to search for or create the instance.
+
+        Returns:
+            BaseModel or None: An existing or newly created model instance, or None if unique fields are missing.
+        """
+        unique_fields = cls.unique_fields()
+        kwargs = cls.validate_fields(**kwargs)
+        unique_kwargs = {key: value for key, value in kwargs.items() if key in unique_fields}
+        if unique_kwargs == {}:
+            return None
+        instance = await cls.get_by_parameters_async(**unique_kwargs)
+        if instance:
+            return instance
+        return await cls.create_async(**kwargs)
+
+
+    @classmethod
+    async def delete_async(cls, instance: Any) -> bool:
+        """
+        Asynchronously deletes an instance from the database.
+
+        Args:
+            instance (BaseModel): The instance to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        try:
+            async with get_db_engine().get_async_session() as session:
+                await session.delete(await session.merge(instance))
+            return True
+        except Exception as e:
+            print(f"Error deleting instance: {e}")
+            return False
+
+
+    @classmethod
+    async def search_async(cls, **kwargs: Any) -> List[BaseModel]:
+        """
+        Asynchronously searches for instances based on provided parameters.
+
+        Args:
+            **kwargs: Keyword arguments to filter the search.
+
+        Returns:
+            list: A list of matching model instances.
+        """
+        query = cls._search_query(**kwargs)
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalars().all()
+        return result
+
+
+    @classmethod
+    async def paginate_async(cls, page_limit: int = 100, cursor: Optional[str] = None, **kwargs: Any) -> tuple[List[BaseModel], Optional[str]]:
+        """
+        Asynchronously paginates through instances of the model, see `paginate`.
+
+        Args:
+            page_limit (int): The maximum number of records per page.
+            cursor (str, optional): The continuation token returned with the previous page.
+            **kwargs: Keyword arguments to filter the query.
+
+        Returns:
+            tuple: A tuple containing (current_page_results, next_cursor). `next_cursor` is None on the last page.
+        """
+        query = cls._page_query(page_limit, cursor, **kwargs)
+        async with get_db_engine().get_async_session() as session:
+            query_result = (await session.execute(query)).scalars().all()
+        return cls._page_result(query_result, page_limit)
+
+
+    @classmethod
+    async def stream_async(cls, **kwargs: Any) -> AsyncIterator[BaseModel]:
+        """
+        Asynchronously streams instances of the model in partitions over a server side cursor.
+
+        Args:
+            **kwargs: Keyword arguments to filter the stream.
+
+        Yields:
+            BaseModel: Instances of the model.
+        """
+        query = cls._filter_query(**kwargs).execution_options(yield_per=1000)
+        async with get_db_engine().get_async_session() as session:
+            result = await session.stream_scalars(query)
+            async for partition in result.partitions():
+                for instance in partition:
+                    yield instance
+
+
+    @classmethod
+    async def stream_rows_async(cls, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Asynchronously streams the matching rows as named tuples over a server side cursor, without building ORM instances.
+
+        Args:
+            **kwargs: Keyword arguments to filter the stream.
+
+        Yields:
+            Row: One row per instance, with one field per column of the table.
+        """
+        query = cls._filter_query(**kwargs).with_only_columns(*cls.__table__.columns).execution_options(yield_per=1000)
+        async with get_db_engine().get_async_engine().connect() as conn:
+            result = await conn.stream(query)
+            async for partition in result.partitions():
+                for row in partition:
+                    yield row
+
+
 
 class ViewBaseModel(BaseModel):
     """
@@ -575,75 +1223,167 @@ class MaterializedViewBaseModel(BaseModel):
     """
     Base class for materialized database views.
 
-    Provides methods for refreshing the materialized view and
-    overrides standard retrieval methods to ensure data freshness.
+    Reads never refresh the view. Writes to the tables listed in
+    `__depends_on__`, from any process, mark the view dirty through
+    database triggers, and the background refresher rebuilds it so it
+    lags behind its base tables by at most `__max_staleness__` seconds.
+    Views with a unique index are refreshed concurrently, so reads are
+    not blocked while the refresh runs.
     """
 
     __abstract__ = True
 
+    # Base tables whose writes make the view stale, if empty the view is refreshed on every max staleness interval
+    __depends_on__: tuple = ()
+    # Seconds the view may lag behind its base tables, defaults to the database configuration
+    __max_staleness__: Optional[float] = None
+
 
     @classmethod
-    def refresh(cls) -> None:
+    def refresh(cls, concurrently: Optional[bool] = None) -> None:
         """
-        Refreshes the materialized view.
+        Refreshes the materialized view synchronously.
+
+        Args:
+            concurrently (bool, optional): Force or disable a concurrent refresh. Detected from the view's indexes if None.
         """
-        with db_engine.get_session() as session:
-            query = text(f"REFRESH MATERIALIZED VIEW {cls.__table__.name}")
-            session.execute(query)
-        
+        get_view_refresher().refresh(cls, concurrently=concurrently)
+
+
+    @classmethod
+    def mark_dirty(cls) -> None:
+        """
+        Marks the materialized view as stale so the background refresher rebuilds it.
+        """
+        get_view_refresher().register(cls)
+        for table_name in cls.__depends_on__ or (cls.__table__.name,):
+            get_view_refresher().mark_dirty(table_name)
+
 
     @classmethod
     def get(cls) -> Optional[BaseModel]:
         """
-        Retrieves a single instance of the materialized view by its ID, refreshing it first.
+        Retrieves a single instance of the materialized view by its ID.
         """
-        cls.refresh()
+        get_view_refresher().register(cls)
         return super().get()
     
 
     @classmethod
     def all(cls) -> List[BaseModel]:
         """
-        Retrieves all instances of the materialized view, refreshing it first.
+        Retrieves all instances of the materialized view.
         """
-        cls.refresh()
+        get_view_refresher().register(cls)
         return super().all()
     
 
     @classmethod
     def get_by_parameters(cls, **kwargs) -> Optional[BaseModel]:
         """
-        Retrieves a single instance of the materialized view based on provided parameters, refreshing it first.
+        Retrieves a single instance of the materialized view based on provided parameters.
         """
-        cls.refresh()
+        get_view_refresher().register(cls)
         return super().get_by_parameters(**kwargs)
     
 
     @classmethod
     def search(cls, **kwargs) -> List[BaseModel]:
         """
-        Searches for instances in the materialized view, refreshing it first.
+        Searches for instances in the materialized view.
         """
-        cls.refresh()
+        get_view_refresher().register(cls)
         return super().search(**kwargs)
     
 
     @classmethod
-    def paginate(cls, order_by: Any, page_number: int, page_limit: int, **kwargs) -> tuple[int, int, List[BaseModel]]:
+    def paginate(cls, page_limit: int = 100, cursor: Optional[str] = None, **kwargs) -> tuple[List[BaseModel], Optional[str]]:
         """
-        Paginates through instances of the materialized view, refreshing it first.
+        Paginates through instances of the materialized view.
         """
-        cls.refresh()
-        return super().paginate(order_by, page_number, page_limit, **kwargs)
+        get_view_refresher().register(cls)
+        return super().paginate(page_limit=page_limit, cursor=cursor, **kwargs)
     
 
     @classmethod
     def stream(cls, **kwargs) -> Any:
         """
-        Streams instances of the materialized view, refreshing it first.
+        Streams instances of the materialized view.
         """
-        cls.refresh()
+        get_view_refresher().register(cls)
         return super().stream(**kwargs)
+
+
+    @classmethod
+    def stream_rows(cls, **kwargs) -> Any:
+        """
+        Streams rows of the materialized view as named tuples.
+        """
+        get_view_refresher().register(cls)
+        return super().stream_rows(**kwargs)
+
+
+    @classmethod
+    async def get_async(cls, id: Any) -> Optional[BaseModel]:
+        """
+        Asynchronously retrieves a single instance of the materialized view by its ID.
+        """
+        get_view_refresher().register(cls)
+        return await super().get_async(id)
+
+
+    @classmethod
+    async def all_async(cls) -> List[BaseModel]:
+        """
+        Asynchronously retrieves all instances of the materialized view.
+        """
+        get_view_refresher().register(cls)
+        return await super().all_async()
+
+
+    @classmethod
+    async def get_by_parameters_async(cls, **kwargs) -> Optional[BaseModel]:
+        """
+        Asynchronously retrieves a single instance of the materialized view based on provided parameters.
+        """
+        get_view_refresher().register(cls)
+        return await super().get_by_parameters_async(**kwargs)
+
+
+    @classmethod
+    async def search_async(cls, **kwargs) -> List[BaseModel]:
+        """
+        Asynchronously searches for instances in the materialized view.
+        """
+        get_view_refresher().register(cls)
+        return await super().search_async(**kwargs)
+
+
+    @classmethod
+    async def paginate_async(cls, page_limit: int = 100, cursor: Optional[str] = None, **kwargs) -> tuple[List[BaseModel], Optional[str]]:
+        """
+        Asynchronously paginates through instances of the materialized view.
+        """
+        get_view_refresher().register(cls)
+        return await super().paginate_async(page_limit=page_limit, cursor=cursor, **kwargs)
+
+
+    @classmethod
+    def stream_async(cls, **kwargs) -> AsyncIterator[BaseModel]:
+        """
+        Asynchronously streams instances of the materialized view.
+        """
+        get_view_refresher().register(cls)
+        return super().stream_async(**kwargs)
+
+
+    @classmethod
+    def stream_rows_async(cls, **kwargs) -> AsyncIterator[Any]:
+        """
+        Asynchronously streams rows of the materialized view as named tuples.
+        """
+        get_view_refresher().register(cls)
+        return super().stream_rows_async(**kwargs)
     
 class ColumnarBaseModel(BaseModel):
     """
@@ -651,6 +1391,143 @@ class ColumnarBaseModel(BaseModel):
     """
 
     __abstract__ = True
+
+    __pagination_keys__ = ("timestamp", "id")
+
+    # Set-based ID resolution, see `resolve_record_ids`.
+    # SQL function validating the (entity, dataset, experiment, season, site) combination of a record
+    __validity_function__: Optional[str] = None
+    # Record columns passed to the validity function, in order
+    __validity_columns__: tuple = ()
+    # (id column, table, name column) of the entity the record belongs to, e.g. ("sensor_id", "sensors", "sensor_name")
+    __entity_lookup__: Optional[tuple] = None
+    # Whether records reference a plot
+    __has_plot__: bool = False
+
+
+    @classmethod
+    def prepare_bulk_insert(cls, session: Any, data: List[Dict[str, Any]], id_resolution: Optional[str] = None) -> None:
+        """
+        Resolves record IDs for the whole batch when batch resolution is selected.
+
+        The transaction is then flagged so the per-row `populate_*_record_ids`
+        triggers return immediately instead of repeating the lookups for every row.
+
+        Args:
+            session: The session of the bulk insert transaction.
+            data (list): The rows about to be inserted. The ID columns are filled in place.
+            id_resolution (str, optional): "trigger" or "batch". Defaults to the database configuration.
+        """
+        id_resolution = id_resolution or get_db_engine().config.record_id_resolution
+        if id_resolution != "batch" or cls.__validity_function__ is None or not data:
+            return
+        cls.resolve_record_ids(session, data)
+        session.execute(text("SELECT set_config('gemini.record_id_resolution', 'batch', true)"))
+
+
+    @classmethod
+    def resolve_record_ids(cls, session: Any, data: List[Dict[str, Any]]) -> None:
+        """
+        Validates and resolves the name columns of a batch of records to IDs.
+
+        Every distinct combination is validated once with the same SQL functions
+        the row triggers use, which also creates missing datasets, plots and
+        dataset associations. Names are then resolved with one query per entity.
+
+        Args:
+            session: The session of the bulk insert transaction.
+            data (list): The rows to resolve. The ID columns are filled in place.
+
+        Raises:
+            ValueError: If a combination is invalid or a plot cannot be found.
+        """
+        validity_args = ", ".join(f":arg{i}" for i in range(len(cls.__validity_columns__)))
+        validity_query = text(f"SELECT gemini.{cls.__validity_function__}({validity_args})")
+        combinations = {tuple(row.get(column) for column in cls.__validity_columns__) for row in data}
+        for combination in combinations:
+            params = {f"arg{i}": value for i, value in enumerate(combination)}
+            if not session.execute(validity_query, params).scalar():
+                raise ValueError(f"Invalid {', '.join(cls.__validity_columns__)} combination: {combination}")
+
+        plot_columns = ("experiment_name", "season_name", "site_name", "plot_number", "plot_row_number", "plot_column_number")
+        if cls.__has_plot__:
+            plot_query = text("SELECT gemini.check_plot_validity(:arg0, :arg1, :arg2, :arg3, :arg4, :arg5)")
+            plot_combinations = {cls._plot_key(row.get(column) for column in plot_columns) for row in data}
+            for combination in plot_combinations:
+                params = {f"arg{i}": value for i, value in enumerate(combination)}
+                if not session.execute(plot_query, params).scalar():
+                    raise ValueError(f"Invalid experiment, season, or site combination for plots: {combination}")
+
+        lookups = [
+            cls.__entity_lookup__,
+            ("dataset_id", "datasets", "dataset_name"),
+            ("experiment_id", "experiments", "experiment_name"),
+            ("site_id", "sites", "site_name")
+        ]
+        for id_column, table_name, name_column in filter(None, lookups):
+            names = list({row.get(name_column) for row in data} - {None})
+            ids = dict(session.execute(
+                text(f"SELECT {name_column}, id FROM gemini.{table_name} WHERE {name_column} = ANY(:names)"),
+                {"names": names}
+            ).all())
+            for row in data:
+                row[id_column] = cls._as_uuid(ids.get(row.get(name_column)))
+
+        experiment_names = list({row.get("experiment_name") for row in data} - {None})
+        season_ids = {
+            (experiment_name, season_name): season_id
+            for experiment_name, season_name, season_id in session.execute(
+                text(
+                    "SELECT e.experiment_name, s.season_name, s.id FROM gemini.seasons s "
+                    "JOIN gemini.experiments e ON e.id = s.experiment_id "
+                    "WHERE e.experiment_name = ANY(:names)"
+                ),
+                {"names": experiment_names}
+            ).all()
+        }
+        for row in data:
+            row["season_id"] = cls._as_uuid(season_ids.get((row.get("experiment_name"), row.get("season_name"))))
+
+        if cls.__has_plot__:
+            plot_ids = {
+                cls._plot_key(plot[:-1]): plot[-1]
+                for plot in session.execute(
+                    text(
+                        "SELECT e.experiment_name, s.season_name, si.site_name, "
+                        "p.plot_number, p.plot_row_number, p.plot_column_number, p.id "
+                        "FROM gemini.plots p "
+                        "JOIN gemini.experiments e ON e.id = p.experiment_id "
+                        "JOIN gemini.seasons s ON s.id = p.season_id "
+                        "JOIN gemini.sites si ON si.id = p.site_id "
+                        "WHERE e.experiment_name = ANY(:names)"
+                    ),
+                    {"names": experiment_names}
+                ).all()
+            }
+            for row in data:
+                plot_id = plot_ids.get(cls._plot_key(row.get(column) for column in plot_columns))
+                if plot_id is None:
+                    raise ValueError("No matching plot found for the given parameters")
+                row["plot_id"] = cls._as_uuid(plot_id)
+
+
+    @staticmethod
+    def _plot_key(values: Any) -> tuple:
+        """
+        Normalizes plot identifying values so lookups match regardless of int/str plot numbers.
+        """
+        values = list(values)
+        return tuple(values[:3]) + tuple(int(value) if value is not None else None for value in values[3:])
+
+
+    @staticmethod
+    def _as_uuid(value: Any) -> Optional[uuid.UUID]:
+        """
+        Converts an ID returned by a raw query to a UUID.
+        """
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(str(value))
     
 
     @classmethod
@@ -665,6 +1542,23 @@ class ColumnarBaseModel(BaseModel):
             list: A list of all columnar model instances.
         """
         query = select(cls).limit(limit)
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(query).scalars().all()
         return result
+
+
+    @classmethod
+    async def all_async(cls, limit: int = 100) -> List[Any]:
+        """
+        Asynchronously retrieves all instances of the columnar model with an optional limit.
+
+        Args:
+            limit (int): The maximum number of records to retrieve.
+
+        Returns:
+            list: A list of all columnar model instances.
+        """
+        query = select(cls).limit(limit)
+        async with get_db_engine().get_async_session() as session:
+            result = (await session.execute(query)).scalars().all()
+        return result
@@ -9,7 +9,7 @@ and context managers for session handling.
 """
 
 import asyncio
-from datetime import datetime
+import time
 from typing import Generator, Optional, Any
 from contextlib import contextmanager, asynccontextmanager
 import logging
@@ -23,6 +23,8 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker
 )
 from gemini.db.config import DatabaseConfig
+from gemini.db.core.metrics import QueryMetrics, timed_pool_class
+from gemini.db.core.slow_queries import SlowQueryRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -60,18 +62,24 @@ class DatabaseEngine:
         self._async_engine = async_engine
         self._session_factory = None
         self._async_session_factory = None
+        # Per-statement latency and pool checkout metrics, see `gemini.db.core.metrics`
+        self.metrics = QueryMetrics()
+        # Statements over the slow-query threshold, see `gemini.db.core.slow_queries`
+        self.slow_queries = SlowQueryRecorder(
+            self,
+            threshold=config.slow_query_threshold,
+            explain_sample_rate=config.slow_query_explain_sample_rate
+        )
         
         
 
 
-        # Initialize engines if not provided
+        # Initialize the sync engine if not provided, the async engine is set up on first use
         if not self._engine:
             self.setup_engine()
-        if not self._async_engine:
-            self.setup_async_engine()
         
         # Set up event listeners
-        self._setup_engine_events()
+        self._setup_engine_events(self._engine)
 
     def setup_engine(self) -> None:
         """
@@ -84,7 +92,7 @@ class DatabaseEngine:
 
         self._engine = create_engine(
             self.config.database_url,
-            poolclass=self.config.pool_class,
+            poolclass=timed_pool_class(self.config.pool_class, self.metrics),
             pool_size=self.config.pool_size,
             max_overflow=self.config.max_overflow,
             pool_timeout=self.config.pool_timeout,
@@ -116,11 +124,11 @@ class DatabaseEngine:
             return
         
         # Add asyncpg dialect to the database URL
-        self.config.database_url = self.config.database_url.replace("postgresql", "postgresql+asyncpg")
+        async_database_url = self.config.database_url.replace("postgresql", "postgresql+asyncpg")
 
         self._async_engine = create_async_engine(
-            self.config.database_url,
-            poolclass=self.config.async_pool_class,
+            async_database_url,
+            poolclass=timed_pool_class(self.config.async_pool_class, self.metrics),
             pool_size=self.config.pool_size,
             max_overflow=self.config.max_overflow,
             pool_timeout=self.config.pool_timeout,
@@ -130,6 +138,9 @@ class DatabaseEngine:
             echo_pool=self.config.echo_pool
         )
 
+        # Async statements run on the sync core of the async engine
+        self._setup_engine_events(self._async_engine.sync_engine)
+
         # Create async session factory
         self._async_session_factory = async_sessionmaker(
             bind=self._async_engine,
@@ -146,31 +157,64 @@ class DatabaseEngine:
         Returns:
             Engine: The synchronous SQLAlchemy engine.
         """
-        return self._engine or self.setup_engine()
+        if self._engine is None:
+            self.setup_engine()
+        return self._engine
+
+    def get_async_engine(self) -> Any:
+        """
+        Retrieves the asynchronous SQLAlchemy engine instance.
+
+        If the engine has not been set up, it calls `setup_async_engine` to initialize it.
+
+        Returns:
+            AsyncEngine: The asynchronous SQLAlchemy engine.
+        """
+        if self._async_engine is None:
+            self.setup_async_engine()
+        return self._async_engine
 
-    def _setup_engine_events(self) -> None:
+    def _setup_engine_events(self, engine: Engine) -> None:
         """
         Sets up SQLAlchemy event listeners for monitoring query execution and connection lifecycle.
 
-        This includes logging for `before_cursor_execute`, `after_cursor_execute`,
+        Every statement is timed and recorded in `metrics` by fingerprint, together
+        with the rows it returned or affected and whether it failed. Statements over
+        the slow-query threshold are passed to `slow_queries`. Debug logs are
+        emitted for `before_cursor_execute`, `after_cursor_execute`,
         `engine_connect`, and `connection_close` events.
+
+        Args:
+            engine (Engine): The engine to listen on.
         """
         
-        @event.listens_for(self._engine, 'before_cursor_execute')
+        @event.listens_for(engine, 'before_cursor_execute')
         def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            conn.info.setdefault('query_start_time', []).append(datetime.now())
+            conn.info.setdefault('query_start_time', []).append(time.perf_counter())
             logger.debug("Executing query: %s", statement)
 
-        @event.listens_for(self._engine, 'after_cursor_execute')
+        @event.listens_for(engine, 'after_cursor_execute')
         def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            total = datetime.now() - conn.info['query_start_time'].pop()
-            logger.debug("Query execution time: %s", total)
-
-        @event.listens_for(self._engine, 'engine_connect')
+            total = time.perf_counter() - conn.info['query_start_time'].pop()
+            self.metrics.record_query(statement, total, rows=cursor.rowcount or 0)
+            if self.slow_queries.enabled:
+                self.slow_queries.observe(statement, parameters, total, executemany)
+            logger.debug("Query execution time: %.6fs", total)
+
+        @event.listens_for(engine, 'handle_error')
+        def handle_error(exception_context):
+            conn = exception_context.connection
+            statement = exception_context.statement
+            if conn is None or statement is None or not conn.info.get('query_start_time'):
+                return
+            total = time.perf_counter() - conn.info['query_start_time'].pop()
+            self.metrics.record_query(statement, total, error=True)
+
+        @event.listens_for(engine, 'engine_connect')
         def engine_connect(conn, branch):
             logger.debug("New database connection established")
 
-        @event.listens_for(self._engine.pool, 'close')
+        @event.listens_for(engine.pool, 'close')
         def connection_close(dbapi_connection, connection_record):
             logger.debug("Database connection closed")
 
@@ -208,6 +252,8 @@ class DatabaseEngine:
             async with engine.get_async_session() as session:
                 result = await session.execute(select(Model))
         """
+        if self._async_session_factory is None:
+            self.setup_async_engine()
         session = self._async_session_factory()
         try:
             yield session
@@ -246,13 +292,24 @@ class DatabaseEngine:
             bool: True if the async database connection is healthy, False otherwise.
         """
         try:
-            async with self._async_engine.connect() as conn:
+            async with self.get_async_engine().connect() as conn:
                 await conn.execute(text("SELECT 1"))
             return True
         except exc.DBAPIError as e:
             logger.error("Async database health check failed: %s", str(e))
             return False
 
+    def set_slow_query_logger(self, logger_provider: Optional[Any]) -> None:
+        """
+        Sets the logger provider slow queries are written to.
+
+        By default they go to the provider created through `LoggerFactory.get_provider`.
+
+        Args:
+            logger_provider (Optional[LoggerProvider]): The provider, or None to use the default.
+        """
+        self.slow_queries.set_logger_provider(logger_provider)
+
     def get_pool_status(self) -> dict:
         """
         Retrieves the current status and statistics of the synchronous connection pool.
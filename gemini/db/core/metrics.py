@@ -0,0 +1,323 @@
+"""
+Query metrics for GEMINI database engines.
+
+Statements are normalized (literals, bound parameters and IN lists are
+replaced by placeholders) and grouped by a fingerprint of the normalized
+text. For each fingerprint the number of executions, a latency histogram,
+the rows returned and the errors are kept. Time spent waiting for a pooled
+connection is tracked in a separate histogram.
+
+The metrics can be read from Python with `QueryMetrics.snapshot` or
+rendered in the Prometheus text exposition format with
+`QueryMetrics.to_prometheus`.
+"""
+
+import re
+import time
+import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds of the latency histogram buckets in seconds
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Longest normalized statement kept as a label on the exported metrics
+MAX_STATEMENT_LABEL_LENGTH = 200
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):(?!:)\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normalizes a SQL statement so that executions differing only in their values group together.
+
+    Examples:
+        >>> normalize_statement("SELECT * FROM gemini.plots WHERE plot_number = 3 AND id IN (%(id_1)s, %(id_2)s)")
+        'SELECT * FROM gemini.plots WHERE plot_number = ? AND id IN (?)'
+
+    Args:
+        statement (str): The SQL statement as sent to the driver.
+
+    Returns:
+        str: The normalized statement.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _VALUES_LIST.sub(r"\1", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    return normalized
+
+
+def fingerprint_statement(normalized_statement: str) -> str:
+    """
+    Computes a short, stable fingerprint for a normalized statement.
+
+    Args:
+        normalized_statement (str): A statement returned by `normalize_statement`.
+
+    Returns:
+        str: A 16 character hexadecimal fingerprint.
+    """
+    return hashlib.sha1(normalized_statement.encode("utf-8")).hexdigest()[:16]
+
+
+class LatencyHistogram:
+    """
+    Cumulative latency histogram with fixed bucket bounds.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts: List[int] = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def cumulative_counts(self) -> List[int]:
+        counts = []
+        total = 0
+        for bucket_count in self.bucket_counts:
+            total += bucket_count
+            counts.append(total)
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(zip(self.buckets, self.cumulative_counts()))
+        }
+
+
+class StatementStats:
+    """
+    Execution statistics for one statement fingerprint.
+    """
+
+    def __init__(self, statement: str, buckets: Tuple[float, ...]):
+        self.statement = statement
+        self.latency = LatencyHistogram(buckets)
+        self.rows = 0
+        self.errors = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "rows": self.rows,
+            "errors": self.errors,
+            "latency": self.latency.to_dict()
+        }
+
+
+class QueryMetrics:
+    """
+    Thread-safe store of per-statement query metrics and pool checkout waits.
+
+    Features:
+    - Statement normalization and fingerprinting
+    - Per-fingerprint execution count, latency histogram, rows and errors
+    - Pool checkout wait histogram
+    - Prometheus text exposition
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the metrics store.
+
+        Args:
+            buckets (tuple): Upper bounds of the latency histogram buckets in seconds.
+        """
+        self.buckets = buckets
+        self._statements: Dict[str, StatementStats] = {}
+        self._fingerprints: Dict[str, Tuple[str, str]] = {}
+        self._checkout_wait = LatencyHistogram(buckets)
+        self._lock = threading.Lock()
+
+    def fingerprint(self, statement: str) -> Tuple[str, str]:
+        """
+        Normalizes and fingerprints a statement, caching the result per statement text.
+
+        Args:
+            statement (str): The SQL statement as sent to the driver.
+
+        Returns:
+            tuple: The fingerprint and the normalized statement.
+        """
+        cached = self._fingerprints.get(statement)
+        if cached is None:
+            normalized = normalize_statement(statement)
+            cached = (fingerprint_statement(normalized), normalized)
+            # Statements with inlined literals would otherwise grow the cache without bound
+            if len(self._fingerprints) < 10000:
+                self._fingerprints[statement] = cached
+        return cached
+
+    def record_query(self, statement: str, seconds: float, rows: int = 0, error: bool = False) -> None:
+        """
+        Records one statement execution.
+
+        Args:
+            statement (str): The SQL statement as sent to the driver.
+            seconds (float): The execution time in seconds.
+            rows (int): The number of rows returned or affected. Defaults to 0.
+            error (bool): Whether the execution failed. Defaults to False.
+        """
+        fingerprint, normalized = self.fingerprint(statement)
+        with self._lock:
+            stats = self._statements.get(fingerprint)
+            if stats is None:
+                stats = self._statements[fingerprint] = StatementStats(normalized, self.buckets)
+            stats.latency.observe(seconds)
+            stats.rows += max(rows, 0)
+            if error:
+                stats.errors += 1
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        """
+        Records the time spent waiting for a connection from the pool.
+
+        Args:
+            seconds (float): The wait time in seconds.
+        """
+        with self._lock:
+            self._checkout_wait.observe(seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Retrieves a copy of the current metrics.
+
+        Returns:
+            dict: The per-fingerprint statement statistics under "statements" and the pool checkout wait histogram under "pool_checkout_wait".
+        """
+        with self._lock:
+            return {
+                "statements": {fingerprint: stats.to_dict() for fingerprint, stats in self._statements.items()},
+                "pool_checkout_wait": self._checkout_wait.to_dict()
+            }
+
+    def top_statements(self, limit: int = 10, by: str = "sum") -> List[dict]:
+        """
+        Retrieves the statements that account for the most database time.
+
+        Args:
+            limit (int): The maximum number of statements to return. Defaults to 10.
+            by (str): The latency field to sort by, "sum", "count", "max" or "mean". Defaults to "sum".
+
+        Returns:
+            list: Statement statistics with their fingerprint, in descending order.
+        """
+        statements = [
+            {"fingerprint": fingerprint, **stats}
+            for fingerprint, stats in self.snapshot()["statements"].items()
+        ]
+        statements.sort(key=lambda stats: stats["latency"][by], reverse=True)
+        return statements[:limit]
+
+    def reset(self) -> None:
+        """
+        Clears all recorded metrics.
+        """
+        with self._lock:
+            self._statements.clear()
+            self._checkout_wait = LatencyHistogram(self.buckets)
+
+    def to_prometheus(self, pool_status: Optional[dict] = None, prefix: str = "gemini_db") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Args:
+            pool_status (dict, optional): Pool statistics from `DatabaseEngine.get_pool_status`, exported as gauges.
+            prefix (str): Prefix of the metric names. Defaults to "gemini_db".
+
+        Returns:
+            str: The metrics in Prometheus text format.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_query_duration_seconds Query execution time by statement fingerprint.",
+            f"# TYPE {prefix}_query_duration_seconds histogram",
+        ]
+        for fingerprint, stats in snapshot["statements"].items():
+            lines.extend(_histogram_lines(f"{prefix}_query_duration_seconds", stats["latency"], f'fingerprint="{fingerprint}"'))
+        lines.append(f"# HELP {prefix}_query_rows_total Rows returned or affected by statement fingerprint.")
+        lines.append(f"# TYPE {prefix}_query_rows_total counter")
+        for fingerprint, stats in snapshot["statements"].items():
+            lines.append(f'{prefix}_query_rows_total{{fingerprint="{fingerprint}"}} {stats["rows"]}')
+        lines.append(f"# HELP {prefix}_query_errors_total Failed executions by statement fingerprint.")
+        lines.append(f"# TYPE {prefix}_query_errors_total counter")
+        for fingerprint, stats in snapshot["statements"].items():
+            lines.append(f'{prefix}_query_errors_total{{fingerprint="{fingerprint}"}} {stats["errors"]}')
+        lines.append(f"# HELP {prefix}_query_info Normalized statement of each fingerprint.")
+        lines.append(f"# TYPE {prefix}_query_info gauge")
+        for fingerprint, stats in snapshot["statements"].items():
+            statement = _escape_label(stats["statement"][:MAX_STATEMENT_LABEL_LENGTH])
+            lines.append(f'{prefix}_query_info{{fingerprint="{fingerprint}",statement="{statement}"}} 1')
+        lines.append(f"# HELP {prefix}_pool_checkout_wait_seconds Time spent waiting for a pooled connection.")
+        lines.append(f"# TYPE {prefix}_pool_checkout_wait_seconds histogram")
+        lines.extend(_histogram_lines(f"{prefix}_pool_checkout_wait_seconds", snapshot["pool_checkout_wait"]))
+        for key, value in (pool_status or {}).items():
+            lines.append(f"# TYPE {prefix}_pool_{key} gauge")
+            lines.append(f"{prefix}_pool_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, histogram: dict, labels: str = "") -> List[str]:
+    separator = "," if labels else ""
+    lines = [
+        f'{name}_bucket{{{labels}{separator}le="{bound}"}} {count}'
+        for bound, count in histogram["buckets"].items()
+    ]
+    lines.append(f'{name}_bucket{{{labels}{separator}le="+Inf"}} {histogram["count"]}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {histogram['sum']}")
+    lines.append(f"{name}_count{suffix} {histogram['count']}")
+    return lines
+
+
+def timed_pool_class(pool_class: type, metrics: QueryMetrics) -> type:
+    """
+    Creates a subclass of a SQLAlchemy pool class that records checkout waits.
+
+    The wait covers the time `_do_get` takes to hand out a connection,
+    including opening a new one when the pool has spare capacity. Using a
+    subclass keeps the timing when the engine recreates its pool.
+
+    Args:
+        pool_class (type): The pool class to instrument, e.g. `QueuePool`.
+        metrics (QueryMetrics): The metrics store to record into.
+
+    Returns:
+        type: The instrumented pool class.
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return pool_class._do_get(self)
+        finally:
+            metrics.record_checkout_wait(time.perf_counter() - start)
+
+    return type(f"Timed{pool_class.__name__}", (pool_class,), {"_do_get": _do_get})
@@ -0,0 +1,365 @@
+"""
+Background refresh of materialized views for GEMINI.
+
+Reads of a `MaterializedViewBaseModel` never refresh the view themselves.
+Instead, writes to the tables a view depends on mark it as dirty, and a
+daemon thread refreshes dirty views so that none of them lags behind its
+base tables by more than its configured maximum staleness. Views with a
+unique index are refreshed with `REFRESH MATERIALIZED VIEW CONCURRENTLY`,
+so readers keep seeing the previous contents while the refresh runs.
+
+Dirtiness is tracked in the database: statement-level triggers on the
+tables listed in a view's `__depends_on__` send a notification on every
+write, whichever process or SQL function made it, and the refresher
+LISTENs for them. Views that cannot be tracked this way, because they do
+not declare their dependencies, the triggers could not be installed or
+the listening connection is down, are refreshed every time their maximum
+staleness has passed.
+"""
+
+import re
+import time
+import select
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, text
+
+logger = logging.getLogger(__name__)
+
+# Matches the target table of statements that modify data
+WRITE_STATEMENT_PATTERN = re.compile(
+    r'^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|COPY)\s+(?:"?\w+"?\.)?"?(\w+)"?',
+    re.IGNORECASE
+)
+
+# Channel the dependency triggers notify, with the written table's name as payload
+NOTIFY_CHANNEL = "gemini_view_dependencies"
+NOTIFY_FUNCTION = "notify_view_dependency_change"
+NOTIFY_TRIGGER = "trg_notify_view_dependency_change"
+
+# Longest wait on the listening connection before checking for wakeups
+LISTEN_POLL_INTERVAL = 1.0
+
+
+class _ViewState:
+    """
+    Refresh bookkeeping for a single materialized view.
+    """
+
+    def __init__(self, view_model: Any, max_staleness: float):
+        self.view_model = view_model
+        self.name = view_model.__table__.fullname
+        self.schema = view_model.__table__.schema or "public"
+        self.depends_on = set(getattr(view_model, "__depends_on__", ()) or ())
+        self.max_staleness = max_staleness
+        self.dirty_since: Optional[float] = None
+        self.last_refreshed: Optional[float] = None
+        self.concurrently: Optional[bool] = None
+        self.refreshing = False
+        # Whether triggers notify writes to every dependency, None until installed
+        self.triggers_installed: Optional[bool] = None
+
+
+class MaterializedViewRefresher:
+    """
+    Keeps registered materialized views within their maximum staleness.
+
+    Features:
+    - Dirty tracking from database triggers on each view's dependencies, for writes from any process
+    - Dirty tracking from writes executed through the database engine
+    - Periodic refresh of views whose writes cannot be tracked
+    - Refreshes coalesced per view, at most one running at a time
+    - CONCURRENTLY refreshes for views with a unique index
+    - Daemon thread started on first registration
+    """
+
+    def __init__(self, database_engine: Any, max_staleness: float = 60.0):
+        """
+        Initialize the refresher.
+
+        Args:
+            database_engine (DatabaseEngine): The engine used to listen for writes and run refreshes.
+            max_staleness (float): Default number of seconds a view may lag behind its base tables.
+        """
+        self.database_engine = database_engine
+        self.max_staleness = max_staleness
+        self._views: Dict[str, _ViewState] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listening = False
+        self._listen_connection: Optional[Any] = None
+        self._listen_retry_at = 0.0
+
+    def register(self, view_model: Any) -> None:
+        """
+        Starts tracking a materialized view model. Registering twice is a no-op.
+
+        A newly registered view is considered dirty, since it may not have been
+        refreshed since the last writes to its base tables.
+
+        Args:
+            view_model: The `MaterializedViewBaseModel` subclass to track.
+        """
+        name = view_model.__table__.fullname
+        if name in self._views:
+            return
+        with self._lock:
+            if name in self._views:
+                return
+            max_staleness = getattr(view_model, "__max_staleness__", None) or self.max_staleness
+            state = _ViewState(view_model, max_staleness)
+            state.dirty_since = time.monotonic()
+            self._views[name] = state
+            if not self._listening:
+                # Writes made through async sessions run on the async engine's sync core
+                for engine in (self.database_engine.get_engine(), self.database_engine.get_async_engine().sync_engine):
+                    event.listen(engine, "after_cursor_execute", self._on_cursor_execute)
+                self._listening = True
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="gemini-view-refresher", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def mark_dirty(self, table_name: str) -> None:
+        """
+        Marks every view depending on a table as dirty.
+
+        Views that do not declare their dependencies are marked dirty by writes to any table.
+
+        Args:
+            table_name (str): The unqualified name of the table that was written to.
+        """
+        now = time.monotonic()
+        for state in list(self._views.values()):
+            if state.depends_on and table_name not in state.depends_on:
+                continue
+            if state.dirty_since is None:
+                state.dirty_since = now
+                self._wakeup.set()
+
+    def refresh(self, view_model: Any, concurrently: Optional[bool] = None) -> None:
+        """
+        Refreshes a view synchronously.
+
+        Args:
+            view_model: The `MaterializedViewBaseModel` subclass to refresh.
+            concurrently (bool, optional): Force or disable a concurrent refresh. Detected from the view's indexes if None.
+        """
+        self.register(view_model)
+        self._refresh_state(self._views[view_model.__table__.fullname], concurrently)
+
+    def status(self) -> Dict[str, dict]:
+        """
+        Retrieves the refresh state of every registered view.
+
+        Returns:
+            dict: For each view, whether it is dirty, refreshing, refreshed concurrently, tracked through database triggers and how many seconds ago it was last refreshed.
+        """
+        now = time.monotonic()
+        return {
+            name: {
+                "dirty": state.dirty_since is not None,
+                "refreshing": state.refreshing,
+                "concurrently": state.concurrently,
+                "tracked": self._is_tracked(state),
+                "max_staleness": state.max_staleness,
+                "seconds_since_refresh": None if state.last_refreshed is None else now - state.last_refreshed
+            }
+            for name, state in self._views.items()
+        }
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish.
+        """
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _on_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        match = WRITE_STATEMENT_PATTERN.match(statement)
+        if match:
+            self.mark_dirty(match.group(1))
+
+    def _is_tracked(self, state: _ViewState) -> bool:
+        # Notifications only cover writes while the listening connection is open
+        return bool(state.triggers_installed) and self._listen_connection is not None
+
+    def _install_triggers(self, state: _ViewState) -> bool:
+        if not state.depends_on:
+            return False
+        schema = state.schema
+        try:
+            with self.database_engine.get_session() as session:
+                function_exists = session.execute(
+                    text("SELECT to_regprocedure(:signature) IS NOT NULL"),
+                    {"signature": f"{schema}.{NOTIFY_FUNCTION}()"}
+                ).scalar()
+                if not function_exists:
+                    session.execute(text(
+                        f"CREATE OR REPLACE FUNCTION {schema}.{NOTIFY_FUNCTION}() "
+                        "RETURNS TRIGGER AS $$ "
+                        "BEGIN "
+                        f"PERFORM pg_notify('{NOTIFY_CHANNEL}', TG_TABLE_NAME); "
+                        "RETURN NULL; "
+                        "END; "
+                        "$$ LANGUAGE plpgsql"
+                    ))
+                for table_name in sorted(state.depends_on):
+                    trigger_exists = session.execute(
+                        text(
+                            "SELECT EXISTS ("
+                            "SELECT 1 FROM pg_trigger t "
+                            "JOIN pg_class c ON c.oid = t.tgrelid "
+                            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                            "WHERE n.nspname = :schema AND c.relname = :table_name AND t.tgname = :trigger)"
+                        ),
+                        {"schema": schema, "table_name": table_name, "trigger": NOTIFY_TRIGGER}
+                    ).scalar()
+                    if not trigger_exists:
+                        session.execute(text(
+                            f"CREATE OR REPLACE TRIGGER {NOTIFY_TRIGGER} "
+                            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {schema}.{table_name} "
+                            f"FOR EACH STATEMENT EXECUTE FUNCTION {schema}.{NOTIFY_FUNCTION}()"
+                        ))
+            return True
+        except Exception as e:
+            logger.warning(
+                "Could not install write triggers for materialized view %s, refreshing it every %s seconds instead: %s",
+                state.name, state.max_staleness, str(e)
+            )
+            return False
+
+    def _listen(self) -> Optional[Any]:
+        if self._listen_connection is not None:
+            return self._listen_connection
+        if not any(state.triggers_installed for state in self._views.values()):
+            return None
+        if time.monotonic() < self._listen_retry_at:
+            return None
+        try:
+            connection = self.database_engine.get_engine().raw_connection()
+            # Keep the listening connection out of the pool, it stays open for the life of the thread
+            connection.detach()
+            driver_connection = connection.driver_connection
+            driver_connection.autocommit = True
+            with driver_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        except Exception as e:
+            logger.warning("Could not listen for materialized view dependency writes: %s", str(e))
+            self._listen_retry_at = time.monotonic() + self.max_staleness
+            return None
+        self._listen_connection = driver_connection
+        # Writes made while nobody was listening were not notified
+        for state in list(self._views.values()):
+            if state.triggers_installed and state.dirty_since is None:
+                state.dirty_since = time.monotonic()
+        return driver_connection
+
+    def _close_listener(self) -> None:
+        connection, self._listen_connection = self._listen_connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        connection = self._listen()
+        if connection is None:
+            self._wakeup.wait(timeout)
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._wakeup.is_set():
+            wait = LISTEN_POLL_INTERVAL if deadline is None else min(deadline - time.monotonic(), LISTEN_POLL_INTERVAL)
+            if wait <= 0:
+                return
+            try:
+                if select.select([connection], [], [], wait)[0]:
+                    connection.poll()
+                    while connection.notifies:
+                        self.mark_dirty(connection.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning("Lost the connection listening for materialized view dependency writes: %s", str(e))
+                self._close_listener()
+                return
+
+    def _supports_concurrent_refresh(self, state: _ViewState) -> bool:
+        schema, _, name = state.name.rpartition(".")
+        query = text(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :name "
+            "AND i.indisunique AND i.indpred IS NULL)"
+        )
+        with self.database_engine.get_session() as session:
+            return bool(session.execute(query, {"schema": schema or "public", "name": name}).scalar())
+
+    def _refresh_state(self, state: _ViewState, concurrently: Optional[bool] = None) -> None:
+        if concurrently is None:
+            if state.concurrently is None:
+                state.concurrently = self._supports_concurrent_refresh(state)
+            concurrently = state.concurrently
+        # Writes that land while the refresh runs mark the view dirty again
+        state.dirty_since = None
+        state.refreshing = True
+        try:
+            with self.database_engine.get_session() as session:
+                session.execute(text(
+                    f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{state.name}"
+                ))
+            state.last_refreshed = time.monotonic()
+        except Exception:
+            if state.dirty_since is None:
+                state.dirty_since = time.monotonic()
+            raise
+        finally:
+            state.refreshing = False
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                for state in list(self._views.values()):
+                    if state.triggers_installed is None:
+                        state.triggers_installed = self._install_triggers(state)
+                self._listen()
+                now = time.monotonic()
+                next_wakeup = None
+                for state in list(self._views.values()):
+                    due = None
+                    if state.dirty_since is not None:
+                        # Wait for half of the staleness budget so bursts of writes share one refresh
+                        due = state.dirty_since + state.max_staleness / 2
+                    if not self._is_tracked(state):
+                        # Writes from other processes may be missed, so never let the view outlive its budget
+                        periodic = (state.last_refreshed or now) + state.max_staleness
+                        due = periodic if due is None else min(due, periodic)
+                    if due is None:
+                        continue
+                    if due <= now:
+                        try:
+                            self._refresh_state(state)
+                        except Exception as e:
+                            logger.error("Failed to refresh materialized view %s: %s", state.name, str(e))
+                            due = now + state.max_staleness / 2
+                        else:
+                            due = None if self._is_tracked(state) else state.last_refreshed + state.max_staleness
+                    if due is not None:
+                        next_wakeup = due if next_wakeup is None else min(next_wakeup, due)
+                timeout = None if next_wakeup is None else max(next_wakeup - time.monotonic(), 0.0)
+                self._wait(timeout)
+                self._wakeup.clear()
+        finally:
+            self._close_listener()
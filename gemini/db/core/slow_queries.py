@@ -0,0 +1,275 @@
+"""
+Slow-query capture for GEMINI database engines.
+
+Capture is enabled with the GEMINI_DB_SLOW_QUERY_THRESHOLD setting, and
+GEMINI_DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE sets the share of slow reads
+whose plan is captured.
+
+Statements slower than the configured threshold are recorded with their
+parameters, duration, fingerprint and the GEMINI API method that issued
+them. A sampled share of slow read statements is re-run under
+`EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` on a background thread, so the
+plan is captured without delaying the caller.
+
+Records are written to the active logger provider from `gemini.logger`,
+falling back to the standard `logging` module when no provider has been
+created, and the most recent ones are kept in memory.
+"""
+
+import os
+import re
+import sys
+import json
+import queue
+import random
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Only plain reads are explained, EXPLAIN ANALYZE executes the statement again
+EXPLAINABLE_STATEMENT_PATTERN = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+MODIFYING_STATEMENT_PATTERN = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b|\bFOR\s+UPDATE\b", re.IGNORECASE)
+
+# Longest parameter representation kept in a record
+MAX_PARAMETER_LENGTH = 200
+MAX_PARAMETERS = 50
+
+_API_PATH = os.sep + os.path.join("gemini", "api") + os.sep
+_REST_API_PATH = os.sep + os.path.join("gemini", "rest_api") + os.sep
+
+
+def find_calling_method(frame: Optional[Any] = None) -> Optional[str]:
+    """
+    Finds the GEMINI API method that issued the current statement.
+
+    Walks up the stack to the innermost frame in `gemini.api`, falling back to `gemini.rest_api`.
+
+    Args:
+        frame (frame, optional): The frame to start from. Defaults to the caller's frame.
+
+    Returns:
+        str: The qualified name of the method, e.g. "gemini.api.sensor.Sensor.search_records", or None if not found.
+    """
+    frame = frame or sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _API_PATH in filename:
+            return f"{frame.f_globals.get('__name__', '')}.{frame.f_code.co_qualname}"
+        if fallback is None and _REST_API_PATH in filename:
+            fallback = f"{frame.f_globals.get('__name__', '')}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback
+
+
+def summarize_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Converts statement parameters into a bounded, JSON serializable form.
+
+    Args:
+        parameters: The parameters as passed to the driver.
+        executemany (bool): Whether the parameters are a batch of parameter sets.
+
+    Returns:
+        The parameters with long values truncated. For batches, only the first set and the batch size are kept.
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {
+            "batch_size": len(parameters),
+            "first": summarize_parameters(parameters[0]) if parameters else None
+        }
+    if isinstance(parameters, dict):
+        items = list(parameters.items())[:MAX_PARAMETERS]
+        return {str(key): _summarize_value(value) for key, value in items}
+    if isinstance(parameters, (list, tuple)):
+        return [_summarize_value(value) for value in parameters[:MAX_PARAMETERS]]
+    return _summarize_value(parameters)
+
+
+def _summarize_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > MAX_PARAMETER_LENGTH:
+        text = text[:MAX_PARAMETER_LENGTH] + f"... ({len(text)} chars)"
+    return text
+
+
+class SlowQueryRecorder:
+    """
+    Records statements that exceed a duration threshold.
+
+    Features:
+    - Parameters, duration, fingerprint and calling API method per record
+    - Sampled EXPLAIN (ANALYZE, BUFFERS) plans for slow reads
+    - Plans captured on a background thread with its own connection
+    - Output to the `gemini.logger` providers
+    """
+
+    def __init__(
+        self,
+        database_engine: Any,
+        threshold: Optional[float] = None,
+        explain_sample_rate: float = 0.0,
+        max_records: int = 100,
+        logger_provider: Optional[Any] = None
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            database_engine (DatabaseEngine): The engine whose statements are recorded, used to run EXPLAIN.
+            threshold (float, optional): Duration in seconds above which a statement is recorded. Disabled if None.
+            explain_sample_rate (float): Share of slow reads, between 0 and 1, to capture a plan for.
+            max_records (int): Number of recent records kept in memory. Defaults to 100.
+            logger_provider (LoggerProvider, optional): Provider to write records to. Defaults to the active `LoggerFactory` provider.
+        """
+        self.database_engine = database_engine
+        self.threshold = threshold
+        self.explain_sample_rate = explain_sample_rate
+        self.logger_provider = logger_provider
+        self._records: Deque[dict] = deque(maxlen=max_records)
+        self._explain_queue: "queue.Queue[dict]" = queue.Queue(maxsize=100)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold is not None and self.threshold > 0
+
+    def set_logger_provider(self, logger_provider: Optional[Any]) -> None:
+        """
+        Sets the logger provider records are written to.
+
+        Args:
+            logger_provider (LoggerProvider, optional): The provider, or None to use the active `LoggerFactory` provider.
+        """
+        self.logger_provider = logger_provider
+
+    def observe(self, statement: str, parameters: Any, seconds: float, executemany: bool = False) -> Optional[dict]:
+        """
+        Records a statement if it exceeded the threshold.
+
+        Args:
+            statement (str): The SQL statement as sent to the driver.
+            parameters: The parameters as sent to the driver.
+            seconds (float): The execution time in seconds.
+            executemany (bool): Whether the statement ran for a batch of parameter sets.
+
+        Returns:
+            dict: The record, or None if the statement was not slow.
+        """
+        if not self.enabled or seconds < self.threshold:
+            return None
+        fingerprint, normalized = self.database_engine.metrics.fingerprint(statement)
+        record = {
+            "fingerprint": fingerprint,
+            "statement": statement,
+            "normalized_statement": normalized,
+            "parameters": summarize_parameters(parameters, executemany),
+            "duration": seconds,
+            "threshold": self.threshold,
+            "caller": find_calling_method(sys._getframe(1)),
+            "timestamp": datetime.now().isoformat(),
+            "plan": None
+        }
+        self._records.append(record)
+        if self._should_explain(statement, executemany):
+            try:
+                self._explain_queue.put_nowait({"record": record, "parameters": parameters})
+                self._ensure_worker()
+                return record
+            except queue.Full:
+                pass
+        self._emit(record)
+        return record
+
+    def recent(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Retrieves the most recent slow-query records, newest first.
+
+        Args:
+            limit (int, optional): The maximum number of records to return.
+
+        Returns:
+            list: The records.
+        """
+        records = list(reversed(self._records))
+        return records[:limit] if limit is not None else records
+
+    def explain(self, statement: str, parameters: Any = None) -> Optional[Any]:
+        """
+        Runs `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` for a statement on a separate connection.
+
+        The statement is executed again and its transaction rolled back.
+
+        Args:
+            statement (str): The SQL statement in the synchronous driver's parameter style.
+            parameters: The parameters for the statement.
+
+        Returns:
+            The JSON plan, or None if it could not be captured.
+        """
+        connection = self.database_engine.get_engine().raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters or None)
+                plan = cursor.fetchone()[0]
+            finally:
+                cursor.close()
+                connection.rollback()
+            return json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as e:
+            logger.debug("Failed to explain slow query: %s", str(e))
+            return None
+        finally:
+            connection.close()
+
+    def _should_explain(self, statement: str, executemany: bool) -> bool:
+        if executemany or self.explain_sample_rate <= 0:
+            return False
+        if not EXPLAINABLE_STATEMENT_PATTERN.match(statement) or MODIFYING_STATEMENT_PATTERN.search(statement):
+            return False
+        return random.random() < self.explain_sample_rate
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="gemini-slow-query-explain", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._explain_queue.get()
+            record = item["record"]
+            # Statements from the async engine use the asyncpg parameter style, which psycopg2 cannot bind
+            if "$1" not in record["statement"]:
+                record["plan"] = self.explain(record["statement"], item["parameters"])
+            self._emit(record)
+            self._explain_queue.task_done()
+
+    def _emit(self, record: dict) -> None:
+        message = f"Slow query ({record['duration']:.3f}s) from {record['caller'] or 'unknown caller'}"
+        provider = self.logger_provider or _active_logger_provider()
+        if provider is not None:
+            try:
+                provider.warning(message, extra={"slow_query": record})
+                return
+            except Exception as e:
+                logger.debug("Failed to write slow query to logger provider: %s", str(e))
+        logger.warning("%s: %s", message, json.dumps(record, default=str))
+
+
+def _active_logger_provider() -> Optional[Any]:
+    # Imported lazily, the logger providers pull in redis
+    factory = sys.modules.get("gemini.logger.factory.logger_factory")
+    if factory is None:
+        return None
+    return factory.LoggerFactory.get_active_provider()
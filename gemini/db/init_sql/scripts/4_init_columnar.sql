@@ -38,6 +38,7 @@ ALTER TABLE gemini.dataset_records ADD CONSTRAINT dataset_records_unique UNIQUE
 );
 
 CREATE INDEX dataset_records_record_info_idx ON gemini.dataset_records USING GIN (record_info);
+CREATE INDEX dataset_records_timestamp_id_idx ON gemini.dataset_records (timestamp, id);
 ------------------------------------------------------------------------------
 -- Sensor Records Table
 ------------------------------------------------------------------------------
@@ -85,6 +86,7 @@ ALTER TABLE gemini.sensor_records ADD CONSTRAINT sensor_records_unique UNIQUE NU
 );
 
 CREATE INDEX sensor_records_record_info_idx ON gemini.sensor_records USING GIN (record_info);
+CREATE INDEX sensor_records_timestamp_id_idx ON gemini.sensor_records (timestamp, id);
 
 ------------------------------------------------------------------------------
 -- Trait Records Table
@@ -132,6 +134,7 @@ ALTER TABLE gemini.trait_records ADD CONSTRAINT trait_records_unique UNIQUE NULL
 );
 
 CREATE INDEX trait_records_record_info_idx ON gemini.trait_records USING GIN (record_info);
+CREATE INDEX trait_records_timestamp_id_idx ON gemini.trait_records (timestamp, id);
 
 ------------------------------------------------------------------------------
 -- Procedure Records Table
@@ -172,6 +175,7 @@ ALTER TABLE gemini.procedure_records ADD CONSTRAINT procedure_records_unique UNI
 );
 
 CREATE INDEX procedure_records_record_info_idx ON gemini.procedure_records USING GIN (record_info);
+CREATE INDEX procedure_records_timestamp_id_idx ON gemini.procedure_records (timestamp, id);
 
 ------------------------------------------------------------------------------
 -- Script Records Table
@@ -212,6 +216,7 @@ ALTER TABLE gemini.script_records ADD CONSTRAINT script_records_unique UNIQUE NU
 );
 
 CREATE INDEX script_records_record_info_idx ON gemini.script_records USING GIN (record_info);
+CREATE INDEX script_records_timestamp_id_idx ON gemini.script_records (timestamp, id);
 ------------------------------------------------------------------------------
 -- Model Records Table
 ------------------------------------------------------------------------------
@@ -251,4 +256,5 @@ ALTER TABLE gemini.model_records ADD CONSTRAINT model_records_unique UNIQUE NULL
 );
 
 CREATE INDEX model_records_record_info_idx ON gemini.model_records USING GIN (record_info);
+CREATE INDEX model_records_timestamp_id_idx ON gemini.model_records (timestamp, id);
 
@@ -682,31 +682,37 @@ SET max_parallel_workers = 1;
 -- Sensor Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.sensor_records_immv', 'select * from gemini.sensor_records');
+CREATE INDEX sensor_records_immv_timestamp_id_idx ON gemini.sensor_records_immv (timestamp, id);
 
 -------------------------------------------------------------------------------
 -- Trait Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.trait_records_immv', 'select * from gemini.trait_records');
+CREATE INDEX trait_records_immv_timestamp_id_idx ON gemini.trait_records_immv (timestamp, id);
 
 -------------------------------------------------------------------------------
 -- Procedure Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.procedure_records_immv', 'select * from gemini.procedure_records');
+CREATE INDEX procedure_records_immv_timestamp_id_idx ON gemini.procedure_records_immv (timestamp, id);
 
 -------------------------------------------------------------------------------
 -- Script Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.script_records_immv', 'select * from gemini.script_records');
+CREATE INDEX script_records_immv_timestamp_id_idx ON gemini.script_records_immv (timestamp, id);
 
 -------------------------------------------------------------------------------
 -- Model Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.model_records_immv', 'select * from gemini.model_records');
+CREATE INDEX model_records_immv_timestamp_id_idx ON gemini.model_records_immv (timestamp, id);
 
 -------------------------------------------------------------------------------
 -- Dataset Records IMMV
 -------------------------------------------------------------------------------
 SELECT pgivm.create_immv('gemini.dataset_records_immv', 'select * from gemini.dataset_records');
+CREATE INDEX dataset_records_immv_timestamp_id_idx ON gemini.dataset_records_immv (timestamp, id);
 
 
 SET max_parallel_workers = DEFAULT;
@@ -133,6 +133,11 @@ DECLARE
     sea_id UUID;
     sit_id UUID;
 BEGIN
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the dataset, experiment, season, and site are valid
     IF NOT gemini.check_dataset_validity(NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid dataset, experiment, season, or site combination';
@@ -222,6 +227,11 @@ DECLARE
     sea_id UUID;
     sit_id UUID;
 BEGIN
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the procedure, dataset, experiment, season, and site are valid
     IF NOT gemini.check_procedure_validity(NEW.procedure_name, NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid procedure, dataset, experiment, season, or site combination';
@@ -311,6 +321,11 @@ DECLARE
     sea_id UUID;
     sit_id UUID;
 BEGIN
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the script, dataset, experiment, season, and site are valid
     IF NOT gemini.check_script_validity(NEW.script_name, NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid script, dataset, experiment, season, or site combination';
@@ -401,6 +416,11 @@ DECLARE
     sit_id UUID;
 BEGIN
     
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the model, dataset, experiment, season, and site are valid
     IF NOT gemini.check_model_validity(NEW.model_name, NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid model, dataset, experiment, season, or site combination';
@@ -516,6 +536,11 @@ DECLARE
     sit_id UUID;
     pl_id UUID;
 BEGIN
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the sensor, dataset, experiment, season, and site are valid
     IF NOT gemini.check_sensor_validity(NEW.sensor_name, NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid sensor, dataset, experiment, season, or site combination';
@@ -623,6 +648,11 @@ DECLARE
     sit_id UUID;
     pl_id UUID;
 BEGIN
+    -- Rows of a batch whose IDs were resolved set-based by the client skip the per-row lookups
+    IF current_setting('gemini.record_id_resolution', true) = 'batch' THEN
+        RETURN NEW;
+    END IF;
+
     -- Check if the trait, dataset, experiment, season, and site are valid
     IF NOT gemini.check_trait_validity(NEW.trait_name, NEW.dataset_name, NEW.experiment_name, NEW.season_name, NEW.site_name) THEN
         RAISE EXCEPTION 'Invalid trait, dataset, experiment, season, or site combination';
@@ -6,7 +6,7 @@ from sqlalchemy.orm import relationship, mapped_column, Mapped, Relationship
 from sqlalchemy import UUID, JSON, String, Integer, UniqueConstraint, Index, ForeignKey, TIMESTAMP, DATE
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import text, bindparam
-from gemini.db.core.base import ColumnarBaseModel, db_engine
+from gemini.db.core.base import ColumnarBaseModel, get_db_engine
 import uuid
 from datetime import datetime, date
 from typing import Optional, List
@@ -36,6 +36,9 @@ class ProcedureRecordModel(ColumnarBaseModel):
     """
 
     __tablename__ = "procedure_records"
+    __validity_function__ = "check_procedure_validity"
+    __validity_columns__ = ("procedure_name", "dataset_name", "experiment_name", "season_name", "site_name")
+    __entity_lookup__ = ("procedure_id", "procedures", "procedure_name")
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=False), primary_key=True, default=uuid.uuid4)
     timestamp: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
@@ -105,7 +108,7 @@ class ProcedureRecordModel(ColumnarBaseModel):
             bindparam('season_names', value=season_names),
             bindparam('site_names', value=site_names)
         )
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(stmt, execution_options={"yield_per": 1000})
             for record in result:
                 yield record
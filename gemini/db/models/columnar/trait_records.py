@@ -17,7 +17,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import text, bindparam
-from gemini.db.core.base import ColumnarBaseModel, db_engine
+from gemini.db.core.base import ColumnarBaseModel, get_db_engine
 import uuid
 from datetime import datetime, date
 from typing import Optional, List
@@ -51,6 +51,10 @@ class TraitRecordModel(ColumnarBaseModel):
     """
 
     __tablename__ = "trait_records"
+    __validity_function__ = "check_trait_validity"
+    __validity_columns__ = ("trait_name", "dataset_name", "experiment_name", "season_name", "site_name")
+    __entity_lookup__ = ("trait_id", "traits", "trait_name")
+    __has_plot__ = True
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=False), primary_key=True, default=uuid.uuid4)
     timestamp: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
@@ -143,7 +147,7 @@ class TraitRecordModel(ColumnarBaseModel):
             bindparam("site_names", value=site_names)
         )
 
-        with db_engine.get_session() as session:
+        with get_db_engine().get_session() as session:
             result = session.execute(stmt, execution_options={"yield_per": 1000})
             for record in result:
                 yield record
@@ -9,6 +9,7 @@ from datetime import datetime, date
 class DatasetRecordsIMMVModel(BaseModel):
 
     __tablename__ = 'dataset_records_immv'
+    __pagination_keys__ = ('timestamp', 'id')
 
     id : Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     timestamp : Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.now)
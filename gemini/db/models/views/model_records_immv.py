@@ -9,6 +9,7 @@ from datetime import datetime, date
 class ModelRecordsIMMVModel(BaseModel):
 
     __tablename__ = 'model_records_immv'
+    __pagination_keys__ = ('timestamp', 'id')
 
     id : Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     timestamp : Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.now)
@@ -0,0 +1,72 @@
+"""
+Measures how long it takes to import the GEMINI library in a fresh interpreter
+and checks that importing it creates no database engine, MinIO client or
+upload folders. Those are created lazily on first use.
+
+Runs without a GEMINI pipeline. Exits with a non-zero status if an import is
+slower than --max-seconds or has side effects, so it can guard against
+regressions in CI.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "gemini.db.core.base",
+    "gemini.api.sensor_record",
+    "gemini.rest_api.controllers.files",
+]
+
+# Runs in the child interpreter, prints the import time and any eagerly created resources
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+import gemini.db.core.base as db_base
+import gemini.api.base as api_base
+import gemini.rest_api.file_handler as file_handler
+created = [
+    name for name, value in (
+        ("database engine", db_base._db_engine),
+        ("MinIO storage provider", api_base._minio_storage_provider),
+        ("API file handler", file_handler._api_file_handler),
+    ) if value is not None
+]
+print(elapsed)
+print(",".join(created))
+"""
+
+def time_import(module: str) -> tuple:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    elapsed, created = result.stdout.splitlines()[-2:]
+    return float(elapsed), [name for name in created.split(",") if name]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="Maximum median import time per module")
+    args = parser.parse_args()
+
+    failed = False
+    for module in MODULES:
+        timings = []
+        created = []
+        for _ in range(args.runs):
+            elapsed, created = time_import(module)
+            timings.append(elapsed)
+        median = statistics.median(timings)
+        print(f"{module:<40} median {median * 1000:8.1f} ms  min {min(timings) * 1000:8.1f} ms")
+        if median > args.max_seconds:
+            print(f"  slower than {args.max_seconds}s")
+            failed = True
+        if created:
+            print(f"  created at import time: {', '.join(created)}")
+            failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,71 @@
+"""
+Compares the throughput of the two bulk ingest paths for sensor records:
+the executemany INSERT used by `insert_bulk` and the COPY based `copy_bulk`.
+Then compares the API entry points, `Sensor.insert_records`, which builds
+a SensorRecord per row, and the column based `Sensor.insert_record_columns`.
+
+Requires a running GEMINI pipeline with the example data loaded
+(Sensor A1, Experiment A, Site A1, Season 1A).
+"""
+import time
+from datetime import datetime, timedelta
+
+from gemini.api.sensor import Sensor
+from gemini.db.models.columnar.sensor_records import SensorRecordModel
+
+N_RECORDS = 50000
+
+def generate_rows(n: int, start: datetime) -> list:
+    rows = []
+    for i in range(n):
+        timestamp = start + timedelta(seconds=i)
+        rows.append({
+            "timestamp": timestamp,
+            "collection_date": timestamp.date(),
+            "sensor_name": "Sensor A1",
+            "dataset_name": "Sensor A1 Benchmark Dataset",
+            "sensor_data": {"value": i},
+            "experiment_name": "Experiment A",
+            "site_name": "Site A1",
+            "season_name": "Season 1A",
+            "plot_number": 1,
+            "plot_row_number": 1,
+            "plot_column_number": 1,
+            "record_info": {"benchmark": True}
+        })
+    return rows
+
+def run(name: str, insert_method, rows: list) -> None:
+    start = time.perf_counter()
+    inserted_ids = insert_method('sensor_records_unique', rows)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {len(inserted_ids):>8} rows in {elapsed:8.2f}s  ({len(inserted_ids) / elapsed:,.0f} rows/s)")
+    SensorRecordModel.delete_bulk(inserted_ids)
+
+def run_api(name: str, insert_method, start: datetime) -> None:
+    timestamps = [start + timedelta(seconds=i) for i in range(N_RECORDS)]
+    begin = time.perf_counter()
+    _, inserted_ids = insert_method(
+        timestamps=timestamps,
+        sensor_data=[{"value": i} for i in range(N_RECORDS)],
+        dataset_name="Sensor A1 Benchmark Dataset",
+        experiment_name="Experiment A",
+        season_name="Season 1A",
+        site_name="Site A1",
+        plot_numbers=[1] * N_RECORDS,
+        plot_row_numbers=[1] * N_RECORDS,
+        plot_column_numbers=[1] * N_RECORDS,
+        use_copy=True
+    )
+    elapsed = time.perf_counter() - begin
+    print(f"{name:<24} {len(inserted_ids):>8} rows in {elapsed:8.2f}s  ({len(inserted_ids) / elapsed:,.0f} rows/s)")
+    SensorRecordModel.delete_bulk(inserted_ids)
+
+if __name__ == "__main__":
+    # Use distinct timestamps per run so neither path hits conflicts from the other
+    run("insert_bulk", SensorRecordModel.insert_bulk, generate_rows(N_RECORDS, datetime(2000, 1, 1)))
+    run("copy_bulk", SensorRecordModel.copy_bulk, generate_rows(N_RECORDS, datetime(2001, 1, 1)))
+
+    sensor = Sensor.get(sensor_name="Sensor A1", experiment_name="Experiment A")
+    run_api("insert_records", lambda use_copy, **columns: sensor.insert_records(**columns), datetime(2002, 1, 1))
+    run_api("insert_record_columns", sensor.insert_record_columns, datetime(2003, 1, 1))
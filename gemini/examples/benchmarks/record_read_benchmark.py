@@ -0,0 +1,44 @@
+"""
+Compares the read throughput of sensor record searches with and without
+`lightweight=True`, for the Python API and for the NDJSON encoding done by
+the REST API streaming endpoints.
+
+Requires a running GEMINI pipeline with the example data loaded
+(Sensor A1, Experiment A). Run record_insert_benchmark.py first for a
+larger data set.
+"""
+import argparse
+import time
+
+from litestar.serialization import encode_json
+
+from gemini.api.sensor import Sensor
+
+def read(sensor: Sensor, lightweight: bool, encode: bool, limit: int) -> int:
+    count = 0
+    for record in sensor.search_records(experiment_name="Experiment A", lightweight=lightweight):
+        if encode:
+            encode_json(record.model_dump(exclude_none=True))
+        count += 1
+        if count >= limit:
+            break
+    return count
+
+def run(name: str, sensor: Sensor, lightweight: bool, encode: bool, limit: int) -> None:
+    start = time.perf_counter()
+    count = read(sensor, lightweight, encode, limit)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {count:>8} rows in {elapsed:8.2f}s  ({count / elapsed:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=100000, help="Maximum number of records to read per run")
+    args = parser.parse_args()
+
+    sensor = Sensor.get(sensor_name="Sensor A1")
+    # Warm up the connection pool and the database cache
+    read(sensor, lightweight=True, encode=False, limit=1000)
+    run("validated", sensor, lightweight=False, encode=False, limit=args.limit)
+    run("lightweight", sensor, lightweight=True, encode=False, limit=args.limit)
+    run("validated + ndjson", sensor, lightweight=False, encode=True, limit=args.limit)
+    run("lightweight + ndjson", sensor, lightweight=True, encode=True, limit=args.limit)
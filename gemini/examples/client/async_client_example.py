@@ -0,0 +1,59 @@
+import asyncio
+import os
+from datetime import datetime
+
+from gemini.client import GEMINIClient
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+sample_images = os.path.join(current_dir, "..", "api", "sample_images")
+
+
+async def main():
+    async with GEMINIClient("http://localhost:8000", max_concurrency=16) as client:
+
+        # Search sensors of an experiment
+        sensors = await client.sensors.search(experiment_name="Experiment A")
+        print(f"Found {len(sensors)} sensors")
+        sensor = sensors[0]
+
+        # Associated experiments and datasets
+        experiments, datasets = await asyncio.gather(
+            client.sensors.related(sensor.id, "experiments"),
+            client.sensors.related(sensor.id, "datasets")
+        )
+        print(f"Sensor {sensor.sensor_name} is in {len(experiments)} experiments and {len(datasets)} datasets")
+
+        # Add a record
+        record = await client.sensors.add_record(
+            sensor.id,
+            timestamp=datetime.now(),
+            sensor_data={"value": 1.5},
+            dataset_name="Dataset A",
+            experiment_name="Experiment A",
+            season_name="Season 1A",
+            site_name="Site A1"
+        )
+        print(f"Added record {record.id}")
+
+        # Stream the records of the sensor, page by page
+        count = 0
+        async for record in client.sensors.search_records(sensor.id, experiment_name="Experiment A", page_size=1000):
+            count += 1
+        print(f"Streamed {count} records")
+
+        # Upload sample images concurrently
+        images = {
+            os.path.join(sample_images, file_name): f"client_example/{file_name}"
+            for file_name in os.listdir(sample_images)
+        }
+        uploaded = await client.files.upload_many(images)
+        print(f"Uploaded {sum(1 for result in uploaded if not isinstance(result, Exception))} of {len(images)} files")
+
+        # Retrieve their metadata concurrently
+        metadata = await client.files.metadata_many(f"gemini/{object_name}" for object_name in images.values())
+        for item in metadata:
+            print(item.object_name, item.size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
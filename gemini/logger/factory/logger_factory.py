@@ -112,6 +112,15 @@ class LoggerFactory:
     
         return cls._instance
 
+    @classmethod
+    def get_active_provider(cls) -> Optional[LoggerProvider]:
+        """Get the singleton provider instance without creating one.
+        
+        Returns:
+            Optional[LoggerProvider]: The provider created by get_provider(), or None
+        """
+        return cls._instance
+
     @classmethod
     def reset_provider(cls) -> None:
         """Reset the singleton provider instance.
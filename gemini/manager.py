@@ -5,7 +5,7 @@ import subprocess, os
 
 import docker
 from docker import DockerClient
-from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic import BaseModel, ConfigDict, PrivateAttr, Field
 
 from gemini.config.settings import GEMINISettings
 from gemini.logger.interfaces import logger_provider
@@ -35,10 +35,11 @@ class GEMINIManager(BaseModel):
 
     env_file_path : str = Path(__file__).parent / "pipeline" / ".env"
     compose_file_path : str = Path(__file__).parent / "pipeline" / "docker-compose.yaml"
-    docker_client: DockerClient = docker.from_env()
+    # Built per instance, so importing this module does not contact Docker or read settings
+    docker_client: DockerClient = Field(default_factory=docker.from_env)
 
     # Pipeline Settings
-    pipeline_settings: GEMINISettings = GEMINISettings()
+    pipeline_settings: GEMINISettings = Field(default_factory=GEMINISettings)
 
     docker_containers: dict[str, GEMINIContainerInfo] = {}
 
@@ -195,7 +196,11 @@ class GEMINIManager(BaseModel):
                     "GEMINI_DB_PASSWORD": current_settings.GEMINI_DB_PASSWORD,
                     "GEMINI_DB_HOSTNAME": current_settings.GEMINI_DB_HOSTNAME,
                     "GEMINI_DB_NAME": current_settings.GEMINI_DB_NAME,
-                    "GEMINI_DB_PORT": current_settings.GEMINI_DB_PORT
+                    "GEMINI_DB_PORT": current_settings.GEMINI_DB_PORT,
+                    "GEMINI_DB_RECORD_ID_RESOLUTION": current_settings.GEMINI_DB_RECORD_ID_RESOLUTION,
+                    "GEMINI_DB_MATERIALIZED_VIEW_MAX_STALENESS": current_settings.GEMINI_DB_MATERIALIZED_VIEW_MAX_STALENESS,
+                    "GEMINI_DB_SLOW_QUERY_THRESHOLD": current_settings.GEMINI_DB_SLOW_QUERY_THRESHOLD,
+                    "GEMINI_DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE": current_settings.GEMINI_DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE
                 }
             case GEMINIComponentType.LOGGER:
                 return {
@@ -216,7 +221,8 @@ class GEMINIManager(BaseModel):
                     "GEMINI_STORAGE_ROOT_PASSWORD": current_settings.GEMINI_STORAGE_ROOT_PASSWORD,
                     "GEMINI_STORAGE_ACCESS_KEY": current_settings.GEMINI_STORAGE_ACCESS_KEY,
                     "GEMINI_STORAGE_SECRET_KEY": current_settings.GEMINI_STORAGE_SECRET_KEY,
-                    "GEMINI_STORAGE_BUCKET_NAME": current_settings.GEMINI_STORAGE_BUCKET_NAME
+                    "GEMINI_STORAGE_BUCKET_NAME": current_settings.GEMINI_STORAGE_BUCKET_NAME,
+                    "GEMINI_STORAGE_PUBLIC_ENDPOINT": current_settings.GEMINI_STORAGE_PUBLIC_ENDPOINT
                 }
             case GEMINIComponentType.REST_API:
                 return {
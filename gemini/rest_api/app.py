@@ -6,6 +6,7 @@ from litestar.config.cors import CORSConfig
 from gemini.rest_api.controllers import controllers
 # from gemini.rest_api.controllers.files import file_route_handlers
 from gemini.config.settings import GEMINISettings
+from gemini.db.core.base import get_db_engine
 
 cors_config = CORSConfig(allow_origins=["*"])
 
@@ -29,6 +30,11 @@ def root_handler() -> dict:
 def settings_handler() -> dict:
     return GEMINISettings().model_dump()
 
+@get(path="/metrics", sync_to_thread=False, tags=["GEMINI"], media_type="text/plain; version=0.0.4")
+def metrics_handler() -> str:
+    db_engine = get_db_engine()
+    return db_engine.metrics.to_prometheus(pool_status=db_engine.get_pool_status())
+
 routers = []
 for key, value in controllers.items():
     router = Router(
@@ -40,4 +46,4 @@ for key, value in controllers.items():
 
 
 # Entry point for the application
-app = Litestar(route_handlers=[root_handler, settings_handler ] + routers, openapi_config=openapi_config, cors_config=cors_config)
+app = Litestar(route_handlers=[root_handler, settings_handler, metrics_handler] + routers, openapi_config=openapi_config, cors_config=cors_config)
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -13,7 +14,9 @@ from gemini.rest_api.models import (
     PlantOutput,
     RESTAPIError,
     str_to_dict,
-    JSONB
+    JSONB,
+    page_limit,
+    cursor_headers
 )
 
 from typing import List, Annotated, Optional
@@ -22,9 +25,16 @@ class CultivarController(Controller):
 
     # Get All Cultivars
     @get(path="/all")
-    async def get_all_cultivars(self) -> List[CultivarOutput]:
+    async def get_all_cultivars(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[CultivarOutput]:
         try:
-            cultivars = Cultivar.get_all()
+            if limit is not None or cursor is not None:
+                cultivars, next_cursor = await Cultivar.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=cultivars, headers=cursor_headers(next_cursor))
+            cultivars = await Cultivar.get_all_async()
             if cultivars is None:
                 error = RESTAPIError(
                     error="No cultivars found in the database",
@@ -32,6 +42,12 @@ class CultivarController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return cultivars
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all cultivars"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -46,13 +62,25 @@ class CultivarController(Controller):
         cultivar_population: Optional[str] = None,
         cultivar_accession: Optional[str] = None,
         cultivar_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[CultivarOutput]:
         try:
             if cultivar_info is not None:
                 cultivar_info = str_to_dict(cultivar_info)
 
-            cultivars = Cultivar.search(
+            if limit is not None or cursor is not None:
+                cultivars, next_cursor = await Cultivar.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    cultivar_population=cultivar_population,
+                    cultivar_accession=cultivar_accession,
+                    cultivar_info=cultivar_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=cultivars, headers=cursor_headers(next_cursor))
+            cultivars = await Cultivar.search_async(
                 cultivar_population=cultivar_population,
                 cultivar_accession=cultivar_accession,
                 cultivar_info=cultivar_info,
@@ -65,6 +93,12 @@ class CultivarController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return cultivars
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving cultivars"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -79,7 +113,7 @@ class CultivarController(Controller):
         self, cultivar_id: str
     ) -> CultivarOutput:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
@@ -100,7 +134,8 @@ class CultivarController(Controller):
         self, data: Annotated[CultivarInput, Body]
     ) -> CultivarOutput:
         try:
-            cultivar = Cultivar.create(
+            cultivar = await asyncio.to_thread(
+                Cultivar.create,
                 cultivar_population=data.cultivar_population,
                 cultivar_accession=data.cultivar_accession,
                 cultivar_info=data.cultivar_info,
@@ -126,14 +161,14 @@ class CultivarController(Controller):
         self, cultivar_id: str, data: Annotated[CultivarUpdate, Body]
     ) -> CultivarOutput:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
                     error_description="The cultivar with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            cultivar = cultivar.update(
+            cultivar = await cultivar.update_async(
                 cultivar_population=data.cultivar_population,
                 cultivar_accession=data.cultivar_accession,
                 cultivar_info=data.cultivar_info,
@@ -158,14 +193,14 @@ class CultivarController(Controller):
         self, cultivar_id: str
     ) -> None:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error_html = RESTAPIError(
                     error="Cultivar not found",
                     error_description="The cultivar with the given ID was not found"
                 ).to_html()
                 return Response(content=error_html, status_code=404)
-            is_deleted = cultivar.delete()
+            is_deleted = await cultivar.delete_async()
             if not is_deleted:
                 error_message = RESTAPIError(
                     error="Cultivar deletion failed",
@@ -186,14 +221,14 @@ class CultivarController(Controller):
         self, cultivar_id: str
     ) -> List[ExperimentOutput]:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
                     error_description="The cultivar with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = cultivar.get_associated_experiments()
+            experiments = await asyncio.to_thread(cultivar.get_associated_experiments)
             if not experiments:
                 error = RESTAPIError(
                     error="No associated experiments found",
@@ -214,14 +249,14 @@ class CultivarController(Controller):
         self, cultivar_id: str
     ) -> List[PlotOutput]:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
                     error_description="The cultivar with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plots = cultivar.get_associated_plots()
+            plots = await asyncio.to_thread(cultivar.get_associated_plots)
             if not plots:
                 error = RESTAPIError(
                     error="No associated plots found",
@@ -242,14 +277,14 @@ class CultivarController(Controller):
         self, cultivar_id: str
     ) -> List[PlantOutput]:
         try:
-            cultivar = Cultivar.get_by_id(id=cultivar_id)
+            cultivar = await Cultivar.get_by_id_async(id=cultivar_id)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
                     error_description="The cultivar with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plants = cultivar.get_associated_plants()
+            plants = await asyncio.to_thread(cultivar.get_associated_plants)
             if not plants:
                 error = RESTAPIError(
                     error="No associated plants found",
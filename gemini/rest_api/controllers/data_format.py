@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.plugins.pydantic import PydanticDTO
 from litestar.handlers import get, post, patch, delete
@@ -12,7 +13,9 @@ from gemini.rest_api.models import (
     DataTypeOutput, 
     RESTAPIError, 
     JSONB, 
-    str_to_dict
+    str_to_dict,
+    page_limit,
+    cursor_headers
 ) 
 
 from typing import List, Annotated, Optional
@@ -22,9 +25,16 @@ class DataFormatController(Controller):
 
     # Get All Data Formats
     @get(path="/all")
-    async def get_all_data_formats(self) -> List[DataFormatOutput]:
+    async def get_all_data_formats(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[DataFormatOutput]:
         try:
-            data_formats = DataFormat.get_all()
+            if limit is not None or cursor is not None:
+                data_formats, next_cursor = await DataFormat.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=data_formats, headers=cursor_headers(next_cursor))
+            data_formats = await DataFormat.get_all_async()
             if data_formats is None:
                 error = RESTAPIError(
                     error="No data formats found",
@@ -32,6 +42,12 @@ class DataFormatController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return data_formats
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all data formats"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -45,13 +61,24 @@ class DataFormatController(Controller):
         cls,
         data_format_name: Optional[str] = None,
         data_format_mime_type: Optional[str] = None,
-        data_format_info: Optional[JSONB] = None
+        data_format_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[DataFormatOutput]:
         try:
             if data_format_info is not None:
                 data_format_info = str_to_dict(data_format_info)
 
-            data_formats = DataFormat.search(
+            if limit is not None or cursor is not None:
+                data_formats, next_cursor = await DataFormat.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    data_format_name=data_format_name,
+                    data_format_mime_type=data_format_mime_type,
+                    data_format_info=data_format_info
+                )
+                return Response(content=data_formats, headers=cursor_headers(next_cursor))
+            data_formats = await DataFormat.search_async(
                 data_format_name=data_format_name,
                 data_format_mime_type=data_format_mime_type,
                 data_format_info=data_format_info
@@ -63,6 +90,12 @@ class DataFormatController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return data_formats
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving data formats"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -76,7 +109,7 @@ class DataFormatController(Controller):
         cls, data_format_id: int
     ) -> DataFormatOutput:
         try:
-            data_format = DataFormat.get_by_id(id=data_format_id)
+            data_format = await DataFormat.get_by_id_async(id=data_format_id)
             if data_format is None:
                 error = RESTAPIError(
                     error="Data format not found",
@@ -98,7 +131,8 @@ class DataFormatController(Controller):
         cls, data: Annotated[DataFormatInput, Body]
     ) -> DataFormatOutput:
         try:
-            data_format = DataFormat.create(
+            data_format = await asyncio.to_thread(
+                DataFormat.create,
                 data_format_name=data.data_format_name,
                 data_format_mime_type=data.data_format_mime_type,
                 data_format_info=data.data_format_info
@@ -123,7 +157,7 @@ class DataFormatController(Controller):
         cls, data_format_id: int, data: Annotated[DataFormatUpdate, Body]
     ) -> DataFormatOutput:
         try:
-            data_format = DataFormat.get_by_id(id=data_format_id)
+            data_format = await DataFormat.get_by_id_async(id=data_format_id)
             if data_format is None:
                 error_html = RESTAPIError(
                     error="Data format not found",
@@ -131,7 +165,7 @@ class DataFormatController(Controller):
                 ).to_html()
                 return Response(content=error_html, status_code=404)
 
-            data_format = data_format.update(
+            data_format = await data_format.update_async(
                 data_format_name=data.data_format_name,
                 data_format_mime_type=data.data_format_mime_type,
                 data_format_info=data.data_format_info
@@ -156,14 +190,14 @@ class DataFormatController(Controller):
         cls, data_format_id: int
     ) -> None:
         try:
-            data_format = DataFormat.get_by_id(id=data_format_id)
+            data_format = await DataFormat.get_by_id_async(id=data_format_id)
             if data_format is None:
                 error = RESTAPIError(
                     error="Data format not found",
                     error_description="The data format with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = data_format.delete()
+            is_deleted = await data_format.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Data Format deletion failed",
@@ -185,14 +219,14 @@ class DataFormatController(Controller):
         cls, data_format_id: int
     ) -> List[DataTypeOutput]:
         try:
-            data_format = DataFormat.get_by_id(id=data_format_id)
+            data_format = await DataFormat.get_by_id_async(id=data_format_id)
             if data_format is None:
                 error = RESTAPIError(
                     error="Data format not found",
                     error_description="The data format with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            data_types = data_format.get_associated_data_types()
+            data_types = await asyncio.to_thread(data_format.get_associated_data_types)
             if data_types is None:
                 error = RESTAPIError(
                     error="No associated data types found",
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -11,7 +12,9 @@ from gemini.rest_api.models import (
     DataFormatOutput,
     RESTAPIError, 
     JSONB, 
-    str_to_dict
+    str_to_dict,
+    page_limit,
+    cursor_headers
 )
 
 from typing import List, Annotated, Optional
@@ -20,9 +23,16 @@ class DataTypeController(Controller):
     
     # Get All Data Types
     @get(path="/all")
-    async def get_all_data_types(self) -> List[DataTypeOutput]:
+    async def get_all_data_types(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[DataTypeOutput]:
         try:
-            data_types = DataType.get_all()
+            if limit is not None or cursor is not None:
+                data_types, next_cursor = await DataType.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=data_types, headers=cursor_headers(next_cursor))
+            data_types = await DataType.get_all_async()
             if data_types is None:
                 error = RESTAPIError(
                     error="No data types found",
@@ -30,6 +40,12 @@ class DataTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return data_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all data types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -42,12 +58,22 @@ class DataTypeController(Controller):
     async def get_data_types(
         self,
         data_type_name: Optional[str] = None,
-        data_type_info: Optional[JSONB] = None
+        data_type_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[DataTypeOutput]:
         try:
             if data_type_info is not None:
                 data_type_info = str_to_dict(data_type_info)
-            data_types = DataType.search(
+            if limit is not None or cursor is not None:
+                data_types, next_cursor = await DataType.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    data_type_name=data_type_name,
+                    data_type_info=data_type_info
+                )
+                return Response(content=data_types, headers=cursor_headers(next_cursor))
+            data_types = await DataType.search_async(
                 data_type_name=data_type_name,
                 data_type_info=data_type_info
             )
@@ -58,6 +84,12 @@ class DataTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return data_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving data types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -71,7 +103,7 @@ class DataTypeController(Controller):
         self, data_type_id: int
     ) -> DataTypeOutput:
         try:
-            data_type = DataType.get_by_id(id=data_type_id)
+            data_type = await DataType.get_by_id_async(id=data_type_id)
             if data_type is None:
                 error = RESTAPIError(
                     error="Data type not found",
@@ -92,7 +124,8 @@ class DataTypeController(Controller):
         self, data: Annotated[DataTypeInput, Body]
     ) -> DataTypeOutput:
         try:
-            data_type = DataType.create(
+            data_type = await asyncio.to_thread(
+                DataType.create,
                 data_type_name=data.data_type_name,
                 data_type_info=data.data_type_info
             )
@@ -117,14 +150,14 @@ class DataTypeController(Controller):
         cls, data_type_id: int, data: Annotated[DataTypeUpdate, Body]
     ) -> DataTypeOutput:
         try:
-            data_type = DataType.get_by_id(id=data_type_id)
+            data_type = await DataType.get_by_id_async(id=data_type_id)
             if data_type is None:
                 error= RESTAPIError(
                     error="Data type not found",
                     error_description="The data type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            data_type = data_type.update(
+            data_type = await data_type.update_async(
                 data_type_name=data.data_type_name,
                 data_type_info=data.data_type_info
             )
@@ -148,14 +181,14 @@ class DataTypeController(Controller):
         cls, data_type_id: int
     ) -> None:
         try:
-            data_type = DataType.get_by_id(id=data_type_id)
+            data_type = await DataType.get_by_id_async(id=data_type_id)
             if data_type is None:
                 error = RESTAPIError(
                     error="Data type not found",
                     error_description="The data type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = data_type.delete()
+            is_deleted = await data_type.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Data type not deleted",
@@ -177,14 +210,14 @@ class DataTypeController(Controller):
         cls, data_type_id: int
     ) -> List[DataFormatOutput]:
         try:
-            data_type = DataType.get_by_id(id=data_type_id)
+            data_type = await DataType.get_by_id_async(id=data_type_id)
             if data_type is None:
                 error = RESTAPIError(
                     error="Data type not found",
                     error_description="The data type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            data_formats = data_type.get_associated_data_formats()
+            data_formats = await asyncio.to_thread(data_type.get_associated_data_formats)
             if data_formats is None:
                 error = RESTAPIError(
                     error="No data formats found",
@@ -1,16 +1,16 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream, Redirect
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
 
-from collections.abc import AsyncGenerator, Generator
-
 from gemini.api.dataset import Dataset
 from gemini.api.dataset_record import DatasetRecord
+from gemini.api.presign import get_presigned_url_cache
+from gemini.rest_api.models import RecordDownloadURL, RecordDownloadURLsRequest, PRESIGNED_DOWNLOADS
 from gemini.api.enums import GEMINIDatasetType
 from gemini.rest_api.models import ( 
     DatasetInput, 
@@ -25,27 +25,31 @@ from gemini.rest_api.models import (
     DatasetRecordInput,
     DatasetRecordOutput,
     DatasetRecordUpdate,
+    page_limit,
+    cursor_headers,
+    ndjson_records
 )
 
-from gemini.rest_api.file_handler import api_file_handler
+from gemini.rest_api.file_handler import get_api_file_handler
 
 from typing import List, Annotated, Optional
 
 
-async def dataset_records_bytes_generator(dataset_record_generator: Generator[DatasetRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in dataset_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
-
 
 class DatasetController(Controller):
 
     # Get All Datasets
     @get(path="/all")
-    async def get_all_datasets(self) -> List[DatasetOutput]:
+    async def get_all_datasets(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[DatasetOutput]:
         try:
-            datasets = Dataset.get_all()
+            if limit is not None or cursor is not None:
+                datasets, next_cursor = await Dataset.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=datasets, headers=cursor_headers(next_cursor))
+            datasets = await Dataset.get_all_async()
             if datasets is None:
                 error = RESTAPIError(
                     error="No datasets found",
@@ -53,6 +57,12 @@ class DatasetController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return datasets
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all datasets"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -68,13 +78,26 @@ class DatasetController(Controller):
         dataset_info: Optional[JSONB] = None,
         dataset_type_id: Optional[int] = None,
         experiment_name: Optional[str] = 'Experiment A',
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[DatasetOutput]:
         try:
             if dataset_info is not None:
                 dataset_info = str_to_dict(dataset_info)
 
-            datasets = Dataset.search(
+            if limit is not None or cursor is not None:
+                datasets, next_cursor = await Dataset.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    dataset_name=dataset_name,
+                    dataset_info=dataset_info,
+                    dataset_type=GEMINIDatasetType(dataset_type_id) if dataset_type_id else None,
+                    experiment_name=experiment_name,
+                    collection_date=collection_date
+                )
+                return Response(content=datasets, headers=cursor_headers(next_cursor))
+            datasets = await Dataset.search_async(
                 dataset_name=dataset_name,
                 dataset_info=dataset_info,
                 dataset_type=GEMINIDatasetType(dataset_type_id) if dataset_type_id else None,
@@ -88,6 +111,12 @@ class DatasetController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return datasets
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving datasets"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -101,7 +130,7 @@ class DatasetController(Controller):
         self, dataset_id: str
     ) -> DatasetOutput:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
@@ -122,7 +151,8 @@ class DatasetController(Controller):
         self, data: Annotated[DatasetInput, Body]
     ) -> DatasetOutput:
         try:
-            dataset = Dataset.create(
+            dataset = await asyncio.to_thread(
+                Dataset.create,
                 collection_date=data.collection_date,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
@@ -149,7 +179,7 @@ class DatasetController(Controller):
         self, dataset_id: str, data: Annotated[DatasetUpdate, Body]
     ) -> DatasetOutput:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
@@ -157,7 +187,7 @@ class DatasetController(Controller):
                 )
                 return Response(content=error, status_code=404)
             
-            dataset = dataset.update(
+            dataset = await dataset.update_async(
                 collection_date=data.collection_date,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
@@ -183,14 +213,14 @@ class DatasetController(Controller):
         self, dataset_id: str
     ) -> None:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
                     error_description="No dataset was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = dataset.delete()
+            is_deleted = await dataset.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Dataset not deleted",
@@ -211,14 +241,14 @@ class DatasetController(Controller):
         self, dataset_id: str
     ) -> List[ExperimentOutput]:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
                     error_description="No dataset was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            experiments = dataset.get_associated_experiments()
+            experiments = await asyncio.to_thread(dataset.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -241,7 +271,7 @@ class DatasetController(Controller):
         data: Annotated[DatasetRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> DatasetRecordOutput:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
@@ -250,9 +280,10 @@ class DatasetController(Controller):
                 return Response(content=error, status_code=404)
             
             if data.record_file:
-                record_file_path = await api_file_handler.create_file(data.record_file)
+                record_file_path = await get_api_file_handler().create_file(data.record_file)
             
-            add_success, inserted_record_ids = dataset.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                dataset.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 dataset_data=data.dataset_data,
@@ -269,7 +300,7 @@ class DatasetController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_dataset_record = DatasetRecord.get_by_id(id=inserted_record_id)
+            inserted_dataset_record = await DatasetRecord.get_by_id_async(id=inserted_record_id)
             if inserted_dataset_record is None:
                 error = RESTAPIError(
                     error="Dataset record not found",
@@ -293,23 +324,47 @@ class DatasetController(Controller):
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
         site_name: Optional[str] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
                     error_description="No dataset was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            records = dataset.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await DatasetRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    dataset_name=dataset.dataset_name,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name,
+                    collection_date=collection_date
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            records = dataset.search_records_async(
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                collection_date=collection_date
+                collection_date=collection_date,
+                lightweight=True
             )
-            return Stream(dataset_records_bytes_generator(records), media_type="application/ndjson")
+            return Stream(ndjson_records(records), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving dataset records"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -330,7 +385,7 @@ class DatasetController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            dataset = Dataset.get_by_id(id=dataset_id)
+            dataset = await Dataset.get_by_id_async(id=dataset_id)
             if dataset is None:
                 error = RESTAPIError(
                     error="Dataset not found",
@@ -342,9 +397,10 @@ class DatasetController(Controller):
                 end_timestamp=end_timestamp,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(dataset_records_bytes_generator(records), media_type="application/ndjson")
+            return Stream(ndjson_records(records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -359,7 +415,7 @@ class DatasetController(Controller):
         self, record_id: str
     ) -> DatasetRecordOutput:
         try:
-            dataset_record = DatasetRecord.get_by_id(id=record_id)
+            dataset_record = await DatasetRecord.get_by_id_async(id=record_id)
             if dataset_record is None:
                 error = RESTAPIError(
                     error="Dataset record not found",
@@ -375,13 +431,31 @@ class DatasetController(Controller):
             return Response(content=error, status_code=500)
         
         
+    # Get pre-signed download URLs for the files of Dataset Records
+    @post(path="/records/download_urls", status_code=200)
+    async def get_dataset_record_download_urls(
+        self,
+        data: RecordDownloadURLsRequest
+    ) -> List[RecordDownloadURL]:
+        try:
+            download_urls = await DatasetRecord.get_download_urls_async(record_ids=data.record_ids)
+            return [RecordDownloadURL(**download_url) for download_url in download_urls]
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while retrieving dataset record download URLs"
+            )
+            return Response(content=error, status_code=500)
+
     # Download Dataset Record File
     @get(path="/records/id/{record_id:str}/download")
     async def download_dataset_record_file(
-        self, record_id: str
+        self,
+        record_id: str,
+        presigned: Optional[bool] = None
     ) -> Redirect:
         try:
-            dataset_record = DatasetRecord.get_by_id(id=record_id)
+            dataset_record = await DatasetRecord.get_by_id_async(id=record_id)
             if dataset_record is None:
                 error = RESTAPIError(
                     error="Dataset record not found",
@@ -397,6 +471,9 @@ class DatasetController(Controller):
                 return Response(content=error_html, status_code=404)
             bucket_name = "gemini"
             object_name = record_file
+            if PRESIGNED_DOWNLOADS if presigned is None else presigned:
+                url, _ = get_presigned_url_cache().get_url(object_name, bucket_name=bucket_name)
+                return Redirect(path=url)
             object_path = f"{bucket_name}/{object_name}"
             return Redirect(path=f"/api/files/download/{object_path}")
         except Exception as e:
@@ -412,14 +489,14 @@ class DatasetController(Controller):
         self, record_id: str, data: Annotated[DatasetRecordUpdate, Body]
     ) -> DatasetRecordOutput:
         try:
-            dataset_record = DatasetRecord.get_by_id(id=record_id)
+            dataset_record = await DatasetRecord.get_by_id_async(id=record_id)
             if dataset_record is None:
                 error = RESTAPIError(
                     error="Dataset record not found",
                     error_description="No dataset record was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            dataset_record = dataset_record.update(
+            dataset_record = await dataset_record.update_async(
                 dataset_data=data.dataset_data,
                 record_info=data.record_info,
             )
@@ -443,14 +520,14 @@ class DatasetController(Controller):
         self, record_id: str
     ) -> None:
         try:
-            dataset_record = DatasetRecord.get_by_id(id=record_id)
+            dataset_record = await DatasetRecord.get_by_id_async(id=record_id)
             if dataset_record is None:
                 error = RESTAPIError(
                     error="Dataset record not found",
                     error_description="No dataset record was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = dataset_record.delete()
+            is_deleted = await dataset_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Dataset record not deleted",
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -10,7 +11,9 @@ from gemini.rest_api.models import (
     DatasetTypeUpdate, 
     RESTAPIError, 
     str_to_dict, 
-    JSONB
+    JSONB,
+    page_limit,
+    cursor_headers
 )
 
 from typing import List, Annotated, Optional
@@ -19,9 +22,16 @@ class DatasetTypeController(Controller):
 
     # Get All Dataset Types
     @get(path="/all")
-    async def get_all_dataset_types(self) -> List[DatasetTypeOutput]:
+    async def get_all_dataset_types(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[DatasetTypeOutput]:
         try:
-            dataset_types = DatasetType.get_all()
+            if limit is not None or cursor is not None:
+                dataset_types, next_cursor = await DatasetType.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=dataset_types, headers=cursor_headers(next_cursor))
+            dataset_types = await DatasetType.get_all_async()
             if dataset_types is None:
                 error = RESTAPIError(
                     error="No dataset types found",
@@ -29,6 +39,12 @@ class DatasetTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return dataset_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all dataset types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -41,13 +57,23 @@ class DatasetTypeController(Controller):
     async def get_dataset_types(
         cls,
         dataset_type_name: Optional[str] = None,
-        dataset_type_info: Optional[JSONB] = None
+        dataset_type_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[DatasetTypeOutput]:
         try:
             if dataset_type_info is not None:
                 dataset_type_info = str_to_dict(dataset_type_info)
 
-            dataset_types = DatasetType.search(
+            if limit is not None or cursor is not None:
+                dataset_types, next_cursor = await DatasetType.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    dataset_type_name=dataset_type_name,
+                    dataset_type_info=dataset_type_info
+                )
+                return Response(content=dataset_types, headers=cursor_headers(next_cursor))
+            dataset_types = await DatasetType.search_async(
                 dataset_type_name=dataset_type_name,
                 dataset_type_info=dataset_type_info
             )
@@ -58,6 +84,12 @@ class DatasetTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return dataset_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving dataset types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -71,7 +103,7 @@ class DatasetTypeController(Controller):
         cls, dataset_type_id: int
     ) -> DatasetTypeOutput:
         try:
-            dataset_type = DatasetType.get_by_id(id=dataset_type_id)
+            dataset_type = await DatasetType.get_by_id_async(id=dataset_type_id)
             if dataset_type is None:
                 error = RESTAPIError(
                     error="Dataset type not found",
@@ -92,7 +124,8 @@ class DatasetTypeController(Controller):
         cls, data: Annotated[DatasetTypeInput, Body]
     ) -> DatasetTypeOutput:
         try:
-            dataset_type = DatasetType.create(
+            dataset_type = await asyncio.to_thread(
+                DatasetType.create,
                 dataset_type_name=data.dataset_type_name,
                 dataset_type_info=data.dataset_type_info
             )
@@ -116,14 +149,14 @@ class DatasetTypeController(Controller):
         cls, dataset_type_id: int, data: Annotated[DatasetTypeUpdate, Body]
     ) -> DatasetTypeOutput:
         try:
-            dataset_type = DatasetType.get_by_id(id=dataset_type_id)
+            dataset_type = await DatasetType.get_by_id_async(id=dataset_type_id)
             if dataset_type is None:
                 error = RESTAPIError(
                     error="Dataset type not found",
                     error_description="The dataset type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            dataset_type = dataset_type.update(
+            dataset_type = await dataset_type.update_async(
                 dataset_type_name=data.dataset_type_name,
                 dataset_type_info=data.dataset_type_info
             )
@@ -147,14 +180,14 @@ class DatasetTypeController(Controller):
         cls, dataset_type_id: int
     ) -> None:
         try:
-            dataset_type = DatasetType.get_by_id(id=dataset_type_id)
+            dataset_type = await DatasetType.get_by_id_async(id=dataset_type_id)
             if dataset_type is None:
                 error = RESTAPIError(
                     error="Dataset type not found",
                     error_description="The dataset type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = dataset_type.delete()
+            is_deleted = await dataset_type.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Dataset type not deleted",
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -7,7 +8,7 @@ from pydantic import BaseModel
 
 from gemini.api.experiment import Experiment
 from gemini.api.enums import GEMINIDataFormat, GEMINIDatasetType, GEMINISensorType, GEMINIDataType, GEMINITraitLevel
-from gemini.rest_api.models import ExperimentInput, ExperimentOutput, ExperimentUpdate, RESTAPIError, str_to_dict, JSONB
+from gemini.rest_api.models import ExperimentInput, ExperimentOutput, ExperimentUpdate, RESTAPIError, str_to_dict, JSONB, page_limit, cursor_headers
 from gemini.rest_api.models import (
     SeasonOutput,
     SiteOutput,
@@ -85,9 +86,16 @@ class ExperimentController(Controller):
 
     # Get All Experiments
     @get(path="/all")
-    async def get_all_experiments(self) -> List[ExperimentOutput]:
+    async def get_all_experiments(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[ExperimentOutput]:
         try:
-            experiments = Experiment.get_all()
+            if limit is not None or cursor is not None:
+                experiments, next_cursor = await Experiment.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=experiments, headers=cursor_headers(next_cursor))
+            experiments = await Experiment.get_all_async()
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -95,6 +103,12 @@ class ExperimentController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return experiments
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all experiments"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -109,14 +123,26 @@ class ExperimentController(Controller):
         experiment_name: Optional[str] = None,
         experiment_info: Optional[JSONB] = None,
         experiment_start_date: Optional[str] = None,
-        experiment_end_date: Optional[str] = None
+        experiment_end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[ExperimentOutput]:
         try:
 
             if experiment_info is not None:
                 experiment_info = str_to_dict(experiment_info)
 
-            experiments = Experiment.search(
+            if limit is not None or cursor is not None:
+                experiments, next_cursor = await Experiment.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    experiment_name=experiment_name,
+                    experiment_info=experiment_info,
+                    experiment_start_date=experiment_start_date,
+                    experiment_end_date=experiment_end_date
+                )
+                return Response(content=experiments, headers=cursor_headers(next_cursor))
+            experiments = await Experiment.search_async(
                 experiment_name=experiment_name,
                 experiment_info=experiment_info,
                 experiment_start_date=experiment_start_date,
@@ -129,6 +155,12 @@ class ExperimentController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return experiments
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving experiments"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -143,7 +175,7 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> ExperimentOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
@@ -165,7 +197,8 @@ class ExperimentController(Controller):
         self, data: Annotated[ExperimentInput, Body]
     ) -> ExperimentOutput:
         try:
-            experiment = Experiment.create(
+            experiment = await asyncio.to_thread(
+                Experiment.create,
                 experiment_name=data.experiment_name,
                 experiment_info=data.experiment_info,
                 experiment_start_date=data.experiment_start_date,
@@ -192,14 +225,14 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentUpdate, Body]
     ) -> ExperimentOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error_ = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            experiment = experiment.update(
+            experiment = await experiment.update_async(
                 experiment_name=data.experiment_name,
                 experiment_info=data.experiment_info,
                 experiment_start_date=data.experiment_start_date,
@@ -220,14 +253,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> None:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            experiment.delete()
+            await experiment.delete_async()
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -241,14 +274,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[SeasonOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            seasons = experiment.get_associated_seasons()
+            seasons = await asyncio.to_thread(experiment.get_associated_seasons)
             if seasons is None:
                 error = RESTAPIError(
                     error="No seasons found",
@@ -270,14 +303,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentSeasonInput, Body]
     ) -> SeasonOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            season = experiment.create_new_season(
+            season = await asyncio.to_thread(
+                experiment.create_new_season,
                 season_name=data.season_name,
                 season_info=data.season_info,
                 season_start_date=data.season_start_date,
@@ -304,14 +338,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[SiteOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            sites = experiment.get_associated_sites()
+            sites = await asyncio.to_thread(experiment.get_associated_sites)
             if sites is None:
                 error = RESTAPIError(
                     error="No sites found",
@@ -333,14 +367,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentSiteInput, Body]
     ) -> SiteOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            site = experiment.create_new_site(
+            site = await asyncio.to_thread(
+                experiment.create_new_site,
                 site_name=data.site_name,
                 site_info=data.site_info,
                 site_city=data.site_city,
@@ -368,14 +403,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[CultivarOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 ).to_html()
                 return Response(content=error, status_code=404)
-            cultivars = experiment.get_associated_cultivars()
+            cultivars = await asyncio.to_thread(experiment.get_associated_cultivars)
             if cultivars is None:
                 error = RESTAPIError(
                     error="No cultivars found",
@@ -397,14 +432,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentCultivarInput, Body]
     ) -> CultivarOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            cultivar = experiment.create_new_cultivar(
+            cultivar = await asyncio.to_thread(
+                experiment.create_new_cultivar,
                 cultivar_population=data.cultivar_population,
                 cultivar_accession=data.cultivar_accession,
                 cultivar_info=data.cultivar_info
@@ -430,14 +466,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[SensorPlatformOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            sensor_platforms = experiment.get_associated_sensor_platforms()
+            sensor_platforms = await asyncio.to_thread(experiment.get_associated_sensor_platforms)
             if sensor_platforms is None:
                 error = RESTAPIError(
                     error="No sensor platforms found",
@@ -459,14 +495,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentSensorPlatformInput, Body]
     ) -> SensorPlatformOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            sensor_platform = experiment.create_new_sensor_platform(
+            sensor_platform = await asyncio.to_thread(
+                experiment.create_new_sensor_platform,
                 sensor_platform_name=data.sensor_platform_name,
                 sensor_platform_info=data.sensor_platform_info,
             )
@@ -491,14 +528,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[TraitOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            traits = experiment.get_associated_traits()
+            traits = await asyncio.to_thread(experiment.get_associated_traits)
             if traits is None:
                 error = RESTAPIError(
                     error="No traits found",
@@ -519,14 +556,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentTraitInput, Body]
     ) -> TraitOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            trait = experiment.create_new_trait(
+            trait = await asyncio.to_thread(
+                experiment.create_new_trait,
                 trait_name=data.trait_name,
                 trait_units=data.trait_units,
                 trait_level=GEMINITraitLevel(data.trait_level_id),
@@ -554,14 +592,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[SensorOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            sensors = experiment.get_associated_sensors()
+            sensors = await asyncio.to_thread(experiment.get_associated_sensors)
             if sensors is None:
                 error = RESTAPIError(
                     error="No sensors found",
@@ -582,14 +620,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentSensorInput, Body]
     ) -> SensorOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            sensor = experiment.create_new_sensor(
+            sensor = await asyncio.to_thread(
+                experiment.create_new_sensor,
                 sensor_name=data.sensor_name,
                 sensor_data_type=GEMINIDataType(data.sensor_data_type_id),
                 sensor_data_format=GEMINIDataFormat(data.sensor_data_format_id),
@@ -618,14 +657,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[ScriptOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            scripts = experiment.get_associated_scripts()
+            scripts = await asyncio.to_thread(experiment.get_associated_scripts)
             if scripts is None:
                 error = RESTAPIError(
                     error="No scripts found",
@@ -647,14 +686,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentScriptInput, Body]
     ) -> ScriptOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            script = experiment.create_new_script(
+            script = await asyncio.to_thread(
+                experiment.create_new_script,
                 script_name=data.script_name,
                 script_extension=data.script_extension,
                 script_url=data.script_url,
@@ -681,14 +721,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[ProcedureOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            procedures = experiment.get_associated_procedures()
+            procedures = await asyncio.to_thread(experiment.get_associated_procedures)
             if procedures is None:
                 error = RESTAPIError(
                     error="No procedures found",
@@ -710,14 +750,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentProcedureInput, Body]
     ) -> ProcedureOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            procedure = experiment.create_new_procedure(
+            procedure = await asyncio.to_thread(
+                experiment.create_new_procedure,
                 procedure_name=data.procedure_name,
                 procedure_info=data.procedure_info,
             )
@@ -742,14 +783,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[ModelOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            models = experiment.get_associated_models()
+            models = await asyncio.to_thread(experiment.get_associated_models)
             if models is None:
                 error = RESTAPIError(
                     error="No models found",
@@ -771,14 +812,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentModelInput, Body]
     ) -> ModelOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            model = experiment.create_new_model(
+            model = await asyncio.to_thread(
+                experiment.create_new_model,
                 model_name=data.model_name,
                 model_info=data.model_info,
                 model_url=data.model_url
@@ -804,14 +846,14 @@ class ExperimentController(Controller):
         self, experiment_id: str
     ) -> List[DatasetOutput]:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_description="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            datasets = experiment.get_associated_datasets()
+            datasets = await asyncio.to_thread(experiment.get_associated_datasets)
             if datasets is None:
                 error = RESTAPIError(
                     error="No datasets found",
@@ -833,14 +875,15 @@ class ExperimentController(Controller):
         self, experiment_id: str, data: Annotated[ExperimentDatasetInput, Body]
     ) -> DatasetOutput:
         try:
-            experiment = Experiment.get_by_id(id=experiment_id)
+            experiment = await Experiment.get_by_id_async(id=experiment_id)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
                     error_descripion="No experiment was found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            dataset = experiment.create_new_dataset(
+            dataset = await asyncio.to_thread(
+                experiment.create_new_dataset,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
                 dataset_type=GEMINIDatasetType(data.dataset_type_id),
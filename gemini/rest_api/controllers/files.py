@@ -1,5 +1,6 @@
-from litestar import Response
-from litestar.handlers import get, post, patch, delete
+import asyncio
+from litestar import Request, Response
+from litestar.handlers import get, post, put, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream
@@ -14,23 +15,11 @@ from gemini.rest_api.models import (
     UploadFileRequest
 )
 
-from gemini.manager import GEMINIManager, GEMINIComponentType
-from gemini.storage.providers.minio_storage import MinioStorageProvider
-from gemini.storage.config.storage_config import MinioStorageConfig
+from gemini.api.base import get_minio_storage_provider
+from gemini.storage.multipart import upload_stream_async
 
 from typing import Annotated, List
 
-manager = GEMINIManager()
-minio_storage_settings = manager.get_component_settings(GEMINIComponentType.STORAGE)
-minio_storage_config = MinioStorageConfig(
-    endpoint=f"{minio_storage_settings['GEMINI_STORAGE_HOSTNAME']}:{minio_storage_settings['GEMINI_STORAGE_PORT']}",
-    access_key=minio_storage_settings['GEMINI_STORAGE_ACCESS_KEY'],
-    secret_key=minio_storage_settings['GEMINI_STORAGE_SECRET_KEY'],
-    bucket_name=minio_storage_settings['GEMINI_STORAGE_BUCKET_NAME'],
-    secure=False
-)
-minio_storage_provider = MinioStorageProvider(minio_storage_config)
-
 class FileController(Controller):
 
     @get(path="/metadata/{file_path:path}")
@@ -39,6 +28,7 @@ class FileController(Controller):
         file_path: str
     ) -> FileMetadata:
         try:
+            minio_storage_provider = get_minio_storage_provider()
             bucket_name = file_path.split('/')[1]
             if not minio_storage_provider.bucket_exists(bucket_name):
                 error = RESTAPIError(
@@ -82,6 +72,7 @@ class FileController(Controller):
         file_path: str
     ) -> List[FileMetadata]:
         try:
+            minio_storage_provider = get_minio_storage_provider()
             bucket_name = file_path.split('/')[1]
             if not minio_storage_provider.bucket_exists(bucket_name):
                 error = RESTAPIError(
@@ -126,6 +117,7 @@ class FileController(Controller):
         file_path: str
     ) -> Stream:
         try:
+            minio_storage_provider = get_minio_storage_provider()
             bucket_name = file_path.split('/')[1]
             if not minio_storage_provider.bucket_exists(bucket_name):
                 error = RESTAPIError(
@@ -167,6 +159,7 @@ class FileController(Controller):
         data: Annotated[UploadFileRequest, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> FileMetadata:
         try:
+            minio_storage_provider = get_minio_storage_provider()
             bucket_name = data.bucket_name
             if not minio_storage_provider.bucket_exists(bucket_name):
                 error = RESTAPIError(
@@ -198,15 +191,68 @@ class FileController(Controller):
                 error_description="An error occurred while uploading the file"
             )
             return Response(content=error_message, status_code=500)
-        
-    
-        
+
+    # Streams the raw request body to storage in parts as it arrives, so
+    # files of any size are uploaded without being held in memory or on disk
+    @put(path="/upload/{file_path:path}", request_max_body_size=None)
+    async def stream_upload_file(
+        self,
+        request: Request,
+        file_path: str
+    ) -> FileMetadata:
+        try:
+            minio_storage_provider = await asyncio.to_thread(get_minio_storage_provider)
+            bucket_name = file_path.split('/')[1]
+            if not await asyncio.to_thread(minio_storage_provider.bucket_exists, bucket_name):
+                error = RESTAPIError(
+                    error="Bucket not found",
+                    error_description=f"Bucket {bucket_name} does not exist"
+                )
+                return Response(content=error, status_code=404)
+            object_name = '/'.join(file_path.split('/')[2:])
+            if not object_name:
+                error = RESTAPIError(
+                    error="Object name required",
+                    error_description="The path must include the object name after the bucket name"
+                )
+                return Response(content=error, status_code=400)
+            content_type = request.headers.get("Content-Type")
+            if not content_type or content_type == "application/octet-stream":
+                content_type = guess_type(object_name)[0] or content_type
+            await upload_stream_async(
+                minio_storage_provider,
+                object_name=object_name,
+                bucket_name=bucket_name,
+                chunks=request.stream(),
+                content_type=content_type
+            )
+            file_info = await asyncio.to_thread(
+                minio_storage_provider.get_file_metadata,
+                object_name=object_name,
+                bucket_name=bucket_name
+            )
+            return FileMetadata(
+                bucket_name=file_info['bucket_name'],
+                object_name=file_info['object_name'],
+                size=file_info['size'],
+                last_modified=file_info['last_modified'],
+                content_type=file_info['content_type'],
+                etag=file_info['etag']
+            )
+        except Exception as e:
+            error_message = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while uploading the file"
+            )
+            return Response(content=error_message, status_code=500)
+
     @delete(path="/delete/{file_path:path}")
     async def delete_file(
         self,
         file_path: str
     ) -> None:
         try:
+            minio_storage_provider = get_minio_storage_provider()
             bucket_name = file_path.split('/')[1]
             if not minio_storage_provider.bucket_exists(bucket_name):
                 error = RESTAPIError(
@@ -1,17 +1,17 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream, Redirect
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
-from collections.abc import AsyncGenerator, Generator
-
 from pydantic import BaseModel
 
 from gemini.api.model import Model
 from gemini.api.model_record import ModelRecord
+from gemini.api.presign import get_presigned_url_cache
+from gemini.rest_api.models import RecordDownloadURL, RecordDownloadURLsRequest, PRESIGNED_DOWNLOADS
 from gemini.rest_api.models import ( 
     ModelInput, 
     ModelOutput, 
@@ -27,18 +27,15 @@ from gemini.rest_api.models import (
     ModelRecordInput,
     ModelRecordOutput,
     ModelRecordUpdate,
+    page_limit,
+    cursor_headers,
+    ndjson_records
 )
 
-from gemini.rest_api.file_handler import api_file_handler
+from gemini.rest_api.file_handler import get_api_file_handler
 
 from typing import List, Annotated, Optional
 
-async def model_records_bytes_generator(model_record_generator: Generator[ModelRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in model_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
-
 
 class ModelModelRunInput(BaseModel):
     model_run_info: Optional[JSONB] = {}
@@ -54,9 +51,16 @@ class ModelController(Controller):
 
     # Get All Models
     @get(path="/all")
-    async def get_all_models(self) -> List[ModelOutput]:
+    async def get_all_models(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[ModelOutput]:
         try:
-            models = Model.get_all()
+            if limit is not None or cursor is not None:
+                models, next_cursor = await Model.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=models, headers=cursor_headers(next_cursor))
+            models = await Model.get_all_async()
             if models is None:
                 error = RESTAPIError(
                     error="No models found",
@@ -64,6 +68,12 @@ class ModelController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return models
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all models"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -78,12 +88,24 @@ class ModelController(Controller):
         model_name: Optional[str] = None,
         model_url: Optional[str] = None,
         model_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[ModelOutput]:
         try:
             if model_info is not None:
                 model_info = str_to_dict(model_info)
-            models = Model.search(
+            if limit is not None or cursor is not None:
+                models, next_cursor = await Model.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    model_name=model_name,
+                    model_info=model_info,
+                    model_url=model_url,
+                    experiment_name=experiment_name
+                )
+                return Response(content=models, headers=cursor_headers(next_cursor))
+            models = await Model.search_async(
                 model_name=model_name,
                 model_info=model_info,
                 model_url=model_url,
@@ -96,6 +118,12 @@ class ModelController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return models
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving models"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -109,7 +137,7 @@ class ModelController(Controller):
         self, model_id: str
     ) -> ModelOutput:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
@@ -130,7 +158,8 @@ class ModelController(Controller):
         self, data: Annotated[ModelInput, Body]
     ) -> ModelOutput:
         try:
-            model = Model.create(
+            model = await asyncio.to_thread(
+                Model.create,
                 model_name=data.model_name,
                 model_url=data.model_url,
                 model_info=data.model_info,
@@ -158,14 +187,14 @@ class ModelController(Controller):
         data: Annotated[ModelUpdate, Body]
     ) -> ModelOutput:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model = model.update(
+            model = await model.update_async(
                 model_name=data.model_name,
                 model_url=data.model_url,
                 model_info=data.model_info
@@ -190,14 +219,14 @@ class ModelController(Controller):
         self, model_id: str
     ) -> None:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = model.delete()
+            is_deleted = await model.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Model not deleted",
@@ -219,14 +248,14 @@ class ModelController(Controller):
         self, model_id: str
     ) -> List[str]:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = model.get_associated_experiments()
+            experiments = await asyncio.to_thread(model.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No model experiments found",
@@ -247,14 +276,14 @@ class ModelController(Controller):
         self, model_id: str
     ) -> List[ModelRunOutput]:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model_runs = model.get_associated_runs()
+            model_runs = await asyncio.to_thread(model.get_associated_runs)
             if model_runs is None:
                 error = RESTAPIError(
                     error="No model runs found",
@@ -275,14 +304,14 @@ class ModelController(Controller):
         self, model_id: str
     ) -> List[DatasetOutput]:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model_datasets = model.get_associated_datasets()
+            model_datasets = await asyncio.to_thread(model.get_associated_datasets)
             if model_datasets is None:
                 error = RESTAPIError(
                     error="No model datasets found",
@@ -305,14 +334,14 @@ class ModelController(Controller):
         data: Annotated[ModelModelRunInput, Body]
     ) -> ModelRunOutput:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model_run = model.create_new_run(model_run_info=data.model_run_info)
+            model_run = await asyncio.to_thread(model.create_new_run, model_run_info=data.model_run_info)
             if model_run is None:
                 error = RESTAPIError(
                     error="Model run not created",
@@ -335,14 +364,15 @@ class ModelController(Controller):
         data: Annotated[ModelDatasetInput, Body]
     ) -> DatasetOutput:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            dataset = model.create_new_dataset(
+            dataset = await asyncio.to_thread(
+                model.create_new_dataset,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
                 collection_date=data.collection_date,
@@ -370,7 +400,7 @@ class ModelController(Controller):
         data: Annotated[ModelRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> ModelOutput:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
@@ -379,9 +409,10 @@ class ModelController(Controller):
                 return Response(content=error, status_code=404)
             
             if data.record_file:
-                record_file_path = await api_file_handler.create_file(data.record_file)
+                record_file_path = await get_api_file_handler().create_file(data.record_file)
 
-            add_success, inserted_record_ids = model.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                model.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 model_data=data.model_data,
@@ -399,7 +430,7 @@ class ModelController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_model_record = ModelRecord.get_by_id(id=inserted_record_id)
+            inserted_model_record = await ModelRecord.get_by_id_async(id=inserted_record_id)
             if inserted_model_record is None:
                 error = RESTAPIError(
                     error="Model record not found",
@@ -423,23 +454,47 @@ class ModelController(Controller):
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
         site_name: Optional[str] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
                     error_description="The model with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model_records = model.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await ModelRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    model_name=model.model_name,
+                    collection_date=collection_date,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            model_records = model.search_records_async(
                 collection_date=collection_date,
                 experiment_name=experiment_name,
                 season_name=season_name,
-                site_name=site_name
+                site_name=site_name,
+                lightweight=True
             )
-            return Stream(model_records_bytes_generator(model_records), media_type="application/ndjson")
+            return Stream(ndjson_records(model_records), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving model records"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -459,7 +514,7 @@ class ModelController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            model = Model.get_by_id(id=model_id)
+            model = await Model.get_by_id_async(id=model_id)
             if model is None:
                 error = RESTAPIError(
                     error="Model not found",
@@ -472,9 +527,10 @@ class ModelController(Controller):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(model_records_bytes_generator(model_records), media_type="application/ndjson")
+            return Stream(ndjson_records(model_records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -489,7 +545,7 @@ class ModelController(Controller):
         self, record_id: str
     ) -> ModelRecordOutput:
         try:
-            model_record = ModelRecord.get_by_id(id=record_id)
+            model_record = await ModelRecord.get_by_id_async(id=record_id)
             if model_record is None:
                 error = RESTAPIError(
                     error="Model record not found",
@@ -504,13 +560,31 @@ class ModelController(Controller):
             )
             return Response(content=error, status_code=500)
         
+    # Get pre-signed download URLs for the files of Model Records
+    @post(path="/records/download_urls", status_code=200)
+    async def get_model_record_download_urls(
+        self,
+        data: RecordDownloadURLsRequest
+    ) -> List[RecordDownloadURL]:
+        try:
+            download_urls = await ModelRecord.get_download_urls_async(record_ids=data.record_ids)
+            return [RecordDownloadURL(**download_url) for download_url in download_urls]
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while retrieving model record download URLs"
+            )
+            return Response(content=error, status_code=500)
+
     # Download Model Record File
     @get(path="/records/id/{record_id:str}/download")
     async def download_model_record_file(
-        self, record_id: str
+        self,
+        record_id: str,
+        presigned: Optional[bool] = None
     ) -> Redirect:
         try:
-            model_record = ModelRecord.get_by_id(id=record_id)
+            model_record = await ModelRecord.get_by_id_async(id=record_id)
             if model_record is None:
                 error = RESTAPIError(
                     error="Model record not found",
@@ -526,6 +600,9 @@ class ModelController(Controller):
                 return Response(content=error, status_code=404)
             bucket_name = "gemini"
             object_name = record_file
+            if PRESIGNED_DOWNLOADS if presigned is None else presigned:
+                url, _ = get_presigned_url_cache().get_url(object_name, bucket_name=bucket_name)
+                return Redirect(path=url)
             object_path = f"{bucket_name}/{object_name}"
             return Redirect(path=f"/api/files/download/{object_path}")
         except Exception as e:
@@ -543,14 +620,14 @@ class ModelController(Controller):
         data: Annotated[ModelRecordUpdate, Body]
     ) -> ModelRecordOutput:
         try:
-            model_record = ModelRecord.get_by_id(id=record_id)
+            model_record = await ModelRecord.get_by_id_async(id=record_id)
             if model_record is None:
                 error = RESTAPIError(
                     error="Model record not found",
                     error_description="The model record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            model_record = model_record.update(
+            model_record = await model_record.update_async(
                 model_data=data.model_data,
                 record_info=data.record_info
             )
@@ -574,14 +651,14 @@ class ModelController(Controller):
         self, record_id: str
     ) -> None:
         try:
-            model_record = ModelRecord.get_by_id(id=record_id)
+            model_record = await ModelRecord.get_by_id_async(id=record_id)
             if model_record is None:
                 error = RESTAPIError(
                     error="Model record not found",
                     error_description="The model record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = model_record.delete()
+            is_deleted = await model_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Model record not deleted",
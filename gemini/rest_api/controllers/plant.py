@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -6,7 +7,7 @@ from litestar.controller import Controller
 from pydantic import BaseModel
 
 from gemini.api.plant import Plant
-from gemini.rest_api.models import PlantInput, PlantOutput, PlantUpdate, RESTAPIError, JSONB, str_to_dict
+from gemini.rest_api.models import PlantInput, PlantOutput, PlantUpdate, RESTAPIError, JSONB, str_to_dict, page_limit, cursor_headers
 from gemini.rest_api.models import CultivarOutput, PlotOutput 
 from typing import List, Annotated, Optional
 
@@ -19,9 +20,16 @@ class PlantController(Controller):
 
     # Get All Plants
     @get(path="/all")
-    async def get_all_plants(self) -> List[PlantOutput]:
+    async def get_all_plants(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[PlantOutput]:
         try:
-            plants = Plant.get_all()
+            if limit is not None or cursor is not None:
+                plants, next_cursor = await Plant.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=plants, headers=cursor_headers(next_cursor))
+            plants = await Plant.get_all_async()
             if plants is None:
                 error = RESTAPIError(
                     error="No plants found",
@@ -29,6 +37,12 @@ class PlantController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return plants
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all plants"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -49,13 +63,30 @@ class PlantController(Controller):
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
         site_name: Optional[str] = None,
-        plant_info: Optional[JSONB] = None
+        plant_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[PlantOutput]:
         try:
             if plant_info is not None:
                 plant_info = str_to_dict(plant_info)
 
-            plants = Plant.search(
+            if limit is not None or cursor is not None:
+                plants, next_cursor = await Plant.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    plant_number=plant_number,
+                    cultivar_accession=cultivar_accession,
+                    cultivar_population=cultivar_population,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name,
+                    plot_number=plot_number,
+                    plot_row_number=plot_row_number,
+                    plot_column_number=plot_column_number
+                )
+                return Response(content=plants, headers=cursor_headers(next_cursor))
+            plants = await Plant.search_async(
                 plant_number=plant_number,
                 cultivar_accession=cultivar_accession,
                 cultivar_population=cultivar_population,
@@ -74,6 +105,12 @@ class PlantController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return plants
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving plants"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -87,7 +124,7 @@ class PlantController(Controller):
             self, plant_id: str
     ) -> PlantOutput:
         try:
-            plant = Plant.get_by_id(id=plant_id)
+            plant = await Plant.get_by_id_async(id=plant_id)
             if plant is None:
                 error = RESTAPIError(
                     error="Plant not found",
@@ -112,7 +149,8 @@ class PlantController(Controller):
             if data.plant_info is not None:
                 data.plant_info = str_to_dict(data.plant_info)
 
-            plant = Plant.create(
+            plant = await asyncio.to_thread(
+                Plant.create,
                 plant_number=data.plant_number,
                 plant_info=data.plant_info,
                 cultivar_accession=data.cultivar_accession,
@@ -146,14 +184,14 @@ class PlantController(Controller):
         data: Annotated[PlantUpdate, Body]
     ) -> PlantOutput:
         try:
-            plant = Plant.get_by_id(id=plant_id)
+            plant = await Plant.get_by_id_async(id=plant_id)
             if plant is None:
                 error = RESTAPIError(
                     error="Plant not found",
                     error_description="The plant with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plant = plant.update(
+            plant = await plant.update_async(
                 plant_number=data.plant_number,
                 plant_info=data.plant_info,
             )
@@ -178,14 +216,14 @@ class PlantController(Controller):
         plant_id: str
     ) -> None:
         try:
-            plant = Plant.get_by_id(id=plant_id)
+            plant = await Plant.get_by_id_async(id=plant_id)
             if plant is None:
                 error = RESTAPIError(
                     error="Plant not found",
                     error_description="The plant with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = plant.delete()
+            is_deleted = await plant.delete_async()
             if not is_deleted:
                 error_html = RESTAPIError(
                     error="Failed to delete plant",
@@ -207,14 +245,14 @@ class PlantController(Controller):
         plant_id: str
     ) -> CultivarOutput:
         try:
-            plant = Plant.get_by_id(id=plant_id)
+            plant = await Plant.get_by_id_async(id=plant_id)
             if plant is None:
                 error = RESTAPIError(
                     error="Plant not found",
                     error_description="The plant with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            cultivar = plant.get_associated_cultivar()
+            cultivar = await asyncio.to_thread(plant.get_associated_cultivar)
             if cultivar is None:
                 error = RESTAPIError(
                     error="Cultivar not found",
@@ -236,14 +274,14 @@ class PlantController(Controller):
         plant_id: str
     ) -> List[PlotOutput]:
         try:
-            plant = Plant.get_by_id(id=plant_id)
+            plant = await Plant.get_by_id_async(id=plant_id)
             if plant is None:
                 error = RESTAPIError(
                     error="Plant not found",
                     error_description="The plant with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plots = plant.get_associated_plot()
+            plots = await asyncio.to_thread(plant.get_associated_plot)
             if plots is None:
                 error = RESTAPIError(
                     error="No plots found",
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -6,7 +7,7 @@ from litestar.controller import Controller
 from pydantic import BaseModel
 
 from gemini.api.plot import Plot
-from gemini.rest_api.models import PlotInput, PlotOutput, PlotUpdate, RESTAPIError, JSONB, str_to_dict
+from gemini.rest_api.models import PlotInput, PlotOutput, PlotUpdate, RESTAPIError, JSONB, str_to_dict, page_limit, cursor_headers
 from gemini.rest_api.models import (
     CultivarOutput,
     PlantOutput,
@@ -43,9 +44,16 @@ class PlotController(Controller):
 
     # Get All Plots
     @get(path="/all")
-    async def get_all_plots(self) -> List[PlotOutput]:
+    async def get_all_plots(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[PlotOutput]:
         try:
-            plots = Plot.get_all()
+            if limit is not None or cursor is not None:
+                plots, next_cursor = await Plot.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=plots, headers=cursor_headers(next_cursor))
+            plots = await Plot.get_all_async()
             if plots is None:
                 error = RESTAPIError(
                     error="No plots found",
@@ -53,6 +61,12 @@ class PlotController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return plots
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all plots"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -69,11 +83,25 @@ class PlotController(Controller):
         plot_column_number: Optional[int] = None,
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
-        site_name: Optional[str] = None
+        site_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[PlotOutput]:
         try:
 
-            plots = Plot.search(
+            if limit is not None or cursor is not None:
+                plots, next_cursor = await Plot.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    plot_number=plot_number,
+                    plot_row_number=plot_row_number,
+                    plot_column_number=plot_column_number,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name
+                )
+                return Response(content=plots, headers=cursor_headers(next_cursor))
+            plots = await Plot.search_async(
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
                 plot_column_number=plot_column_number,
@@ -89,6 +117,12 @@ class PlotController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return plots
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving plots"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -102,7 +136,7 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> PlotOutput:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
@@ -124,7 +158,8 @@ class PlotController(Controller):
         data: Annotated[PlotInput, Body]
     ) -> PlotOutput:
         try:
-            plot = Plot.create(
+            plot = await asyncio.to_thread(
+                Plot.create,
                 plot_number=data.plot_number,
                 plot_row_number=data.plot_row_number,
                 plot_column_number=data.plot_column_number,
@@ -157,14 +192,14 @@ class PlotController(Controller):
         data: Annotated[PlotUpdate, Body]
     ) -> PlotOutput:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plot = plot.update(
+            plot = await plot.update_async(
                 plot_number=data.plot_number,
                 plot_row_number=data.plot_row_number,
                 plot_column_number=data.plot_column_number,
@@ -191,14 +226,14 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> None:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = plot.delete()
+            is_deleted = await plot.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete plot",
@@ -220,14 +255,14 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> List[CultivarOutput]:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            cultivars = plot.get_associated_cultivars()
+            cultivars = await asyncio.to_thread(plot.get_associated_cultivars)
             if cultivars is None:
                 error_html = RESTAPIError(
                     error="No cultivars found",
@@ -248,14 +283,14 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> ExperimentOutput:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiment = plot.get_associated_experiment()
+            experiment = await asyncio.to_thread(plot.get_associated_experiment)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
@@ -276,14 +311,14 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> SeasonOutput:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            season = plot.get_associated_season()
+            season = await asyncio.to_thread(plot.get_associated_season)
             if season is None:
                 error = RESTAPIError(
                     error="Season not found",
@@ -304,14 +339,14 @@ class PlotController(Controller):
         self, plot_id: str
     ) -> SiteOutput:
         try:
-            plot = Plot.get_by_id(id=plot_id)
+            plot = await Plot.get_by_id_async(id=plot_id)
             if plot is None:
                 error = RESTAPIError(
                     error="Plot not found",
                     error_description="The plot with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            site = plot.get_associated_site()
+            site = await asyncio.to_thread(plot.get_associated_site)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
@@ -1,17 +1,17 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream, Redirect
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
-from collections.abc import AsyncGenerator, Generator
-
 from pydantic import BaseModel
 
 from gemini.api.procedure import Procedure
 from gemini.api.procedure_record import ProcedureRecord 
+from gemini.api.presign import get_presigned_url_cache
+from gemini.rest_api.models import RecordDownloadURL, RecordDownloadURLsRequest, PRESIGNED_DOWNLOADS
 from gemini.rest_api.models import (
     ProcedureInput,
     ProcedureOutput,
@@ -20,7 +20,10 @@ from gemini.rest_api.models import (
     DatasetOutput,
     RESTAPIError,
     JSONB,
-    str_to_dict
+    str_to_dict,
+    page_limit,
+    cursor_headers,
+    ndjson_records
 )
 
 from gemini.rest_api.models import (
@@ -29,17 +32,11 @@ from gemini.rest_api.models import (
     ProcedureRecordUpdate,
 )
 
-from gemini.rest_api.file_handler import api_file_handler
+from gemini.rest_api.file_handler import get_api_file_handler
 
 from typing import List, Annotated, Optional
 
 
-async def procedure_records_bytes_generator(procedure_record_generator : Generator[ProcedureRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in procedure_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
-
 
 class ProcedureProcedureRunInput(BaseModel):
     procedure_run_info: Optional[JSONB] = {}
@@ -55,9 +52,16 @@ class ProcedureController(Controller):
 
     # Get All Procedures
     @get(path="/all")
-    async def get_all_procedures(self) -> List[ProcedureOutput]:
+    async def get_all_procedures(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[ProcedureOutput]:
         try:
-            procedures = Procedure.get_all()
+            if limit is not None or cursor is not None:
+                procedures, next_cursor = await Procedure.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=procedures, headers=cursor_headers(next_cursor))
+            procedures = await Procedure.get_all_async()
             if procedures is None:
                 error = RESTAPIError(
                     error="No Procedures Found",
@@ -65,6 +69,12 @@ class ProcedureController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return procedures
+        except ValueError as e:
+            error = RESTAPIError(
+                error="Bad Request",
+                error_description=str(e)
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error="Internal Server Error",
@@ -78,13 +88,24 @@ class ProcedureController(Controller):
         self,
         procedure_name: Optional[str] = None,
         procedure_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[ProcedureOutput]:
         try:
             if procedure_info is not None:
                 procedure_info = str_to_dict(procedure_info)
 
-            procedures = Procedure.search(
+            if limit is not None or cursor is not None:
+                procedures, next_cursor = await Procedure.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    procedure_name=procedure_name,
+                    procedure_info=procedure_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=procedures, headers=cursor_headers(next_cursor))
+            procedures = await Procedure.search_async(
                 procedure_name=procedure_name,
                 procedure_info=procedure_info,
                 experiment_name=experiment_name
@@ -96,6 +117,12 @@ class ProcedureController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return procedures
+        except ValueError as e:
+            error = RESTAPIError(
+                error="Bad Request",
+                error_description=str(e)
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error="Internal Server Error",
@@ -110,7 +137,7 @@ class ProcedureController(Controller):
         self, procedure_id: str
     ) -> ProcedureOutput:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
@@ -133,7 +160,8 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureInput, Body]
     ) -> ProcedureOutput:
         try:
-            procedure = Procedure.create(
+            procedure = await asyncio.to_thread(
+                Procedure.create,
                 procedure_name=data.procedure_name,
                 procedure_info=data.procedure_info,
                 experiment_name=data.experiment_name
@@ -160,14 +188,14 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureUpdate, Body]
     ) -> ProcedureOutput:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            procedure = procedure.update(
+            procedure = await procedure.update_async(
                 procedure_name=data.procedure_name,
                 procedure_info=data.procedure_info
             )
@@ -192,14 +220,14 @@ class ProcedureController(Controller):
         self, procedure_id: str
     ) -> None:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = procedure.delete()
+            is_deleted = await procedure.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Procedure Deletion Failed",
@@ -220,14 +248,14 @@ class ProcedureController(Controller):
         self, procedure_id: str
     ) -> List[ProcedureRunOutput]:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            runs = procedure.get_associated_runs()
+            runs = await asyncio.to_thread(procedure.get_associated_runs)
             if runs is None:
                 error = RESTAPIError(
                     error="No Procedure Runs Found",
@@ -249,14 +277,14 @@ class ProcedureController(Controller):
         self, procedure_id: str
     ) -> List[str]:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            experiments = procedure.get_associated_experiments()
+            experiments = await asyncio.to_thread(procedure.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No Procedure Experiments Found",
@@ -277,14 +305,14 @@ class ProcedureController(Controller):
         self, procedure_id: str
     ) -> List[DatasetOutput]:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            datasets = procedure.get_associated_datasets()
+            datasets = await asyncio.to_thread(procedure.get_associated_datasets)
             if datasets is None:
                 error = RESTAPIError(
                     error="No Procedure Datasets Found",
@@ -307,14 +335,14 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureProcedureRunInput, Body]
     ) -> ProcedureRunOutput:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            run = procedure.create_new_run(procedure_run_info=data.procedure_run_info)
+            run = await asyncio.to_thread(procedure.create_new_run, procedure_run_info=data.procedure_run_info)
             if run is None:
                 error = RESTAPIError(
                     error="Procedure Run Creation Failed",
@@ -337,14 +365,15 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureDatasetInput, Body]
     ) -> DatasetOutput:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            dataset = procedure.create_new_dataset(
+            dataset = await asyncio.to_thread(
+                procedure.create_new_dataset,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
                 collection_date=data.collection_date,
@@ -372,7 +401,7 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> ProcedureRecordOutput:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
@@ -380,9 +409,10 @@ class ProcedureController(Controller):
                 )
                 return Response(content=error, status_code=404)
             if data.record_file:
-                record_file_path = await api_file_handler.create_file(data.record_file)
+                record_file_path = await get_api_file_handler().create_file(data.record_file)
 
-            add_success, inserted_record_ids = procedure.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                procedure.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 procedure_data=data.procedure_data,
@@ -400,7 +430,7 @@ class ProcedureController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_procedure_record = ProcedureRecord.get_by_id(id=inserted_record_id)
+            inserted_procedure_record = await ProcedureRecord.get_by_id_async(id=inserted_record_id)
             if inserted_procedure_record is None:
                 error = RESTAPIError(
                     error="Procedure Record Not Found",
@@ -423,23 +453,47 @@ class ProcedureController(Controller):
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
         site_name: Optional[str] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure Not Found",
                     error_description="No procedure found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            records = procedure.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await ProcedureRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    procedure_name=procedure.procedure_name,
+                    collection_date=collection_date,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            records = procedure.search_records_async(
                 collection_date=collection_date,
                 experiment_name=experiment_name,
                 season_name=season_name,
-                site_name=site_name
+                site_name=site_name,
+                lightweight=True
             )
-            return Stream(procedure_records_bytes_generator(records), media_type="application/ndjson")
+            return Stream(ndjson_records(records), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error="Bad Request",
+                error_description=str(e)
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error="Internal Server Error",
@@ -459,7 +513,7 @@ class ProcedureController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            procedure = Procedure.get_by_id(id=procedure_id)
+            procedure = await Procedure.get_by_id_async(id=procedure_id)
             if procedure is None:
                 error = RESTAPIError(
                     error="Procedure not found",
@@ -472,9 +526,10 @@ class ProcedureController(Controller):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(procedure_records_bytes_generator(procedure_records), media_type="application/ndjson")
+            return Stream(ndjson_records(procedure_records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -488,7 +543,7 @@ class ProcedureController(Controller):
         self, procedure_record_id: str
     ) -> ProcedureRecordOutput:
         try:
-            record = ProcedureRecord.get_by_id(id=procedure_record_id)
+            record = await ProcedureRecord.get_by_id_async(id=procedure_record_id)
             if record is None:
                 error = RESTAPIError(
                     error="Procedure Record Not Found",
@@ -503,13 +558,31 @@ class ProcedureController(Controller):
             )
             return Response(content=error, status_code=500)
         
+    # Get pre-signed download URLs for the files of Procedure Records
+    @post(path="/records/download_urls", status_code=200)
+    async def get_procedure_record_download_urls(
+        self,
+        data: RecordDownloadURLsRequest
+    ) -> List[RecordDownloadURL]:
+        try:
+            download_urls = await ProcedureRecord.get_download_urls_async(record_ids=data.record_ids)
+            return [RecordDownloadURL(**download_url) for download_url in download_urls]
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while retrieving procedure record download URLs"
+            )
+            return Response(content=error, status_code=500)
+
     # Get Procedure Record File
     @get(path="/records/id/{record_id:str}/download")
     async def download_procedure_record_file(
-        self, record_id: str
+        self,
+        record_id: str,
+        presigned: Optional[bool] = None
     ) -> Redirect:
         try:
-            procedure_record = ProcedureRecord.get_by_id(id=record_id)
+            procedure_record = await ProcedureRecord.get_by_id_async(id=record_id)
             if procedure_record is None:
                 error = RESTAPIError(
                     error="Procedure Record Not Found",
@@ -525,6 +598,9 @@ class ProcedureController(Controller):
                 return Response(content=error, status_code=404)
             bucket_name = "gemini"
             object_name = record_file
+            if PRESIGNED_DOWNLOADS if presigned is None else presigned:
+                url, _ = get_presigned_url_cache().get_url(object_name, bucket_name=bucket_name)
+                return Redirect(path=url)
             object_path = f"{bucket_name}/{object_name}"
             return Redirect(path=f"/api/files/download/{object_path}")
         except Exception as e:
@@ -543,14 +619,14 @@ class ProcedureController(Controller):
         data: Annotated[ProcedureRecordUpdate, Body]
     ) -> ProcedureRecordOutput:
         try:
-            procedure_record = ProcedureRecord.get_by_id(id=procedure_record_id)
+            procedure_record = await ProcedureRecord.get_by_id_async(id=procedure_record_id)
             if procedure_record is None:
                 error = RESTAPIError(
                     error="Procedure Record Not Found",
                     error_description="No procedure record found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            procedure_record = procedure_record.update(
+            procedure_record = await procedure_record.update_async(
                 procedure_data=data.procedure_data,
                 record_info=data.record_info
             )
@@ -574,14 +650,14 @@ class ProcedureController(Controller):
         self, procedure_record_id: str
     ) -> None:
         try:
-            procedure_record = ProcedureRecord.get_by_id(id=procedure_record_id)
+            procedure_record = await ProcedureRecord.get_by_id_async(id=procedure_record_id)
             if procedure_record is None:
                 error = RESTAPIError(
                     error="Procedure Record Not Found",
                     error_description="No procedure record found with the given ID"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = procedure_record.delete()
+            is_deleted = await procedure_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Procedure Record Deletion Failed",
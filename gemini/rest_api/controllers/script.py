@@ -1,17 +1,17 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream, Redirect
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
-from collections.abc import AsyncGenerator, Generator
-
 from pydantic import BaseModel
 
 from gemini.api.script import Script
 from gemini.api.script_record import ScriptRecord
+from gemini.api.presign import get_presigned_url_cache
+from gemini.rest_api.models import RecordDownloadURL, RecordDownloadURLsRequest, PRESIGNED_DOWNLOADS
 from gemini.rest_api.models import ( 
     ScriptInput, 
     ScriptOutput, 
@@ -28,18 +28,15 @@ from gemini.rest_api.models import (
     ScriptRecordInput,
     ScriptRecordOutput,
     ScriptRecordUpdate,
+    page_limit,
+    cursor_headers,
+    ndjson_records
 )
 
-from gemini.rest_api.file_handler import api_file_handler
+from gemini.rest_api.file_handler import get_api_file_handler
 
 from typing import List, Annotated, Optional
 
-async def script_records_bytes_generator(script_record_generator: Generator[ScriptRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in script_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
-
 
 class ScriptScriptRunInput(BaseModel):
     script_run_info: Optional[JSONB] = {}
@@ -56,9 +53,16 @@ class ScriptController(Controller):
 
     # Get All Scripts
     @get(path="/all")
-    async def get_all_scripts(self) -> List[ScriptOutput]:
+    async def get_all_scripts(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[ScriptOutput]:
         try:
-            scripts = Script.get_all()
+            if limit is not None or cursor is not None:
+                scripts, next_cursor = await Script.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=scripts, headers=cursor_headers(next_cursor))
+            scripts = await Script.get_all_async()
             if scripts is None:
                 error = RESTAPIError(
                     error="No scripts found",
@@ -66,6 +70,12 @@ class ScriptController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return scripts
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all scripts"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -81,13 +91,26 @@ class ScriptController(Controller):
         script_url: Optional[str] = None,
         script_extension: Optional[str] = None,
         script_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[ScriptOutput]:
         try:
             if script_info is not None:
                 script_info = str_to_dict(script_info)
 
-            scripts = Script.search(
+            if limit is not None or cursor is not None:
+                scripts, next_cursor = await Script.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    script_name=script_name,
+                    script_url=script_url,
+                    script_extension=script_extension,
+                    script_info=script_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=scripts, headers=cursor_headers(next_cursor))
+            scripts = await Script.search_async(
                 script_name=script_name,
                 script_url=script_url,
                 script_extension=script_extension,
@@ -101,6 +124,12 @@ class ScriptController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return scripts
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving scripts"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -114,7 +143,7 @@ class ScriptController(Controller):
         self, script_id: str
     ) -> ScriptOutput:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
@@ -137,7 +166,8 @@ class ScriptController(Controller):
         data: Annotated[ScriptInput, Body]
     ) -> ScriptOutput:
         try:
-            script = Script.create(
+            script = await asyncio.to_thread(
+                Script.create,
                 script_name=data.script_name,
                 script_url=data.script_url,
                 script_extension=data.script_extension,
@@ -166,14 +196,14 @@ class ScriptController(Controller):
         data: Annotated[ScriptUpdate, Body]
     ) -> ScriptOutput:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            script = script.update(
+            script = await script.update_async(
                 script_name=data.script_name,
                 script_url=data.script_url,
                 script_extension=data.script_extension,
@@ -200,14 +230,14 @@ class ScriptController(Controller):
         script_id: str
     ) -> None:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = script.delete()
+            is_deleted = await script.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Script not deleted",
@@ -228,14 +258,14 @@ class ScriptController(Controller):
         self, script_id: str
     ) -> List[ExperimentOutput]:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = script.get_associated_experiments()
+            experiments = await asyncio.to_thread(script.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -257,14 +287,14 @@ class ScriptController(Controller):
         self, script_id: str
     ) -> List[ScriptRunOutput]:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            script_runs = script.get_associated_runs()
+            script_runs = await asyncio.to_thread(script.get_associated_runs)
             if script_runs is None:
                 error = RESTAPIError(
                     error="No script runs found",
@@ -285,14 +315,14 @@ class ScriptController(Controller):
         self, script_id: str
     ) -> List[DatasetOutput]:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            datasets = script.get_associated_datasets()
+            datasets = await asyncio.to_thread(script.get_associated_datasets)
             if datasets is None:
                 error = RESTAPIError(
                     error="No datasets found",
@@ -315,14 +345,14 @@ class ScriptController(Controller):
         data: Annotated[ScriptScriptRunInput, Body]
     ) -> ScriptRunOutput:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            script_run = script.create_new_run(script_run_info=data.script_run_info)
+            script_run = await asyncio.to_thread(script.create_new_run, script_run_info=data.script_run_info)
             if script_run is None:
                 error = RESTAPIError(
                     error="Script run not created",
@@ -345,14 +375,15 @@ class ScriptController(Controller):
         data: Annotated[ScriptDatasetInput, Body]
     ) -> DatasetOutput:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            dataset = script.create_new_dataset(
+            dataset = await asyncio.to_thread(
+                script.create_new_dataset,
                 dataset_name=data.dataset_name,
                 dataset_info=data.dataset_info,
                 collection_date=data.collection_date,
@@ -381,7 +412,7 @@ class ScriptController(Controller):
         data: Annotated[ScriptRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> ScriptRecordOutput:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
@@ -391,9 +422,10 @@ class ScriptController(Controller):
             
             record_file_path = None
             if data.record_file:
-                record_file_path = await api_file_handler.create_file(data.record_file)
+                record_file_path = await get_api_file_handler().create_file(data.record_file)
 
-            add_success, inserted_record_ids = script.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                script.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 script_data=data.script_data,
@@ -411,7 +443,7 @@ class ScriptController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_script_record = ScriptRecord.get_by_id(id=inserted_record_id)
+            inserted_script_record = await ScriptRecord.get_by_id_async(id=inserted_record_id)
             if inserted_script_record is None:
                 error = RESTAPIError(
                     error="Script record not found",
@@ -434,23 +466,47 @@ class ScriptController(Controller):
         experiment_name: Optional[str] = None,
         season_name: Optional[str] = None,
         site_name: Optional[str] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
                     error_description="The script with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            script_records = script.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await ScriptRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    script_name=script.script_name,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name,
+                    collection_date=collection_date
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            script_records = script.search_records_async(
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
-                collection_date=collection_date
+                collection_date=collection_date,
+                lightweight=True
             )
-            return Stream(script_records_bytes_generator(script_records), media_type="application/ndjson")
+            return Stream(ndjson_records(script_records), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving script records"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -471,7 +527,7 @@ class ScriptController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            script = Script.get_by_id(id=script_id)
+            script = await Script.get_by_id_async(id=script_id)
             if script is None:
                 error = RESTAPIError(
                     error="Script not found",
@@ -484,9 +540,10 @@ class ScriptController(Controller):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(script_records_bytes_generator(script_records), media_type="application/ndjson")
+            return Stream(ndjson_records(script_records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -502,7 +559,7 @@ class ScriptController(Controller):
         record_id: str
     ) -> ScriptRecordOutput:
         try:
-            script_record = ScriptRecord.get_by_id(id=record_id)
+            script_record = await ScriptRecord.get_by_id_async(id=record_id)
             if script_record is None:
                 error = RESTAPIError(
                     error="Script record not found",
@@ -517,14 +574,31 @@ class ScriptController(Controller):
             )
             return Response(content=error, status_code=500)
         
+    # Get pre-signed download URLs for the files of Script Records
+    @post(path="/records/download_urls", status_code=200)
+    async def get_script_record_download_urls(
+        self,
+        data: RecordDownloadURLsRequest
+    ) -> List[RecordDownloadURL]:
+        try:
+            download_urls = await ScriptRecord.get_download_urls_async(record_ids=data.record_ids)
+            return [RecordDownloadURL(**download_url) for download_url in download_urls]
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while retrieving script record download URLs"
+            )
+            return Response(content=error, status_code=500)
+
     # Get Script Record File
     @get(path="/records/id/{record_id:str}/download")
     async def download_script_record_file(
         self,
-        record_id: str
+        record_id: str,
+        presigned: Optional[bool] = None
     ) -> Redirect:
         try:
-            script_record = ScriptRecord.get_by_id(id=record_id)
+            script_record = await ScriptRecord.get_by_id_async(id=record_id)
             if script_record is None:
                 error = RESTAPIError(
                     error="Script record not found",
@@ -540,6 +614,9 @@ class ScriptController(Controller):
                 return Response(content=error, status_code=404) # This will be a type error at runtime
             bucket_name = "gemini"
             object_name = record_file
+            if PRESIGNED_DOWNLOADS if presigned is None else presigned:
+                url, _ = get_presigned_url_cache().get_url(object_name, bucket_name=bucket_name)
+                return Redirect(path=url)
             object_path = f"{bucket_name}/{object_name}"
             return Redirect(path=f"/api/files/download/{object_path}")
         except Exception as e:
@@ -557,14 +634,14 @@ class ScriptController(Controller):
         data: Annotated[ScriptRecordUpdate, Body]
     ) -> ScriptRecordOutput:
         try:
-            script_record = ScriptRecord.get_by_id(id=record_id)
+            script_record = await ScriptRecord.get_by_id_async(id=record_id)
             if script_record is None:
                 error = RESTAPIError(
                     error="Script record not found",
                     error_description="The script record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            script_record = script_record.update(
+            script_record = await script_record.update_async(
                 script_data=data.script_data,
                 record_info=data.record_info
             )
@@ -590,14 +667,14 @@ class ScriptController(Controller):
         record_id: str
     ) -> None:
         try:
-            script_record = ScriptRecord.get_by_id(id=record_id)
+            script_record = await ScriptRecord.get_by_id_async(id=record_id)
             if script_record is None:
                 error = RESTAPIError(
                     error="Script record not found",
                     error_description="The script record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = script_record.delete()
+            is_deleted = await script_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Script record not deleted",
@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -11,7 +12,9 @@ from gemini.rest_api.models import (
     ExperimentOutput, 
     RESTAPIError, 
     JSONB, 
-    str_to_dict
+    str_to_dict,
+    page_limit,
+    cursor_headers
 )
 
 from typing import List, Annotated, Optional
@@ -20,9 +23,16 @@ class SeasonController(Controller):
 
     # Get All Seasons
     @get(path="/all")
-    async def get_all_seasons(self) -> List[SeasonOutput]:
+    async def get_all_seasons(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[SeasonOutput]:
         try:
-            seasons = Season.get_all()
+            if limit is not None or cursor is not None:
+                seasons, next_cursor = await Season.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=seasons, headers=cursor_headers(next_cursor))
+            seasons = await Season.get_all_async()
             if seasons is None:
                 error = RESTAPIError(
                     error="No seasons found",
@@ -30,6 +40,12 @@ class SeasonController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return seasons
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all seasons"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -45,13 +61,26 @@ class SeasonController(Controller):
         season_info: Optional[JSONB] = None,
         season_start_date: Optional[str] = None,
         season_end_date: Optional[str] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[SeasonOutput]:
         try:
             if season_info is not None:
                 season_info = str_to_dict(season_info)
 
-            seasons = Season.search(
+            if limit is not None or cursor is not None:
+                seasons, next_cursor = await Season.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    season_name=season_name,
+                    season_info=season_info,
+                    season_start_date=season_start_date,
+                    season_end_date=season_end_date,
+                    experiment_name=experiment_name
+                )
+                return Response(content=seasons, headers=cursor_headers(next_cursor))
+            seasons = await Season.search_async(
                 season_name=season_name,
                 season_info=season_info,
                 season_start_date=season_start_date,
@@ -65,6 +94,12 @@ class SeasonController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return seasons
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving seasons"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -78,7 +113,7 @@ class SeasonController(Controller):
         self, season_id: str
     ) -> SeasonOutput:
         try:
-            season = Season.get_by_id(id=season_id)
+            season = await Season.get_by_id_async(id=season_id)
             if season is None:
                 error = RESTAPIError(
                     error="Season not found",
@@ -100,7 +135,8 @@ class SeasonController(Controller):
         data: Annotated[SeasonInput, Body]
     ) -> SeasonOutput:
         try:
-            season = Season.create(
+            season = await asyncio.to_thread(
+                Season.create,
                 season_name=data.season_name,
                 season_info=data.season_info,
                 season_start_date=data.season_start_date,
@@ -129,7 +165,7 @@ class SeasonController(Controller):
         data: Annotated[SeasonUpdate, Body]
     ) -> SeasonOutput:
         try:
-            season_obj = Season.get_by_id(id=season_id) # Renamed to avoid conflict
+            season_obj = await Season.get_by_id_async(id=season_id) # Renamed to avoid conflict
             if season_obj is None:
                 error = RESTAPIError(
                     error="Season not found",
@@ -137,7 +173,7 @@ class SeasonController(Controller):
                 )
                 return Response(content=error, status_code=404)
             
-            updated_season = season_obj.update( # Use a different variable for the result of update
+            updated_season = await season_obj.update_async( # Use a different variable for the result of update
                 season_name=data.season_name,
                 season_info=data.season_info,
                 season_start_date=data.season_start_date,
@@ -163,14 +199,14 @@ class SeasonController(Controller):
         self, season_id: str
     ) -> None:
         try:
-            season = Season.get_by_id(id=season_id)
+            season = await Season.get_by_id_async(id=season_id)
             if season is None:
                 error = RESTAPIError(
                     error="Season not found",
                     error_description="The season with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = season.delete()
+            is_deleted = await season.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Season not deleted",
@@ -193,14 +229,14 @@ class SeasonController(Controller):
         self, season_id: str
     ) -> ExperimentOutput:
         try:
-            season = Season.get_by_id(id=season_id)
+            season = await Season.get_by_id_async(id=season_id)
             if season is None:
                 error = RESTAPIError(
                     error="Season not found",
                     error_description="The season with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiment = season.get_associated_experiment()
+            experiment = await asyncio.to_thread(season.get_associated_experiment)
             if experiment is None:
                 error = RESTAPIError(
                     error="Experiment not found",
@@ -1,21 +1,23 @@
-from litestar import Response
+import asyncio
+from litestar import Request, Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream, Redirect
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
 from pydantic import BaseModel
 
-from collections.abc import AsyncGenerator, Generator
-
 from gemini.api.sensor import Sensor
 from gemini.api.sensor_record import SensorRecord
+from gemini.api.presign import get_presigned_url_cache
+from gemini.rest_api.models import RecordDownloadURL, RecordDownloadURLsRequest, PRESIGNED_DOWNLOADS
 from gemini.api.enums import GEMINISensorType, GEMINIDataType, GEMINIDataFormat
-from gemini.rest_api.models import SensorInput, SensorOutput, SensorUpdate, RESTAPIError, JSONB, str_to_dict
+from gemini.rest_api.models import SensorInput, SensorOutput, SensorUpdate, RESTAPIError, JSONB, str_to_dict, page_limit, cursor_headers, ndjson_records
 from gemini.rest_api.models import DatasetOutput, ExperimentOutput, SensorPlatformOutput
 from typing import List, Annotated, Optional
+from datetime import datetime
+from urllib.parse import quote
 
 from gemini.rest_api.models import (
     SensorRecordInput,
@@ -23,14 +25,8 @@ from gemini.rest_api.models import (
     SensorRecordUpdate
 )
 
-from gemini.rest_api.file_handler import api_file_handler
-
+from gemini.rest_api.file_handler import get_api_file_handler
 
-async def sensor_records_bytes_generator(sensor_record_generator: Generator[SensorRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in sensor_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
 
 
 class SensorDatasetInput(BaseModel):
@@ -44,9 +40,16 @@ class SensorController(Controller):
 
     # Get All Sensors
     @get(path="/all")
-    async def get_all_sensors(self) -> List[SensorOutput]:
+    async def get_all_sensors(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[SensorOutput]:
         try:
-            sensors = Sensor.get_all()
+            if limit is not None or cursor is not None:
+                sensors, next_cursor = await Sensor.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=sensors, headers=cursor_headers(next_cursor))
+            sensors = await Sensor.get_all_async()
             if sensors is None:
                 error = RESTAPIError(
                     error="No sensors found",
@@ -54,6 +57,12 @@ class SensorController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensors
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all sensors"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -70,13 +79,27 @@ class SensorController(Controller):
         sensor_data_type_id: Optional[int] = None,
         sensor_data_format_id: Optional[int] = None,
         sensor_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[SensorOutput]:
         try:
             if sensor_info is not None:
                 sensor_info = str_to_dict(sensor_info)
 
-            sensors = Sensor.search(
+            if limit is not None or cursor is not None:
+                sensors, next_cursor = await Sensor.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    sensor_name=sensor_name,
+                    sensor_type=GEMINISensorType(sensor_type_id) if sensor_type_id else None,
+                    sensor_data_type=GEMINIDataType(sensor_data_type_id) if sensor_data_type_id else None,
+                    sensor_data_format=GEMINIDataFormat(sensor_data_format_id) if sensor_data_format_id else None,
+                    sensor_info=sensor_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=sensors, headers=cursor_headers(next_cursor))
+            sensors = await Sensor.search_async(
                 sensor_name=sensor_name,
                 sensor_type=GEMINISensorType(sensor_type_id) if sensor_type_id else None,
                 sensor_data_type=GEMINIDataType(sensor_data_type_id) if sensor_data_type_id else None,
@@ -91,6 +114,12 @@ class SensorController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensors
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving sensors"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -104,7 +133,7 @@ class SensorController(Controller):
         self, sensor_id: str
     ) -> SensorOutput:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
@@ -126,7 +155,8 @@ class SensorController(Controller):
         data: Annotated[SensorInput, Body]
     ) -> SensorOutput:
         try:
-            sensor = Sensor.create(
+            sensor = await asyncio.to_thread(
+                Sensor.create,
                 sensor_name=data.sensor_name,
                 sensor_type=GEMINISensorType(data.sensor_type_id) if data.sensor_type_id else None,
                 sensor_data_type=GEMINIDataType(data.sensor_data_type_id) if data.sensor_data_type_id else None,
@@ -156,14 +186,14 @@ class SensorController(Controller):
         data: Annotated[SensorUpdate, Body]
     ) -> SensorOutput:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor = sensor.update(
+            sensor = await sensor.update_async(
                 sensor_name=data.sensor_name,
                 sensor_type=GEMINISensorType(data.sensor_type_id),
                 sensor_data_type=GEMINIDataType(data.sensor_data_type_id),
@@ -184,14 +214,14 @@ class SensorController(Controller):
         self, sensor_id: str
     ) -> None:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = sensor.delete()
+            is_deleted = await sensor.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete sensor",
@@ -211,14 +241,14 @@ class SensorController(Controller):
         self, sensor_id: str
     ) -> List[ExperimentOutput]:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = sensor.get_associated_experiments()
+            experiments = await asyncio.to_thread(sensor.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -239,14 +269,14 @@ class SensorController(Controller):
         self, sensor_id: str
     ) -> List[SensorPlatformOutput]:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor_platforms = sensor.get_associated_sensor_platforms()
+            sensor_platforms = await asyncio.to_thread(sensor.get_associated_sensor_platforms)
             if sensor_platforms is None:
                 error = RESTAPIError(
                     error="No sensor platforms found",
@@ -267,14 +297,14 @@ class SensorController(Controller):
         self, sensor_id: str
     ) -> List[DatasetOutput]:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            datasets = sensor.get_associated_datasets()
+            datasets = await asyncio.to_thread(sensor.get_associated_datasets)
             if datasets is None:
                 error = RESTAPIError(
                     error="No datasets found",
@@ -298,7 +328,7 @@ class SensorController(Controller):
         data: Annotated[SensorRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> SensorRecordOutput:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
@@ -307,9 +337,10 @@ class SensorController(Controller):
                 return Response(content=error, status_code=404)
             
             if data.record_file:
-                record_file_path = await api_file_handler.create_file(data.record_file)
+                record_file_path = await get_api_file_handler().create_file(data.record_file)
 
-            add_success, inserted_record_ids = sensor.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                sensor.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 sensor_data=data.sensor_data,
@@ -330,7 +361,72 @@ class SensorController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_sensor_record = SensorRecord.get_by_id(id=inserted_record_id)
+            inserted_sensor_record = await SensorRecord.get_by_id_async(id=inserted_record_id)
+            if inserted_sensor_record is None:
+                error = RESTAPIError(
+                    error="Sensor record not found",
+                    error_description="The sensor record with the given ID was not found"
+                )
+                return Response(content=error, status_code=404)
+            return inserted_sensor_record
+        except Exception as e:
+            error_message = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while adding sensor record"
+            )
+            return Response(content=error_message, status_code=500)
+
+    # Add Sensor Record, streaming the raw request body to storage as the record file
+    @post(path="/id/{sensor_id:str}/records/stream", request_max_body_size=None)
+    async def add_sensor_record_stream(
+        self,
+        request: Request,
+        sensor_id: str,
+        file_name: str,
+        timestamp: datetime,
+        collection_date: Optional[datetime] = None,
+        sensor_data: Optional[str] = None,
+        dataset_name: Optional[str] = None,
+        experiment_name: Optional[str] = None,
+        season_name: Optional[str] = None,
+        site_name: Optional[str] = None,
+        plot_number: Optional[int] = None,
+        plot_row_number: Optional[int] = None,
+        plot_column_number: Optional[int] = None,
+        record_info: Optional[str] = None
+    ) -> SensorRecordOutput:
+        try:
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
+            if sensor is None:
+                error = RESTAPIError(
+                    error="Sensor not found",
+                    error_description="The sensor with the given ID was not found"
+                )
+                return Response(content=error, status_code=404)
+            content_type = request.headers.get("Content-Type")
+            add_success, inserted_record_ids = await sensor.insert_record_stream_async(
+                file_stream=request.stream(),
+                file_name=file_name,
+                timestamp=timestamp,
+                collection_date=collection_date,
+                sensor_data=str_to_dict(sensor_data) if sensor_data else {},
+                dataset_name=dataset_name,
+                experiment_name=experiment_name,
+                season_name=season_name,
+                site_name=site_name,
+                plot_number=plot_number if plot_number is not None else -1,
+                plot_row_number=plot_row_number if plot_row_number is not None else -1,
+                plot_column_number=plot_column_number if plot_column_number is not None else -1,
+                record_info=str_to_dict(record_info) if record_info else {},
+                content_type=content_type if content_type != "application/octet-stream" else None
+            )
+            if not add_success:
+                error = RESTAPIError(
+                    error="Failed to add sensor record",
+                    error_description="An error occurred while adding the sensor record"
+                )
+                return Response(content=error, status_code=500)
+            inserted_sensor_record = await SensorRecord.get_by_id_async(id=inserted_record_ids[0])
             if inserted_sensor_record is None:
                 error = RESTAPIError(
                     error="Sensor record not found",
@@ -356,26 +452,53 @@ class SensorController(Controller):
         plot_number: Optional[int] = None,
         plot_row_number: Optional[int] = None,
         plot_column_number: Optional[int] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
                     error_description="The sensor with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor_record_generator = sensor.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await SensorRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    sensor_name=sensor.sensor_name,
+                    collection_date=collection_date,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name,
+                    plot_number=plot_number,
+                    plot_row_number=plot_row_number,
+                    plot_column_number=plot_column_number
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            sensor_record_generator = sensor.search_records_async(
                 collection_date=collection_date,
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
-                plot_column_number=plot_column_number
+                plot_column_number=plot_column_number,
+                lightweight=True
+            )
+            return Stream(ndjson_records(sensor_record_generator), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving sensor records"
             )
-            return Stream(sensor_records_bytes_generator(sensor_record_generator), media_type="application/ndjson")
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -395,7 +518,7 @@ class SensorController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            sensor = Sensor.get_by_id(id=sensor_id)
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
             if sensor is None:
                 error = RESTAPIError(
                     error="Sensor not found",
@@ -408,9 +531,10 @@ class SensorController(Controller):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(sensor_records_bytes_generator(sensor_records), media_type="application/ndjson")
+            return Stream(ndjson_records(sensor_records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -418,6 +542,47 @@ class SensorController(Controller):
             )
             return Response(content=error, status_code=500)
 
+    # Download the files of filtered Sensor Records as one archive
+    @get(path="/id/{sensor_id:str}/records/archive")
+    async def archive_sensor_records(
+        self,
+        sensor_id: str,
+        start_timestamp: Optional[str] = None,
+        end_timestamp: Optional[str] = None,
+        dataset_names: Optional[List[str]] = None,
+        experiment_names: Optional[List[str]] = None,
+        season_names: Optional[List[str]] = None,
+        site_names: Optional[List[str]] = None
+    ) -> Stream:
+        try:
+            sensor = await Sensor.get_by_id_async(id=sensor_id)
+            if sensor is None:
+                error = RESTAPIError(
+                    error="Sensor not found",
+                    error_description="The sensor with the given ID was not found"
+                )
+                return Response(content=error, status_code=404)
+            archive = sensor.filter_records_archive(
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                dataset_names=dataset_names,
+                experiment_names=experiment_names,
+                season_names=season_names,
+                site_names=site_names
+            )
+            archive_name = quote(f"{sensor.sensor_name}_records.tar")
+            return Stream(
+                archive,
+                media_type="application/x-tar",
+                headers={"Content-Disposition": f"attachment; filename*=UTF-8''{archive_name}"}
+            )
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while archiving sensor records"
+            )
+            return Response(content=error, status_code=500)
+
         
     # Get Sensor Record by ID
     @get(path="/records/id/{record_id:str}")
@@ -425,7 +590,7 @@ class SensorController(Controller):
         self, record_id: str
     ) -> SensorRecordOutput:
         try:
-            sensor_record = SensorRecord.get_by_id(id=record_id)
+            sensor_record = await SensorRecord.get_by_id_async(id=record_id)
             if sensor_record is None:
                 error = RESTAPIError(
                     error="Sensor record not found",
@@ -440,13 +605,31 @@ class SensorController(Controller):
             )
             return Response(content=error_message, status_code=500)
         
+    # Get pre-signed download URLs for the files of Sensor Records
+    @post(path="/records/download_urls", status_code=200)
+    async def get_sensor_record_download_urls(
+        self,
+        data: RecordDownloadURLsRequest
+    ) -> List[RecordDownloadURL]:
+        try:
+            download_urls = await SensorRecord.get_download_urls_async(record_ids=data.record_ids)
+            return [RecordDownloadURL(**download_url) for download_url in download_urls]
+        except Exception as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="An error occurred while retrieving sensor record download URLs"
+            )
+            return Response(content=error, status_code=500)
+
     # Download Sensor Record File
     @get(path="/records/id/{record_id:str}/download")
     async def download_sensor_record_file(
-        self, record_id: str
+        self,
+        record_id: str,
+        presigned: Optional[bool] = None
     ) -> Redirect:
         try:
-            sensor_record = SensorRecord.get_by_id(id=record_id)
+            sensor_record = await SensorRecord.get_by_id_async(id=record_id)
             if sensor_record is None:
                 error = RESTAPIError(
                     error="Sensor record not found",
@@ -462,6 +645,9 @@ class SensorController(Controller):
                 return Response(content=error, status_code=404)
             bucket_name = "gemini"
             object_name = record_file
+            if PRESIGNED_DOWNLOADS if presigned is None else presigned:
+                url, _ = get_presigned_url_cache().get_url(object_name, bucket_name=bucket_name)
+                return Redirect(path=url)
             object_path = f"{bucket_name}/{object_name}"
             return Redirect(path=f"/api/files/download/{object_path}")
         except Exception as e:
@@ -479,14 +665,14 @@ class SensorController(Controller):
         data: Annotated[SensorRecordUpdate, Body]
     ) -> SensorRecordOutput:
         try:
-            sensor_record = SensorRecord.get_by_id(id=record_id)
+            sensor_record = await SensorRecord.get_by_id_async(id=record_id)
             if sensor_record is None:
                 error = RESTAPIError(
                     error="Sensor record not found",
                     error_description="The sensor record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor_record = sensor_record.update(
+            sensor_record = await sensor_record.update_async(
                 sensor_data=data.sensor_data,
                 record_info=data.record_info,
             )
@@ -511,14 +697,14 @@ class SensorController(Controller):
         self, record_id: str
     ) -> None:
         try:
-            sensor_record = SensorRecord.get_by_id(id=record_id)
+            sensor_record = await SensorRecord.get_by_id_async(id=record_id)
             if sensor_record is None:
                 error = RESTAPIError(
                     error="Sensor record not found",
                     error_description="The sensor record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = sensor_record.delete()
+            is_deleted = await sensor_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete sensor record",
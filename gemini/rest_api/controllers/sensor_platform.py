@@ -1,3 +1,4 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
@@ -7,7 +8,7 @@ from pydantic import BaseModel
 
 from gemini.api.sensor_platform import SensorPlatform
 from gemini.api.enums import GEMINISensorType, GEMINIDataFormat, GEMINIDataType
-from gemini.rest_api.models import SensorPlatformInput, SensorPlatformOutput, SensorPlatformUpdate, RESTAPIError, JSONB, str_to_dict
+from gemini.rest_api.models import SensorPlatformInput, SensorPlatformOutput, SensorPlatformUpdate, RESTAPIError, JSONB, str_to_dict, page_limit, cursor_headers
 from gemini.rest_api.models import SensorOutput, ExperimentOutput
 from typing import List, Annotated, Optional
 
@@ -24,9 +25,16 @@ class SensorPlatformController(Controller):
 
     # Get All Sensor Platforms
     @get(path="/all")
-    async def get_all_sensor_platforms(self) -> List[SensorPlatformOutput]:
+    async def get_all_sensor_platforms(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[SensorPlatformOutput]:
         try:
-            sensor_platforms = SensorPlatform.get_all()
+            if limit is not None or cursor is not None:
+                sensor_platforms, next_cursor = await SensorPlatform.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=sensor_platforms, headers=cursor_headers(next_cursor))
+            sensor_platforms = await SensorPlatform.get_all_async()
             if sensor_platforms is None:
                 error = RESTAPIError(
                     error="No sensor platforms found",
@@ -34,6 +42,12 @@ class SensorPlatformController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensor_platforms
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all sensor platforms"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -47,13 +61,24 @@ class SensorPlatformController(Controller):
         self,
         sensor_platform_name: Optional[str] = None,
         sensor_platform_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[SensorPlatformOutput]:
         try:
             if sensor_platform_info is not None:
                 sensor_platform_info = str_to_dict(sensor_platform_info)
 
-            sensor_platforms = SensorPlatform.search(
+            if limit is not None or cursor is not None:
+                sensor_platforms, next_cursor = await SensorPlatform.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    sensor_platform_name=sensor_platform_name,
+                    sensor_platform_info=sensor_platform_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=sensor_platforms, headers=cursor_headers(next_cursor))
+            sensor_platforms = await SensorPlatform.search_async(
                 sensor_platform_name=sensor_platform_name,
                 sensor_platform_info=sensor_platform_info,
                 experiment_name=experiment_name
@@ -66,6 +91,12 @@ class SensorPlatformController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensor_platforms
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving sensor platforms"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -80,7 +111,7 @@ class SensorPlatformController(Controller):
         self, sensor_platform_id: str
     ) -> SensorPlatformOutput:
         try:
-            sensor_platform = SensorPlatform.get_by_id(id=sensor_platform_id)
+            sensor_platform = await SensorPlatform.get_by_id_async(id=sensor_platform_id)
             if sensor_platform is None:
                 error = RESTAPIError(
                     error="Sensor platform not found",
@@ -102,7 +133,8 @@ class SensorPlatformController(Controller):
         data: Annotated[SensorPlatformInput, Body]
     ) -> SensorPlatformOutput:
         try:
-            sensor_platform = SensorPlatform.create(
+            sensor_platform = await asyncio.to_thread(
+                SensorPlatform.create,
                 sensor_platform_name=data.sensor_platform_name,
                 sensor_platform_info=data.sensor_platform_info,
                 experiment_name=data.experiment_name
@@ -129,14 +161,14 @@ class SensorPlatformController(Controller):
         data: Annotated[SensorPlatformUpdate, Body]
     ) -> SensorPlatformOutput:
         try:
-            sensor_platform = SensorPlatform.get_by_id(id=sensor_platform_id)
+            sensor_platform = await SensorPlatform.get_by_id_async(id=sensor_platform_id)
             if sensor_platform is None:
                 error = RESTAPIError(
                     error="Sensor platform not found",
                     error_description="The sensor platform with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor_platform = sensor_platform.update(
+            sensor_platform = await sensor_platform.update_async(
                 sensor_platform_name=data.sensor_platform_name,
                 sensor_platform_info=data.sensor_platform_info
             )
@@ -161,14 +193,14 @@ class SensorPlatformController(Controller):
         self, sensor_platform_id: str
     ) -> None:
         try:
-            sensor_platform = SensorPlatform.get_by_id(id=sensor_platform_id)
+            sensor_platform = await SensorPlatform.get_by_id_async(id=sensor_platform_id)
             if sensor_platform is None:
                 error = RESTAPIError(
                     error="Sensor platform not found",
                     error_description="The sensor platform with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = sensor_platform.delete()
+            is_deleted = await sensor_platform.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Sensor platform not deleted",
@@ -188,14 +220,14 @@ class SensorPlatformController(Controller):
         self, sensor_platform_id: str
     ) -> List[ExperimentOutput]:
         try:
-            sensor_platform = SensorPlatform.get_by_id(id=sensor_platform_id)
+            sensor_platform = await SensorPlatform.get_by_id_async(id=sensor_platform_id)
             if sensor_platform is None:
                 error = RESTAPIError(
                     error="Sensor platform not found",
                     error_description="The sensor platform with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = sensor_platform.get_associated_experiments()
+            experiments = await asyncio.to_thread(sensor_platform.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -216,14 +248,14 @@ class SensorPlatformController(Controller):
         self, sensor_platform_id: str
     ) -> List[SensorOutput]:
         try:
-            sensor_platform = SensorPlatform.get_by_id(id=sensor_platform_id)
+            sensor_platform = await SensorPlatform.get_by_id_async(id=sensor_platform_id)
             if sensor_platform is None:
                 error = RESTAPIError(
                     error="Sensor platform not found",
                     error_description="The sensor platform with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensors = sensor_platform.get_associated_sensors()
+            sensors = await asyncio.to_thread(sensor_platform.get_associated_sensors)
             if sensors is None:
                 error = RESTAPIError(
                     error="No sensors found",
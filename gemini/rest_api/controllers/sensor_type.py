@@ -1,10 +1,11 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 
 from gemini.api.sensor_type import SensorType
-from gemini.rest_api.models import SensorTypeInput, SensorTypeOutput, SensorTypeUpdate, RESTAPIError, str_to_dict, JSONB
+from gemini.rest_api.models import SensorTypeInput, SensorTypeOutput, SensorTypeUpdate, RESTAPIError, str_to_dict, JSONB, page_limit, cursor_headers
 
 from typing import List, Annotated, Optional
 
@@ -12,9 +13,16 @@ class SensorTypeController(Controller):
 
     # Get All Sensor Types
     @get(path="/all")
-    async def get_all_sensor_types(self) -> List[SensorTypeOutput]:
+    async def get_all_sensor_types(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[SensorTypeOutput]:
         try:
-            sensor_types = SensorType.get_all()
+            if limit is not None or cursor is not None:
+                sensor_types, next_cursor = await SensorType.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=sensor_types, headers=cursor_headers(next_cursor))
+            sensor_types = await SensorType.get_all_async()
             if sensor_types is None:
                 error = RESTAPIError(
                     error="No sensor types found",
@@ -22,6 +30,12 @@ class SensorTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensor_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all sensor types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -35,13 +49,23 @@ class SensorTypeController(Controller):
     async def get_sensor_types(
         self,
         sensor_type_name: Optional[str] = None,
-        sensor_type_info: Optional[JSONB] = None
+        sensor_type_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[SensorTypeOutput]:
         try:
             if sensor_type_info is not None:
                 sensor_type_info = str_to_dict(sensor_type_info)
 
-            sensor_types = SensorType.search(
+            if limit is not None or cursor is not None:
+                sensor_types, next_cursor = await SensorType.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    sensor_type_name=sensor_type_name,
+                    sensor_type_info=sensor_type_info
+                )
+                return Response(content=sensor_types, headers=cursor_headers(next_cursor))
+            sensor_types = await SensorType.search_async(
                 sensor_type_name=sensor_type_name,
                 sensor_type_info=sensor_type_info
             )
@@ -53,6 +77,12 @@ class SensorTypeController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sensor_types
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving sensor types"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -66,7 +96,7 @@ class SensorTypeController(Controller):
             self, sensor_type_id: int
         ) -> SensorTypeOutput:
             try:
-                sensor_type = SensorType.get_by_id(id=sensor_type_id)
+                sensor_type = await SensorType.get_by_id_async(id=sensor_type_id)
                 if sensor_type is None:
                     error = RESTAPIError(
                         error="Sensor type not found",
@@ -88,7 +118,8 @@ class SensorTypeController(Controller):
         data: Annotated[SensorTypeInput, Body]
     ) -> SensorTypeOutput:
         try:
-            sensor_type = SensorType.create(
+            sensor_type = await asyncio.to_thread(
+                SensorType.create,
                 sensor_type_name=data.sensor_type_name,
                 sensor_type_info=data.sensor_type_info
             )
@@ -114,14 +145,14 @@ class SensorTypeController(Controller):
         data: Annotated[SensorTypeUpdate, Body]
     ) -> SensorTypeOutput:
         try:
-            sensor_type = SensorType.get_by_id(id=sensor_type_id)
+            sensor_type = await SensorType.get_by_id_async(id=sensor_type_id)
             if sensor_type is None:
                 error = RESTAPIError(
                     error="Sensor type not found",
                     error_description="The sensor type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            sensor_type = sensor_type.update(
+            sensor_type = await sensor_type.update_async(
                 sensor_type_name=data.sensor_type_name,
                 sensor_type_info=data.sensor_type_info
             )
@@ -146,14 +177,14 @@ class SensorTypeController(Controller):
         sensor_type_id: int
     ) -> None:
         try:
-            sensor_type = SensorType.get_by_id(id=sensor_type_id)
+            sensor_type = await SensorType.get_by_id_async(id=sensor_type_id)
             if sensor_type is None:
                 error = RESTAPIError(
                     error="Sensor type not found",
                     error_description="The sensor type with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = sensor_type.delete()
+            is_deleted = await sensor_type.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Sensor type not deleted",
@@ -1,10 +1,11 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 
 from gemini.api.site import Site
-from gemini.rest_api.models import SiteInput, SiteOutput, RESTAPIError, SiteUpdate, str_to_dict, JSONB
+from gemini.rest_api.models import SiteInput, SiteOutput, RESTAPIError, SiteUpdate, str_to_dict, JSONB, page_limit, cursor_headers
 from gemini.rest_api.models import ExperimentOutput, PlotOutput
 
 from typing import List, Annotated, Optional
@@ -13,9 +14,16 @@ class SiteController(Controller):
 
     # Get All Sites
     @get(path="/all")
-    async def get_all_sites(self) -> List[SiteOutput]:
+    async def get_all_sites(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[SiteOutput]:
         try:
-            sites = Site.get_all()
+            if limit is not None or cursor is not None:
+                sites, next_cursor = await Site.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=sites, headers=cursor_headers(next_cursor))
+            sites = await Site.get_all_async()
             if sites is None:
                 error = RESTAPIError(
                     error="No sites found",
@@ -23,6 +31,12 @@ class SiteController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sites
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all sites"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -39,13 +53,27 @@ class SiteController(Controller):
         site_state: Optional[str] = None,
         site_country: Optional[str] = None,
         site_info: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[SiteOutput]:
         try:
             if site_info is not None:
                 site_info = str_to_dict(site_info)
 
-            sites = Site.search(
+            if limit is not None or cursor is not None:
+                sites, next_cursor = await Site.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    site_name=site_name,
+                    site_city=site_city,
+                    site_state=site_state,
+                    site_country=site_country,
+                    site_info=site_info,
+                    experiment_name=experiment_name
+                )
+                return Response(content=sites, headers=cursor_headers(next_cursor))
+            sites = await Site.search_async(
                 site_name=site_name,
                 site_city=site_city,
                 site_state=site_state,
@@ -60,6 +88,12 @@ class SiteController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return sites
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving sites"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -73,7 +107,7 @@ class SiteController(Controller):
         self, site_id: str
     ) -> SiteOutput:
         try:
-            site = Site.get_by_id(id=site_id)
+            site = await Site.get_by_id_async(id=site_id)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
@@ -95,7 +129,8 @@ class SiteController(Controller):
         data: Annotated[SiteInput, Body]
     ) -> SiteOutput:
         try:
-            site = Site.create(
+            site = await asyncio.to_thread(
+                Site.create,
                 site_name=data.site_name,
                 site_city=data.site_city,
                 site_state=data.site_state,
@@ -126,14 +161,14 @@ class SiteController(Controller):
         data: Annotated[SiteUpdate, Body]
     ) -> SiteOutput:
         try:
-            site = Site.get_by_id(id=site_id)
+            site = await Site.get_by_id_async(id=site_id)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
                     error_description="The site with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            site = site.update(
+            site = await site.update_async(
                 site_name=data.site_name,
                 site_city=data.site_city,
                 site_state=data.site_state,
@@ -154,14 +189,14 @@ class SiteController(Controller):
         self, site_id: str
     ) -> None:
         try:
-            site = Site.get_by_id(id=site_id)
+            site = await Site.get_by_id_async(id=site_id)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
                     error_description="The site with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = site.delete()
+            is_deleted = await site.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete site",
@@ -182,14 +217,14 @@ class SiteController(Controller):
         self, site_id: str
     ) -> List[ExperimentOutput]:
         try:
-            site = Site.get_by_id(id=site_id)
+            site = await Site.get_by_id_async(id=site_id)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
                     error_description="The site with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = site.get_associated_experiments()
+            experiments = await asyncio.to_thread(site.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -210,14 +245,14 @@ class SiteController(Controller):
         self, site_id: str
     ) -> List[PlotOutput]:
         try:
-            site = Site.get_by_id(id=site_id)
+            site = await Site.get_by_id_async(id=site_id)
             if site is None:
                 error = RESTAPIError(
                     error="Site not found",
                     error_description="The site with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            plots = site.get_associated_plots()
+            plots = await asyncio.to_thread(site.get_associated_plots)
             if plots is None:
                 error = RESTAPIError(
                     error="No plots found",
@@ -1,18 +1,16 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 from litestar.response import Stream
-from litestar.serialization import encode_json
 from litestar.enums import RequestEncodingType
 
 from pydantic import BaseModel
 
-from collections.abc import AsyncGenerator, Generator
-
 from gemini.api.trait import Trait, GEMINITraitLevel
 from gemini.api.trait_record import TraitRecord
-from gemini.rest_api.models import TraitInput, TraitOutput, TraitUpdate, JSONB, str_to_dict
+from gemini.rest_api.models import TraitInput, TraitOutput, TraitUpdate, JSONB, str_to_dict, page_limit, cursor_headers, ndjson_records
 from gemini.rest_api.models import TraitRecordInput, TraitRecordOutput, TraitRecordUpdate, TraitLevelSearch
 from gemini.rest_api.models import RESTAPIError
 from gemini.rest_api.models import DatasetOutput
@@ -25,12 +23,6 @@ from gemini.rest_api.models import (
 )
 
 
-async def trait_records_bytes_generator(trait_record_generator: Generator[TraitRecord, None, None]) -> AsyncGenerator[bytes, None]:
-    for record in trait_record_generator:
-        record = record.model_dump(exclude_none=True)
-        record = encode_json(record) + b'\n'
-        yield record
-
 
 class TraitDatasetInput(BaseModel):
     dataset_name: str
@@ -44,9 +36,16 @@ class TraitController(Controller):
 
     # Get All Traits
     @get(path="/all")
-    async def get_all_traits(self) -> List[TraitOutput]:
+    async def get_all_traits(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[TraitOutput]:
         try:
-            traits = Trait.get_all()
+            if limit is not None or cursor is not None:
+                traits, next_cursor = await Trait.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=traits, headers=cursor_headers(next_cursor))
+            traits = await Trait.get_all_async()
             if traits is None:
                 error = RESTAPIError(
                     error="No traits found",
@@ -54,6 +53,12 @@ class TraitController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return traits
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all traits"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -70,7 +75,9 @@ class TraitController(Controller):
         trait_level_id: Optional[int] = None,
         trait_info: Optional[JSONB] = None,
         trait_metrics: Optional[JSONB] = None,
-        experiment_name: Optional[str] = 'Experiment A'
+        experiment_name: Optional[str] = 'Experiment A',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[TraitOutput]:
         try:
             if trait_info is not None:
@@ -78,7 +85,19 @@ class TraitController(Controller):
             if trait_metrics is not None:
                 trait_metrics = str_to_dict(trait_metrics)
 
-            traits = Trait.search(
+            if limit is not None or cursor is not None:
+                traits, next_cursor = await Trait.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    trait_name=trait_name,
+                    trait_units=trait_units,
+                    trait_level=GEMINITraitLevel(trait_level_id) if trait_level_id else None,
+                    trait_info=trait_info,
+                    trait_metrics=trait_metrics,
+                    experiment_name=experiment_name
+                )
+                return Response(content=traits, headers=cursor_headers(next_cursor))
+            traits = await Trait.search_async(
                 trait_name=trait_name,
                 trait_units=trait_units,
                 trait_level=GEMINITraitLevel(trait_level_id) if trait_level_id else None,
@@ -93,6 +112,12 @@ class TraitController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return traits
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving traits"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -106,7 +131,7 @@ class TraitController(Controller):
         self, trait_id: str
     ) -> TraitOutput:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
@@ -128,7 +153,8 @@ class TraitController(Controller):
         data: Annotated[TraitInput, Body]
     ) -> TraitOutput:
         try:
-            trait = Trait.create(
+            trait = await asyncio.to_thread(
+                Trait.create,
                 trait_name=data.trait_name,
                 trait_units=data.trait_units,
                 trait_level=GEMINITraitLevel(data.trait_level_id),
@@ -158,14 +184,14 @@ class TraitController(Controller):
         data: Annotated[TraitUpdate, Body]
     ) -> TraitOutput:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
                     error_description="The trait with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            trait = trait.update(
+            trait = await trait.update_async(
                 trait_name=data.trait_name,
                 trait_units=data.trait_units,
                 trait_level=GEMINITraitLevel(data.trait_level_id) if data.trait_level_id else None,
@@ -192,14 +218,14 @@ class TraitController(Controller):
         self, trait_id: str
     ) -> None:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
                     error_description="The trait with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = trait.delete()
+            is_deleted = await trait.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete trait",
@@ -220,14 +246,14 @@ class TraitController(Controller):
         self, trait_id: str
     ) -> List[str]:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
                     error_description="The trait with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            experiments = trait.get_associated_experiments()
+            experiments = await asyncio.to_thread(trait.get_associated_experiments)
             if experiments is None:
                 error = RESTAPIError(
                     error="No experiments found",
@@ -248,14 +274,14 @@ class TraitController(Controller):
         self, trait_id: str
     ) -> List[DatasetOutput]:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
                     error_description="The trait with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            datasets = trait.get_associated_datasets()
+            datasets = await asyncio.to_thread(trait.get_associated_datasets)
             if datasets is None:
                 error = RESTAPIError(
                     error="No datasets found",
@@ -278,7 +304,7 @@ class TraitController(Controller):
         data: Annotated[TraitRecordInput, Body(media_type=RequestEncodingType.MULTI_PART)]
     ) -> TraitRecordOutput:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
@@ -286,7 +312,8 @@ class TraitController(Controller):
                 )
                 return Response(content=error, status_code=404)
 
-            add_success, inserted_record_ids = trait.insert_record(
+            add_success, inserted_record_ids = await asyncio.to_thread(
+                trait.insert_record,
                 timestamp=data.timestamp,
                 collection_date=data.collection_date,
                 trait_value=data.trait_value,
@@ -306,7 +333,7 @@ class TraitController(Controller):
                 )
                 return Response(content=error, status_code=500)
             inserted_record_id = inserted_record_ids[0]
-            inserted_trait_record = TraitRecord.get_by_id(id=inserted_record_id)
+            inserted_trait_record = await TraitRecord.get_by_id_async(id=inserted_record_id)
             if inserted_trait_record is None:
                 error = RESTAPIError(
                     error="Trait record not found",
@@ -332,26 +359,53 @@ class TraitController(Controller):
         plot_number: Optional[int] = None,
         plot_row_number: Optional[int] = None,
         plot_column_number: Optional[int] = None,
-        collection_date: Optional[str] = None
+        collection_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Stream:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
                     error_description="The trait with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            trait_records = trait.search_records(
+            if limit is not None or cursor is not None:
+                records, next_cursor = await TraitRecord.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    trait_name=trait.trait_name,
+                    experiment_name=experiment_name,
+                    season_name=season_name,
+                    site_name=site_name,
+                    plot_number=plot_number,
+                    plot_row_number=plot_row_number,
+                    plot_column_number=plot_column_number,
+                    collection_date=collection_date
+                )
+                return Stream(
+                    ndjson_records(iter(records)),
+                    media_type="application/ndjson",
+                    headers=cursor_headers(next_cursor)
+                )
+            trait_records = trait.search_records_async(
                 experiment_name=experiment_name,
                 season_name=season_name,
                 site_name=site_name,
                 plot_number=plot_number,
                 plot_row_number=plot_row_number,
                 plot_column_number=plot_column_number,
-                collection_date=collection_date
+                collection_date=collection_date,
+                lightweight=True
+            )
+            return Stream(ndjson_records(trait_records), media_type="application/ndjson")
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving trait records"
             )
-            return Stream(trait_records_bytes_generator(trait_records), media_type="application/ndjson")
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -371,7 +425,7 @@ class TraitController(Controller):
         site_names: Optional[List[str]] = None
     ) -> Stream:
         try:
-            trait = Trait.get_by_id(id=trait_id)
+            trait = await Trait.get_by_id_async(id=trait_id)
             if trait is None:
                 error = RESTAPIError(
                     error="Trait not found",
@@ -384,9 +438,10 @@ class TraitController(Controller):
                 dataset_names=dataset_names,
                 experiment_names=experiment_names,
                 season_names=season_names,
-                site_names=site_names
+                site_names=site_names,
+                lightweight=True
             )
-            return Stream(trait_records_bytes_generator(trait_records), media_type="application/ndjson")
+            return Stream(ndjson_records(trait_records), media_type="application/ndjson")
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -400,7 +455,7 @@ class TraitController(Controller):
         self, trait_record_id: str
     ) -> TraitRecordOutput:
         try:
-            trait_record = TraitRecord.get_by_id(id=trait_record_id)
+            trait_record = await TraitRecord.get_by_id_async(id=trait_record_id)
             if trait_record is None:
                 error = RESTAPIError(
                     error="Trait record not found",
@@ -423,14 +478,14 @@ class TraitController(Controller):
         data: Annotated[TraitRecordUpdate, Body]
     ) -> TraitRecordOutput:
         try:
-            trait_record = TraitRecord.get_by_id(id=trait_record_id)
+            trait_record = await TraitRecord.get_by_id_async(id=trait_record_id)
             if trait_record is None:
                 error = RESTAPIError(
                     error="Trait record not found",
                     error_description="The trait record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            trait_record = trait_record.update(
+            trait_record = await trait_record.update_async(
                 trait_value=data.trait_value,
                 record_info=data.record_info,
             )
@@ -454,14 +509,14 @@ class TraitController(Controller):
         self, trait_record_id: str
     ) -> None:
         try:
-            trait_record = TraitRecord.get_by_id(id=trait_record_id)
+            trait_record = await TraitRecord.get_by_id_async(id=trait_record_id)
             if trait_record is None:
                 error = RESTAPIError(
                     error="Trait record not found",
                     error_description="The trait record with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = trait_record.delete()
+            is_deleted = await trait_record.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete trait record",
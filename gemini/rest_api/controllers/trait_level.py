@@ -1,10 +1,11 @@
+import asyncio
 from litestar import Response
 from litestar.handlers import get, post, patch, delete
 from litestar.params import Body
 from litestar.controller import Controller
 
 from gemini.api.trait_level import TraitLevel
-from gemini.rest_api.models import TraitLevelInput, TraitLevelOutput, TraitLevelUpdate, RESTAPIError, str_to_dict, JSONB
+from gemini.rest_api.models import TraitLevelInput, TraitLevelOutput, TraitLevelUpdate, RESTAPIError, str_to_dict, JSONB, page_limit, cursor_headers
 
 from typing import List, Annotated, Optional
 
@@ -12,9 +13,16 @@ class TraitLevelController(Controller):
 
     # Get All Trait Levels
     @get(path="/all")
-    async def get_all_trait_levels(self) -> List[TraitLevelOutput]:
+    async def get_all_trait_levels(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[TraitLevelOutput]:
         try:
-            trait_levels = TraitLevel.get_all()
+            if limit is not None or cursor is not None:
+                trait_levels, next_cursor = await TraitLevel.paginate_async(page_limit=page_limit(limit), cursor=cursor)
+                return Response(content=trait_levels, headers=cursor_headers(next_cursor))
+            trait_levels = await TraitLevel.get_all_async()
             if trait_levels is None:
                 error = RESTAPIError(
                     error="No trait levels found",
@@ -22,6 +30,12 @@ class TraitLevelController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return trait_levels
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving all trait levels"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error = RESTAPIError(
                 error=str(e),
@@ -34,13 +48,23 @@ class TraitLevelController(Controller):
     async def get_trait_levels(
         self,
         trait_level_name: Optional[str] = None,
-        trait_level_info: Optional[JSONB] = None
+        trait_level_info: Optional[JSONB] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[TraitLevelOutput]:
         try:
             if trait_level_info is not None:
                 trait_level_info = str_to_dict(trait_level_info)
 
-            trait_levels = TraitLevel.search(
+            if limit is not None or cursor is not None:
+                trait_levels, next_cursor = await TraitLevel.paginate_async(
+                    page_limit=page_limit(limit),
+                    cursor=cursor,
+                    trait_level_name=trait_level_name,
+                    trait_level_info=trait_level_info
+                )
+                return Response(content=trait_levels, headers=cursor_headers(next_cursor))
+            trait_levels = await TraitLevel.search_async(
                 trait_level_name=trait_level_name,
                 trait_level_info=trait_level_info
             )
@@ -52,6 +76,12 @@ class TraitLevelController(Controller):
                 )
                 return Response(content=error, status_code=404)
             return trait_levels
+        except ValueError as e:
+            error = RESTAPIError(
+                error=str(e),
+                error_description="Invalid parameters were given while retrieving trait levels"
+            )
+            return Response(content=error, status_code=400)
         except Exception as e:
             error_message = RESTAPIError(
                 error=str(e),
@@ -65,7 +95,7 @@ class TraitLevelController(Controller):
         self, trait_level_id: int
     ) -> TraitLevelOutput:
         try:
-            trait_level = TraitLevel.get_by_id(id=trait_level_id)
+            trait_level = await TraitLevel.get_by_id_async(id=trait_level_id)
             if trait_level is None:
                 error = RESTAPIError(
                     error="Trait level not found",
@@ -87,7 +117,8 @@ class TraitLevelController(Controller):
         data: Annotated[TraitLevelInput, Body]
     ) -> TraitLevelOutput:
         try:
-            trait_level = TraitLevel.create(
+            trait_level = await asyncio.to_thread(
+                TraitLevel.create,
                 trait_level_name=data.trait_level_name,
                 trait_level_info=data.trait_level_info
             )
@@ -113,14 +144,14 @@ class TraitLevelController(Controller):
         data: Annotated[TraitLevelUpdate, Body]
     ) -> TraitLevelOutput:
         try:
-            trait_level = TraitLevel.get_by_id(id=trait_level_id)
+            trait_level = await TraitLevel.get_by_id_async(id=trait_level_id)
             if trait_level is None:
                 error = RESTAPIError(
                     error="Trait level not found",
                     error_description="The trait level with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            trait_level = trait_level.update(
+            trait_level = await trait_level.update_async(
                 trait_level_name=data.trait_level_name,
                 trait_level_info=data.trait_level_info
             )
@@ -144,14 +175,14 @@ class TraitLevelController(Controller):
         self, trait_level_id: int
     ) -> None:
         try:
-            trait_level = TraitLevel.get_by_id(id=trait_level_id)
+            trait_level = await TraitLevel.get_by_id_async(id=trait_level_id)
             if trait_level is None:
                 error = RESTAPIError(
                     error="Trait level not found",
                     error_description="The trait level with the given ID was not found"
                 )
                 return Response(content=error, status_code=404)
-            is_deleted = trait_level.delete()
+            is_deleted = await trait_level.delete_async()
             if not is_deleted:
                 error = RESTAPIError(
                     error="Failed to delete trait level",
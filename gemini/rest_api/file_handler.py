@@ -1,6 +1,9 @@
 import os
+from typing import Optional
 from litestar.datastructures import UploadFile
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 class RESTAPIFileHandler:
 
     def __init__(self, root_folder: str):
@@ -16,17 +19,24 @@ class RESTAPIFileHandler:
 
     async def create_file(self, uploaded_file: UploadFile) -> str:
         original_file_name = uploaded_file.filename
-        file_content = await uploaded_file.read()
         local_file_path = os.path.join(self.uploads_folder, original_file_name)
+        # Copied in chunks so the file is never held in memory whole
         with open(local_file_path, "wb") as f:
-            f.write(file_content)
+            while chunk := await uploaded_file.read(UPLOAD_CHUNK_SIZE):
+                f.write(chunk)
         local_file_path = os.path.abspath(local_file_path)
         return local_file_path
 
-# Create a File Handler for uploads and downloads
-home_dir = os.path.expanduser("~")
-gemini_data_dir = os.path.join(home_dir, "gemini_data")
-if not os.path.exists(gemini_data_dir):
-    os.makedirs(gemini_data_dir)
-api_file_handler = RESTAPIFileHandler(root_folder=gemini_data_dir)
+# File Handler for uploads and downloads, created with its folders on first use
+_api_file_handler: Optional[RESTAPIFileHandler] = None
+
+def get_api_file_handler() -> RESTAPIFileHandler:
+    global _api_file_handler
+    if _api_file_handler is None:
+        home_dir = os.path.expanduser("~")
+        gemini_data_dir = os.path.join(home_dir, "gemini_data")
+        if not os.path.exists(gemini_data_dir):
+            os.makedirs(gemini_data_dir)
+        _api_file_handler = RESTAPIFileHandler(root_folder=gemini_data_dir)
+    return _api_file_handler
 
@@ -1,12 +1,17 @@
-from pydantic import BaseModel, ValidationError, ConfigDict
+from pydantic import BaseModel, ValidationError, ConfigDict, Field
 from pydantic.types import UUID4
 from pydantic.functional_validators import BeforeValidator
 from litestar.datastructures import UploadFile
+from litestar.serialization import encode_json
 from typing import Any, List, Union, Optional
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from typing_extensions import Annotated
 from uuid import UUID
 from datetime import datetime
 import json
+import os
+
+from gemini.api.presign import MAX_PRESIGN_BATCH
 
 def str_to_dict(value: Any) -> dict:
     if isinstance(value, str):
@@ -40,12 +45,46 @@ class RESTAPIError(RESTAPIBase):
 # Paginated Response
 # --------------------------------
 
-class PaginatedResponseBase(RESTAPIBase):
-    total_records: int
-    total_pages: int
-    current_page: int
-    next_page: Optional[str] = None
-    previous_page: Optional[str] = None
+# List endpoints accept `limit` and `cursor` query parameters. The page is
+# returned as the regular list body and the cursor for the next page is sent
+# in this header, which is absent on the last page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 10000
+
+# A limit outside 1..MAX_PAGE_LIMIT raises ValueError, like a malformed
+# cursor, and the controllers answer both with 400.
+def page_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        return DEFAULT_PAGE_LIMIT
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+    return limit
+
+def cursor_headers(next_cursor: Optional[str]) -> dict:
+    if next_cursor is None:
+        return {}
+    return {NEXT_CURSOR_HEADER: next_cursor}
+
+# Record endpoints stream NDJSON from synchronous generators (filters, pages)
+# and asynchronous ones (searches over the async session) alike. Synchronous
+# sources get a synchronous body, which Litestar iterates in its thread pool,
+# so their database reads do not block the event loop.
+def ndjson_records(records: Union[Iterable, AsyncIterable]) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+    if isinstance(records, AsyncIterable):
+        return _ndjson_records_async(records)
+    return _ndjson_records(records)
+
+def _ndjson_line(record: Any) -> bytes:
+    return encode_json(record.model_dump(exclude_none=True)) + b'\n'
+
+def _ndjson_records(records: Iterable) -> Iterator[bytes]:
+    for record in records:
+        yield _ndjson_line(record)
+
+async def _ndjson_records_async(records: AsyncIterable) -> AsyncIterator[bytes]:
+    async for record in records:
+        yield _ndjson_line(record)
 
 # --------------------------------
 # File Handling
@@ -64,6 +103,20 @@ class UploadFileRequest(RESTAPIBase):
     bucket_name: Optional[str] = None
     object_name: Optional[str] = None
 
+# Record file downloads redirect to a pre-signed storage URL instead of
+# `/api/files/download` when this is set, or per request with `?presigned=true`.
+PRESIGNED_DOWNLOADS = os.getenv("GEMINI_PRESIGNED_DOWNLOADS", "false").lower() in ("1", "true", "yes")
+
+class RecordDownloadURLsRequest(RESTAPIBase):
+    record_ids: Annotated[List[str], Field(min_length=1, max_length=MAX_PRESIGN_BATCH)]
+
+class RecordDownloadURL(RESTAPIBase):
+    record_id: str
+    record_file: Optional[str] = None
+    url: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    error: Optional[str] = None
+
 
 # --------------------------------
 # Experiment Classes
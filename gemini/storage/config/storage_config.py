@@ -81,9 +81,34 @@ class MinioStorageConfig(StorageConfig):
         None,
         description="MinIO region name"
     )
-    http_client: Optional[Dict[str, Any]] = Field(
+    http_client: Optional[Any] = Field(
         None,
-        description="Custom HTTP client configuration"
+        description="Custom urllib3 PoolManager used instead of the default one"
+    )
+    max_connections: int = Field(
+        10,
+        ge=1,
+        description="Connections kept open per host, at least the number of concurrent uploads"
+    )
+    public_endpoint: Optional[str] = Field(
+        None,
+        description="Endpoint clients reach MinIO at, e.g. 'https://storage.example.org', used to sign download URLs"
+    )
+    multipart_threshold: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Size in bytes from which files are uploaded in parts, defaults to GEMINI_MULTIPART_THRESHOLD or 64 MiB"
+    )
+    part_size: Optional[int] = Field(
+        None,
+        ge=5 * 1024 * 1024,
+        le=5 * 1024 ** 3,
+        description="Part size in bytes of multipart uploads, defaults to GEMINI_MULTIPART_PART_SIZE or 64 MiB"
+    )
+    multipart_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Parts of one file uploaded at once, defaults to GEMINI_MULTIPART_CONCURRENCY or 4"
     )
 
     @field_validator('endpoint')
@@ -131,6 +156,22 @@ class S3StorageConfig(StorageConfig):
         None,
         description="Custom endpoint URL for S3-compatible storage"
     )
+    multipart_threshold: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Size in bytes from which files are uploaded in parts, defaults to GEMINI_MULTIPART_THRESHOLD or 64 MiB"
+    )
+    part_size: Optional[int] = Field(
+        None,
+        ge=5 * 1024 * 1024,
+        le=5 * 1024 ** 3,
+        description="Part size in bytes of multipart uploads, defaults to GEMINI_MULTIPART_PART_SIZE or 64 MiB"
+    )
+    multipart_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Parts of one file uploaded at once, defaults to GEMINI_MULTIPART_CONCURRENCY or 4"
+    )
 
     @model_validator(mode='after')
     def validate_credentials(self) -> 'S3StorageConfig':
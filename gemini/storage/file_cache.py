@@ -0,0 +1,353 @@
+# gemini/storage/file_cache.py
+"""
+Read-through local cache of files in object storage.
+
+`LocalFileCache.get` returns the path of a local copy of an object,
+downloading it on a miss. Cached copies are validated against the ETag
+and last-modified time from `get_file_metadata` before they are served,
+and the least recently used copies are evicted once the cache exceeds its
+size cap.
+
+The index is a SQLite database in the cache directory and downloads are
+serialised per object with file locks, so any number of threads and
+processes (e.g. data loader workers) can share one cache directory.
+Eviction skips objects whose lock is held and removes the lock file
+together with the cached copy.
+Files are downloaded to a temporary name and moved into place, so a
+reader never sees a partial copy.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+from gemini.storage.exceptions import StorageConnectionError, StorageFileNotFoundError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_CACHE_DIRECTORY = os.getenv("GEMINI_FILE_CACHE_DIR", os.path.join("~", ".cache", "gemini", "files"))
+DEFAULT_CACHE_SIZE = int(os.getenv("GEMINI_FILE_CACHE_SIZE", str(10 * 1024 ** 3)))
+
+_INDEX_FILE_NAME = "index.sqlite"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_key TEXT PRIMARY KEY,
+    bucket_name TEXT NOT NULL,
+    object_name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    accessed_at REAL NOT NULL,
+    validated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class LocalFileCache:
+    """
+    Size-capped local cache of object storage files with LRU eviction.
+
+    Features:
+    - Read-through downloads on a miss
+    - ETag and last-modified validation of cached copies
+    - Least recently used eviction above the size cap
+    - Safe to share between threads and processes
+    """
+
+    def __init__(
+        self,
+        storage_provider: Any,
+        cache_directory: Optional[Union[str, Path]] = None,
+        max_size: Optional[int] = None,
+        max_age: float = 0.0
+    ):
+        """
+        Open or create a cache.
+
+        Examples:
+            >>> cache = LocalFileCache(get_minio_storage_provider(), "/scratch/gemini_cache", max_size=50 * 1024 ** 3)
+            >>> cache.get("sensor_data/Experiment A/Camera/Dataset A/2024-07-01/Site A/Season 1/1719835200000.jpg", bucket_name="gemini")
+            PosixPath('/scratch/gemini_cache/objects/3f/3f2a...e1.jpg')
+
+        Args:
+            storage_provider: The storage provider to read through, e.g. the MinIO storage provider.
+            cache_directory (str | Path, optional): Directory of the cache. Defaults to the
+                `GEMINI_FILE_CACHE_DIR` environment variable, or `~/.cache/gemini/files`.
+            max_size (int, optional): Size cap in bytes. Defaults to the `GEMINI_FILE_CACHE_SIZE`
+                environment variable, or 10 GiB.
+            max_age (float, optional): Seconds a validated copy is served without validating it again. Defaults to 0.
+        """
+        self.storage_provider = storage_provider
+        self.directory = Path(cache_directory or DEFAULT_CACHE_DIRECTORY).expanduser()
+        self.max_size = DEFAULT_CACHE_SIZE if max_size is None else max_size
+        self.max_age = max_age
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+        self._index_path = self.directory / _INDEX_FILE_NAME
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    def get(self, object_name: str, bucket_name: Optional[str] = None, validate: bool = True) -> Path:
+        """
+        Retrieves the path of a local copy of a file, downloading it if it is not cached or has changed.
+
+        If the storage cannot be reached to validate a cached copy, the cached copy is returned.
+
+        Args:
+            object_name (str): The key of the object.
+            bucket_name (str, optional): The bucket. Defaults to the provider's bucket.
+            validate (bool, optional): Check a cached copy against the object metadata. Defaults to True.
+
+        Returns:
+            Path: The local copy.
+
+        Raises:
+            StorageFileNotFoundError: If the object does not exist.
+            StorageError: If the object cannot be downloaded.
+        """
+        bucket_name = bucket_name or self.storage_provider.bucket_name
+        cache_key = f"{bucket_name}/{object_name}"
+        entry = self._entry(cache_key)
+        metadata = None
+        if entry is not None:
+            path = self.directory / entry["path"]
+            if path.exists():
+                if not validate or time.time() - entry["validated_at"] < self.max_age:
+                    self._touch(cache_key)
+                    return path
+                try:
+                    metadata = self.storage_provider.get_file_metadata(object_name, bucket_name=bucket_name)
+                except StorageFileNotFoundError:
+                    self.remove(object_name, bucket_name)
+                    raise
+                except StorageConnectionError as e:
+                    print(f"Could not validate cached {cache_key}, using the cached copy: {e}")
+                    self._touch(cache_key)
+                    return path
+                if _same_version(entry, metadata):
+                    self._touch(cache_key, validated=True)
+                    return path
+        if metadata is None:
+            metadata = self.storage_provider.get_file_metadata(object_name, bucket_name=bucket_name)
+        path = self._object_path(cache_key, object_name)
+        with _file_lock(_lock_path(path)):
+            # Another thread or process may have downloaded it while we waited
+            entry = self._entry(cache_key)
+            if entry is None or not path.exists() or not _same_version(entry, metadata):
+                self._download(cache_key, object_name, bucket_name, path, metadata)
+            else:
+                self._touch(cache_key, validated=True)
+        self._evict(keep=cache_key)
+        return path
+
+    def contains(self, object_name: str, bucket_name: Optional[str] = None) -> bool:
+        """
+        Checks whether a file is cached, without validating it.
+
+        Returns:
+            bool: True if a local copy exists.
+        """
+        bucket_name = bucket_name or self.storage_provider.bucket_name
+        entry = self._entry(f"{bucket_name}/{object_name}")
+        return entry is not None and (self.directory / entry["path"]).exists()
+
+    def remove(self, object_name: str, bucket_name: Optional[str] = None) -> bool:
+        """
+        Removes a file from the cache.
+
+        Returns:
+            bool: True if a cached copy was removed.
+        """
+        bucket_name = bucket_name or self.storage_provider.bucket_name
+        cache_key = f"{bucket_name}/{object_name}"
+        entry = self._entry(cache_key)
+        if entry is None:
+            return False
+        self._remove_entry(cache_key, entry["path"])
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes every file from the cache.
+        """
+        with self._connect() as connection:
+            entries = connection.execute("SELECT cache_key, path FROM entries").fetchall()
+        for cache_key, path in entries:
+            self._remove_entry(cache_key, path)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarises the cache.
+
+        Returns:
+            dict: The cache directory, number of files, total size and size cap in bytes.
+        """
+        with self._connect() as connection:
+            files, size = connection.execute("SELECT count(*), coalesce(sum(size), 0) FROM entries").fetchone()
+        return {"directory": str(self.directory), "files": files, "size": size, "max_size": self.max_size}
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation, so the cache can be used from threads and forked processes
+        connection = sqlite3.connect(str(self._index_path), timeout=60, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def _entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            row = connection.execute("SELECT * FROM entries WHERE cache_key = ?", (cache_key,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def _touch(self, cache_key: str, validated: bool = False) -> None:
+        now = time.time()
+        with self._connect() as connection:
+            if validated:
+                connection.execute("UPDATE entries SET accessed_at = ?, validated_at = ? WHERE cache_key = ?", (now, now, cache_key))
+            else:
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE cache_key = ?", (now, cache_key))
+
+    def _object_path(self, cache_key: str, object_name: str) -> Path:
+        # Keep the extension so readers can tell the file type
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        path = self.directory / "objects" / digest[:2] / f"{digest}{Path(object_name).suffix}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _download(self, cache_key: str, object_name: str, bucket_name: str, path: Path, metadata: Dict[str, Any]) -> None:
+        partial_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        try:
+            self.storage_provider.download_file(object_name, partial_path, bucket_name=bucket_name)
+            os.replace(partial_path, path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key, bucket_name, object_name, str(path.relative_to(self.directory)),
+                    path.stat().st_size, metadata.get("etag"), _timestamp(metadata.get("last_modified")), now, now
+                )
+            )
+
+    def _remove_entry(self, cache_key: str, path: str) -> None:
+        # Waits for a download of the object in progress, so it is not removed under the writer
+        path = self.directory / path
+        with _file_lock(_lock_path(path), remove=True):
+            path.unlink(missing_ok=True)
+            with self._connect() as connection:
+                connection.execute("DELETE FROM entries WHERE cache_key = ?", (cache_key,))
+
+    def _evict(self, keep: str) -> None:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                total = connection.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+                if total > self.max_size:
+                    candidates = connection.execute(
+                        "SELECT cache_key, path, size FROM entries WHERE cache_key != ? ORDER BY accessed_at",
+                        (keep,)
+                    ).fetchall()
+                    for cache_key, path, size in candidates:
+                        if total <= self.max_size:
+                            break
+                        path = self.directory / path
+                        # Never wait for an object lock while holding the write lock of the index
+                        with _file_lock(_lock_path(path), blocking=False, remove=True) as locked:
+                            if not locked:
+                                # Being downloaded or validated, so not least recently used after all
+                                continue
+                            path.unlink(missing_ok=True)
+                        connection.execute("DELETE FROM entries WHERE cache_key = ?", (cache_key,))
+                        total -= size
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+
+def _same_version(entry: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+    return entry["etag"] == metadata.get("etag") and entry["last_modified"] == _timestamp(metadata.get("last_modified"))
+
+
+def _timestamp(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _lock_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.lock")
+
+
+@contextmanager
+def _file_lock(path: Path, blocking: bool = True, remove: bool = False) -> Iterator[bool]:
+    # Yields False if blocking is off and the lock is held, removes the lock file on release if asked to
+    handle = _acquire_lock(path, blocking)
+    if handle is None:
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        _release_lock(handle, path, remove)
+
+
+def _acquire_lock(path: Path, blocking: bool) -> Optional[BinaryIO]:
+    while True:
+        handle = open(path, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            if blocking:
+                raise
+            return None
+        # Lock files are removed with their entries, so the one locked may have been removed while waiting
+        if fcntl is None or _is_same_file(handle, path):
+            return handle
+        handle.close()
+
+
+def _release_lock(handle: BinaryIO, path: Path, remove: bool) -> None:
+    try:
+        if fcntl is not None:
+            if remove:
+                path.unlink(missing_ok=True)
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        handle.close()
+    if remove and fcntl is None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            # Still open in another process
+            pass
+
+
+def _is_same_file(handle: BinaryIO, path: Path) -> bool:
+    try:
+        return os.fstat(handle.fileno()).st_ino == os.stat(path).st_ino
+    except FileNotFoundError:
+        return False
@@ -1,7 +1,7 @@
 # gemini/storage/interfaces/storage_provider.py
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional, Union, Dict, Any
+from typing import BinaryIO, Optional, Union, Dict, Any, List, Tuple
 from pathlib import Path
 from datetime import datetime
 from gemini.storage.exceptions import StorageError
@@ -168,4 +168,163 @@ class StorageProvider(ABC):
             StorageFileNotFoundError: If file doesn't exist
             StorageConnectionError: If connection fails
         """
-        pass
\ No newline at end of file
+        pass
+
+    def upload_file_multipart(
+        self,
+        object_name: str,
+        data_stream: Optional[BinaryIO] = None,
+        input_file_path: Optional[Union[str, Path]] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        bucket_name: Optional[str] = None,
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        resume: bool = True
+    ) -> str:
+        """Upload a file in parts, several at a time, resuming an interrupted upload.
+
+        Providers that implement the multipart primitives below get parallel
+        uploads with per-part retries; see `gemini.storage.multipart`.
+
+        Args:
+            object_name: Name/path of the object in storage
+            data_stream: File-like object containing the data
+            input_file_path: Path to the local file to upload
+            content_type: MIME type of the file
+            metadata: Additional metadata
+            bucket_name: Bucket to upload to, defaults to the provider's bucket
+            part_size: Part size in bytes
+            concurrency: Number of parts uploaded at once
+            resume: Resume an interrupted upload of the same local file
+
+        Returns:
+            str: URL or identifier for the uploaded file
+
+        Raises:
+            StorageUploadError: If upload fails
+            StorageAuthError: If access is denied
+        """
+        from gemini.storage.multipart import upload_multipart
+        target_bucket = bucket_name if bucket_name is not None else getattr(self, "bucket_name", None)
+        upload_multipart(
+            self,
+            object_name,
+            bucket_name=target_bucket,
+            data_stream=data_stream,
+            input_file_path=input_file_path,
+            content_type=content_type,
+            metadata=metadata,
+            part_size=part_size,
+            concurrency=concurrency,
+            resume=resume
+        )
+        return self.get_download_url(object_name, bucket_name=target_bucket)
+
+    def create_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Start a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Bucket to upload to
+            content_type: MIME type of the file
+            metadata: Additional metadata
+
+        Returns:
+            str: The upload ID
+
+        Raises:
+            StorageUploadError: If the upload cannot be started
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart uploads")
+
+    def upload_part(
+        self,
+        object_name: str,
+        bucket_name: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes
+    ) -> str:
+        """Upload one part of a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Bucket of the upload
+            upload_id: The upload ID
+            part_number: Number of the part, from 1
+            data: Content of the part
+
+        Returns:
+            str: ETag of the part
+
+        Raises:
+            StorageUploadError: If the part cannot be uploaded
+            StorageFileNotFoundError: If the upload no longer exists
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart uploads")
+
+    def list_parts(
+        self,
+        object_name: str,
+        bucket_name: str,
+        upload_id: str
+    ) -> Dict[int, Tuple[str, int]]:
+        """List the parts of a multipart upload already stored.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Bucket of the upload
+            upload_id: The upload ID
+
+        Returns:
+            Dict[int, Tuple[str, int]]: ETag and size of each stored part, by part number
+
+        Raises:
+            StorageFileNotFoundError: If the upload no longer exists
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart uploads")
+
+    def complete_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: str,
+        upload_id: str,
+        parts: List[Tuple[int, str]]
+    ) -> None:
+        """Assemble the uploaded parts into the object.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Bucket of the upload
+            upload_id: The upload ID
+            parts: Part number and ETag of every part, in order
+
+        Raises:
+            StorageUploadError: If the upload cannot be completed
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart uploads")
+
+    def abort_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: str,
+        upload_id: str
+    ) -> None:
+        """Abort a multipart upload and discard its parts.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Bucket of the upload
+            upload_id: The upload ID
+
+        Raises:
+            StorageError: If the upload cannot be aborted
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart uploads")
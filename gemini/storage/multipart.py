@@ -0,0 +1,504 @@
+# gemini/storage/multipart.py
+"""
+Parallel, resumable multipart uploads.
+
+`upload_multipart` splits a file into parts, uploads them on a thread pool
+and completes the multipart upload once every part is stored. A part that
+fails is retried on its own with exponential backoff, so a dropped
+connection costs one part instead of the whole transfer.
+
+Uploads from a local file are resumable. The upload ID is recorded in a
+small state file (see `DEFAULT_STATE_DIRECTORY`), keyed by bucket and
+object. When the same file is uploaded to the same object again, the parts
+the server already holds are listed and skipped. A state whose file has
+changed size or modification time since is discarded and its upload
+aborted. A failed upload from a file is left open on the server so the
+next attempt can resume it; a failed stream upload is aborted, since
+streams cannot be identified between runs.
+
+The providers supply the multipart primitives (`create_multipart_upload`,
+`upload_part`, `list_parts`, `complete_multipart_upload` and
+`abort_multipart_upload`); this module only drives them.
+`upload_stream_async` drives the same primitives from an async stream of
+unknown length, such as a request body, without buffering it whole.
+
+Defaults come from environment variables:
+- `GEMINI_MULTIPART_THRESHOLD`: size from which `upload_file` switches to multipart (64 MiB)
+- `GEMINI_MULTIPART_PART_SIZE`: part size in bytes (64 MiB)
+- `GEMINI_MULTIPART_CONCURRENCY`: parts uploaded at once per file (4)
+- `GEMINI_MULTIPART_STATE_DIR`: directory of the resume state (`~/.cache/gemini/multipart`)
+"""
+
+import io
+import os
+import json
+import time
+import asyncio
+import hashlib
+from pathlib import Path
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterable, BinaryIO, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from gemini.storage.exceptions import (
+    StorageAuthError,
+    StorageError,
+    StorageFileNotFoundError,
+    StorageUploadError
+)
+
+# Limits of the S3 multipart API, which MinIO shares
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_SIZE = 5 * 1024 ** 3
+MAX_PARTS = 10000
+
+DEFAULT_MULTIPART_THRESHOLD = int(os.getenv("GEMINI_MULTIPART_THRESHOLD", str(64 * 1024 * 1024)))
+DEFAULT_PART_SIZE = int(os.getenv("GEMINI_MULTIPART_PART_SIZE", str(64 * 1024 * 1024)))
+DEFAULT_MULTIPART_CONCURRENCY = max(int(os.getenv("GEMINI_MULTIPART_CONCURRENCY", "4")), 1)
+DEFAULT_PART_RETRIES = 5
+DEFAULT_STATE_DIRECTORY = os.getenv("GEMINI_MULTIPART_STATE_DIR", os.path.join("~", ".cache", "gemini", "multipart"))
+
+
+def resolve_part_size(total_size: Optional[int], part_size: Optional[int] = None) -> int:
+    """
+    Picks the part size for an upload.
+
+    The requested size is clamped to the S3 limits and, for large files, raised so
+    the file fits in `MAX_PARTS` parts.
+
+    Examples:
+        >>> resolve_part_size(2 * 1024 ** 3)
+        67108864
+        >>> resolve_part_size(1024 ** 4, part_size=8 * 1024 ** 2)
+        109951163
+
+    Args:
+        total_size (int, optional): Size of the file, if known.
+        part_size (int, optional): Requested part size. Defaults to `DEFAULT_PART_SIZE`.
+
+    Returns:
+        int: The part size in bytes.
+    """
+    part_size = min(max(part_size or DEFAULT_PART_SIZE, MIN_PART_SIZE), MAX_PART_SIZE)
+    if total_size:
+        part_size = max(part_size, -(-total_size // MAX_PARTS))
+    return part_size
+
+
+def should_upload_multipart(
+    data_stream: Optional[BinaryIO],
+    input_file_path: Optional[Union[str, Path]],
+    threshold: Optional[int] = None
+) -> bool:
+    """
+    Checks whether a file is large enough to be uploaded in parts.
+
+    Streams are measured from their start, where `upload_file` reads them from, and
+    left there. Streams that cannot be measured are uploaded in parts.
+
+    Args:
+        data_stream (BinaryIO, optional): File-like object to upload.
+        input_file_path (str | Path, optional): Local file to upload.
+        threshold (int, optional): Size in bytes from which to upload in parts. Defaults to `DEFAULT_MULTIPART_THRESHOLD`.
+
+    Returns:
+        bool: True if the file should be uploaded in parts.
+    """
+    threshold = DEFAULT_MULTIPART_THRESHOLD if threshold is None else threshold
+    if input_file_path:
+        try:
+            return Path(input_file_path).stat().st_size >= threshold
+        except OSError:
+            # Reported by the single-request upload
+            return False
+    if data_stream is None:
+        return False
+    try:
+        data_stream.seek(0)
+    except (AttributeError, OSError, ValueError):
+        return True
+    size = _remaining_size(data_stream)
+    return size is None or size >= threshold
+
+
+def upload_multipart(
+    storage_provider: Any,
+    object_name: str,
+    bucket_name: str,
+    data_stream: Optional[BinaryIO] = None,
+    input_file_path: Optional[Union[str, Path]] = None,
+    content_type: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    part_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    retries: int = DEFAULT_PART_RETRIES,
+    resume: bool = True,
+    state_directory: Optional[Union[str, Path]] = None
+) -> None:
+    """
+    Uploads a file in parts, several at a time.
+
+    Examples:
+        >>> upload_multipart(
+        ...     get_minio_storage_provider(),
+        ...     "sensor_data/Experiment A/Camera/Dataset A/2024-07-01/Site A/Season 1/flight_01.mp4",
+        ...     bucket_name="gemini",
+        ...     input_file_path="/data/flight_01.mp4",
+        ...     part_size=128 * 1024 ** 2,
+        ...     concurrency=8
+        ... )
+
+    Args:
+        storage_provider: The storage provider, implementing the multipart primitives.
+        object_name (str): The key of the object.
+        bucket_name (str): The bucket to upload to.
+        data_stream (BinaryIO, optional): File-like object to upload. Read once, in order.
+        input_file_path (str | Path, optional): Local file to upload. Takes precedence over `data_stream`.
+        content_type (str, optional): MIME type of the file.
+        metadata (dict, optional): Additional object metadata.
+        part_size (int, optional): Part size in bytes. Defaults to `DEFAULT_PART_SIZE`; see `resolve_part_size`.
+            A resumed upload keeps the part size it was started with.
+        concurrency (int, optional): Parts uploaded at once. Defaults to `DEFAULT_MULTIPART_CONCURRENCY`.
+            At most this many parts are held in memory.
+        retries (int, optional): Attempts per part. Defaults to 5.
+        resume (bool, optional): Resume an interrupted upload of the same file. Defaults to True.
+        state_directory (str | Path, optional): Directory of the resume state. Defaults to `DEFAULT_STATE_DIRECTORY`.
+
+    Raises:
+        StorageUploadError: If a part cannot be uploaded or the upload cannot be completed.
+        StorageAuthError: If access is denied.
+        ValueError: If neither data_stream nor input_file_path is provided.
+    """
+    concurrency = max(concurrency or DEFAULT_MULTIPART_CONCURRENCY, 1)
+    source = None
+    if input_file_path:
+        input_file_path = Path(input_file_path)
+        if not input_file_path.is_file():
+            raise StorageUploadError(f"Input file path not found: {input_file_path}")
+        stat = input_file_path.stat()
+        source = {"path": str(input_file_path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        total_size = stat.st_size
+    elif data_stream is not None:
+        total_size = _remaining_size(data_stream)
+    else:
+        raise ValueError("Either data_stream or input_file_path must be provided")
+
+    state = _UploadState(state_directory, bucket_name, object_name) if source is not None and resume else None
+    upload_id, uploaded_parts = None, {}
+    if state is not None:
+        upload_id, resumed_part_size, uploaded_parts = _resume(storage_provider, state, source, object_name, bucket_name)
+        if upload_id is not None:
+            part_size = resumed_part_size
+    if upload_id is None:
+        part_size = resolve_part_size(total_size, part_size)
+        upload_id = storage_provider.create_multipart_upload(
+            object_name,
+            bucket_name=bucket_name,
+            content_type=content_type,
+            metadata=metadata
+        )
+        if state is not None:
+            state.save({**source, "upload_id": upload_id, "part_size": part_size})
+
+    if source is not None:
+        parts = _file_parts(input_file_path, total_size, part_size)
+    else:
+        parts = _stream_parts(data_stream, part_size)
+
+    completed: Dict[int, str] = {}
+    in_flight: Dict[Future, int] = {}
+    upload = partial(_upload_part, storage_provider, object_name, bucket_name, upload_id, retries)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gemini-multipart")
+    try:
+        for part_number, length, read in parts:
+            uploaded = uploaded_parts.get(part_number)
+            if uploaded is not None and uploaded[1] == length:
+                completed[part_number] = uploaded[0]
+                continue
+            while len(in_flight) >= concurrency:
+                _collect(in_flight, completed, wait(in_flight, return_when=FIRST_COMPLETED).done)
+            # Stream parts are read here, in order; file parts are read by the worker
+            in_flight[executor.submit(upload, part_number, read if source is not None else read())] = part_number
+        while in_flight:
+            _collect(in_flight, completed, wait(in_flight, return_when=FIRST_COMPLETED).done)
+        storage_provider.complete_multipart_upload(
+            object_name,
+            bucket_name=bucket_name,
+            upload_id=upload_id,
+            parts=sorted(completed.items())
+        )
+    except BaseException as e:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if state is None:
+            _abort(storage_provider, object_name, bucket_name, upload_id)
+        if isinstance(e, StorageError) or not isinstance(e, Exception):
+            raise
+        raise StorageUploadError(f"Failed to upload file '{object_name}' in parts: {e}")
+    executor.shutdown(wait=True)
+    if state is not None:
+        state.clear()
+
+
+async def upload_stream_async(
+    storage_provider: Any,
+    object_name: str,
+    bucket_name: str,
+    chunks: AsyncIterable[bytes],
+    content_type: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    part_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    retries: int = DEFAULT_PART_RETRIES
+) -> Dict[str, Any]:
+    """
+    Uploads a stream of unknown length, e.g. an HTTP request body, as it arrives.
+
+    Chunks are collected into parts, which are uploaded while the next part is read,
+    so at most `concurrency` parts and the one being filled are held in memory. A
+    stream that ends before the first part is full is stored with a single request.
+    Failed uploads are aborted; streams are not resumable.
+
+    Examples:
+        >>> result = await upload_stream_async(
+        ...     get_minio_storage_provider(),
+        ...     "uploads/flight_01.mp4",
+        ...     bucket_name="gemini",
+        ...     chunks=request.stream(),
+        ...     content_type="video/mp4"
+        ... )
+        >>> result
+        {'size': 4831838208, 'sha256': '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'}
+
+    Args:
+        storage_provider: The storage provider, implementing the multipart primitives.
+        object_name (str): The key of the object.
+        bucket_name (str): The bucket to upload to.
+        chunks (AsyncIterable[bytes]): The content, chunk by chunk.
+        content_type (str, optional): MIME type of the file.
+        metadata (dict, optional): Additional object metadata.
+        part_size (int, optional): Part size in bytes. Defaults to `DEFAULT_PART_SIZE`.
+        concurrency (int, optional): Parts uploaded at once. Defaults to `DEFAULT_MULTIPART_CONCURRENCY`.
+        retries (int, optional): Attempts per part. Defaults to 5.
+
+    Returns:
+        dict: The `size` of the uploaded content in bytes and its `sha256` hex digest.
+
+    Raises:
+        StorageUploadError: If a part cannot be uploaded or the upload cannot be completed.
+        StorageAuthError: If access is denied.
+    """
+    part_size = resolve_part_size(None, part_size)
+    concurrency = max(concurrency or DEFAULT_MULTIPART_CONCURRENCY, 1)
+    digest = hashlib.sha256()
+    size = 0
+    buffer = bytearray()
+    upload_id = None
+    completed: Dict[int, str] = {}
+    in_flight: Dict[asyncio.Future, int] = {}
+
+    async def send(data: bytes) -> None:
+        nonlocal upload_id
+        if upload_id is None:
+            upload_id = await asyncio.to_thread(
+                storage_provider.create_multipart_upload,
+                object_name,
+                bucket_name=bucket_name,
+                content_type=content_type,
+                metadata=metadata
+            )
+        while len(in_flight) >= concurrency:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            _collect(in_flight, completed, done)
+        part_number = len(completed) + len(in_flight) + 1
+        task = asyncio.ensure_future(asyncio.to_thread(
+            _upload_part, storage_provider, object_name, bucket_name, upload_id, retries, part_number, data
+        ))
+        in_flight[task] = part_number
+
+    try:
+        async for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+            buffer += chunk
+            while len(buffer) >= part_size:
+                with memoryview(buffer) as view:
+                    data = bytes(view[:part_size])
+                del buffer[:part_size]
+                await send(data)
+        if upload_id is None:
+            await asyncio.to_thread(
+                storage_provider.upload_file,
+                object_name,
+                data_stream=io.BytesIO(buffer),
+                content_type=content_type,
+                metadata=metadata,
+                bucket_name=bucket_name
+            )
+        else:
+            if buffer:
+                await send(bytes(buffer))
+                buffer.clear()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                _collect(in_flight, completed, done)
+            await asyncio.to_thread(
+                storage_provider.complete_multipart_upload,
+                object_name,
+                bucket_name=bucket_name,
+                upload_id=upload_id,
+                parts=sorted(completed.items())
+            )
+    except BaseException as e:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.wait(in_flight)
+        if upload_id is not None:
+            await asyncio.to_thread(_abort, storage_provider, object_name, bucket_name, upload_id)
+        if isinstance(e, StorageError) or not isinstance(e, Exception):
+            raise
+        raise StorageUploadError(f"Failed to upload stream to '{object_name}': {e}")
+    return {"size": size, "sha256": digest.hexdigest()}
+
+
+def _upload_part(
+    storage_provider: Any,
+    object_name: str,
+    bucket_name: str,
+    upload_id: str,
+    retries: int,
+    part_number: int,
+    data: Union[bytes, Callable[[], bytes]]
+) -> str:
+    attempts = max(retries, 1)
+    for attempt in range(attempts):
+        try:
+            return storage_provider.upload_part(
+                object_name,
+                bucket_name=bucket_name,
+                upload_id=upload_id,
+                part_number=part_number,
+                data=data() if callable(data) else data
+            )
+        except (StorageAuthError, StorageFileNotFoundError):
+            raise
+        except Exception as e:
+            if attempt == attempts - 1:
+                raise StorageUploadError(f"Failed to upload part {part_number} of '{object_name}' after {attempts} attempts: {e}")
+            time.sleep(0.5 * (2 ** attempt))
+
+
+def _collect(in_flight: Dict[Future, int], completed: Dict[int, str], done: Any) -> None:
+    for future in done:
+        completed[in_flight.pop(future)] = future.result()
+
+
+def _resume(
+    storage_provider: Any,
+    state: "_UploadState",
+    source: Dict[str, Any],
+    object_name: str,
+    bucket_name: str
+) -> Tuple[Optional[str], Optional[int], Dict[int, Tuple[str, int]]]:
+    saved = state.load()
+    if saved is None:
+        return None, None, {}
+    if any(saved.get(key) != value for key, value in source.items()):
+        # The file changed since the interrupted upload, its parts are useless
+        _abort(storage_provider, object_name, bucket_name, saved.get("upload_id"))
+        state.clear()
+        return None, None, {}
+    try:
+        parts = storage_provider.list_parts(object_name, bucket_name=bucket_name, upload_id=saved["upload_id"])
+    except StorageFileNotFoundError:
+        # Completed, aborted or expired on the server
+        state.clear()
+        return None, None, {}
+    return saved["upload_id"], saved["part_size"], parts
+
+
+def _abort(storage_provider: Any, object_name: str, bucket_name: str, upload_id: Optional[str]) -> None:
+    if not upload_id:
+        return
+    try:
+        storage_provider.abort_multipart_upload(object_name, bucket_name=bucket_name, upload_id=upload_id)
+    except Exception as e:
+        print(f"Could not abort multipart upload of {object_name}: {e}")
+
+
+def _file_parts(path: Path, total_size: int, part_size: int) -> Iterator[Tuple[int, int, Callable[[], bytes]]]:
+    if total_size == 0:
+        yield 1, 0, bytes
+        return
+    for index, offset in enumerate(range(0, total_size, part_size)):
+        length = min(part_size, total_size - offset)
+        yield index + 1, length, partial(_read_range, path, offset, length)
+
+
+def _read_range(path: Path, offset: int, length: int) -> bytes:
+    with open(path, "rb") as file:
+        file.seek(offset)
+        return file.read(length)
+
+
+def _stream_parts(data_stream: BinaryIO, part_size: int) -> Iterator[Tuple[int, int, Callable[[], bytes]]]:
+    part_number = 0
+    while True:
+        data = _read_exactly(data_stream, part_size)
+        if not data and part_number:
+            return
+        part_number += 1
+        yield part_number, len(data), partial(bytes, data)
+        if len(data) < part_size:
+            return
+
+
+def _read_exactly(data_stream: BinaryIO, size: int) -> bytes:
+    # Raw streams may return short reads before the end
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = data_stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _remaining_size(data_stream: BinaryIO) -> Optional[int]:
+    try:
+        position = data_stream.tell()
+        size = data_stream.seek(0, os.SEEK_END) - position
+        data_stream.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class _UploadState:
+    """
+    Resume state of one multipart upload, a JSON file named by bucket and object.
+    """
+
+    def __init__(self, state_directory: Optional[Union[str, Path]], bucket_name: str, object_name: str):
+        directory = Path(state_directory or DEFAULT_STATE_DIRECTORY).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256(f"{bucket_name}/{object_name}".encode("utf-8")).hexdigest()
+        self.path = directory / f"{digest}.json"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        partial_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.part")
+        with open(partial_path, "w") as f:
+            json.dump(state, f)
+        os.replace(partial_path, self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
@@ -4,14 +4,19 @@ import os
 import sys
 import time # Import time for sleep
 from datetime import datetime, timedelta
-from typing import BinaryIO, Optional, Union, Dict, Any
+from typing import BinaryIO, Optional, Union, Dict, Any, List, Tuple
 from pathlib import Path
 from minio import Minio
 from minio.error import S3Error
+from minio.datatypes import Part
+from minio.helpers import genheaders
+import certifi
+import urllib3
 from urllib3.response import HTTPResponse
 
 from gemini.storage.interfaces.storage_provider import StorageProvider
 from gemini.storage.config.storage_config import MinioStorageConfig
+from gemini.storage.multipart import should_upload_multipart
 from gemini.storage.exceptions import (
     StorageError,
     StorageFileNotFoundError,
@@ -44,12 +49,60 @@ class MinioStorageProvider(StorageProvider):
                 secret_key=config.secret_key,
                 secure=config.secure,
                 region=config.region,
-                http_client=config.http_client
+                http_client=config.http_client or self._create_http_client(config)
             )
+            self.presign_client = self._create_presign_client(config) if config.public_endpoint else self.client
             self.bucket_name = config.bucket_name
         except Exception as e:
             raise StorageInitializationError(f"Failed to initialize MinIO client: {e}")
 
+    @staticmethod
+    def _create_http_client(config: MinioStorageConfig) -> urllib3.PoolManager:
+        """Create the connection pool of the MinIO client.
+
+        Same settings as the MinIO default, except that the pool holds
+        `config.max_connections` connections so concurrent uploads do not
+        open and discard a connection per request.
+
+        Args:
+            config: MinIO configuration
+
+        Returns:
+            urllib3.PoolManager: The connection pool
+        """
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=config.max_connections,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+
+    @staticmethod
+    def _create_presign_client(config: MinioStorageConfig) -> Minio:
+        """Create the client that signs download URLs for the public endpoint.
+
+        The signature covers the host, so URLs handed to clients outside the
+        deployment must be signed for the address they use. Signing is done
+        locally; the region is fixed so no request is made to look it up.
+        """
+        endpoint = config.public_endpoint
+        secure = config.secure
+        if "://" in endpoint:
+            scheme, endpoint = endpoint.split("://", 1)
+            secure = scheme.lower() == "https"
+        return Minio(
+            endpoint=endpoint.rstrip("/"),
+            access_key=config.access_key,
+            secret_key=config.secret_key,
+            secure=secure,
+            region=config.region or "us-east-1"
+        )
+
     def initialize(self) -> bool:
         """Initialize MinIO storage and create bucket if needed.
         
@@ -75,15 +128,22 @@ class MinioStorageProvider(StorageProvider):
         input_file_path: Optional[Union[str, Path]] = None,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
-        bucket_name: Optional[str] = None
+        bucket_name: Optional[str] = None,
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> str:
         """Upload a file to MinIO storage.
+
+        Files of at least `config.multipart_threshold` bytes are uploaded in
+        parallel parts with `upload_file_multipart`.
         
         Args:
             object_name: Name/path of the object in storage
             data_stream: File-like object containing the data
             content_type: MIME type of the file
             metadata: Additional metadata to store
+            part_size: Part size of multipart uploads, defaults to `config.part_size`
+            concurrency: Parts uploaded at once, defaults to `config.multipart_concurrency`
             
         Returns:
             str: URL for the uploaded file
@@ -93,6 +153,18 @@ class MinioStorageProvider(StorageProvider):
             StorageConnectionError: If connection fails
             StorageAuthError: If access is denied after retries
         """
+        if should_upload_multipart(data_stream, input_file_path, self.config.multipart_threshold):
+            return self.upload_file_multipart(
+                object_name,
+                data_stream=data_stream,
+                input_file_path=input_file_path,
+                content_type=content_type,
+                metadata=metadata,
+                bucket_name=bucket_name,
+                part_size=part_size or self.config.part_size,
+                concurrency=concurrency or self.config.multipart_concurrency
+            )
+
         max_retries = 5
         base_delay = 1.0 # seconds
 
@@ -102,9 +174,6 @@ class MinioStorageProvider(StorageProvider):
                 tags = metadata.copy() if metadata else {}
                 if content_type:
                     tags['Content-Type'] = content_type
-                
-                # Note: part_size was removed in the base file content, keeping it removed here.
-                # part_size = 5 * 1024 * 1024 # 5MB part size
 
                 if input_file_path:
                     input_file_path = Path(input_file_path)
@@ -115,8 +184,7 @@ class MinioStorageProvider(StorageProvider):
                         object_name=object_name,
                         file_path=str(input_file_path),
                         content_type=content_type,
-                        metadata=tags,
-                        # part_size=part_size # Removed based on base file
+                        metadata=tags
                     )
                 elif data_stream:
                     # Ensure stream is at the beginning before each attempt
@@ -133,8 +201,7 @@ class MinioStorageProvider(StorageProvider):
                         data=data_stream,
                         length=file_size, # MinIO requires length for streams
                         content_type=content_type,
-                        metadata=tags,
-                        # part_size=part_size # Removed based on base file
+                        metadata=tags
                     )
                     # Restore original stream position if needed after successful upload?
                     # data_stream.seek(current_pos) # Maybe not necessary depending on caller
@@ -165,6 +232,185 @@ class MinioStorageProvider(StorageProvider):
         # Fallback if loop finishes without success or raising (should not happen with current logic)
         raise StorageUploadError(f"Upload failed definitively for {object_name} after {max_retries} attempts.")
 
+    # The multipart steps below use the MinIO client's internal multipart
+    # methods, which are stable across minio 7.x, since the public API only
+    # uploads parts one after another with no way to resume.
+
+    def create_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Start a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Name of the bucket
+            content_type: MIME type of the file
+            metadata: Additional metadata to store
+
+        Returns:
+            str: The upload ID
+
+        Raises:
+            StorageUploadError: If the upload cannot be started
+            StorageAuthError: If access is denied
+        """
+        metadata = {k: v for k, v in (metadata or {}).items() if v is not None}
+        headers = genheaders(metadata, None, None, None, False)
+        headers["Content-Type"] = content_type or "application/octet-stream"
+        try:
+            return self.client._create_multipart_upload(
+                self.bucket_name if bucket_name is None else bucket_name,
+                object_name,
+                headers
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"start multipart upload of '{object_name}'")
+
+    def upload_part(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str,
+        part_number: int,
+        data: bytes
+    ) -> str:
+        """Upload one part of a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Name of the bucket
+            upload_id: The upload ID
+            part_number: Number of the part, from 1
+            data: Content of the part
+
+        Returns:
+            str: ETag of the part
+
+        Raises:
+            StorageUploadError: If the part cannot be uploaded
+            StorageFileNotFoundError: If the upload no longer exists
+            StorageAuthError: If access is denied
+        """
+        try:
+            return self.client._upload_part(
+                self.bucket_name if bucket_name is None else bucket_name,
+                object_name,
+                data,
+                None,
+                upload_id,
+                part_number
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"upload part {part_number} of '{object_name}'")
+
+    def list_parts(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str
+    ) -> Dict[int, Tuple[str, int]]:
+        """List the parts of a multipart upload already stored.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Name of the bucket
+            upload_id: The upload ID
+
+        Returns:
+            Dict[int, Tuple[str, int]]: ETag and size of each stored part, by part number
+
+        Raises:
+            StorageFileNotFoundError: If the upload no longer exists
+            StorageError: If the parts cannot be listed
+        """
+        parts = {}
+        part_number_marker = None
+        try:
+            while True:
+                result = self.client._list_parts(
+                    self.bucket_name if bucket_name is None else bucket_name,
+                    object_name,
+                    upload_id,
+                    part_number_marker=part_number_marker
+                )
+                for part in result.parts:
+                    parts[part.part_number] = (part.etag, part.size)
+                if not result.is_truncated:
+                    return parts
+                part_number_marker = result.next_part_number_marker
+        except Exception as e:
+            raise self._multipart_error(e, f"list parts of '{object_name}'")
+
+    def complete_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str,
+        parts: List[Tuple[int, str]]
+    ) -> None:
+        """Assemble the uploaded parts into the object.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Name of the bucket
+            upload_id: The upload ID
+            parts: Part number and ETag of every part, in order
+
+        Raises:
+            StorageUploadError: If the upload cannot be completed
+            StorageAuthError: If access is denied
+        """
+        try:
+            self.client._complete_multipart_upload(
+                self.bucket_name if bucket_name is None else bucket_name,
+                object_name,
+                upload_id,
+                [Part(part_number, etag) for part_number, etag in parts]
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"complete multipart upload of '{object_name}'")
+
+    def abort_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str
+    ) -> None:
+        """Abort a multipart upload and discard its parts.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Name of the bucket
+            upload_id: The upload ID
+
+        Raises:
+            StorageError: If the upload cannot be aborted
+        """
+        try:
+            self.client._abort_multipart_upload(
+                self.bucket_name if bucket_name is None else bucket_name,
+                object_name,
+                upload_id
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"abort multipart upload of '{object_name}'")
+
+    @staticmethod
+    def _multipart_error(e: Exception, action: str) -> StorageError:
+        """Map an error of a multipart step to a storage exception."""
+        if isinstance(e, S3Error):
+            if e.code == 'NoSuchUpload':
+                return StorageFileNotFoundError(f"Failed to {action}: the upload no longer exists")
+            if e.code == 'AccessDenied':
+                return StorageAuthError(f"Access denied while trying to {action}: {e}")
+        elif isinstance(e, ConnectionError):
+            return StorageConnectionError(f"Connection failed while trying to {action}: {e}")
+        return StorageUploadError(f"Failed to {action}: {e}")
+
     def download_file_stream(
         self,
         object_name: str,
@@ -270,16 +516,21 @@ class MinioStorageProvider(StorageProvider):
     def get_download_url(
         self,
         object_name: str,
-        expires: Optional[datetime] = None,
+        expires: Optional[timedelta] = None,
         response_headers: Optional[Dict[str, str]] = None,
-        bucket_name: Optional[str] = None
+        bucket_name: Optional[str] = None,
+        check_exists: bool = True
     ) -> str:
         """Get a pre-signed URL for downloading the file.
+
+        URLs are signed for `config.public_endpoint` if one is set.
         
         Args:
             object_name: Name/path of the object
-            expires: URL expiration time
+            expires: How long the URL stays valid, 7 days by default
             response_headers: Headers for the response
+            bucket_name: Name of the bucket
+            check_exists: Check that the object exists first, which costs a request
             
         Returns:
             str: Pre-signed URL
@@ -290,14 +541,14 @@ class MinioStorageProvider(StorageProvider):
         """
         try:
             # Ensure file exists
-            if not self.file_exists(object_name):
+            if check_exists and not self.file_exists(object_name, bucket_name=bucket_name):
                 raise StorageFileNotFoundError(f"File not found: {object_name}")
             
             # Default expiration of 7 days if not specified
             if expires is None:
                 expires = timedelta(days=7)
             
-            url = self.client.presigned_get_object(
+            url = self.presign_client.presigned_get_object(
                 bucket_name=self.bucket_name if bucket_name is None else bucket_name,
                 object_name=object_name,
                 expires=expires,
@@ -306,6 +557,8 @@ class MinioStorageProvider(StorageProvider):
         
             return url
             
+        except StorageError:
+            raise
         except S3Error as e:
             if 'AccessDenied' in str(e):
                 raise StorageAuthError(f"Access denied while generating URL: {e}")
@@ -6,11 +6,12 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 from datetime import datetime, timedelta, timezone
-from typing import BinaryIO, Optional, Union, Dict, Any
+from typing import BinaryIO, Optional, Union, Dict, Any, List, Tuple
 from pathlib import Path
 
 from gemini.storage.interfaces.storage_provider import StorageProvider
 from gemini.storage.config.storage_config import S3StorageConfig
+from gemini.storage.multipart import should_upload_multipart
 from gemini.storage.exceptions import (
     StorageError,
     StorageFileNotFoundError,
@@ -92,16 +93,23 @@ class S3StorageProvider(StorageProvider):
         input_file_path: Optional[Union[str, Path]] = None,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
-        bucket_name: Optional[str] = None
+        bucket_name: Optional[str] = None,
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> str:
         """Upload a file to S3 storage.
 
+        Files of at least `config.multipart_threshold` bytes are uploaded in
+        parallel, resumable parts with `upload_file_multipart`.
+
         Args:
             object_name: Name/path of the object in storage
             data_stream: File-like object containing the data
             input_file_path: Path to the local file to upload
             content_type: MIME type of the file
             metadata: Additional metadata (converted to string values for S3)
+            part_size: Part size of multipart uploads, defaults to `config.part_size`
+            concurrency: Parts uploaded at once, defaults to `config.multipart_concurrency`
 
         Returns:
             str: Pre-signed URL for the uploaded file
@@ -112,6 +120,18 @@ class S3StorageProvider(StorageProvider):
             StorageAuthError: If access is denied
             ValueError: If neither data_stream nor input_file_path is provided
         """
+        if should_upload_multipart(data_stream, input_file_path, self.config.multipart_threshold):
+            return self.upload_file_multipart(
+                object_name,
+                data_stream=data_stream,
+                input_file_path=input_file_path,
+                content_type=content_type,
+                metadata=metadata,
+                bucket_name=bucket_name,
+                part_size=part_size or self.config.part_size,
+                concurrency=concurrency or self.config.multipart_concurrency
+            )
+
         target_bucket = bucket_name if bucket_name is not None else self.bucket_name
         extra_args = {}
         if content_type:
@@ -157,6 +177,181 @@ class S3StorageProvider(StorageProvider):
                  raise StorageConnectionError(f"Connection failed during S3 upload: {e}")
             raise StorageUploadError(f"Unexpected error during S3 upload: {e}")
 
+    def create_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Start a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Optional specific bucket name
+            content_type: MIME type of the file
+            metadata: Additional metadata (converted to string values for S3)
+
+        Returns:
+            str: The upload ID
+
+        Raises:
+            StorageUploadError: If the upload cannot be started
+            StorageAuthError: If access is denied
+        """
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        if metadata:
+            extra_args['Metadata'] = {k: str(v) for k, v in metadata.items()}
+        try:
+            response = self.client.create_multipart_upload(
+                Bucket=bucket_name if bucket_name is not None else self.bucket_name,
+                Key=object_name,
+                **extra_args
+            )
+            return response['UploadId']
+        except Exception as e:
+            raise self._multipart_error(e, f"start multipart upload of '{object_name}'")
+
+    def upload_part(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str,
+        part_number: int,
+        data: bytes
+    ) -> str:
+        """Upload one part of a multipart upload.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Optional specific bucket name
+            upload_id: The upload ID
+            part_number: Number of the part, from 1
+            data: Content of the part
+
+        Returns:
+            str: ETag of the part
+
+        Raises:
+            StorageUploadError: If the part cannot be uploaded
+            StorageFileNotFoundError: If the upload no longer exists
+            StorageAuthError: If access is denied
+        """
+        try:
+            response = self.client.upload_part(
+                Bucket=bucket_name if bucket_name is not None else self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data
+            )
+            return response['ETag']
+        except Exception as e:
+            raise self._multipart_error(e, f"upload part {part_number} of '{object_name}'")
+
+    def list_parts(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str
+    ) -> Dict[int, Tuple[str, int]]:
+        """List the parts of a multipart upload already stored.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Optional specific bucket name
+            upload_id: The upload ID
+
+        Returns:
+            Dict[int, Tuple[str, int]]: ETag and size of each stored part, by part number
+
+        Raises:
+            StorageFileNotFoundError: If the upload no longer exists
+            StorageError: If the parts cannot be listed
+        """
+        parts = {}
+        try:
+            paginator = self.client.get_paginator('list_parts')
+            for page in paginator.paginate(
+                Bucket=bucket_name if bucket_name is not None else self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id
+            ):
+                for part in page.get('Parts', []):
+                    parts[part['PartNumber']] = (part['ETag'], part['Size'])
+            return parts
+        except Exception as e:
+            raise self._multipart_error(e, f"list parts of '{object_name}'")
+
+    def complete_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str,
+        parts: List[Tuple[int, str]]
+    ) -> None:
+        """Assemble the uploaded parts into the object.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Optional specific bucket name
+            upload_id: The upload ID
+            parts: Part number and ETag of every part, in order
+
+        Raises:
+            StorageUploadError: If the upload cannot be completed
+            StorageAuthError: If access is denied
+        """
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=bucket_name if bucket_name is not None else self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': [{'PartNumber': part_number, 'ETag': etag} for part_number, etag in parts]}
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"complete multipart upload of '{object_name}'")
+
+    def abort_multipart_upload(
+        self,
+        object_name: str,
+        bucket_name: Optional[str],
+        upload_id: str
+    ) -> None:
+        """Abort a multipart upload and discard its parts.
+
+        Args:
+            object_name: Name/path of the object in storage
+            bucket_name: Optional specific bucket name
+            upload_id: The upload ID
+
+        Raises:
+            StorageError: If the upload cannot be aborted
+        """
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=bucket_name if bucket_name is not None else self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id
+            )
+        except Exception as e:
+            raise self._multipart_error(e, f"abort multipart upload of '{object_name}'")
+
+    @staticmethod
+    def _multipart_error(e: Exception, action: str) -> StorageError:
+        """Map an error of a multipart step to a storage exception."""
+        if isinstance(e, ClientError):
+            error_code = e.response.get('Error', {}).get('Code')
+            if error_code == 'NoSuchUpload':
+                return StorageFileNotFoundError(f"Failed to {action}: the upload no longer exists")
+            if error_code in ('AccessDenied', '403'):
+                return StorageAuthError(f"Access denied while trying to {action}: {e}")
+        elif "Could not connect to the endpoint URL" in str(e):
+            return StorageConnectionError(f"Connection failed while trying to {action}: {e}")
+        return StorageUploadError(f"Failed to {action}: {e}")
+
     def download_file(
         self,
         object_name: str,